@@ -4,6 +4,7 @@ import multiprocessing as mp
 
 from wisdem.aeroelasticse.CaseGen_General import CaseGen_General, save_case_matrix
 from wisdem.aeroelasticse.pyIECWind import pyIECWind_extreme, pyIECWind_turb
+from wisdem.commonse.mpi_tools import subprocessor_map
 
 try:
     from mpi4py import MPI
@@ -33,6 +34,14 @@ def gen_windfile(data):
         WindFile_type_out = wind_file_type
     return [U_out, WindFile_out, WindFile_type_out]
 
+def windfile_key(iecwind, IEC_WindType, change_vars, var_vals):
+    # identifies the wind files a gen_windfile call produces: wind model, settings of the generator, Uref and seed
+    settings = dict(vars(iecwind))
+    if 'Seeds' in change_vars:
+        settings['seed'] = float(var_vals[change_vars.index('Seeds')])
+    settings['U'] = float(var_vals[change_vars.index('U')])
+    return (type(iecwind).__name__, IEC_WindType) + tuple(sorted((var, repr(val)) for var, val in settings.items()))
+
 class CaseGen_IEC():
 
     def __init__(self):
@@ -65,6 +74,7 @@ class CaseGen_IEC():
         case_list_all = {}
         dlc_all = []
 
+        dlc_setup = []
         for i, dlc in enumerate(self.dlc_inputs['DLC']):
             case_inputs_i = copy.deepcopy(case_inputs)
 
@@ -177,62 +187,30 @@ class CaseGen_IEC():
                 matrix_out.append(row_out)
             matrix_out = np.asarray(matrix_out)
             
-            if self.parallel_windfile_gen and not self.mpi_run:
-                # Parallel wind file generation (threaded with multiprocessing)
-                if self.cores != 0:
-                    p = mp.Pool(self.cores)
-                else:
-                    p = mp.Pool()
-                data_out = p.map(gen_windfile, [(iecwind, IEC_WindType, change_vars, var_vals) for var_vals in matrix_out])
-                U_out = []
-                WindFile_out = []
-                WindFile_type_out = []
-                for case in data_out:
-                    U_out.extend(case[0])
-                    WindFile_out.extend(case[1])
-                    WindFile_type_out.extend(case[2])
-
-            elif self.parallel_windfile_gen and self.mpi_run:
-                # Parallel wind file generation with MPI
-                comm = MPI.COMM_WORLD
-                # size = comm.Get_size()
-                rank = comm.Get_rank()
-                sub_ranks = self.comm_map_down[rank]
-                size = len(sub_ranks)
-
-                N_cases = len(matrix_out)
-                N_loops = int(np.ceil(float(N_cases)/float(size)))
-
-                U_out = []
-                WindFile_out = []
-                WindFile_type_out = []
-                for i in range(N_loops):
-                    idx_s    = i*size
-                    idx_e    = min((i+1)*size, N_cases)
-
-                    for j, var_vals in enumerate(matrix_out[idx_s:idx_e]):
-                        data   = [gen_windfile, [iecwind, IEC_WindType, change_vars, var_vals]]
-                        rank_j = sub_ranks[j]
-                        comm.send(data, dest=rank_j, tag=0)
-
-                    for j, var_vals in enumerate(matrix_out[idx_s:idx_e]):
-                        rank_j = sub_ranks[j]
-                        data_out = comm.recv(source=rank_j, tag=1)
-                        U_out.extend(data_out[0])
-                        WindFile_out.extend(data_out[1])
-                        WindFile_type_out.extend(data_out[2])
+            # Wind files of this DLC, generated below with those of the other DLCs
+            windfile_jobs = [[iecwind, IEC_WindType, change_vars, var_vals] for var_vals in matrix_out]
+            dlc_setup.append([dlc, case_inputs_i, TMax, windfile_jobs])
+
+        # Generate each distinct wind file once, DLCs with the same inflow (e.g. NTM in DLC 1.1 and 1.2) share it
+        windfile_keys = [[windfile_key(*job) for job in dlc_i[3]] for dlc_i in dlc_setup]
+        unique_jobs = {}
+        for dlc_i, keys in zip(dlc_setup, windfile_keys):
+            for job, key in zip(dlc_i[3], keys):
+                if key not in unique_jobs:
+                    unique_jobs[key] = job
+        unique_keys = list(unique_jobs.keys())
+        windfiles = dict(zip(unique_keys, self.gen_windfiles([unique_jobs[key] for key in unique_keys])))
+
+        for i, (dlc, case_inputs_i, TMax, windfile_jobs) in enumerate(dlc_setup):
+            U_out = []
+            WindFile_out = []
+            WindFile_type_out = []
+            for key in windfile_keys[i]:
+                [U_out_i, WindFile_out_i, WindFile_type_out_i] = windfiles[key]
+                U_out.extend(U_out_i)
+                WindFile_out.extend(WindFile_out_i)
+                WindFile_type_out.extend(WindFile_type_out_i)
 
-            else:
-                # Serial
-                U_out = []
-                WindFile_out = []
-                WindFile_type_out = []
-                for var_vals in matrix_out:
-                    [U_out_i, WindFile_out_i, WindFile_type_out_i] = gen_windfile([iecwind, IEC_WindType, change_vars, var_vals])
-                    U_out.extend(U_out_i)
-                    WindFile_out.extend(WindFile_out_i)
-                    WindFile_type_out.extend(WindFile_type_out_i)
-            
             # Set FAST variables from DLC setup
             if ("Fst","TMax") not in case_inputs_i:
                 case_inputs_i[("Fst","TMax")] = {'vals':[TMax], 'group':0}
@@ -260,6 +238,35 @@ class CaseGen_IEC():
         return case_list_all, [self.case_name_base +'_'+ ('%d'%i).zfill(len('%d'%(len(case_list_all)-1))) for i in range(len(case_list_all))]
 
 
+    def gen_windfiles(self, windfile_jobs):
+        # run gen_windfile for each job, in parallel if parallel_windfile_gen is set
+
+        if self.parallel_windfile_gen and not self.mpi_run:
+            # Parallel wind file generation (threaded with multiprocessing), one pool for all the DLCs
+            if self.cores != 0:
+                p = mp.Pool(self.cores)
+            else:
+                p = mp.Pool()
+            data_out = p.map(gen_windfile, windfile_jobs, chunksize=1)
+            p.close()
+            p.join()
+
+        elif self.parallel_windfile_gen and self.mpi_run:
+            # Parallel wind file generation with MPI
+            comm = MPI.COMM_WORLD
+            # size = comm.Get_size()
+            rank = comm.Get_rank()
+            sub_ranks = self.comm_map_down[rank]
+
+            # wind files are handed to the sub-ranks as they become free
+            data_out = subprocessor_map(gen_windfile, windfile_jobs, sub_ranks)
+
+        else:
+            # Serial
+            data_out = [gen_windfile(job) for job in windfile_jobs]
+
+        return data_out
+
     def join_case_dicts(self, caselist, caselist_add):
         if caselist:
             keys1 = caselist[0].keys()
@@ -0,0 +1,204 @@
+"""
+Content-addressed cache of completed FAST runs.
+
+A case is identified by the hash of its fully updated fst_vt (every input value, including the output channel
+list), the contents of the input files it reads that are only referenced by name in fst_vt (wind files, a
+controller input file that is not written from fst_vt['DISCON_in'], WAMIT data, ...), the FAST version and the
+executable and controller library it runs with.  The FAST output file of a run is stored in the cache directory under that hash, so an identical case,
+e.g. when restarting a load case campaign or at a design point the optimizer already visited, copies the stored
+output into the run directory instead of running FAST.  The least recently used outputs are removed once the
+cache grows beyond max_size bytes.
+
+Set an instance as runFAST_pywrapper_batch.cache (or runFAST_pywrapper.cache).
+"""
+import os
+import hashlib
+import shutil
+import threading
+import numpy as np
+
+
+def _digest_value(h, val):
+    # feed a fst_vt value to the hash h, with its type so that e.g. 1, 1.0 and '1' differ
+    if type(val) is dict:
+        h.update(b'{')
+        for key in sorted(val.keys(), key=str):
+            _digest_value(h, key)
+            _digest_value(h, val[key])
+        h.update(b'}')
+    elif type(val) in [list, tuple]:
+        h.update(b'[')
+        for val_i in val:
+            _digest_value(h, val_i)
+        h.update(b']')
+    elif isinstance(val, np.ndarray):
+        val = np.ascontiguousarray(val)
+        if val.dtype == object:
+            _digest_value(h, val.tolist())
+        else:
+            h.update(('array %s %s:' % (val.dtype.str, val.shape)).encode('utf-8'))
+            h.update(val.tobytes())
+    else:
+        h.update(('%s %r;' % (type(val).__name__, val)).encode('utf-8'))
+
+
+def fst_vt_digest(fst_vt):
+    """ SHA1 of the values of a (nested) fst_vt dictionary, independent of the dictionary order """
+    h = hashlib.sha1()
+    _digest_value(h, fst_vt)
+    return h.hexdigest()
+
+
+class FASTRunCache(object):
+
+    def __init__(self, cache_dir, max_size=20e9):
+        self.cache_dir = cache_dir      # directory the FAST outputs are stored in
+        self.max_size  = max_size       # size of the cache, in bytes, above which old outputs are removed
+
+        # content hash of the input files read by this process, by (path, size, mtime)
+        self._file_digests = {}
+
+    def __getstate__(self):
+        # sent to worker processes with the cases, without the digests of this process
+        state = self.__dict__.copy()
+        state['_file_digests'] = {}
+        return state
+
+    def file_digest(self, fname):
+        # SHA1 of a file content, computed once per file version
+        stat = os.stat(fname)
+        file_id = (os.path.abspath(fname), stat.st_size, stat.st_mtime)
+        if file_id not in self._file_digests:
+            h = hashlib.sha1()
+            with open(fname, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+            self._file_digests[file_id] = h.hexdigest()
+        return self._file_digests[file_id]
+
+    def key(self, fst_vt, FAST_ver, FAST_exe, FAST_runDirectory):
+        """ Cache key of a case, from its fully updated fst_vt (before the writer sets the output file names) """
+        h = hashlib.sha1()
+        h.update(('%s;%s;' % (FAST_ver.lower(), fst_vt_digest(fst_vt))).encode('utf-8'))
+
+        # executable and controller library, by version (size and modification time)
+        for fname in [FAST_exe, fst_vt.get('ServoDyn', {}).get('DLL_FileName', '')]:
+            fname = self.find_file(fname, FAST_runDirectory)
+            if fname:
+                stat = os.stat(fname)
+                h.update(('%s %d %r;' % (os.path.abspath(fname), stat.st_size, stat.st_mtime)).encode('utf-8'))
+
+        # input files that are not written from fst_vt, by content
+        for fname in self.input_files(fst_vt, FAST_runDirectory):
+            h.update(('file %s %s;' % (os.path.basename(fname), self.file_digest(fname))).encode('utf-8'))
+
+        return h.hexdigest()
+
+    def input_files(self, fst_vt, FAST_runDirectory):
+        """ Existing input files of a case that fst_vt only references by name """
+        inflow = fst_vt.get('InflowWind', {})
+        servo  = fst_vt.get('ServoDyn', {})
+        hydro  = fst_vt.get('HydroDyn', {})
+
+        fnames = [inflow.get(var, '') for var in ['Filename', 'FileName_u', 'FileName_v', 'FileName_w']]
+        if inflow.get('FilenameRoot', ''):
+            fnames.extend([inflow['FilenameRoot'] + '.wnd', inflow['FilenameRoot'] + '.sum'])
+        if 'DISCON_in' in fst_vt:
+            # DLL_InFile is written from DISCON_in, which references the rotor performance table
+            fnames.append(fst_vt['DISCON_in'].get('PerfFileName', ''))
+        else:
+            fnames.append(servo.get('DLL_InFile', ''))
+        fnames.append(fst_vt.get('ElastoDyn', {}).get('FurlFile', ''))
+        fnames.append(fst_vt.get('Fst', {}).get('IceFile', ''))
+        soil_files = fst_vt.get('SubDyn', {}).get('Rct_SoilFile', [])
+        fnames.extend(soil_files if type(soil_files) in [list, tuple] else [soil_files])
+
+        files = [self.find_file(fname, FAST_runDirectory) for fname in fnames]
+        # WAMIT output (.1, .3, .hst, ...) and wave kinematics files are given by their root name
+        for root in [hydro.get('PotFile', ''), hydro.get('WvKinFile', '')]:
+            files.extend(self.find_root_files(root, FAST_runDirectory))
+
+        return [fname for fname in files if fname]
+
+    def find_file(self, fname, FAST_runDirectory):
+        # input files are given relative to the run directory, or to the current directory
+        if type(fname) is not str or fname.strip() in ['', '"', '""']:
+            return None
+        fname = fname.strip().strip('"')
+        for fname_i in [os.path.join(FAST_runDirectory, fname), fname]:
+            if os.path.isfile(fname_i):
+                return fname_i
+        return None
+
+    def find_root_files(self, root, FAST_runDirectory):
+        # files named <root>.<extension>, relative to the run directory, or to the current directory
+        if type(root) is not str or root.strip() in ['', '"', '""']:
+            return []
+        root = root.strip().strip('"')
+        for root_i in [os.path.join(FAST_runDirectory, root), root]:
+            dirname, basename = os.path.split(root_i)
+            dirname = dirname if dirname else os.curdir
+            if os.path.isdir(dirname):
+                files = [os.path.join(dirname, fname) for fname in sorted(os.listdir(dirname)) if fname.startswith(basename + '.')]
+                files = [fname for fname in files if os.path.isfile(fname)]
+                if files:
+                    return files
+        return []
+
+    def cached_file(self, key, FAST_Output):
+        return os.path.join(self.cache_dir, key + os.path.splitext(FAST_Output)[1])
+
+    def get(self, key, FAST_Output):
+        """ Copy the cached output of key to FAST_Output, returns False if the case is not cached """
+        # copy under a temporary name and rename, an output of a previous run may still be memory mapped
+        cached_file = self.cached_file(key, FAST_Output)
+        tmp_file = '%s.%d.%d.tmp' % (FAST_Output, os.getpid(), threading.current_thread().ident)
+        try:
+            shutil.copyfile(cached_file, tmp_file)
+            os.replace(tmp_file, FAST_Output)
+            os.utime(cached_file, None)
+        except (IOError, OSError):
+            if os.path.isfile(tmp_file):
+                os.remove(tmp_file)
+            return False
+        return True
+
+    def put(self, key, FAST_Output):
+        """ Store the output file FAST_Output of the case key """
+        if not os.path.isfile(FAST_Output):
+            return
+        if not os.path.isdir(self.cache_dir):
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                pass
+
+        # copy under a temporary name and rename, identical cases may finish at the same time
+        cached_file = self.cached_file(key, FAST_Output)
+        tmp_file = '%s.%d.%d.tmp' % (cached_file, os.getpid(), threading.current_thread().ident)
+        shutil.copyfile(FAST_Output, tmp_file)
+        os.replace(tmp_file, cached_file)
+
+        self.evict()
+
+    def evict(self):
+        # remove the least recently used outputs until the cache fits in max_size
+        files = []
+        for fname in os.listdir(self.cache_dir):
+            fname = os.path.join(self.cache_dir, fname)
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                continue
+            if not fname.endswith('.tmp'):
+                files.append((stat.st_mtime, stat.st_size, fname))
+
+        size = sum([f[1] for f in files])
+        for mtime, fsize, fname in sorted(files):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(fname)
+            except OSError:
+                pass
+            size -= fsize
@@ -0,0 +1,261 @@
+"""
+Rainflow counting and damage equivalent loads (DEL) for aeroelastic outputs.
+
+Cycles are counted with the 4-point rainflow rule on the turning points of each signal.  All channels (and seeds)
+are processed at once: their turning points are concatenated and every pass removes, in all channels
+simultaneously, the closed cycles found by the 4-point criterion, until only the residue is left.  The residue is
+counted as half cycles.
+
+The damage of a signal is summarized by its Miner sum, sum(n_i * S_i**m), which can be accumulated over seeds and
+load cases and weighted by the Weibull probability of each wind speed bin to give lifetime DELs for the DLC 1.2
+case matrix of CaseGen_IEC.  The (DEL, N_eq) pairs can be used directly as the M_DEL, N_DEL inputs of
+commonse.UtilizationSupplement.fatigue.
+"""
+from __future__ import print_function
+import numpy as np
+from scipy.special import gamma
+
+from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASToutFormat
+
+
+def turning_points(x):
+    """ Return the turning points (local extrema, plus the first and last point) of the 1-D signal x """
+    x = np.asarray(x, dtype=float)
+    # drop repeated values so plateaus do not hide a turning point
+    x = x[np.r_[True, np.diff(x) != 0.]]
+    if x.size < 3:
+        return x
+    dx = np.diff(x)
+    idx = np.nonzero(dx[:-1]*dx[1:] < 0.)[0] + 1
+    return np.r_[x[0], x[idx], x[-1]]
+
+
+def rainflow_multi(signals):
+    """
+    Rainflow count several signals at once.
+
+    Parameters
+    ----------
+    signals : list of array_like, or 2-D array_like (time along axis 0, one signal per column)
+
+    Returns
+    -------
+    cycles : list of (ranges, means, counts) tuples, one per signal.  counts is 1 for full cycles and
+             0.5 for the half cycles of the residue.
+    """
+    if isinstance(signals, np.ndarray) and signals.ndim == 2:
+        signals = signals.T
+    tp = [turning_points(x) for x in signals]
+    nsig = len(tp)
+    if nsig == 0:
+        return []
+
+    # concatenate all turning points, tagged by signal
+    x   = np.concatenate(tp)
+    sig = np.repeat(np.arange(nsig), [len(t) for t in tp])
+
+    full_x0  = []
+    full_x1  = []
+    full_sig = []
+    while x.size >= 4:
+        # 4-point rule: points A,B,C,D of one signal, B-C is a closed cycle if |C-B| <= |B-A| and |C-B| <= |D-C|
+        r = np.abs(np.diff(x))
+        candidate = (r[1:-1] <= r[:-2]) & (r[1:-1] <= r[2:]) & (sig[:-3] == sig[3:])
+        # windows that share points cannot be removed in the same pass, keep the first of each run
+        overlap = np.zeros_like(candidate)
+        overlap[1:] |= candidate[:-1]
+        overlap[2:] |= candidate[:-2]
+        idx = np.nonzero(candidate & ~overlap)[0]
+        if idx.size == 0:
+            break
+
+        full_x0.append(x[idx+1])
+        full_x1.append(x[idx+2])
+        full_sig.append(sig[idx+1])
+
+        keep = np.ones(x.size, dtype=bool)
+        keep[idx+1] = False
+        keep[idx+2] = False
+        x   = x[keep]
+        sig = sig[keep]
+
+    if full_x0:
+        full_x0  = np.concatenate(full_x0)
+        full_x1  = np.concatenate(full_x1)
+        full_sig = np.concatenate(full_sig)
+    else:
+        full_x0 = full_x1 = np.zeros(0)
+        full_sig = np.zeros(0, dtype=int)
+
+    # residue, half cycles between consecutive remaining points of the same signal
+    same = sig[:-1] == sig[1:]
+    half_x0  = x[:-1][same]
+    half_x1  = x[1:][same]
+    half_sig = sig[:-1][same]
+
+    # group by signal
+    x0     = np.r_[full_x0, half_x0]
+    x1     = np.r_[full_x1, half_x1]
+    counts = np.r_[np.ones(len(full_x0)), 0.5*np.ones(len(half_x0))]
+    sig    = np.r_[full_sig, half_sig]
+    order  = np.argsort(sig, kind='mergesort')
+    split  = np.cumsum(np.bincount(sig, minlength=nsig))[:-1]
+    ranges = np.split(np.abs(x1-x0)[order], split)
+    means  = np.split(0.5*(x0+x1)[order], split)
+    counts = np.split(counts[order], split)
+
+    cycles = list(zip(ranges, means, counts))
+    return cycles
+
+
+def rainflow(x):
+    """ Rainflow count the 1-D signal x, returns ranges, means and counts (1 full cycle, 0.5 half cycle) """
+    return rainflow_multi([x])[0]
+
+
+def damage_sum(signals, m):
+    """
+    Miner sum, sum(n_i * S_i**m), of each signal.
+
+    Parameters
+    ----------
+    signals : list of array_like, or 2-D array_like (time along axis 0, one signal per column)
+    m : float or array_like(float)
+        S/N curve slope (Wohler exponent), one value or one per signal
+
+    Returns
+    -------
+    D : array_like(float)
+        Miner sum for each signal
+    """
+    cycles = rainflow_multi(signals)
+    m = m*np.ones(len(cycles))
+    return np.array([np.sum(counts*ranges**mi) for (ranges, means, counts), mi in zip(cycles, m)])
+
+
+def damage_equivalent_load(signals, m, N_eq):
+    """
+    Damage equivalent load of each signal, the constant range that gives the same damage in N_eq cycles
+
+    Parameters
+    ----------
+    signals : list of array_like, or 2-D array_like (time along axis 0, one signal per column)
+    m : float or array_like(float)
+        S/N curve slope (Wohler exponent), one value or one per signal
+    N_eq : float
+        number of equivalent cycles, e.g. 1 Hz times the simulation length
+
+    Returns
+    -------
+    DEL : array_like(float)
+    """
+    D = damage_sum(signals, m)
+    return (D / N_eq)**(1./(m*np.ones(len(D))))
+
+
+def weibull_bin_probability(U, shape, scale, U_in=None, U_out=None):
+    """
+    Probability of each wind speed bin for a Weibull distribution of hub height wind speed.  Bins are centered on
+    the (sorted) wind speeds U and extend half way to their neighbours, the first and last bins extend to U_in and
+    U_out if given, or symmetrically about U[0] and U[-1] otherwise.
+    """
+    U = np.asarray(U, dtype=float)
+    if U.size == 1:
+        edges = np.r_[U[0]-0.5, U[0]+0.5]
+    else:
+        mid = 0.5*(U[1:] + U[:-1])
+        edges = np.r_[U[0] - (mid[0]-U[0]), mid, U[-1] + (U[-1]-mid[-1])]
+    if U_in is not None:
+        edges[0] = U_in
+    if U_out is not None:
+        edges[-1] = U_out
+    edges = np.maximum(edges, 0.)
+    cdf = 1. - np.exp(-(edges/scale)**shape)
+    return np.diff(cdf)
+
+
+def weibull_scale(V_mean, shape=2.):
+    """ Weibull scale parameter for a given mean wind speed, shape=2 is the Rayleigh distribution of IEC 61400-1 """
+    return V_mean / gamma(1. + 1./shape)
+
+
+def lifetime_DEL(D, U, T, m, shape, scale, T_life=20.*365.25*24.*3600., f_eq=1., availability=1., U_in=None, U_out=None):
+    """
+    Lifetime damage equivalent loads from the Miner sums of a case matrix, e.g. DLC 1.2 from CaseGen_IEC.
+    Seeds at the same wind speed are averaged, and each wind speed is weighted by its Weibull bin probability.
+
+    Parameters
+    ----------
+    D : array_like(float), shape (ncases, nchannels)
+        Miner sums of each case, see damage_sum or FAST_DEL
+    U : array_like(float), shape (ncases,)
+        mean hub height wind speed of each case
+    T : float or array_like(float)
+        length of each simulation used in the counting (s)
+    m : float or array_like(float)
+        S/N curve slope, one value or one per channel
+    shape, scale : float
+        Weibull distribution of the hub height wind speed
+    T_life : float
+        design lifetime (s)
+    f_eq : float
+        frequency of the equivalent load cycles (Hz)
+    availability : float
+        fraction of the lifetime in power production
+
+    Returns
+    -------
+    DEL : array_like(float), shape (nchannels,)
+        lifetime damage equivalent load of each channel
+    N_eq : float
+        corresponding number of cycles in the lifetime, T_life*f_eq
+    """
+    D = np.atleast_2d(np.asarray(D, dtype=float))
+    U = np.asarray(U, dtype=float)
+    T = T*np.ones(len(U))
+
+    # damage per second, averaged over the seeds of each wind speed
+    U_bins, inverse = np.unique(U, return_inverse=True)
+    D_rate = np.zeros((len(U_bins), D.shape[1]))
+    for i in range(len(U_bins)):
+        D_rate[i,:] = np.mean(D[inverse == i,:] / T[inverse == i,np.newaxis], axis=0)
+
+    p = weibull_bin_probability(U_bins, shape, scale, U_in=U_in, U_out=U_out)
+    D_life = availability*T_life*np.dot(p, D_rate)
+
+    N_eq = T_life*f_eq
+    DEL  = (D_life / N_eq)**(1./(m*np.ones(D.shape[1])))
+    return DEL, N_eq
+
+
+class FAST_DEL(object):
+    """
+    Post processor for runFAST_pywrapper_batch.post that rainflow counts the given channels in the worker and
+    returns only their Miner sums and the simulation length, the inputs of lifetime_DEL.
+
+    channels : list of output channel names
+    m : float or list, S/N curve slope, one value or one per channel
+    t_start : samples before t_start are ignored (start-up transient)
+    """
+
+    def __init__(self, channels, m, t_start=0.):
+        self.channels = channels
+        self.m        = m
+        self.t_start  = t_start
+
+    def __call__(self, fname):
+        data, meta = ReadFASToutFormat(fname, 2, Verbose=True, channels=self.channels)
+        missing = [chan for chan in self.channels if chan not in data]
+        if missing:
+            raise ValueError('%s: channels %s are not in the output' % (fname, ', '.join(missing)))
+
+        time  = data['Time']
+        idx_s = np.searchsorted(time, self.t_start)
+        if idx_s >= len(time):
+            raise ValueError('%s: no samples after t_start = %g s, the output ends at %g s' % (fname, self.t_start, time[-1] if len(time) > 0 else 0.))
+
+        out = {}
+        out['T'] = time[-1] - time[idx_s]
+        out['D'] = damage_sum([data[chan][idx_s:] for chan in self.channels], self.m)
+        out['channels'] = self.channels
+        return out
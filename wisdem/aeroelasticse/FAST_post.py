@@ -9,6 +9,11 @@ def return_timeseries(fname):
     data, meta = ReadFASToutFormat(fname, 2, Verbose=True)
     return data
 
+def return_timeseries_lazy(fname):
+    # memory mapped FASTOutput, channels are only decoded when indexed, valid until the output file is overwritten
+    data, meta = ReadFASToutFormat(fname, 2, Verbose=True, lazy=True)
+    return data
+
 def return_stats(fname):
     data, meta = ReadFASToutFormat(fname, 2, Verbose=True)
     stats = {}
@@ -19,4 +24,70 @@ def return_stats(fname):
         stats[var]['max']    = max(data[var])
         stats[var]['std']    = np.std((data[var]))
         stats[var]['absmax'] = np.abs(max(data[var]))
-    return stats
\ No newline at end of file
+    return stats
+
+class FAST_Stats(object):
+    """
+    Post processor that reduces a FAST output file to a compact statistics record inside the worker that ran
+    the case, so only the record is returned to the parent process (multiprocessing or MPI) instead of the
+    time series.  Set an instance as runFAST_pywrapper_batch.post.
+
+    For each channel in channels (all channels if None) the record holds the mean, std, min, max and absmax,
+    the time of the min, max and absmax, and the values of the coincident channels at those three times:
+        stats[chan]['mean'], ... , stats[chan]['time_max'], stats[chan]['coincident_max'][coincident_chan]
+    Samples before t_start are ignored, e.g. to skip the start-up transient.  A ValueError is raised if no
+    sample is left, or if a requested channel or coincident channel is not in the output.  reduce() computes
+    the same record from time series that are already loaded.
+    """
+
+    def __init__(self, channels=None, coincident=None, t_start=0.):
+        self.channels   = channels
+        self.coincident = [] if coincident is None else coincident
+        self.t_start    = t_start
+
+    def __call__(self, fname):
+        if self.channels is None:
+            read_channels = None
+        else:
+            read_channels = list(self.channels) + [chan for chan in self.coincident if chan not in self.channels]
+        data, _ = ReadFASToutFormat(fname, 2, Verbose=True, channels=read_channels)
+        return self.reduce(data, fname)
+
+    def reduce(self, data, name='FAST output'):
+        """ Statistics record of the time series data (dict-like, channel name -> array, including 'Time') """
+        channels   = [chan for chan in data.keys() if chan != 'Time'] if self.channels is None else list(self.channels)
+        coincident = self.coincident
+        missing    = [chan for chan in channels + coincident if chan not in data]
+        if missing:
+            raise ValueError('%s: channels %s are not in the output' % (name, ', '.join(sorted(set(missing)))))
+        if len(channels) == 0:
+            return {}
+
+        time  = data['Time']
+        idx_s = np.searchsorted(time, self.t_start)
+        if idx_s >= len(time):
+            raise ValueError('%s: no samples after t_start = %g s, the output ends at %g s' % (name, self.t_start, time[-1] if len(time) > 0 else 0.))
+        time  = time[idx_s:]
+        X     = np.column_stack([data[chan][idx_s:] for chan in channels])
+        C     = np.column_stack([data[chan][idx_s:] for chan in coincident]) if coincident else np.zeros((len(time), 0))
+
+        # all channels at once, reduced along time
+        mean   = X.mean(axis=0)
+        std    = X.std(axis=0)
+        idxmin = X.argmin(axis=0)
+        idxmax = X.argmax(axis=0)
+        idxabs = np.abs(X).argmax(axis=0)
+
+        stats = {}
+        for i, chan in enumerate(channels):
+            stats[chan] = {}
+            stats[chan]['mean']   = mean[i]
+            stats[chan]['std']    = std[i]
+            stats[chan]['min']    = X[idxmin[i], i]
+            stats[chan]['max']    = X[idxmax[i], i]
+            stats[chan]['absmax'] = np.abs(X[idxabs[i], i])
+            for key, idx in [('min', idxmin), ('max', idxmax), ('absmax', idxabs)]:
+                stats[chan]['time_'+key]       = time[idx[i]]
+                stats[chan]['coincident_'+key] = dict(zip(coincident, C[idx[i], :]))
+
+        return stats
@@ -46,6 +46,35 @@ def int_read(text):
         except:
             return str(text)
 
+def read_array(f, nrows, ncols=None, skip_comments=False):
+    # read the next nrows lines of a numeric table into a (nrows, ncols) array, converted in one call
+    # text after '!' is ignored, as are tokens past the first ncols (by default the length of the first row)
+    # with skip_comments, blank lines and lines starting with '!' are not table rows
+    fname = getattr(f, 'name', '')
+    rows = []
+    while len(rows) < nrows:
+        line = f.readline()
+        if not line:
+            raise ValueError('%s: expected %d table rows, found %d' % (fname, nrows, len(rows)))
+        row = line.split('!', 1)[0].split()
+        if skip_comments and len(row) == 0:
+            continue
+        if ncols is None:
+            ncols = len(row)
+        if len(row) < ncols:
+            raise ValueError('%s: table row %d has %d values, expected %d: %s' % (fname, len(rows)+1, len(row), ncols, line.strip()))
+        rows.append(row[:ncols])
+    if nrows == 0:
+        return np.zeros((0, ncols or 0))
+    try:
+        return np.array(rows, dtype=float)
+    except ValueError:
+        for i, row in enumerate(rows):
+            try:
+                [float(val) for val in row]
+            except ValueError:
+                raise ValueError('%s: table row %d is not numeric: %s' % (fname, i+1, ' '.join(row)))
+        raise
 
 class InputReader_Common(object):
     """ Methods for reading input files that are (relatively) unchanged across FAST versions."""
@@ -132,44 +161,25 @@ class InputReader_Common(object):
         f.readline()
         f.readline()
         f.readline()
-        self.fst_vt['ElastoDynBlade']['BlFract'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['PitchAxis'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['StrcTwst'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['BMassDen'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['FlpStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        self.fst_vt['ElastoDynBlade']['EdgStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
+        data = read_array(f, self.fst_vt['ElastoDynBlade']['NBlInpSt'], ncols=17 if self.FAST_ver.lower() == 'fast7' else 6)
+        self.fst_vt['ElastoDynBlade']['BlFract']   = data[:,0]
+        self.fst_vt['ElastoDynBlade']['PitchAxis'] = data[:,1]
+        self.fst_vt['ElastoDynBlade']['StrcTwst']  = data[:,2]
+        self.fst_vt['ElastoDynBlade']['BMassDen']  = data[:,3]
+        self.fst_vt['ElastoDynBlade']['FlpStff']   = data[:,4]
+        self.fst_vt['ElastoDynBlade']['EdgStff']   = data[:,5]
         if self.FAST_ver.lower() == 'fast7':
-            self.fst_vt['ElastoDynBlade']['GJStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EAStff'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['Alpha'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EdgIner'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['PrecrvRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['PreswpRef'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpcgOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['Edgcgof'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['FlpEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-            self.fst_vt['ElastoDynBlade']['EdgEAOf'] = [None] * self.fst_vt['ElastoDynBlade']['NBlInpSt']
-        for i in range(self.fst_vt['ElastoDynBlade']['NBlInpSt']):
-            data = f.readline().split()          
-            self.fst_vt['ElastoDynBlade']['BlFract'][i]  = float_read(data[0])
-            self.fst_vt['ElastoDynBlade']['PitchAxis'][i]  = float_read(data[1])
-            self.fst_vt['ElastoDynBlade']['StrcTwst'][i]  = float_read(data[2])
-            self.fst_vt['ElastoDynBlade']['BMassDen'][i]  = float_read(data[3])
-            self.fst_vt['ElastoDynBlade']['FlpStff'][i]  = float_read(data[4])
-            self.fst_vt['ElastoDynBlade']['EdgStff'][i]  = float_read(data[5])
-            if self.FAST_ver.lower() == 'fast7':
-                self.fst_vt['ElastoDynBlade']['GJStff'][i]  = float_read(data[6])
-                self.fst_vt['ElastoDynBlade']['EAStff'][i]  = float_read(data[7])
-                self.fst_vt['ElastoDynBlade']['Alpha'][i]  = float_read(data[8])
-                self.fst_vt['ElastoDynBlade']['FlpIner'][i]  = float_read(data[9])
-                self.fst_vt['ElastoDynBlade']['EdgIner'][i]  = float_read(data[10])
-                self.fst_vt['ElastoDynBlade']['PrecrvRef'][i]  = float_read(data[11])
-                self.fst_vt['ElastoDynBlade']['PreswpRef'][i]  = float_read(data[12])
-                self.fst_vt['ElastoDynBlade']['FlpcgOf'][i]  = float_read(data[13])
-                self.fst_vt['ElastoDynBlade']['Edgcgof'][i]  = float_read(data[14])
-                self.fst_vt['ElastoDynBlade']['FlpEAOf'][i]  = float_read(data[15])
-                self.fst_vt['ElastoDynBlade']['EdgEAOf'][i]  = float_read(data[16])
+            self.fst_vt['ElastoDynBlade']['GJStff']    = data[:,6]
+            self.fst_vt['ElastoDynBlade']['EAStff']    = data[:,7]
+            self.fst_vt['ElastoDynBlade']['Alpha']     = data[:,8]
+            self.fst_vt['ElastoDynBlade']['FlpIner']   = data[:,9]
+            self.fst_vt['ElastoDynBlade']['EdgIner']   = data[:,10]
+            self.fst_vt['ElastoDynBlade']['PrecrvRef'] = data[:,11]
+            self.fst_vt['ElastoDynBlade']['PreswpRef'] = data[:,12]
+            self.fst_vt['ElastoDynBlade']['FlpcgOf']   = data[:,13]
+            self.fst_vt['ElastoDynBlade']['Edgcgof']   = data[:,14]
+            self.fst_vt['ElastoDynBlade']['FlpEAOf']   = data[:,15]
+            self.fst_vt['ElastoDynBlade']['EdgEAOf']   = data[:,16]
 
         f.readline()
         self.fst_vt['ElastoDynBlade']['BldFl1Sh'] = [None] * 5
@@ -224,31 +234,18 @@ class InputReader_Common(object):
         f.readline()
         f.readline()
         f.readline()
-        self.fst_vt['ElastoDynTower']['HtFract'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TMassDen'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TwFAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-        self.fst_vt['ElastoDynTower']['TwSSStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
+        data = read_array(f, self.fst_vt['ElastoDynTower']['NTwInpSt'], ncols=10 if self.FAST_ver.lower() == 'fast7' else 4)
+        self.fst_vt['ElastoDynTower']['HtFract']  = data[:,0]
+        self.fst_vt['ElastoDynTower']['TMassDen'] = data[:,1]
+        self.fst_vt['ElastoDynTower']['TwFAStif'] = data[:,2]
+        self.fst_vt['ElastoDynTower']['TwSSStif'] = data[:,3]
         if self.FAST_ver.lower() == 'fast7':
-            self.fst_vt['ElastoDynTower']['TwGJStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwEAStif'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwFAIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwSSIner'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwFAcgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-            self.fst_vt['ElastoDynTower']['TwSScgOf'] = [None] * self.fst_vt['ElastoDynTower']['NTwInpSt']
-
-        for i in range(self.fst_vt['ElastoDynTower']['NTwInpSt']):
-            data = f.readline().split()
-            self.fst_vt['ElastoDynTower']['HtFract'][i]  = float_read(data[0])
-            self.fst_vt['ElastoDynTower']['TMassDen'][i]  = float_read(data[1])
-            self.fst_vt['ElastoDynTower']['TwFAStif'][i]  = float_read(data[2])
-            self.fst_vt['ElastoDynTower']['TwSSStif'][i]  = float_read(data[3])
-            if self.FAST_ver.lower() == 'fast7':
-                self.fst_vt['ElastoDynTower']['TwGJStif'][i]  = float_read(data[4])
-                self.fst_vt['ElastoDynTower']['TwEAStif'][i]  = float_read(data[5])
-                self.fst_vt['ElastoDynTower']['TwFAIner'][i]  = float_read(data[6])
-                self.fst_vt['ElastoDynTower']['TwSSIner'][i]  = float_read(data[7])
-                self.fst_vt['ElastoDynTower']['TwFAcgOf'][i]  = float_read(data[8])
-                self.fst_vt['ElastoDynTower']['TwSScgOf'][i]  = float_read(data[9])           
+            self.fst_vt['ElastoDynTower']['TwGJStif'] = data[:,4]
+            self.fst_vt['ElastoDynTower']['TwEAStif'] = data[:,5]
+            self.fst_vt['ElastoDynTower']['TwFAIner'] = data[:,6]
+            self.fst_vt['ElastoDynTower']['TwSSIner'] = data[:,7]
+            self.fst_vt['ElastoDynTower']['TwFAcgOf'] = data[:,8]
+            self.fst_vt['ElastoDynTower']['TwSScgOf'] = data[:,9]
         
         # Tower Mode Shapes
         f.readline()
@@ -1094,22 +1091,14 @@ class InputReader_OpenFAST(InputReader_Common):
         self.fst_vt['AeroDynBlade']['NumBlNds']       = int(f.readline().split()[0])
         f.readline()
         f.readline()
-        self.fst_vt['AeroDynBlade']['BlSpn']          = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlCrvAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlSwpAC']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlCrvAng']       = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlTwist']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlChord']        = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        self.fst_vt['AeroDynBlade']['BlAFID']         = [None]*self.fst_vt['AeroDynBlade']['NumBlNds']
-        for i in range(self.fst_vt['AeroDynBlade']['NumBlNds']):
-            data = [float(val) for val in f.readline().split()]
-            self.fst_vt['AeroDynBlade']['BlSpn'][i]   = data[0] 
-            self.fst_vt['AeroDynBlade']['BlCrvAC'][i] = data[1] 
-            self.fst_vt['AeroDynBlade']['BlSwpAC'][i] = data[2]
-            self.fst_vt['AeroDynBlade']['BlCrvAng'][i]= data[3]
-            self.fst_vt['AeroDynBlade']['BlTwist'][i] = data[4]
-            self.fst_vt['AeroDynBlade']['BlChord'][i] = data[5]
-            self.fst_vt['AeroDynBlade']['BlAFID'][i]  = data[6]
+        data = read_array(f, self.fst_vt['AeroDynBlade']['NumBlNds'], ncols=7)
+        self.fst_vt['AeroDynBlade']['BlSpn']          = data[:,0]
+        self.fst_vt['AeroDynBlade']['BlCrvAC']        = data[:,1]
+        self.fst_vt['AeroDynBlade']['BlSwpAC']        = data[:,2]
+        self.fst_vt['AeroDynBlade']['BlCrvAng']       = data[:,3]
+        self.fst_vt['AeroDynBlade']['BlTwist']        = data[:,4]
+        self.fst_vt['AeroDynBlade']['BlChord']        = data[:,5]
+        self.fst_vt['AeroDynBlade']['BlAFID']         = data[:,6].astype(int)
         
         f.close()
 
@@ -1179,23 +1168,12 @@ class InputReader_OpenFAST(InputReader_Common):
 
             # Polar Data
             polar['NumAlf']         = int_read(readline_filterComments(f).split()[0])
-            polar['Alpha']          = [None]*polar['NumAlf']
-            polar['Cl']             = [None]*polar['NumAlf']
-            polar['Cd']             = [None]*polar['NumAlf']
-            polar['Cm']             = [None]*polar['NumAlf']
-            polar['Cpmin']          = [None]*polar['NumAlf']
-            for i in range(polar['NumAlf']):
-                data = [float(val) for val in readline_filterComments(f).split()]
-                if self.fst_vt['AeroDyn15']['InCol_Alfa'] > 0:
-                    polar['Alpha'][i] = data[self.fst_vt['AeroDyn15']['InCol_Alfa']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cl'] > 0:
-                    polar['Cl'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cl']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cd'] > 0:
-                    polar['Cd'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cd']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cm'] > 0:
-                    polar['Cm'][i]    = data[self.fst_vt['AeroDyn15']['InCol_Cm']-1]
-                if self.fst_vt['AeroDyn15']['InCol_Cpmin'] > 0:
-                    polar['Cpmin'][i] = data[self.fst_vt['AeroDyn15']['InCol_Cpmin']-1]
+            ncols = max([self.fst_vt['AeroDyn15'][col] for col in ['InCol_Alfa', 'InCol_Cl', 'InCol_Cd', 'InCol_Cm', 'InCol_Cpmin']])
+            data = read_array(f, polar['NumAlf'], ncols=ncols, skip_comments=True)
+            # columns not in the table (InCol_* = 0) are returned as zeros
+            for name, col in [('Alpha', 'InCol_Alfa'), ('Cl', 'InCol_Cl'), ('Cd', 'InCol_Cd'), ('Cm', 'InCol_Cm'), ('Cpmin', 'InCol_Cpmin')]:
+                icol = self.fst_vt['AeroDyn15'][col]
+                polar[name] = data[:,icol-1] if icol > 0 else np.zeros(polar['NumAlf'])
 
             self.fst_vt['AeroDyn15']['af_data'][afi] = polar
             
@@ -21,7 +21,9 @@ class FastWrapper(object):
 
         super(FastWrapper, self).__init__()
 
-    def execute(self):
+    def launch(self):
+        """ Start FAST in FAST_directory and return its subprocess.Popen without waiting for it.  The working
+        directory of this process is not changed, so FAST runs can be started from several threads. """
 
         self.input_file = os.path.join(self.FAST_directory, self.FAST_InputFile)
 
@@ -35,9 +37,6 @@ class FastWrapper(object):
         exec_str.append(self.FAST_exe)
         exec_str.append(self.FAST_InputFile)
 
-        olddir = os.getcwd()
-        os.chdir(self.FAST_directory)
-
         if self.debug_level > 0:
             print ("EXECUTING", self.FAST_ver)
             print ("Executable: \t", self.FAST_exe)
@@ -46,12 +45,13 @@ class FastWrapper(object):
             print ("Exec string: \t", exec_str)
 
         if self.debug_level > 1:
-            subprocess.call(exec_str)
+            return subprocess.Popen(exec_str, cwd=self.FAST_directory)
         else:
-            FNULL = open(os.devnull, 'w')
-            subprocess.call(exec_str, stdout=FNULL, stderr=subprocess.STDOUT)
+            return subprocess.Popen(exec_str, cwd=self.FAST_directory, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
 
-        os.chdir(olddir)
+    def execute(self):
+        # run FAST and wait for it to finish, returns the exit code
+        return self.launch().wait()
 
 if __name__=="__main__":
 
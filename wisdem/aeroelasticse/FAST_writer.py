@@ -1,4 +1,4 @@
-import os, sys, copy, random, time
+import os, sys, copy, random, time, io, hashlib, threading
 import operator
 import yaml
 import numpy as np
@@ -50,6 +50,7 @@ class InputWriter_Common(object):
         self.FAST_runDirectory = None #Output directory
         self.fst_vt = FstModel
         self.fst_update = {}
+        self.shared_files = False     # Name sub-files by a hash of their content and write each one once per run directory
 
         # Optional population class attributes from key word arguments
         for (k, w) in kwargs.items():
@@ -65,6 +66,40 @@ class InputWriter_Common(object):
         f = open(self.FAST_yamlfile, "w")
         yaml.dump(self.fst_vt, f)
 
+    def open_file(self, filename):
+        """ Open a sub-file for writing, in shared file mode the content is buffered until close_file """
+        if self.shared_files:
+            return io.StringIO()
+        return open(filename, 'w')
+
+    def close_file(self, f, name):
+        """ Close a sub-file opened with open_file and return the name to reference it by, relative to FAST_runDirectory.
+        In shared file mode the file is named by the hash of its content and only written if no identical file exists,
+        so sub-files that do not change between the cases of a batch are written once and referenced from every case. """
+        if not self.shared_files:
+            f.close()
+            return name
+
+        text = f.getvalue()
+        f.close()
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+        path, fname = os.path.split(name)
+        root, ext = os.path.splitext(fname)
+        if root.startswith(self.FAST_namingOut + '_'):
+            root = root[len(self.FAST_namingOut)+1:]
+        name = os.path.join(path, '%s_%s%s'%(root, digest, ext))
+
+        filename = os.path.join(self.FAST_runDirectory, name)
+        if not os.path.exists(filename):
+            # write under a temporary name and rename, cases running in parallel (processes or threads) may write the same file
+            tmp_file = '%s.%d.%d.tmp'%(filename, os.getpid(), threading.current_thread().ident)
+            f = open(tmp_file, 'w')
+            f.write(text)
+            f.close()
+            os.replace(tmp_file, filename)
+        return name
+
 
     def update(self, fst_update={}):
         """ Change fast variables based on the user supplied values """
@@ -106,10 +141,8 @@ class InputWriter_Common(object):
     def write_ElastoDynBlade(self):
 
         self.fst_vt['ElastoDyn']['BldFile1'] = self.FAST_namingOut + '_ElastoDyn_blade.dat'
-        self.fst_vt['ElastoDyn']['BldFile2'] = self.fst_vt['ElastoDyn']['BldFile1']
-        self.fst_vt['ElastoDyn']['BldFile3'] = self.fst_vt['ElastoDyn']['BldFile1']
         blade_file = os.path.join(self.FAST_runDirectory,self.fst_vt['ElastoDyn']['BldFile1'])
-        f = open(blade_file, 'w')
+        f = self.open_file(blade_file)
 
         f.write('------- ELASTODYN V1.00.* INDIVIDUAL BLADE INPUT FILE --------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -152,14 +185,16 @@ class InputWriter_Common(object):
         f.write('{:<22} {:<11} {:}'.format(self.fst_vt['ElastoDynBlade']['BldEdgSh'][3], 'BldEdgSh(5)', '-            , coeff of x^5\n'))
         f.write('{:<22} {:<11} {:}'.format(self.fst_vt['ElastoDynBlade']['BldEdgSh'][4], 'BldEdgSh(6)', '-            , coeff of x^6\n'))      
          
-        f.close()
+        self.fst_vt['ElastoDyn']['BldFile1'] = self.close_file(f, self.fst_vt['ElastoDyn']['BldFile1'])
+        self.fst_vt['ElastoDyn']['BldFile2'] = self.fst_vt['ElastoDyn']['BldFile1']
+        self.fst_vt['ElastoDyn']['BldFile3'] = self.fst_vt['ElastoDyn']['BldFile1']
 
 
     def write_ElastoDynTower(self):
 
         self.fst_vt['ElastoDyn']['TwrFile'] = self.FAST_namingOut + '_ElastoDyn_tower.dat'
         tower_file = os.path.join(self.FAST_runDirectory,self.fst_vt['ElastoDyn']['TwrFile'])
-        f = open(tower_file, 'w')
+        f = self.open_file(tower_file)
 
         f.write('------- ELASTODYN V1.00.* TOWER INPUT FILE -------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -224,7 +259,7 @@ class InputWriter_Common(object):
         f.write('{:<22} {:<11} {:}'.format(self.fst_vt['ElastoDynTower']['TwSSM2Sh'][3], 'TwSSM2Sh(5)', '-       , coefficient of x^5 term\n'))
         f.write('{:<22} {:<11} {:}'.format(self.fst_vt['ElastoDynTower']['TwSSM2Sh'][4], 'TwSSM2Sh(6)', '-       , coefficient of x^6 term\n'))
         
-        f.close()
+        self.fst_vt['ElastoDyn']['TwrFile'] = self.close_file(f, self.fst_vt['ElastoDyn']['TwrFile'])
 
     def write_AeroDyn14Polar(self, filename, a_i):
         # AeroDyn v14 Airfoil Polar Input File
@@ -423,7 +458,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
 
         self.fst_vt['Fst']['EDFile'] = self.FAST_namingOut + '_ElastoDyn.dat'
         ed_file = os.path.join(self.FAST_runDirectory,self.fst_vt['Fst']['EDFile'])
-        f = open(ed_file, 'w')
+        f = self.open_file(ed_file)
 
         f.write('------- ELASTODYN v1.03.* INPUT FILE -------------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -558,7 +593,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         
         f.write('END of input file (the word "END" must appear in the first 3 columns of this last OutList line)\n')
         f.write('---------------------------------------------------------------------------------------\n')
-        f.close()
+        self.fst_vt['Fst']['EDFile'] = self.close_file(f, self.fst_vt['Fst']['EDFile'])
 
 
     def write_BeamDyn(self):
@@ -675,7 +710,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
     def write_InflowWind(self):
         self.fst_vt['Fst']['InflowFile'] = self.FAST_namingOut + '_InflowFile.dat'
         inflow_file = os.path.join(self.FAST_runDirectory,self.fst_vt['Fst']['InflowFile'])
-        f = open(inflow_file, 'w')
+        f = self.open_file(inflow_file)
 
         f.write('------- InflowWind v3.01.* INPUT FILE -------------------------------------------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -736,7 +771,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         f.write('END of input file (the word "END" must appear in the first 3 columns of this last OutList line)\n')
         f.write('---------------------------------------------------------------------------------------\n')
 
-        f.close()
+        self.fst_vt['Fst']['InflowFile'] = self.close_file(f, self.fst_vt['Fst']['InflowFile'])
 
     # def WndWindWriter(self, wndfile):
 
@@ -862,7 +897,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         # Generate AeroDyn v15.03 input file
         self.fst_vt['Fst']['AeroFile'] = self.FAST_namingOut + '_AeroDyn15.dat'
         ad_file = os.path.join(self.FAST_runDirectory, self.fst_vt['Fst']['AeroFile'])
-        f = open(ad_file, 'w')
+        f = self.open_file(ad_file)
 
         f.write('------- AERODYN v15.03.* INPUT FILE ------------------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -942,15 +977,13 @@ class InputWriter_OpenFAST(InputWriter_Common):
                 f.write('"' + channel_list[i] + '"\n')
         f.write('END of input file (the word "END" must appear in the first 3 columns of this last OutList line)\n')
         f.write('---------------------------------------------------------------------------------------\n')
-        f.close()
+        self.fst_vt['Fst']['AeroFile'] = self.close_file(f, self.fst_vt['Fst']['AeroFile'])
 
     def write_AeroDyn15Blade(self):
         # AeroDyn v15.00 Blade
         self.fst_vt['AeroDyn15']['ADBlFile1'] = self.FAST_namingOut + '_AeroDyn15_blade.dat'
-        self.fst_vt['AeroDyn15']['ADBlFile2'] = self.fst_vt['AeroDyn15']['ADBlFile1']
-        self.fst_vt['AeroDyn15']['ADBlFile3'] = self.fst_vt['AeroDyn15']['ADBlFile1']
         filename = os.path.join(self.FAST_runDirectory, self.fst_vt['AeroDyn15']['ADBlFile1'])
-        f = open(filename, 'w')
+        f = self.open_file(filename)
 
         f.write('------- AERODYN v15.00.* BLADE DEFINITION INPUT FILE -------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -968,7 +1001,9 @@ class InputWriter_OpenFAST(InputWriter_Common):
         for Spn, CrvAC, SwpAC, CrvAng, Twist, Chord, AFID in zip(BlSpn, BlCrvAC, BlSwpAC, BlCrvAng, BlTwist, BlChord, BlAFID):
             f.write('{: 2.15e} {: 2.15e} {: 2.15e} {: 2.15e} {: 2.15e} {: 2.15e} {: 8d}\n'.format(Spn, CrvAC, SwpAC, CrvAng, Twist, Chord, int(AFID)))
         
-        f.close()
+        self.fst_vt['AeroDyn15']['ADBlFile1'] = self.close_file(f, self.fst_vt['AeroDyn15']['ADBlFile1'])
+        self.fst_vt['AeroDyn15']['ADBlFile2'] = self.fst_vt['AeroDyn15']['ADBlFile1']
+        self.fst_vt['AeroDyn15']['ADBlFile3'] = self.fst_vt['AeroDyn15']['ADBlFile1']
         
     def write_AeroDyn15Polar(self):
         # Airfoil Info v1.01
@@ -992,7 +1027,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
 
             self.fst_vt['AeroDyn15']['AFNames'][afi] = os.path.join('Airfoils', self.FAST_namingOut + '_AeroDyn15_Polar_%02d.dat'%afi)
             af_file = os.path.join(self.FAST_runDirectory, self.fst_vt['AeroDyn15']['AFNames'][afi])
-            f = open(af_file, 'w')
+            f = self.open_file(af_file)
 
             f.write('! ------------ AirfoilInfo v1.01.x Input File ----------------------------------\n')
             f.write('! AeroElasticSE FAST driver\n')
@@ -1069,7 +1104,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
             for row in polar:
                 f.write(' '.join(['{: 2.14e}'.format(val) for val in row])+'\n')
             
-            f.close()
+            self.fst_vt['AeroDyn15']['AFNames'][afi] = self.close_file(f, self.fst_vt['AeroDyn15']['AFNames'][afi])
             
     def write_AeroDyn15Coord(self):
 
@@ -1083,7 +1118,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
 
             self.fst_vt['AeroDyn15']['AFNames_coord'][afi] = os.path.join('Airfoils/AF%02d_Coords.txt'%afi)
             af_file = os.path.join(self.FAST_runDirectory, self.fst_vt['AeroDyn15']['AFNames_coord'][afi])
-            f = open(af_file, 'w')
+            f = self.open_file(af_file)
             
             f.write('{: 22d}   {:<11} {:}'.format(len(x)+1, 'NumCoords', '! The number of coordinates in the airfoil shape file (including an extra coordinate for airfoil reference).  Set to zero if coordinates not included.\n'))
             f.write('! ......... x-y coordinates are next if NumCoords > 0 .............\n')
@@ -1095,7 +1130,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
             f.write('!  x/c        y/c\n')
             for row in coord:
                 f.write(' '.join(['{: 2.14e}'.format(val) for val in row])+'\n')
-            f.close()
+            self.fst_vt['AeroDyn15']['AFNames_coord'][afi] = self.close_file(f, self.fst_vt['AeroDyn15']['AFNames_coord'][afi])
     
     
     def write_ServoDyn(self):
@@ -1103,7 +1138,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
 
         self.fst_vt['Fst']['ServoFile'] = self.FAST_namingOut + '_ServoDyn.dat'
         sd_file = os.path.join(self.FAST_runDirectory,self.fst_vt['Fst']['ServoFile'])
-        f = open(sd_file,'w')
+        f = self.open_file(sd_file)
 
         f.write('------- SERVODYN v1.05.* INPUT FILE --------------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -1213,7 +1248,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         f.write('END of input file (the word "END" must appear in the first 3 columns of this last OutList line)\n')
         f.write('---------------------------------------------------------------------------------------\n')
 
-        f.close()
+        self.fst_vt['Fst']['ServoFile'] = self.close_file(f, self.fst_vt['Fst']['ServoFile'])
 
     def write_DISCON_in(self):
 
@@ -1223,7 +1258,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         # self.fst_vt['ServoDyn']['DLL_InFile'] = self.FAST_namingOut + '_DISCON.IN'
         self.fst_vt['ServoDyn']['DLL_InFile'] = 'DISCON.IN'
         discon_in_file = os.path.join(self.FAST_runDirectory, self.fst_vt['ServoDyn']['DLL_InFile'])
-        f = open(discon_in_file, 'w')
+        f = self.open_file(discon_in_file)
 
         f.write('! Controller parameter input file\n')
         f.write('!    - File written using NREL Reference OpenSource Controller tuning logic on 11/01/19\n')
@@ -1328,14 +1363,14 @@ class InputWriter_OpenFAST(InputWriter_Common):
         f.write('\n!------- Floating -------------------------------------------\n')
         f.write('{:<22} {:<11} {:}'.format(self.fst_vt['DISCON_in']['Fl_Kp'], '! Fl_Kp', '- Nacelle velocity proportional feedback gain [s]\n'))
 
-        f.close()
+        self.fst_vt['ServoDyn']['DLL_InFile'] = self.close_file(f, self.fst_vt['ServoDyn']['DLL_InFile'])
 
     def write_HydroDyn(self):
 
         # Generate HydroDyn v2.03 input file
         self.fst_vt['Fst']['HydroFile'] = self.FAST_namingOut + '_HydroDyn.dat'
         hd_file = os.path.join(self.FAST_runDirectory, self.fst_vt['Fst']['HydroFile'])
-        f = open(hd_file, 'w')
+        f = self.open_file(hd_file)
 
         f.write('------- HydroDyn v2.03.* Input File --------------------------------------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -1585,13 +1620,13 @@ class InputWriter_OpenFAST(InputWriter_Common):
             
         f.write('END of output channels and end of file. (the word "END" must appear in the first 3 columns of this line)\n')
         
-        f.close()
+        self.fst_vt['Fst']['HydroFile'] = self.close_file(f, self.fst_vt['Fst']['HydroFile'])
 
     def write_SubDyn(self):
         # Generate SubDyn v1.1 input file
         self.fst_vt['Fst']['SubFile'] = self.FAST_namingOut + '_SubDyn.dat'
         sd_file = os.path.join(self.FAST_runDirectory, self.fst_vt['Fst']['SubFile'])
-        f = open(sd_file, 'w')
+        f = self.open_file(sd_file)
 
         f.write('----------- SubDyn v1.01.x MultiMember Support Structure Input File ------------\n')
         f.write('Generated with AeroElasticSE FAST driver\n')
@@ -1744,14 +1779,14 @@ class InputWriter_OpenFAST(InputWriter_Common):
             for i in range(len(channel_list)):
                 f.write('"' + channel_list[i] + '"\n')
         f.write('END of output channels and end of file. (the word "END" must appear in the first 3 columns of this line)\n')
-        f.close()
+        self.fst_vt['Fst']['SubFile'] = self.close_file(f, self.fst_vt['Fst']['SubFile'])
 
     def write_MAP(self):
 
         # Generate MAP++ input file
         self.fst_vt['Fst']['MooringFile'] = self.FAST_namingOut + '_MAP.dat'
         map_file = os.path.join(self.FAST_runDirectory, self.fst_vt['Fst']['MooringFile'])
-        f = open(map_file, 'w')
+        f = self.open_file(map_file)
 
         f.write('---------------------- LINE DICTIONARY ---------------------------------------\n')
         f.write(" ".join(['{:<11s}'.format(i) for i in ['LineType', 'Diam', 'MassDenInAir', 'EA', 'CB', 'CIntDamp', 'Ca', 'Cdn', 'Cdt']])+'\n')
@@ -1799,7 +1834,7 @@ class InputWriter_OpenFAST(InputWriter_Common):
         f.write('{:<11s}'.format('(-)')+'\n')
         f.write(" ".join(self.fst_vt['MAP']['Option']).strip() + '\n')
 
-        f.close()
+        self.fst_vt['Fst']['MooringFile'] = self.close_file(f, self.fst_vt['Fst']['MooringFile'])
 
         # f.write('{:<22} {:<11} {:}'.format(self.fst_vt['MAP'][''], '', '- \n'))
         # f.write('\n')
@@ -1,9 +1,9 @@
 import os, sys
-import numpy as np
 import multiprocessing as mp
 from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch
 from wisdem.aeroelasticse.Turbsim_mdao.pyturbsim_wrapper import pyTurbsim_wrapper
 from wisdem.aeroelasticse.CaseGen_General import CaseGen_General, save_case_matrix_direct
+from wisdem.commonse.mpi_tools import subprocessor_map
 
 from openmdao.core.mpi_wrap import MPI
 if MPI:
@@ -73,7 +73,6 @@ class runTS_pywrapper_batch(object):
         # size = comm.Get_size()
         rank = comm.Get_rank()
         sub_ranks = mpi_comm_map_down[rank]
-        size = len(sub_ranks)
 
         caseNfile = []
         for case_idx in range(len(self.case_list)):
@@ -81,28 +80,14 @@ class runTS_pywrapper_batch(object):
             case_name = self.case_name_list[case_idx]
             caseNfile.append([case,self.filedict, case_idx, case_name, self.overwrite])
 
-        N_cases = len(caseNfile)
-        N_loops = int(np.ceil(float(N_cases)/float(size)))
+        # cases are handed to the sub-ranks as they become free, longest wind (TMax) first
+        cost = [case.get('TMax', 0.) for case in self.case_list]
+        res = subprocessor_map(tseval, caseNfile, sub_ranks, cost=cost)
 
-        U_out = []
-        WindFile_out = []
-        WindFile_type_out = []
-        for i in range(N_loops):
-            idx_s    = i*size
-            idx_e    = min((i+1)*size, N_cases)
-
-            for j, var_vals in enumerate(caseNfile[idx_s:idx_e]):
-                data   = [tseval, var_vals]
-                rank_j = sub_ranks[j]
-                comm.send(data, dest=rank_j, tag=0)
-
-            for j, var_vals in enumerate(caseNfile[idx_s:idx_e]):
-                rank_j = sub_ranks[j]
-                data_out = comm.recv(source=rank_j, tag=1)
-
-                idx   = data_out[0]
-                fname = data_out[1]
-                self.case_list[idx]['tswind_file'] = fname
+        for r in res:
+            idx   = r[0]
+            fname = r[1]
+            self.case_list[idx]['tswind_file'] = fname
 
     # def run_mpi(self, comm=None):
     #     from mpi4py import MPI
@@ -6,26 +6,35 @@ Author: Evan Gaertner, National Renewable Energy Laboratory
 Inputs:
     FileName      - string: contains file name to open
     OutFileFmt    - int: (optional) 1=textfile, 2=binary
+    channels      - list: (optional) channel names to read, all channels by default. 'Time' is always returned
+    lazy          - bool: (optional) for binary files, return a FASTOutput that decodes channels on first access
 
 Outputs:
-    data          - dict: FAST output time series, output channel names as dict keys
+    data          - dict: FAST output time series, output channel names as dict keys (FASTOutput if lazy)
     meta          - dict: additional meta data from output file, keys include: 'units', 'DescStr', 'FileID'
 
 """
 import numpy as np
 import struct
 import os
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
-def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
+def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False, channels=None, lazy=False):
     
     if OutFileFmt == 2:
         path,fname = os.path.split(FileName)
         FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.outb')
-        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName)
+        if lazy:
+            data = FASTOutput(FileName, channels=channels)
+            return data, data.meta
+        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName, channels=channels)
     elif OutFileFmt == 1: 
         path,fname = os.path.split(FileName)
         FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.out')
-        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName)
+        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName, channels=channels)
     else:
         if Verbose:
             print('Attempting to read FAST output file: %s, format not specified'%FileName)
@@ -35,7 +44,12 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
                 print('Attempting binary read')
             path,fname = os.path.split(FileName)
             FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.outb')
-            Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName)
+            if lazy:
+                data = FASTOutput(FileName, channels=channels)
+                if Verbose:
+                    print('Success')
+                return data, data.meta
+            Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(FileName, channels=channels)
             if Verbose:
                 print('Success')
             error = False
@@ -49,7 +63,7 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
                     print('Attempting text read')
                 path,fname = os.path.split(FileName)
                 FileName = os.path.join(path, '.'.join(fname.split('.')[:-1])+'.out')
-                Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName)
+                Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTtext(FileName, channels=channels)
                 if Verbose:
                     print('Success')
                 error = False
@@ -71,107 +85,181 @@ def ReadFASToutFormat(FileName, OutFileFmt=0, Verbose=False):
 
     return data, meta
 
-def ReadFASTbinary(FileName):
+def ReadFASTbinaryHeader(data):
+    """ Parse the header of a binary FAST output file held in the buffer data (bytes or a uint8 memmap).
+    Returns the header quantities and the byte offset of the packed time series """
     LenName = 10    # number of characters per channel name
     LenUnit = 10    # number of characters per unit name
 
+    FileID, NumOutChans, NT, TimeA, TimeB = struct.unpack_from('=hiidd', data, 0)
+    i = struct.calcsize('=hiidd')
+    # FileID == 1: TimeA, TimeB are the time slopes and offsets for scaling, REAL(8)
+    # otherwise:   TimeA, TimeB are the first time and the time increment, REAL(8)
+
+    ColScl = np.frombuffer(data, dtype=np.float32, count=NumOutChans, offset=i).astype(np.float64)   # The channel slopes for scaling, REAL(4)
+    i += 4*NumOutChans
+    ColOff = np.frombuffer(data, dtype=np.float32, count=NumOutChans, offset=i).astype(np.float64)   # The channel offsets for scaling, REAL(4)
+    i += 4*NumOutChans
+
+    LenDesc = struct.unpack_from('i', data, i)[0]           # The number of characters in the description string, INT(4)
+    i += 4
+    DescStr = bytes(data[i:i+LenDesc]).decode("utf-8").strip()
+    i += LenDesc
+
+    ChanName = [bytes(data[i+k*LenName:i+(k+1)*LenName]).decode("utf-8").strip() for k in range(NumOutChans+1)]   # variable channel names
+    i += LenName*(NumOutChans+1)
+    ChanUnit = [bytes(data[i+k*LenUnit:i+(k+1)*LenUnit]).decode("utf-8").strip() for k in range(NumOutChans+1)]   # variable units
+    i += LenUnit*(NumOutChans+1)
+
+    return FileID, NumOutChans, NT, TimeA, TimeB, ColScl, ColOff, DescStr, ChanName, ChanUnit, i
+
+def ReadFASTbinary(FileName, channels=None):
+
     #----------------------------        
     # load file binary data
     #----------------------------
     f = open(FileName, 'rb')
     data = f.read()
     f.close()
-    i = 0           # data position pointer for binary unpacking
 
     #----------------------------        
     # get the header information
     #----------------------------
+    FileID, NumOutChans, NT, TimeA, TimeB, ColScl, ColOff, DescStr, ChanName, ChanUnit, i = ReadFASTbinaryHeader(data)
 
-    FileID = struct.unpack('h',data[i:i+2])[0]              # FAST output file format, INT(2)
-    i+=2
-    NumOutChans = struct.unpack('i',data[i:i+4])[0]         # The number of output channels, INT(4)
-    i+=4
-    NT = struct.unpack('i',data[i:i+4])[0]                  # The number of time steps, INT(4)
-    i+=4
-
-    if FileID == 1: # with time
-        TimeScl = struct.unpack('d',data[i:i+8])[0]         # The time slopes for scaling, REAL(8)
-        i+=8
-        TimeOff = struct.unpack('d',data[i:i+8])[0]         # The time offsets for scaling, REAL(8)
-        i+=8
-    else: # without time
-        TimeOut1 = struct.unpack('d',data[i:i+8])[0]        # The first time in the time series, REAL(8)
-        i+=8
-        TimeIncr = struct.unpack('d',data[i:i+8])[0]        # The time increment, REAL(8)
-        i+=8
-    
-    ColScl = [None]*NumOutChans
-    for idx in range(0,NumOutChans):
-        ColScl[idx] = struct.unpack('f',data[i:i+4])[0]     # The channel slopes for scaling, REAL(4)
-        i+=4
-
-    ColOff = [None]*NumOutChans
-    for idx in range(0,NumOutChans):
-        ColOff[idx] = struct.unpack('f',data[i:i+4])[0]     # The channel offsets for scaling, REAL(4)
-        i+=4
-
-    LenDesc = struct.unpack('i',data[i:i+4])[0]             # The number of characters in the description string, INT(4)
-    i+=4
-    try:
-        DescStr = ''.join(struct.unpack(str('c'*LenDesc),data[i:i+LenDesc]))     # DescStr converted to ASCII
-    except:
-        DescStr = data[i:i+LenDesc].decode("utf-8").strip()
-    i+=LenDesc
-
-    ChanName = [None]*(NumOutChans+1)
-    for idx in range(0,NumOutChans+1):
-        try:
-            ChanName[idx] = ''.join(''.join(struct.unpack('c'*LenName,data[i:i+LenName]))).strip()  # variable channel names
-        except:
-            ChanName[idx] = data[i:i+LenName].decode("utf-8").strip()
-        i+=LenName
-
-    ChanUnit = [None]*(NumOutChans+1)
-    for idx in range(0,NumOutChans+1):
-        try:
-            ChanUnit[idx] = ''.join(''.join(struct.unpack('c'*LenUnit,data[i:i+LenUnit]))).strip()  # variable units
-        except:
-            ChanUnit[idx] = data[i:i+LenUnit].decode("utf-8").strip()
-        i+=LenUnit
+    #-------------------------        
+    # select the channels to scale, column 0 (time) is always kept
+    #-------------------------
+    if channels is None:
+        idx = np.arange(NumOutChans)
+    else:
+        idx = np.array([ChanName.index(chan)-1 for chan in channels if chan in ChanName[1:]], dtype=int)
+    ChanName = [ChanName[0]] + [ChanName[k+1] for k in idx]
+    ChanUnit = [ChanUnit[0]] + [ChanUnit[k+1] for k in idx]
 
     #-------------------------        
     # get the channel time series
     #-------------------------
-    nPts = NT*NumOutChans                                       # number of data points in the file   
-
     if FileID == 1:
-        PackedTime = struct.unpack('i'*NT,data[i:i+4*NT])[0]    # read the time data
-        i+=4*NT
-    
-    PackedData = [None]*nPts
-    for idx in range(0,nPts):
-        PackedData[idx] = struct.unpack('h',data[i:i+2])[0]     # read the channel data
-        i+=2
+        PackedTime = np.frombuffer(data, dtype=np.int32, count=NT, offset=i)   # read the time data
+        i += 4*NT
+
+    PackedData = np.frombuffer(data, dtype=np.int16, count=NT*NumOutChans, offset=i).reshape(NT, NumOutChans)   # read the channel data
 
     #-------------------------
     # Scale the packed binary to real data
     #-------------------------
-    Channels = np.zeros((NT,NumOutChans+1))                     # output channels (including time in column 1)
-    for it in range(0,NT):
-        data_slice = PackedData[NumOutChans*(it):NumOutChans*(it+1)]
-        for idx, (datai, ColOffi, ColScli) in enumerate(zip(data_slice, ColOff, ColScl)):
-            Channels[it,idx+1] = (datai - ColOffi) / ColScli
+    Channels = np.empty((NT,len(idx)+1))                        # output channels (including time in column 1)
+    Channels[:,1:] = (PackedData[:,idx] - ColOff[idx]) / ColScl[idx]
 
     if FileID == 1:
-        for idx, (PackedTimei, TimeOffi, TimeScli) in enumerate(zip(PackedTime, TimeOff, TimeScl)):
-            Channels[idx,0] = (PackedTimei - TimeOffi) / TimeScli
+        Channels[:,0] = (PackedTime - TimeB) / TimeA
     else:
-        for idx in range(0,NT):
-            Channels[idx,0] = TimeOut1 + TimeIncr*idx
+        Channels[:,0] = TimeA + TimeB*np.arange(NT)
 
     return Channels, ChanName, ChanUnit, FileID, DescStr
 
-def ReadFASTtext(FileName):
+class FASTOutput(Mapping):
+    """
+    Read-only, dict-like access to the channels of a binary FAST output file.
+    The packed time series is memory mapped and a channel is only decoded and scaled when it is first
+    indexed, after which it is cached.  Pickling a FASTOutput only transfers the file name and header
+    (and the channels, after load()), the memory map is reopened on first access in the receiving process.
+
+    The channels that are not decoded yet are read from the output file, so a FASTOutput is only valid until
+    the file is overwritten or removed: by the next FAST run of the case, clean_FAST_directory or a run cache
+    hit.  Call load() to decode all channels beforehand to keep the data past that point.
+    """
+
+    def __init__(self, FileName, channels=None):
+        self.FileName = FileName
+        self._packed  = None
+        self._cache   = {}
+        self._loaded  = False
+
+        raw = np.memmap(FileName, dtype=np.uint8, mode='r')
+        FileID, NumOutChans, NT, TimeA, TimeB, ColScl, ColOff, DescStr, ChanName, ChanUnit, i = ReadFASTbinaryHeader(raw)
+        del raw
+
+        self.FileID      = FileID
+        self.NumOutChans = NumOutChans
+        self.NT          = NT
+        self._time       = (TimeA, TimeB)
+        self._ColScl     = ColScl
+        self._ColOff     = ColOff
+        self._offset     = i
+
+        # channel name -> column in the packed data, 0 is time
+        if channels is None:
+            self._index = dict((chan, k) for k, chan in enumerate(ChanName))
+        else:
+            self._index = dict([(ChanName[0], 0)] + [(chan, ChanName.index(chan)) for chan in channels if chan in ChanName[1:]])
+
+        self.meta = {}
+        self.meta['units']   = dict((chan, ChanUnit[k]) for chan, k in self._index.items())
+        self.meta['FileID']  = FileID
+        self.meta['DescStr'] = DescStr
+
+    def _packed_data(self):
+        # memory map the packed channel data (and packed time, if present)
+        if self._packed is None:
+            i = self._offset
+            if self.FileID == 1:
+                self._packed_time = np.memmap(self.FileName, dtype=np.int32, mode='r', offset=i, shape=(self.NT,))
+                i += 4*self.NT
+            self._packed = np.memmap(self.FileName, dtype=np.int16, mode='r', offset=i, shape=(self.NT, self.NumOutChans))
+        return self._packed
+
+    def __getitem__(self, chan):
+        if chan in self._cache:
+            return self._cache[chan]
+
+        k = self._index[chan]
+        PackedData = self._packed_data()
+        if k > 0:
+            val = (PackedData[:,k-1] - self._ColOff[k-1]) / self._ColScl[k-1]
+        elif self.FileID == 1:
+            val = (self._packed_time - self._time[1]) / self._time[0]
+        else:
+            val = self._time[0] + self._time[1]*np.arange(self.NT)
+
+        self._cache[chan] = val
+        return val
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, chan):
+        return chan in self._index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_packed'] = None
+        if not self._loaded:
+            state['_cache'] = {}
+        state.pop('_packed_time', None)
+        return state
+
+    def load(self):
+        """ Decode all channels and release the memory map, the data no longer depends on the file """
+        for chan in self._index:
+            self[chan]
+        self._loaded = True
+        self._packed = None
+        self.__dict__.pop('_packed_time', None)
+        return self
+
+    def clear_cache(self):
+        """ Drop the decoded channels and release the memory map """
+        self._cache  = {}
+        self._loaded = False
+        self._packed = None
+        self.__dict__.pop('_packed_time', None)
+
+def ReadFASTtext(FileName, channels=None):
 
     f = open(FileName, 'r')
 
@@ -187,7 +275,13 @@ def ReadFASTtext(FileName):
     DescStr = ' '.join(DescStr).strip()
     ChanName = ln.split()
     ChanUnit = f.readline().split()
-    Channels = np.loadtxt(f)
+    if channels is None:
+        Channels = np.loadtxt(f)
+    else:
+        idx = [0] + [ChanName.index(chan) for chan in channels if chan in ChanName[1:]]
+        ChanName = [ChanName[k] for k in idx]
+        ChanUnit = [ChanUnit[k] for k in idx]
+        Channels = np.loadtxt(f, usecols=idx, ndmin=2)
     f.close()
 
     return Channels, ChanName, ChanUnit, None, DescStr
@@ -5,16 +5,50 @@ programmatically with minimal additional dependencies.
 """
 # Hacky way of doing relative imports
 from __future__ import print_function
-import os, sys, time
+import os, sys, time, copy, uuid
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, as_completed
 # sys.path.insert(0, os.path.abspath(".."))
 
 from wisdem.aeroelasticse.FAST_reader import InputReader_Common, InputReader_OpenFAST, InputReader_FAST7
 from wisdem.aeroelasticse.FAST_writer import InputWriter_Common, InputWriter_OpenFAST, InputWriter_FAST7
 from wisdem.aeroelasticse.FAST_wrapper import FastWrapper
 from wisdem.aeroelasticse.FAST_post import return_timeseries
-
-import numpy as np
+from wisdem.commonse.mpi_tools import subprocessor_map
+
+
+# Base FAST model of the batch currently being run by this process, keyed by batch.  Set once per
+# worker process (multiprocessing) or sent with the first case received by each rank (MPI), so the
+# full fst_vt is not pickled with every case.
+_fst_vt_shared = {}
+
+def fst_vt_overlay(fst_vt):
+    """ Copy the nested dictionaries and lists of a fst_vt, sharing the leaf values (arrays, strings, numbers).
+    Case updates and the file names set by the writer then only modify the copy, while the base model and its
+    table data are left untouched and not duplicated. """
+    fst_vt_case = {}
+    for var, val in fst_vt.items():
+        if type(val) is dict:
+            fst_vt_case[var] = fst_vt_overlay(val)
+        elif type(val) is list:
+            fst_vt_case[var] = copy.copy(val)
+        else:
+            fst_vt_case[var] = val
+    return fst_vt_case
+
+def set_fst_vt_shared(fst_vt_key, fst_vt):
+    # store the base model of a batch for this process, replacing any previous batch
+    _fst_vt_shared.clear()
+    _fst_vt_shared[fst_vt_key] = fst_vt
+
+def get_fst_vt_shared(fst_vt):
+    # cases reference the shared base model as (key, None), or as (key, fst_vt) the first time a process receives it
+    if type(fst_vt) is tuple:
+        fst_vt_key, fst_vt_base = fst_vt
+        if fst_vt_base is not None:
+            set_fst_vt_shared(fst_vt_key, fst_vt_base)
+        return _fst_vt_shared[fst_vt_key]
+    return fst_vt
 
 class runFAST_pywrapper(object):
 
@@ -33,6 +67,8 @@ class runFAST_pywrapper(object):
         self.channels = {}              # dictionary of output channels to change
         self.debug_level   = 0
         self.dev_branch = False
+        self.shared_files = False       # write unchanged sub-files once per run directory, see InputWriter_Common.close_file
+        self.cache = None               # FASTRunCache of completed runs, see FAST_cache
 
         # Optional population class attributes from key word arguments
         for (k, w) in kwargs.items():
@@ -44,6 +80,23 @@ class runFAST_pywrapper(object):
         super(runFAST_pywrapper, self).__init__()
 
     def execute(self):
+        # Write the case inputs and run FAST
+        wrapper = self.write_inputs()
+        FAST_Output = os.path.join(wrapper.FAST_directory, wrapper.FAST_InputFile[:-3]+'outb')
+
+        # identical case already run, reuse its output
+        if self.cache and self.cache.get(self.cache_key, FAST_Output):
+            if self.debug_level > 0:
+                print('Cached FAST output: \t', FAST_Output)
+            return FAST_Output
+
+        if wrapper.execute() == 0 and self.cache:
+            self.cache.put(self.cache_key, FAST_Output)
+
+        return FAST_Output
+
+    def write_inputs(self):
+        # Write the FAST input files of the case, returns the FastWrapper set up to run them
         # FAST version specific initialization
         if self.FAST_ver.lower() == 'fast7':
             reader = InputReader_FAST7(FAST_ver=self.FAST_ver)
@@ -67,30 +120,32 @@ class runFAST_pywrapper(object):
             # Initialize writer variables with input model
             writer.fst_vt = reader.fst_vt
         else:
-            writer.fst_vt = self.fst_vt
+            # Apply the case on top of a shared base model, without modifying it
+            writer.fst_vt = fst_vt_overlay(self.fst_vt)
         writer.FAST_runDirectory = self.FAST_runDirectory
         writer.FAST_namingOut = self.FAST_namingOut
         writer.dev_branch = self.dev_branch
+        writer.shared_files = self.shared_files
         # Make any case specific variable changes
         if self.case:
             writer.update(fst_update=self.case)
         # Modify any specified output channels
         if self.channels:
             writer.update_outlist(self.channels)
+        # Identify the case by its inputs, before the writer sets the case file names
+        if self.cache:
+            self.cache_key = self.cache.key(writer.fst_vt, self.FAST_ver, self.FAST_exe, self.FAST_runDirectory)
         # Write out FAST model
         writer.execute()
         if self.write_yaml:
             writer.FAST_yamlfile = self.FAST_yamlfile_out
             writer.write_yaml()
 
-        # Run FAST
+        # FAST run set up
         wrapper.FAST_exe = self.FAST_exe
         wrapper.FAST_InputFile = os.path.split(writer.FAST_InputFileOut)[1]
         wrapper.FAST_directory = os.path.split(writer.FAST_InputFileOut)[0]
-        wrapper.execute()
-
-        FAST_Output = os.path.join(wrapper.FAST_directory, wrapper.FAST_InputFile[:-3]+'outb')
-        return FAST_Output
+        return wrapper
 
 class runFAST_pywrapper_batch(object):
 
@@ -103,6 +158,8 @@ class runFAST_pywrapper_batch(object):
         self.FAST_runDirectory  = None
         self.debug_level        = 0
         self.dev_branch         = False
+        self.shared_files       = False
+        self.cache              = None
 
         self.read_yaml          = False
         self.FAST_yamlfile_in   = ''
@@ -125,6 +182,27 @@ class runFAST_pywrapper_batch(object):
 
         super(runFAST_pywrapper_batch, self).__init__()
 
+    def read_model(self):
+        """ Parse the base FAST model once for the whole batch, each case is then written as an overlay on it """
+        if self.fst_vt != {}:
+            return self.fst_vt
+
+        if self.FAST_ver.lower() == 'fast7':
+            reader = InputReader_FAST7(FAST_ver=self.FAST_ver)
+        elif self.FAST_ver.lower() in ['fast8','openfast']:
+            reader = InputReader_OpenFAST(FAST_ver=self.FAST_ver)
+
+        if self.read_yaml:
+            reader.FAST_yamlfile = self.FAST_yamlfile_in
+            reader.read_yaml()
+        else:
+            reader.FAST_InputFile = self.FAST_InputFile
+            reader.FAST_directory = self.FAST_directory
+            reader.dev_branch = self.dev_branch
+            reader.execute()
+
+        # the reader populates a module level model dict, keep an independent copy
+        return copy.deepcopy(reader.fst_vt)
         
     def run_serial(self):
         # Run batch serially
@@ -132,9 +210,11 @@ class runFAST_pywrapper_batch(object):
         if not os.path.exists(self.FAST_runDirectory):
             os.makedirs(self.FAST_runDirectory)
 
+        fst_vt = self.read_model()
+
         out = [None]*len(self.case_list)
         for i, (case, case_name) in enumerate(zip(self.case_list, self.case_name_list)):
-            out[i] = eval(case, case_name, self.FAST_ver, self.FAST_exe, self.FAST_runDirectory, self.FAST_InputFile, self.FAST_directory, self.read_yaml, self.FAST_yamlfile_in, self.fst_vt, self.write_yaml, self.FAST_yamlfile_out, self.channels, self.debug_level, self.dev_branch, self.post)
+            out[i] = eval(case, case_name, self.FAST_ver, self.FAST_exe, self.FAST_runDirectory, self.FAST_InputFile, self.FAST_directory, self.read_yaml, self.FAST_yamlfile_in, fst_vt, self.write_yaml, self.FAST_yamlfile_out, self.channels, self.debug_level, self.dev_branch, self.post, self.shared_files, self.cache)
 
         return out
 
@@ -146,7 +226,10 @@ class runFAST_pywrapper_batch(object):
 
         if not cores:
             cores = mp.cpu_count()
-        pool = mp.Pool(cores)
+
+        # parse the model once, each worker receives it a single time when the pool starts
+        fst_vt_key = uuid.uuid4().hex
+        pool = mp.Pool(cores, initializer=set_fst_vt_shared, initargs=(fst_vt_key, self.read_model()))
 
         case_data_all = []
         for i in range(len(self.case_list)):
@@ -160,13 +243,15 @@ class runFAST_pywrapper_batch(object):
             case_data.append(self.FAST_directory)
             case_data.append(self.read_yaml)
             case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
+            case_data.append((fst_vt_key, None))
             case_data.append(self.write_yaml)
             case_data.append(self.FAST_yamlfile_out)
             case_data.append(self.channels)
             case_data.append(self.debug_level)
             case_data.append(self.dev_branch)
             case_data.append(self.post)
+            case_data.append(self.shared_files)
+            case_data.append(self.cache)
 
             case_data_all.append(case_data)
 
@@ -176,23 +261,69 @@ class runFAST_pywrapper_batch(object):
 
         return output
 
+    def run_threaded(self, cores=None):
+        # Run cases in parallel from threads of this process, see run_threaded_iter
+
+        output = [None]*len(self.case_list)
+        for i, out in self.run_threaded_iter(cores):
+            output[i] = out
+
+        return output
+
+    def run_threaded_iter(self, cores=None):
+        """ Run the cases keeping up to cores FAST processes running at once, and yield (case index, output)
+        in the order the runs finish.  Each case is written and its FAST process waited on by a worker thread
+        of this process, no Python interpreter is forked.  The post processing is done in the calling thread
+        as the results are consumed. """
+
+        if not os.path.exists(self.FAST_runDirectory):
+            os.makedirs(self.FAST_runDirectory)
+
+        if not cores:
+            cores = mp.cpu_count()
+
+        fst_vt = self.read_model()
+
+        executor = ThreadPoolExecutor(max_workers=cores)
+        try:
+            futures = {}
+            for i, (case, case_name) in enumerate(zip(self.case_list, self.case_name_list)):
+                future = executor.submit(eval_fast, case, case_name, self.FAST_ver, self.FAST_exe, self.FAST_runDirectory, self.FAST_InputFile, self.FAST_directory, self.read_yaml, self.FAST_yamlfile_in, fst_vt, self.write_yaml, self.FAST_yamlfile_out, self.channels, self.debug_level, self.dev_branch, self.shared_files, self.cache)
+                futures[future] = i
+
+            for future in as_completed(futures):
+                FAST_Output = future.result()
+                if self.post:
+                    out = self.post(FAST_Output)
+                else:
+                    out = []
+                yield futures[future], out
+        finally:
+            # if the consumer stops early, cases that have not started are dropped
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def run_mpi(self, mpi_comm_map_down):
-        # Run in parallel with mpi
+        # Run in parallel with mpi, cases are handed to the sub-ranks of this rank as they become free,
+        # longest simulation (TMax) first
         from mpi4py import MPI
 
         # mpi comm management
         comm = MPI.COMM_WORLD
         rank = comm.Get_rank()
         sub_ranks = mpi_comm_map_down[rank]
-        size = len(sub_ranks)
 
         N_cases = len(self.case_list)
-        N_loops = int(np.ceil(float(N_cases)/float(size)))
         
         # file management
         if not os.path.exists(self.FAST_runDirectory) and rank == 0:
             os.makedirs(self.FAST_runDirectory)
 
+        # parse the model once, it is sent to each sub-rank with the first case that rank receives
+        fst_vt = self.read_model()
+        fst_vt_key = uuid.uuid4().hex
+
         case_data_all = []
         for i in range(N_cases):
             case_data = []
@@ -205,33 +336,26 @@ class runFAST_pywrapper_batch(object):
             case_data.append(self.FAST_directory)
             case_data.append(self.read_yaml)
             case_data.append(self.FAST_yamlfile_in)
-            case_data.append(self.fst_vt)
+            case_data.append((fst_vt_key, None))
             case_data.append(self.write_yaml)
             case_data.append(self.FAST_yamlfile_out)
             case_data.append(self.channels)
             case_data.append(self.debug_level)
             case_data.append(self.dev_branch)
             case_data.append(self.post)
+            case_data.append(self.shared_files)
+            case_data.append(self.cache)
 
             case_data_all.append(case_data)
 
-        output = []
-        for i in range(N_loops):
-            idx_s    = i*size
-            idx_e    = min((i+1)*size, N_cases)
+        def with_model(case_data):
+            case_data = copy.copy(case_data)
+            case_data[9] = (fst_vt_key, fst_vt)
+            return case_data
 
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
-                data   = [eval_multi, case_data]
-                rank_j = sub_ranks[j]
-                comm.send(data, dest=rank_j, tag=0)
+        cost = [case.get(('Fst','TMax'), fst_vt['Fst']['TMax']) for case in self.case_list]
 
-            # for rank_j in sub_ranks:
-            for j, case_data in enumerate(case_data_all[idx_s:idx_e]):
-                rank_j = sub_ranks[j]
-                data_out = comm.recv(source=rank_j, tag=1)
-                output.append(data_out)
-
-        return output
+        return subprocessor_map(eval_multi, case_data_all, sub_ranks, cost=cost, args_first=with_model)
 
 
     # def run_mpi(self, comm=None):
@@ -319,19 +443,34 @@ class runFAST_pywrapper_batch(object):
 
 
 
-def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post):
+def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, post, shared_files=False, cache=None):
     # Batch FAST pyWrapper call, as a function outside the runFAST_pywrapper_batch class for pickle-ablility
 
+    FAST_Output = eval_fast(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, shared_files, cache)
+
+    # Post process
+    if post:
+        out = post(FAST_Output)
+    else:
+        out = []
+
+    return out
+
+def eval_fast(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile, FAST_directory, read_yaml, FAST_yamlfile_in, fst_vt, write_yaml, FAST_yamlfile_out, channels, debug_level, dev_branch, shared_files=False, cache=None):
+    # Write and run one case of a batch, returns the FAST output file name without post processing
+
     fast = runFAST_pywrapper(FAST_ver=FAST_ver)
     fast.FAST_exe           = FAST_exe
     fast.FAST_InputFile     = FAST_InputFile
     fast.FAST_directory     = FAST_directory
     fast.FAST_runDirectory  = FAST_runDirectory
     fast.dev_branch         = dev_branch
+    fast.shared_files       = shared_files
+    fast.cache              = cache
 
     fast.read_yaml          = read_yaml
     fast.FAST_yamlfile_in   = FAST_yamlfile_in
-    fast.fst_vt             = fst_vt
+    fast.fst_vt             = get_fst_vt_shared(fst_vt)
     fast.write_yaml         = write_yaml
     fast.FAST_yamlfile_out  = FAST_yamlfile_out
 
@@ -340,20 +479,12 @@ def eval(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, FAST_InputFile,
     fast.channels           = channels
     fast.debug_level        = debug_level
 
-    FAST_Output = fast.execute()
-
-    # Post process
-    if post:
-        out = post(FAST_Output)
-    else:
-        out = []
-
-    return out
+    return fast.execute()
 
 def eval_multi(data):
     # helper function for running with multiprocessing.Pool.map
     # converts list of arguement values to arguments
-    return eval(data[0], data[1], data[2], data[3], data[4], data[5], data[6], data[7], data[8], data[9], data[10], data[11], data[12], data[13], data[14], data[15])
+    return eval(*data)
 
 def example_runFAST_pywrapper_batch():
     """ 
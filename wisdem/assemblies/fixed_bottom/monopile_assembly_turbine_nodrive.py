@@ -2,7 +2,7 @@
 from __future__ import print_function
 import numpy as np
 from pprint import pprint
-from openmdao.api import IndepVarComp, ExplicitComponent, Group, Problem, ScipyOptimizeDriver, SqliteRecorder, NonlinearRunOnce, DirectSolver
+from openmdao.api import IndepVarComp, ExplicitComponent, Group, Problem, SqliteRecorder, NonlinearRunOnce, DirectSolver
 try:
     from openmdao.api import pyOptSparseDriver
 except:
@@ -18,6 +18,7 @@ from wisdem.plant_financese.plant_finance import PlantFinance
 from wisdem.drivetrainse.rna  import RNA
 
 from wisdem.commonse.mpi_tools import MPI
+from wisdem.commonse.parallel_fd import ScipyOptimizeDriverParallelFD
 
 # np.seterr(all ='raise')
         
@@ -335,18 +336,17 @@ if __name__ == "__main__":
 
     
     # Initialize OpenMDAO problem and FloatingSE Group
+    # Under MPI every rank holds its own copy of the model and the finite difference gradient
+    # is spread over the ranks, otherwise over local processes (see commonse.parallel_fd)
     if MPI:
-        num_par_fd = MPI.COMM_WORLD.Get_size()
-        prob = Problem(model=Group(num_par_fd=num_par_fd))
-        prob.model.approx_totals(method='fd')
-        prob.model.add_subsystem('comp', LandBasedTurbine(RefBlade=blade, Nsection_Tow = Nsection_Tow, VerbosityCosts = True), promotes=['*'])
+        prob = Problem(comm=MPI.COMM_SELF)
     else:
         prob = Problem()
-        prob.model=LandBasedTurbine(RefBlade=blade, Nsection_Tow = Nsection_Tow, VerbosityCosts = True)
+    prob.model=LandBasedTurbine(RefBlade=blade, Nsection_Tow = Nsection_Tow, VerbosityCosts = True)
     
     if optFlag:
         # --- Solver ---
-        prob.driver  = ScipyOptimizeDriver()
+        prob.driver  = ScipyOptimizeDriverParallelFD()
         prob.driver.options['optimizer'] = 'SLSQP'
         prob.driver.options['tol']       = 1.e-6
         prob.driver.options['maxiter']   = 100
@@ -407,8 +407,7 @@ if __name__ == "__main__":
     prob.model.nonlinear_solver = NonlinearRunOnce()
     prob.model.linear_solver = DirectSolver()
 
-    if not MPI:
-        prob.model.approx_totals()
+    prob.model.approx_totals()
 
     # prob.run_model()
     # prob.model.list_inputs(units=True)
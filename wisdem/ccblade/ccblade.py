@@ -26,6 +26,8 @@ from math import pi, radians, sin, cos, isnan
 from scipy.optimize import brentq
 from scipy.interpolate import RectBivariateSpline, bisplev
 import warnings
+import hashlib
+from collections import OrderedDict
 
 from wisdem.airfoilprep import Airfoil
 import wisdem.ccblade._bem as _bem
@@ -41,6 +43,9 @@ class CCAirfoil(object):
     """A helper class to evaluate airfoil data using a continuously
     differentiable cubic spline"""
 
+    # airfoils built by CCAirfoil.cached, keyed on the polar data, least recently used first
+    _cache = OrderedDict()
+    cache_size = 256
 
     def __init__(self, alpha, Re, cl, cd, cm=[]):
         """Setup CCAirfoil from raw airfoil data on a grid.
@@ -89,6 +94,48 @@ class CCAirfoil(object):
         if self.use_cm > 0:
             self.cm_spline = RectBivariateSpline(alpha, Re, cm, kx=kx, ky=ky, s=0.0001)
 
+        # knots, coefficients and degrees of the splines, built once for the derivative evaluations
+        self.tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
+        self.tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
+
+
+    @classmethod
+    def cached(cls, alpha, Re, cl, cd, cm=[]):
+        """Same as the constructor, but returns a shared instance if one was already built
+        from identical polar data, so unchanged airfoils are not re-fitted on every call.
+        The most recently used ``CCAirfoil.cache_size`` airfoils are kept.
+        Parameters
+        ----------
+        see constructor
+        Returns
+        -------
+        af : CCAirfoil
+            a constructed (or previously constructed) CCAirfoil object
+        """
+
+        h = hashlib.sha1()
+        for v in (alpha, Re, cl, cd, cm):
+            v = np.ascontiguousarray(v, dtype=np.float64)
+            h.update(str(v.shape).encode())
+            h.update(v.tobytes())
+        key = h.hexdigest()
+
+        af = cls._cache.pop(key, None)
+        if af is None:
+            af = cls(alpha, Re, cl, cd, cm=cm)
+        cls._cache[key] = af
+
+        while len(cls._cache) > cls.cache_size:
+            cls._cache.popitem(last=False)
+
+        return af
+
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all airfoils built by CCAirfoil.cached"""
+        cls._cache.clear()
+
 
     @classmethod
     def initFromAerodynFile(cls, aerodynFile):
@@ -208,11 +255,64 @@ class CCAirfoil(object):
             return cl, cd
 
 
+    def evaluate_vectorized(self, alpha, Re, return_cm=False, return_derivatives=False):
+        """Get lift/drag (and moment) coefficients, and optionally their derivatives, at arrays of
+        angles of attack and Reynolds numbers.  Points are evaluated pairwise, one call per spline.
+        Parameters
+        ----------
+        alpha : array_like (rad)
+            angles of attack
+        Re : array_like
+            Reynolds numbers, broadcast against alpha
+        return_cm : bool, optional
+            if True (and the airfoil has moment data), also return the moment coefficient
+        return_derivatives : bool, optional
+            if True, also return the derivatives of lift and drag
+        Returns
+        -------
+        cl, cd : ndarray
+            lift and drag coefficients
+        cm : ndarray (present if return_cm and the airfoil has moment data)
+            moment coefficient
+        dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe : ndarray (present if return_derivatives)
+            derivatives of lift and drag coefficients, same conventions as :meth:`derivatives`
+        """
+
+        alpha, Re = np.broadcast_arrays(np.asarray(alpha, dtype=float), np.asarray(Re, dtype=float))
+        shape = alpha.shape
+        alpha = alpha.ravel()
+        Re = Re.ravel()
+
+        out = [self.cl_spline.ev(alpha, Re), self.cd_spline.ev(alpha, Re)]
+
+        if self.use_cm and return_cm:
+            out.append(self.cm_spline.ev(alpha, Re))
+
+        if return_derivatives:
+            dcl_dalpha = self.cl_spline.ev(alpha, Re, dx=1, dy=0)
+            dcd_dalpha = self.cd_spline.ev(alpha, Re, dx=1, dy=0)
+
+            if self.one_Re:
+                dcl_dRe = np.zeros_like(alpha)
+                dcd_dRe = np.zeros_like(alpha)
+            else:
+                try:
+                    dcl_dRe = self.cl_spline.ev(alpha, Re, dx=0, dy=1)
+                    dcd_dRe = self.cd_spline.ev(alpha, Re, dx=0, dy=1)
+                except:
+                    dcl_dRe = np.zeros_like(alpha)
+                    dcd_dRe = np.zeros_like(alpha)
+
+            out += [dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe]
+
+        return tuple(v.reshape(shape) for v in out)
+
+
     def derivatives(self, alpha, Re):
 
         # note: direct call to bisplev will be unnecessary with latest scipy update (add derivative method)
-        tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
-        tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
+        tck_cl = self.tck_cl
+        tck_cd = self.tck_cd
 
         dcl_dalpha = bisplev(alpha, Re, tck_cl, dx=1, dy=0)
         dcd_dalpha = bisplev(alpha, Re, tck_cd, dx=1, dy=0)
@@ -390,6 +490,177 @@ class CCAirfoil(object):
 
         # plt.show()
 
+# ------------------
+#  Vectorized BEM
+# ------------------
+
+
+def brentq_vectorized(f, xa, xb, xtol=2e-12, rtol=4*np.finfo(float).eps, maxiter=100):
+    """Brent's method applied to many independent scalar problems at once.
+    Follows the iteration of scipy.optimize.brentq (same defaults), so each root matches
+    the scalar solve, but every step is taken for all unconverged problems together.
+    Parameters
+    ----------
+    f : callable
+        f(x, idx) returns the residuals of problems idx evaluated at x (arrays of the same size)
+    xa, xb : array_like
+        bracket of each problem
+    Returns
+    -------
+    x : ndarray
+        roots, 0.0 where the residual has the same sign at both ends of the bracket
+    valid : ndarray(bool)
+        False where the bracket did not contain a sign change
+    """
+
+    xpre = np.array(xa, dtype=float)
+    xcur = np.array(xb, dtype=float)
+    idx  = np.arange(xpre.size)
+    x    = np.zeros(xpre.size)
+
+    fpre = f(xpre, idx)
+    fcur = f(xcur, idx)
+
+    x[fcur == 0] = xcur[fcur == 0]
+    x[fpre == 0] = xpre[fpre == 0]
+    valid  = (fpre == 0) | (fcur == 0) | (np.signbit(fpre) != np.signbit(fcur))
+    active = valid & (fpre != 0) & (fcur != 0)
+
+    idx  = idx[active]
+    xpre = xpre[active]
+    xcur = xcur[active]
+    fpre = fpre[active]
+    fcur = fcur[active]
+    xblk = np.zeros_like(xpre)
+    fblk = np.zeros_like(xpre)
+    spre = np.zeros_like(xpre)
+    scur = np.zeros_like(xpre)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(maxiter):
+
+            # new bracket where the sign changed over the last step
+            flip = (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(flip, xpre, xblk)
+            fblk = np.where(flip, fpre, fblk)
+            spre = np.where(flip, xcur - xpre, spre)
+            scur = np.where(flip, xcur - xpre, scur)
+
+            # keep the best estimate in xcur
+            swap = np.abs(fblk) < np.abs(fcur)
+            xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+            fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+            delta = (xtol + rtol*np.abs(xcur))/2
+            sbis  = (xblk - xcur)/2
+
+            done = (fcur == 0) | (np.abs(sbis) < delta)
+            if np.any(done):
+                x[idx[done]] = xcur[done]
+                keep = ~done
+                idx, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, delta, sbis = [v[keep] for v in
+                    (idx, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, delta, sbis)]
+            if idx.size == 0:
+                break
+
+            # interpolate (secant) or extrapolate (inverse quadratic)
+            stry_int = -fcur*(xcur - xpre)/(fcur - fpre)
+            dpre = (fpre - fcur)/(xpre - xcur)
+            dblk = (fblk - fcur)/(xblk - xcur)
+            stry_ext = -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre))
+            stry = np.where(xpre == xblk, stry_int, stry_ext)
+
+            # accept a short step, otherwise bisect
+            good = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre)) & \
+                (2*np.abs(stry) < np.minimum(np.abs(spre), 3*np.abs(sbis) - delta))
+            spre = np.where(good, scur, sbis)
+            scur = np.where(good, stry, sbis)
+
+            xpre = xcur
+            fpre = fcur
+            xcur = xcur + np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            fcur = f(xcur, idx)
+
+    x[idx] = xcur
+
+    return x, valid
+
+
+def _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, rho, mu):
+    """array version of _bem.relativewind"""
+
+    alpha = phi - (theta + pitch)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W = np.where(np.abs(a) > 10, Vy*(1+ap)/np.cos(phi),
+            np.where(np.abs(ap) > 10, Vx*(1-a)/np.sin(phi), np.sqrt((Vx*(1-a))**2 + (Vy*(1+ap))**2)))
+
+    Re = rho * W * chord / mu
+
+    return alpha, W, Re
+
+
+def _inductionfactors(r, chord, Rhub, Rtip, phi, cl, cd, B, Vx, Vy,
+                      usecd=True, hubloss=True, tiploss=True, wakerotation=True):
+    """array version of _bem.inductionfactors"""
+
+    sigma_p = B/2.0/pi*chord/r
+    sphi = np.sin(phi)
+    cphi = np.cos(phi)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+
+        # resolve into normal and tangential forces
+        if not usecd:
+            cn = cl*cphi
+            ct = cl*sphi
+        else:
+            cn = cl*cphi + cd*sphi
+            ct = cl*sphi - cd*cphi
+
+        # Prandtl's tip and hub loss factor
+        Ftip = 1.0
+        if tiploss:
+            factortip = B/2.0*(Rtip - r)/(r*sphi)
+            Ftip = 2.0/pi*np.arccos(np.exp(-factortip))
+
+        Fhub = 1.0
+        if hubloss:
+            factorhub = B/2.0*(r - Rhub)/(Rhub*sphi)
+            Fhub = 2.0/pi*np.arccos(np.exp(-factorhub))
+
+        F = Ftip * Fhub
+
+        # bem parameters
+        k = sigma_p*cn/4.0/F/sphi/sphi
+        kp = sigma_p*ct/4.0/F/sphi/cphi
+
+        # axial induction factor, momentum state or Glauert(Buhl) correction
+        g1 = 2.0*F*k - (10.0/9-F)
+        g2 = 2.0*F*k - (4.0/3-F)*F
+        g3 = 2.0*F*k - (25.0/9-2*F)
+        a_glauert = np.where(np.abs(g3) < 1e-6, 1.0 - 1.0/2.0/np.sqrt(g2), (g1 - np.sqrt(g2)) / g3)
+        a_momentum = np.where(k <= 2.0/3.0, k/(1+k), a_glauert)
+
+        # propeller brake region (a not directly used but update anyway)
+        a_brake = np.where(k > 1, k/(k-1), 0.0)
+
+        a = np.where(phi > 0, a_momentum, a_brake)
+
+        # tangential induction factor
+        ap = kp/(1-kp)
+
+        if not wakerotation:
+            ap = np.zeros_like(kp)
+            kp = np.zeros_like(kp)
+
+        # error function
+        lambda_r = Vy/Vx
+        fzero = np.where(phi > 0, sphi/(1-a) - cphi/lambda_r*(1-kp), sphi*(1-k) - cphi/lambda_r*(1-kp))
+
+    return fzero, a, ap
+
+
 # ------------------
 #  Main Class: CCBlade
 # ------------------
@@ -400,7 +671,8 @@ class CCBlade(object):
     def __init__(self, r, chord, theta, af, Rhub, Rtip, B=3, rho=1.225, mu=1.81206e-5,
                  precone=0.0, tilt=0.0, yaw=0.0, shearExp=0.2, hubHt=80.0,
                  nSector=8, precurve=None, precurveTip=0.0, presweep=None, presweepTip=0.0,
-                 tiploss=True, hubloss=True, wakerotation=True, usecd=True, iterRe=1, derivatives=False):
+                 tiploss=True, hubloss=True, wakerotation=True, usecd=True, iterRe=1, derivatives=False,
+                 vectorized=False):
         """Constructor for aerodynamic rotor analysis
         Parameters
         ----------
@@ -462,6 +734,11 @@ class CCBlade(object):
             should not be necessary.  Gradients have only been implemented for the case iterRe=1.
         derivatives : boolean, optional
             if True, derivatives along with function values will be returned for the various methods
+        vectorized : boolean, optional
+            if True, the BEM residual is solved for all stations, azimuthal sectors and operating
+            conditions together (see :func:`brentq_vectorized`) rather than one station at a time.
+            Results match the default path to solver tolerance.  Not used with derivatives or the
+            inverse analysis, which always take the default path.
         """
 
         self.r = np.array(r)
@@ -481,6 +758,7 @@ class CCBlade(object):
         self.bemoptions = dict(usecd=usecd, tiploss=tiploss, hubloss=hubloss, wakerotation=wakerotation)
         self.iterRe = iterRe
         self.derivatives = derivatives
+        self.vectorized = vectorized
         
         
         # check if no precurve / presweep
@@ -681,6 +959,138 @@ class CCBlade(object):
 
 
 
+    def __airfoilsEvaluate(self, af_idx, alpha, Re):
+        """lift and drag coefficients of sections using airfoils self._af_unique[af_idx]"""
+
+        cl = np.zeros_like(alpha)
+        cd = np.zeros_like(alpha)
+        for k, af in enumerate(self._af_unique):
+            m = af_idx == k
+            if np.any(m):
+                cl[m], cd[m] = af.evaluate_vectorized(alpha[m], Re[m])
+
+        return cl, cd
+
+
+    def __runBEM_vectorized(self, phi, r, chord, theta, af_idx, Vx, Vy, pitch):
+        """residual of BEM method and induction factors for arrays of sections"""
+
+        a = np.zeros_like(phi)
+        ap = np.zeros_like(phi)
+        for i in range(self.iterRe):
+
+            alpha, W, Re = _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, self.rho, self.mu)
+            cl, cd = self.__airfoilsEvaluate(af_idx, alpha, Re)
+
+            fzero, a, ap = _inductionfactors(r, chord, self.Rhub, self.Rtip, phi,
+                                             cl, cd, self.B, Vx, Vy, **self.bemoptions)
+
+        return fzero, a, ap
+
+
+    def __distributedAeroLoadsVectorized(self, Uinf, Omega, pitch, azimuth):
+        """a, ap, Np, Tp, alpha (deg), cl, cd at all stations for arrays of operating conditions
+        (Uinf, Omega, pitch, azimuth (deg)) of the same length.  Outputs have shape (len(Uinf), len(r))"""
+
+        Uinf, Omega, pitch, azimuth = np.broadcast_arrays(np.array(Uinf, dtype=float).flatten(),
+            np.array(Omega, dtype=float).flatten(), np.array(pitch, dtype=float).flatten(),
+            np.array(azimuth, dtype=float).flatten())
+
+        npts = len(Uinf)
+        n = len(self.r)
+        shape = (npts, n)
+
+        # component of velocity at each radial station
+        Vx = np.zeros(shape)
+        Vy = np.zeros(shape)
+        for i in range(npts):
+            Vx[i, :], Vy[i, :] = _bem.windcomponents(self.r, self.precurve, self.presweep,
+                self.precone, self.yaw, self.tilt, radians(azimuth[i]), Uinf[i], Omega[i], self.hubHt, self.shearExp)
+
+        # group stations sharing the same airfoil object
+        self._af_unique = []
+        af_idx = np.zeros(n, dtype=int)
+        for i, af in enumerate(self.af):
+            for k, afk in enumerate(self._af_unique):
+                if af is afk:
+                    af_idx[i] = k
+                    break
+            else:
+                af_idx[i] = len(self._af_unique)
+                self._af_unique.append(af)
+
+        # flatten all sections
+        r = np.broadcast_to(self.r, shape).ravel()
+        chord = np.broadcast_to(self.chord, shape).ravel()
+        theta = np.broadcast_to(self.theta, shape).ravel()
+        af_idx = np.broadcast_to(af_idx, shape).ravel()
+        pitch = np.broadcast_to(np.array([radians(p) for p in pitch])[:, np.newaxis], shape).ravel()
+        rotating = np.broadcast_to((Omega != 0)[:, np.newaxis], shape).ravel()
+        Vx = Vx.ravel()
+        Vy = Vy.ravel()
+
+        def errf(phi, idx):
+            return self.__runBEM_vectorized(phi, r[idx], chord[idx], theta[idx], af_idx[idx], Vx[idx], Vy[idx], pitch[idx])[0]
+
+        # ------ BEM solution method see (Ning, doi:10.1002/we.1636) ------
+        phi = pi/2.0*np.ones(r.size)  # non-rotating
+        rot = np.nonzero(rotating)[0]
+
+        if rot.size > 0:
+
+            # set standard limits
+            epsilon = 1e-6
+            phi_lower = epsilon*np.ones(rot.size)
+            phi_upper = pi/2*np.ones(rot.size)
+
+            swap = errf(phi_lower, rot)*errf(phi_upper, rot) > 0  # an uncommon but possible case
+            if np.any(swap):
+                idx = rot[swap]
+                ones = np.ones(idx.size)
+                brake = (errf(-pi/4*ones, idx) < 0) & (errf(-epsilon*ones, idx) > 0)
+                phi_lower[swap] = np.where(brake, -pi/4, pi/2)
+                phi_upper[swap] = np.where(brake, -epsilon, pi - epsilon)
+
+            phi[rot], valid = brentq_vectorized(lambda x, k: errf(x, rot[k]), phi_lower, phi_upper)
+
+            if not np.all(valid):
+                warnings.warn('error.  check input values.')
+
+        # ----------------------------------------------------------------
+
+        # loads
+        a = np.zeros(r.size)
+        ap = np.zeros(r.size)
+        if rot.size > 0:
+            _, a[rot], ap[rot] = self.__runBEM_vectorized(phi[rot], r[rot], chord[rot], theta[rot], af_idx[rot],
+                                                          Vx[rot], Vy[rot], pitch[rot])
+
+        alpha_rad, W, Re = _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, self.rho, self.mu)
+        cl, cd = self.__airfoilsEvaluate(af_idx, alpha_rad, Re)
+
+        cphi = np.cos(phi)
+        sphi = np.sin(phi)
+        cn = cl*cphi + cd*sphi  # these expressions should always contain drag
+        ct = cl*sphi - cd*cphi
+
+        q = 0.5*self.rho*W**2
+        Np = cn*q*chord
+        Tp = ct*q*chord
+
+        alpha_deg = alpha_rad * 180. / np.pi
+
+        failed = np.isnan(Np)
+        a[failed] = 0.
+        ap[failed] = 0.
+        Np[failed] = 0.
+        Tp[failed] = 0.
+        alpha_deg[failed] = 0.
+
+        return [v.reshape(shape) for v in (a, ap, Np, Tp, alpha_deg, cl, cd)]
+
+
+
+
     def __windComponents(self, Uinf, Omega, azimuth):
         """x, y components of wind in blade-aligned coordinate system"""
 
@@ -751,6 +1161,18 @@ class CCBlade(object):
         """
 
         self.pitch = radians(pitch)
+
+        if self.vectorized and not self.derivatives and not self.inverse_analysis:
+            a, ap, Np, Tp, alpha, cl, cd = [v[0] for v in
+                self.__distributedAeroLoadsVectorized([Uinf], [Omega], [pitch], [azimuth])]
+
+            if self.induction:
+                return a, ap, Np, Tp
+            elif self.induction_inflow:
+                return a, ap, alpha, cl, cd
+            else:
+                return Np, Tp
+
         azimuth = radians(azimuth)
 
         # component of velocity at each radial station
@@ -948,6 +1370,52 @@ class CCBlade(object):
 
 
 
+    def distributedAeroLoadsMulti(self, Uinf, Omega, pitch, azimuth):
+        """Compute distributed aerodynamic loads along blade for several operating conditions.
+        Parameters
+        ----------
+        Uinf : array_like (m/s)
+            hub height wind speed of each condition
+        Omega : array_like (RPM)
+            rotor rotation speed of each condition
+        pitch : array_like (deg)
+            blade pitch of each condition
+        azimuth : array_like (deg)
+            azimuth angle of each condition
+        Returns
+        -------
+        Np : ndarray (N/m)
+            force per unit length normal to the section on downwind side, shape (len(Uinf), len(r))
+        Tp : ndarray (N/m)
+            force per unit length tangential to the section in the direction of rotation, shape (len(Uinf), len(r))
+        Notes
+        -----
+        With ``vectorized=True`` (and no derivatives) all conditions are solved together,
+        otherwise :meth:`distributedAeroLoads` is called for each condition.
+        """
+
+        Uinf, Omega, pitch, azimuth = np.broadcast_arrays(np.array(Uinf, dtype=float).flatten(),
+            np.array(Omega, dtype=float).flatten(), np.array(pitch, dtype=float).flatten(),
+            np.array(azimuth, dtype=float).flatten())
+
+        if self.vectorized and not self.derivatives and not self.inverse_analysis:
+            _, _, Np, Tp, _, _, _ = self.__distributedAeroLoadsVectorized(Uinf, Omega, pitch, azimuth)
+            return Np, Tp
+
+        npts = len(Uinf)
+        Np = np.zeros((npts, len(self.r)))
+        Tp = np.zeros((npts, len(self.r)))
+        for i in range(npts):
+            loads = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth[i])
+            if self.induction:
+                Np[i], Tp[i] = loads[2], loads[3]
+            else:
+                Np[i], Tp[i] = loads[0], loads[1]
+
+        return Np, Tp
+
+
+
 
     def evaluate(self, Uinf, Omega, pitch, coefficients=False):
         """Run the aerodynamic analysis at the specified conditions.
@@ -1014,39 +1482,60 @@ class CCBlade(object):
             dT_dv = np.zeros((npts, 5, len(self.r)))
             dQ_dv = np.zeros((npts, 5, len(self.r)))
 
-        for i in range(npts):  # iterate across conditions
+        if self.vectorized and not self.derivatives and not self.inverse_analysis:
 
-            for j in range(nsec):  # integrate across azimuth
-                azimuth = 360.0*float(j)/nsec
+            # all conditions and azimuthal locations at once
+            azimuth = 360.0*np.arange(nsec)/nsec
+            a, ap, Np, Tp, _, _, _ = [v.reshape(npts, nsec, -1) for v in self.__distributedAeroLoadsVectorized(
+                np.repeat(Uinf, nsec), np.repeat(Omega, nsec), np.repeat(pitch, nsec), np.tile(azimuth, npts))]
 
-                if not self.derivatives:
-                    # contribution from this azimuthal location
-                    if self.induction:
-                        a, ap, Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
-                        # Induction
-                        self.a  = a
-                        self.ap = ap
-                    else:
-                        Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+            if self.induction:
+                self.a  = a[-1, -1]
+                self.ap = ap[-1, -1]
 
-                else:
+            for i in range(npts):
+                for j in range(nsec):
+                    Tsub, Qsub, Msub = _bem.thrusttorque(Np[i, j], Tp[i, j], *args)
+
+                    T[i] += self.B * Tsub / nsec
+                    Q[i] += self.B * Qsub / nsec
+                    M[i] += Msub / nsec
+
+        else:
+
+            for i in range(npts):  # iterate across conditions
+
+                for j in range(nsec):  # integrate across azimuth
+                    azimuth = 360.0*float(j)/nsec
+
+                    if not self.derivatives:
+                        # contribution from this azimuthal location
+                        if self.induction:
+                            a, ap, Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+                            # Induction
+                            self.a  = a
+                            self.ap = ap
+                        else:
+                            Np, Tp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+
+                    else:
 
-                    Np, Tp, dNp, dTp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
+                        Np, Tp, dNp, dTp = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
 
-                    dT_ds_sub, dQ_ds_sub, dT_dv_sub, dQ_dv_sub = self.__thrustTorqueDeriv(
-                        Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args)
+                        dT_ds_sub, dQ_ds_sub, dT_dv_sub, dQ_dv_sub = self.__thrustTorqueDeriv(
+                            Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args)
 
-                    dT_ds[i, :] += self.B * dT_ds_sub / nsec
-                    dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
-                    dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
-                    dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
+                        dT_ds[i, :] += self.B * dT_ds_sub / nsec
+                        dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
+                        dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
+                        dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
 
 
-                Tsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
+                    Tsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
 
-                T[i] += self.B * Tsub / nsec
-                Q[i] += self.B * Qsub / nsec
-                M[i] += Msub / nsec
+                    T[i] += self.B * Tsub / nsec
+                    Q[i] += self.B * Qsub / nsec
+                    M[i] += Msub / nsec
 
 
         
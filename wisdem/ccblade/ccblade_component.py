@@ -149,7 +149,7 @@ class CCBladePower(ExplicitComponent):
 
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
         
         self.ccblade = CCBlade(self.r, self.chord, self.theta, af, self.Rhub, self.Rtip, self.B,
             self.rho, self.mu, self.precone, self.tilt, self.yaw, self.shearExp, self.hub_height,
@@ -331,7 +331,7 @@ class CCBladeLoads(ExplicitComponent):
         # n = len(self.airfoils)
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
         # af = self.airfoils
 
         self.ccblade = CCBlade(self.r, self.chord, self.theta, af, self.Rhub, self.Rtip, self.B,
@@ -418,3 +418,135 @@ class CCBladeLoads(ExplicitComponent):
         '''
 
         
+
+
+class CCBladeMultiLoads(ExplicitComponent):
+    """
+    Distributed loads (as CCBladeLoads) at several operating conditions, and optionally rotor thrust, torque
+    and power (as CCBladePower) at a vector of conditions.  The airfoils and the rotor model are built once
+    and all the load cases are solved together.  Each load case adds the inputs V_load_<case>, Omega_load_<case>,
+    pitch_load_<case>, azimuth_load_<case> and the outputs loads_Px_<case>, loads_Py_<case>, loads_Pz_<case>,
+    loads_V_<case>, loads_Omega_<case>, loads_pitch_<case>, loads_azimuth_<case>.
+    """
+    def initialize(self):
+        self.options.declare('naero')
+        self.options.declare('load_cases', desc='names of the distributed load cases')
+        self.options.declare('npower', default=0, desc='number of thrust/torque/power conditions')
+
+        self.options.declare('n_aoa_grid')
+        self.options.declare('n_Re_grid')
+
+    def setup(self):
+        self.naero = naero = self.options['naero']
+        load_cases = self.options['load_cases']
+        npower     = self.options['npower']
+        n_aoa_grid = self.options['n_aoa_grid']
+        n_Re_grid  = self.options['n_Re_grid']
+        """blade element momentum code"""
+
+        # inputs and outputs of each load case
+        for case in load_cases:
+            self.add_input('V_load_'+case, val=0.0, units='m/s', desc='hub height wind speed')
+            self.add_input('Omega_load_'+case, val=0.0, units='rpm', desc='rotor rotation speed')
+            self.add_input('pitch_load_'+case, val=0.0, units='deg', desc='blade pitch setting')
+            self.add_input('azimuth_load_'+case, val=0.0, units='deg', desc='blade azimuthal location')
+
+            self.add_output('loads_Px_'+case, val=np.zeros(naero), units='N/m', desc='distributed loads in blade-aligned x-direction')
+            self.add_output('loads_Py_'+case, val=np.zeros(naero), units='N/m', desc='distributed loads in blade-aligned y-direction')
+            self.add_output('loads_Pz_'+case, val=np.zeros(naero), units='N/m', desc='distributed loads in blade-aligned z-direction')
+
+            # corresponding setting for loads
+            self.add_output('loads_V_'+case, val=0.0, units='m/s', desc='hub height wind speed')
+            self.add_output('loads_Omega_'+case, val=0.0, units='rpm', desc='rotor rotation speed')
+            self.add_output('loads_pitch_'+case, val=0.0, units='deg', desc='pitch angle')
+            self.add_output('loads_azimuth_'+case, val=0.0, units='deg', desc='azimuthal angle')
+
+        self.add_output('loads_r', val=np.zeros(naero), units='m', desc='radial positions along blade going toward tip')
+
+        # thrust, torque and power conditions
+        if npower > 0:
+            self.add_input('Uhub', val=np.zeros(npower), units='m/s', desc='hub height wind speed')
+            self.add_input('Omega', val=np.zeros(npower), units='rpm', desc='rotor rotation speed')
+            self.add_input('pitch', val=np.zeros(npower), units='deg', desc='blade pitch setting')
+
+            self.add_output('T', val=np.zeros(npower), units='N', desc='rotor aerodynamic thrust')
+            self.add_output('Q', val=np.zeros(npower), units='N*m', desc='rotor aerodynamic torque')
+            self.add_output('P', val=np.zeros(npower), units='W', desc='rotor aerodynamic power')
+
+        # (potential) variables
+        self.add_input('r', val=np.zeros(naero), units='m', desc='radial locations where blade is defined (should be increasing and not go all the way to hub or tip)')
+        self.add_input('chord', val=np.zeros(naero), units='m', desc='chord length at each section')
+        self.add_input('theta', val=np.zeros(naero),  units='deg', desc='twist angle at each section (positive decreases angle of attack)')
+        self.add_input('Rhub', val=0.0, units='m', desc='hub radius')
+        self.add_input('Rtip', val=0.0, units='m', desc='tip radius')
+        self.add_input('hub_height', val=0.0, units='m', desc='hub height')
+        self.add_input('precone', val=0.0, desc='precone angle', units='deg')
+        self.add_input('tilt', val=0.0, desc='shaft tilt', units='deg')
+        self.add_input('yaw', val=0.0, desc='yaw error', units='deg')
+        self.add_input('precurve', val=np.zeros(naero), units='m', desc='precurve at each section')
+        self.add_input('precurveTip', val=0.0, units='m', desc='precurve at tip')
+
+        # parameters
+        self.add_input('airfoils_cl', val=np.zeros((n_aoa_grid, naero, n_Re_grid)), desc='lift coefficients, spanwise')
+        self.add_input('airfoils_cd', val=np.zeros((n_aoa_grid, naero, n_Re_grid)), desc='drag coefficients, spanwise')
+        self.add_input('airfoils_cm', val=np.zeros((n_aoa_grid, naero, n_Re_grid)), desc='moment coefficients, spanwise')
+        self.add_input('airfoils_aoa', val=np.zeros((n_aoa_grid)), units='deg', desc='angle of attack grid for polars')
+        self.add_input('airfoils_Re', val=np.zeros((n_Re_grid)), desc='Reynolds numbers of polars')
+
+        self.add_discrete_input('nBlades', val=0, desc='number of blades')
+        self.add_input('rho', val=0.0, units='kg/m**3', desc='density of air')
+        self.add_input('mu', val=0.0, units='kg/(m*s)', desc='dynamic viscosity of air')
+        self.add_input('shearExp', val=0.0, desc='shear exponent')
+        self.add_discrete_input('nSector', val=4, desc='number of sectors to divide rotor face into in computing thrust and power')
+        self.add_discrete_input('tiploss', val=True, desc='include Prandtl tip loss model')
+        self.add_discrete_input('hubloss', val=True, desc='include Prandtl hub loss model')
+        self.add_discrete_input('wakerotation', val=True, desc='include effect of wake rotation (i.e., tangential induction factor is nonzero)')
+        self.add_discrete_input('usecd', val=True, desc='use drag coefficient in computing induction factors')
+
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        load_cases = self.options['load_cases']
+
+        r        = inputs['r']
+        precurve = inputs['precurve']
+        if len(precurve) == 0:
+            precurve = np.zeros_like(r)
+
+        af = [None]*self.naero
+        for i in range(self.naero):
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+
+        self.ccblade = CCBlade(r, inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'],
+            inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'],
+            discrete_inputs['nSector'], precurve, inputs['precurveTip'], tiploss=discrete_inputs['tiploss'], hubloss=discrete_inputs['hubloss'],
+            wakerotation=discrete_inputs['wakerotation'], usecd=discrete_inputs['usecd'], vectorized=True)
+
+        # distributed loads, all cases together
+        if len(load_cases) > 0:
+            V_load       = np.array([inputs['V_load_'+case] for case in load_cases]).flatten()
+            Omega_load   = np.array([inputs['Omega_load_'+case] for case in load_cases]).flatten()
+            pitch_load   = np.array([inputs['pitch_load_'+case] for case in load_cases]).flatten()
+            azimuth_load = np.array([inputs['azimuth_load_'+case] for case in load_cases]).flatten()
+
+            Np, Tp = self.ccblade.distributedAeroLoadsMulti(V_load, Omega_load, pitch_load, azimuth_load)
+
+            for k, case in enumerate(load_cases):
+                # conform to blade-aligned coordinate system
+                outputs['loads_Px_'+case] = Np[k]
+                outputs['loads_Py_'+case] = -Tp[k]
+                outputs['loads_Pz_'+case] = 0*Np[k]
+
+                # return other outputs needed
+                outputs['loads_V_'+case]       = V_load[k]
+                outputs['loads_Omega_'+case]   = Omega_load[k]
+                outputs['loads_pitch_'+case]   = pitch_load[k]
+                outputs['loads_azimuth_'+case] = azimuth_load[k]
+
+        outputs['loads_r'] = r
+
+        # power, thrust, torque
+        if self.options['npower'] > 0:
+            P, T, Q, M = self.ccblade.evaluate(inputs['Uhub'], inputs['Omega'], inputs['pitch'], coefficients=False)
+            outputs['T'] = T
+            outputs['Q'] = Q
+            outputs['P'] = P
@@ -46,7 +46,9 @@ class GeometricConstraints(ExplicitComponent):
         self.add_output('slope', np.zeros(nPoints-2))
 
         # Derivatives
-        self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        self.declare_partials('weldability', ['d','t','min_d_to_t'])
+        self.declare_partials('manufacturability', ['d','max_taper'])
+        self.declare_partials('slope', 'd')
 
 
     def compute(self, inputs, outputs):
@@ -67,20 +69,33 @@ class GeometricConstraints(ExplicitComponent):
         outputs['manufacturability'] = np.r_[manufacturability, manufacturability[-1]]
         outputs['slope'] = d_ratio
 
-    # def compute_partials(self, inputs, J):
+    def compute_partials(self, inputs, J):
+        nPoints  = self.options['nPoints']
+        diamFlag = self.options['diamFlag']
 
-    #     dw_dd = np.diag(-1.0/self.t/self.min_d_to_t)
-    #     dw_dt = np.diag(self.d/self.t**2/self.min_d_to_t)
+        d,_ = nodal2sectional(inputs['d'])
+        t = inputs['t']
+        fact = 1.0 if diamFlag else 2.0
+        d *= fact
 
-    #     dw = np.hstack([dw_dd, dw_dt])
+        min_d_to_t = inputs['min_d_to_t']
+        max_taper = inputs['max_taper']
+        nsec = nPoints-1
 
+        # Sectional diameters are the mean of the nodal ones
+        dsec_dd = 0.5*fact*(np.eye(nsec, nPoints) + np.eye(nsec, nPoints, k=1))
 
+        J['weldability','d'] = -(1.0/t/min_d_to_t)[:,np.newaxis] * dsec_dd
+        J['weldability','t'] = np.diag(d/t**2/min_d_to_t)
+        J['weldability','min_d_to_t'] = d/t/min_d_to_t**2
 
-    #     dm_dd = np.zeros_like(self.d)
-    #     dm_dd[0] = self.d[-1]/self.d[0]**2
-    #     dm_dd[-1] = -1.0/self.d[0]
+        d_ratio = d[1:]/d[:-1]
+        dr_dd = (dsec_dd[1:,:] - d_ratio[:,np.newaxis]*dsec_dd[:-1,:]) / d[:-1,np.newaxis]
+        J['slope','d'] = dr_dd
 
-    #     dm = np.hstack([dm_dd, np.zeros(len(self.t))])
+        dm_dd = np.where((d_ratio <= 1.0)[:,np.newaxis], 1.0, -1.0/d_ratio[:,np.newaxis]**2) * dr_dd
+        J['manufacturability','d'] = np.r_[dm_dd, dm_dd[-1:,:]]
+        J['manufacturability','max_taper'] = -1.0
 
 
 def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld_factor=True):
@@ -263,34 +278,12 @@ def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma
                       Each utilization must be < 1 to avoid failure.
     """
 
-    n = len(d)
-    EU_utilization = np.zeros(n)
-    sigma_z_sh = np.zeros(n)
-    sigma_t_sh = np.zeros(n)
-    tau_zt_sh = np.zeros(n)
-
-    for i in range(n):
-        h = L_reinforced[i]
-
-        r1 = d[i]/2.0 - t[i]/2.0
-        r2 = d[i]/2.0 - t[i]/2.0
-
-        sigma_z_shell = sigma_z[i]
-        sigma_t_shell = sigma_t[i]
-        tau_zt_shell = tau_zt[i]
-
-        # TODO: the following is non-smooth, although in general its probably OK
-        # change to magnitudes and add safety factor
-        sigma_z_shell = gamma_f*abs(sigma_z_shell)
-        sigma_t_shell = gamma_f*abs(sigma_t_shell)
-        tau_zt_shell = gamma_f*abs(tau_zt_shell)
-
-        EU_utilization[i] = _shellBucklingOneSection(h, r1, r2, t[i], gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E[i], sigma_y[i])
-
-        #make them into vectors
-        sigma_z_sh[i]=sigma_z_shell
-        sigma_t_sh[i]=sigma_t_shell
-        tau_zt_sh[i]=tau_zt_shell
+    # TODO: the following is non-smooth, although in general its probably OK
+    # change to magnitudes and add safety factor
+    r = 0.5*np.asarray(d) - 0.5*np.asarray(t)
+    EU_utilization = _shellBuckling_vectorized(np.asarray(L_reinforced), r, r, np.asarray(t), gamma_b,
+                                               gamma_f*np.abs(sigma_z), gamma_f*np.abs(sigma_t), gamma_f*np.abs(tau_zt),
+                                               np.asarray(E), np.asarray(sigma_y))
 
     return EU_utilization  # this is utilization must be <1
 
@@ -610,6 +603,182 @@ def _buckling_reduction_factor(alpha, beta, eta, lambda_0, lambda_bar):
 
 
 
+def _cubic_spline_vectorized(x1, x2, f1, f2, g1, g2, x):
+    """cubic_spline_eval for arrays of points (and end conditions), from the end values and slopes directly"""
+
+    h = x2 - x1
+    s = (x - x1)/h
+    return f1 + s*(h*g1 + s*(3*(f2 - f1) - h*(2*g1 + g2) + s*(2*(f1 - f2) + h*(g1 + g2))))
+
+
+def _cxsmooth_vectorized(omega, rovert):
+    """_cxsmooth for arrays of sections"""
+
+    Cxb = 6.0  # clamped-clamped
+    constant = 1 + 1.83/1.7 - 2.07/1.7**2
+
+    ptL1 = 1.7-0.25
+    ptR1 = 1.7+0.25
+
+    ptL2 = 0.5*rovert - 1.0
+    ptR2 = 0.5*rovert + 1.0
+
+    ptL3 = (0.5+Cxb)*rovert - 1.0
+    ptR3 = (0.5+Cxb)*rovert + 1.0
+
+    # conditions are checked in order, as in the if/elif chain of _cxsmooth
+    cond = [omega < ptL1, omega <= ptR1, omega < ptL2, omega <= ptR2, omega < ptL3, omega <= ptR3]
+    Cx = [constant - 1.83/omega + 2.07/omega**2,
+          _cubic_spline_vectorized(ptL1, ptR1, constant - 1.83/ptL1 + 2.07/ptL1**2, 1.0,
+                                   1.83/ptL1**2 - 4.14/ptL1**3, 0.0, omega),
+          np.ones(np.shape(omega)),
+          _cubic_spline_vectorized(ptL2, ptR2, 1.0, 1 + 0.2/Cxb*(1-2.0*ptR2/rovert), 0.0, -0.4/Cxb/rovert, omega),
+          1 + 0.2/Cxb*(1-2.0*omega/rovert),
+          _cubic_spline_vectorized(ptL3, ptR3, 1 + 0.2/Cxb*(1-2.0*ptL3/rovert), 0.6, -0.4/Cxb/rovert, 0.0, omega)]
+
+    return np.select(cond, Cx, 0.6)
+
+
+def _sigmasmooth_vectorized(omega, E, rovert):
+    """_sigmasmooth for arrays of sections"""
+
+    Ctheta = 1.5  # clamped-clamped
+
+    ptL = 1.63*rovert*Ctheta - 1
+    ptR = 1.63*rovert*Ctheta + 1
+
+    offset = (10.0/(20*Ctheta)**2 - 5/(20*Ctheta)**3)
+    Cthetas = 1.5 + 10.0/omega**2 - 5/omega**3 - offset
+    alpha1 = 0.92/1.63 - 2.03/1.63**4
+
+    fL = 0.92*E*Ctheta/ptL/rovert
+    fR = E*(1.0/rovert)**2*(alpha1 + 2.03*(Ctheta/ptR*rovert)**4)
+    gL = -0.92*E*Ctheta/rovert/ptL**2
+    gR = -E*(1.0/rovert)*2.03*4*(Ctheta/ptR*rovert)**3*Ctheta/ptR**2
+
+    cond = [omega < 20.0*Ctheta, omega < ptL, omega <= ptR]
+    sigma = [0.92*E*Cthetas/omega/rovert,
+             0.92*E*Ctheta/omega/rovert,
+             _cubic_spline_vectorized(ptL, ptR, fL, fR, gL, gR, omega)]
+
+    return np.select(cond, sigma, E*(1.0/rovert)**2*(alpha1 + 2.03*(Ctheta/omega*rovert)**4))
+
+
+def _tausmooth_vectorized(omega, rovert):
+    """_tausmooth for arrays of sections"""
+
+    ptL1 = 9
+    ptR1 = 11
+
+    ptL2 = 8.7*rovert - 1
+    ptR2 = 8.7*rovert + 1
+
+    fL = np.sqrt(1.0 + 42.0/ptL1**3 - 42.0/10**3)
+
+    cond = [omega < ptL1, omega <= ptR1, omega < ptL2, omega <= ptR2]
+    C_tau = [np.sqrt(1.0 + 42.0/omega**3 - 42.0/10**3),
+             _cubic_spline_vectorized(ptL1, ptR1, fL, 1.0, -63.0/ptL1**4/fL, 0.0, omega),
+             np.ones(np.shape(omega)),
+             _cubic_spline_vectorized(ptL2, ptR2, 1.0, 1.0/3.0*np.sqrt(ptR2/rovert) + 1 - np.sqrt(8.7)/3,
+                                      0.0, 1.0/6/np.sqrt(ptR2*rovert), omega)]
+
+    return np.select(cond, C_tau, 1.0/3.0*np.sqrt(omega/rovert) + 1 - np.sqrt(8.7)/3)
+
+
+def _buckling_reduction_factor_vectorized(alpha, beta, eta, lambda_0, lambda_bar):
+    """_buckling_reduction_factor for arrays of imperfection factors alpha and slenderness values lambda_bar"""
+
+    lambda_p = np.sqrt(alpha/(1.0-beta))
+
+    ptL = 0.9*lambda_0
+    ptR = 1.1*lambda_0
+
+    fracR = (ptR-lambda_0)/(lambda_p-lambda_0)
+    fR = 1-beta*fracR**eta
+    gR = -beta*eta*fracR**(eta-1)/(lambda_p-lambda_0)
+
+    cond = [lambda_bar < ptL, lambda_bar <= ptR, lambda_bar < lambda_p]
+    chi = [np.ones(np.shape(lambda_bar)),
+           _cubic_spline_vectorized(ptL, ptR, 1.0, fR, 0.0, gR, lambda_bar),
+           1.0 - beta*((lambda_bar-lambda_0)/(lambda_p-lambda_0))**eta]
+
+    return np.select(cond, chi, alpha/lambda_bar**2)
+
+
+def _shellBuckling_vectorized(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E, sigma_y):
+    """
+    Estimate shell buckling for arrays of tapered cylindrical shell sections.
+    Same arguments and result as _shellBucklingOneSection, for all sections at once.
+    """
+
+    # ----- geometric parameters --------
+    beta = np.arctan2(r1-r2, h)
+    L = h/np.cos(beta)
+
+    # ------------- axial and hoop stress -------------
+    # length parameter
+    le = L
+    re = 0.5*(r1+r2)/np.cos(beta)
+    omega = le/np.sqrt(re*t)
+    rovert = re/t
+
+    # critical axial buckling stress
+    sigma_z_Rcr = 0.605*E*_cxsmooth_vectorized(omega, rovert)/rovert
+
+    # compute buckling reduction factors
+    Q = 25.0  # quality parameter - high
+    lambda_z = np.sqrt(sigma_y/sigma_z_Rcr)
+    delta_wk = 1.0/Q*np.sqrt(rovert)*t
+    alpha_z = 0.62/(1 + 1.91*(delta_wk/t)**1.44)
+
+    chi_z = _buckling_reduction_factor_vectorized(alpha_z, 0.6, 1.0, 0.2, lambda_z)
+
+    # design buckling stress
+    sigma_z_Rd = chi_z*sigma_y/gamma_b
+
+    # critical hoop buckling stress
+    sigma_t_Rcr = np.maximum(eps, _sigmasmooth_vectorized(omega, E, rovert))
+
+    # buckling reduction factor, high fabrication quality
+    lambda_t = np.sqrt(sigma_y/sigma_t_Rcr)
+    chi_theta = _buckling_reduction_factor_vectorized(0.65, 0.6, 1.0, 0.4, lambda_t)
+
+    sigma_t_Rd = chi_theta*sigma_y/gamma_b
+
+    # ----------------- shear stress ----------------------
+
+    # length parameter
+    le = h
+    rho = np.sqrt((r1+r2)/(2.0*r2))
+    re = (1.0 + rho - 1.0/rho)*r2*np.cos(beta)
+    omega = le/np.sqrt(re*t)
+    rovert = re/t
+
+    tau_zt_Rcr = 0.75*E*_tausmooth_vectorized(omega, rovert)*np.sqrt(1.0/omega)/rovert
+
+    # reduction factor, high fabrication quality
+    lambda_tau = np.sqrt(sigma_y/np.sqrt(3)/tau_zt_Rcr)
+    chi_tau = _buckling_reduction_factor_vectorized(0.65, 0.6, 1.0, 0.4, lambda_tau)
+
+    tau_zt_Rd = chi_tau*sigma_y/np.sqrt(3)/gamma_b
+
+    # buckling interaction parameters
+    k_z = 1.25 + 0.75*chi_z
+    k_theta = 1.25 + 0.75*chi_theta
+    k_tau = 1.75 + 0.25*chi_tau
+    k_i = (chi_z*chi_theta)**2
+
+    # shell buckling utilization
+    utilization = \
+        (sigma_z/sigma_z_Rd)**k_z + \
+        (sigma_t/sigma_t_Rd)**k_theta - \
+        k_i*(sigma_z*sigma_t/sigma_z_Rd/sigma_t_Rd) + \
+        (tau_zt/tau_zt_Rd)**k_tau
+
+    return utilization #this is utilization must be <1
+
+
+
 
 def _TBeamProperties(h_web, t_web, w_flange, t_flange):
     """Computes T-cross section area, CG, and moments of inertia
@@ -921,17 +1090,17 @@ def shellBuckling_withStiffeners(P, sigma_ax, R_od, t_wall, h_section, h_web, t_
     load_per_length_Nth = hoop_stress_nostiff * t_wall
     load_ratio_k        = load_per_length_Nph / load_per_length_Nth
     def solveFthFph(Fxci, Frci, Kth):
-        Fphci = np.zeros(Fxci.shape)
-        Fthci = np.zeros(Fxci.shape)
         Kph   = 1.0
         c1    = (Fxci + Frci) / sigma_y - 1.0
         c2    = load_ratio_k * Kph / Kth
-        for k in range(Fxci.size):
-            try:
-                Fthci[k] = brentq(lambda x: (c2[k]*x/Fxci[k])**2 - c1[k]*(c2[k]*x/Fxci[k])*(x/Frci[k]) + (x/Frci[k])**2 - 1.0, 0, Fxci[k]+Frci[k], maxiter=20)
-            except:
-                Fthci[k] = Fxci[k] + Frci[k]
-            Fphci[k] = c2[k] * Fthci[k]
+        # The interaction equation (Fph/Fxci)**2 - c1*(Fph/Fxci)*(Fth/Frci) + (Fth/Frci)**2 = 1 with Fph = c2*Fth
+        # is a*Fth**2 = 1, solved for all sections at once with the root between 0 and Fxci+Frci.  Sections without
+        # a root in that interval fall back to the bound.
+        Fmax  = Fxci + Frci
+        a     = (c2/Fxci)**2 - c1*c2/Fxci/Frci + 1.0/Frci**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Fthci = np.where(a*Fmax**2 >= 1.0, np.sign(Fmax)/np.sqrt(a), Fmax)
+        Fphci = c2 * Fthci
         return Fphci, Fthci
 
     inelastic_local_FphcL, inelastic_local_FthcL = solveFthFph(inelastic_axial_local_FxcL, inelastic_extern_local_FrcL, stiffener_factor_KthL)
@@ -24,4 +24,60 @@ if under_mpirun():
         sys.stdout.write('\n')
         sys.stdout.flush()
 else:
-    MPI = None
\ No newline at end of file
+    MPI = None
+
+
+def subprocessor_map(func, args_list, sub_ranks, cost=None, args_first=None):
+    """
+    Master side of a dynamic task queue over the worker ranks sub_ranks of MPI.COMM_WORLD: func(args) is evaluated
+    for every entry of args_list and a rank is sent its next task as soon as it returns a result, so long tasks do
+    not hold up the ranks running short ones.  Workers receive [func, args] with tag 0 and send the output back
+    with tag 1.
+
+    cost : list of float, optional
+        expected run time of each task (e.g. the simulation length); the tasks are started longest first
+    args_first : callable, optional
+        args_first(args) is sent in place of args with the first task a rank receives (e.g. to send shared data once)
+
+    Returns the outputs in the order of args_list.
+    """
+    if len(sub_ranks) == 0:
+        raise ValueError('subprocessor_map needs at least one worker rank in sub_ranks')
+
+    from mpi4py import MPI
+    comm = MPI.COMM_WORLD
+
+    N_tasks = len(args_list)
+    if cost is None:
+        order = list(range(N_tasks))
+    else:
+        order = sorted(range(N_tasks), key=lambda i: -cost[i])
+    order.reverse()
+
+    output  = [None]*N_tasks
+    running = {}
+    started = set()
+
+    def send_next(rank):
+        i = order.pop()
+        args = args_list[i]
+        if args_first is not None and rank not in started:
+            args = args_first(args)
+            started.add(rank)
+        comm.send([func, args], dest=rank, tag=0)
+        running[rank] = i
+
+    for rank in sub_ranks:
+        if len(order) == 0:
+            break
+        send_next(rank)
+
+    status = MPI.Status()
+    while running:
+        data_out = comm.recv(source=MPI.ANY_SOURCE, tag=1, status=status)
+        rank = status.Get_source()
+        output[running.pop(rank)] = data_out
+        if len(order) > 0:
+            send_next(rank)
+
+    return output
@@ -0,0 +1,189 @@
+"""
+Finite difference total derivatives evaluated in parallel.
+
+OpenMDAO's approx_totals runs one perturbed model evaluation per design variable entry, one after the other.
+ParallelFDMixin replaces the total derivative computation of a driver with a finite difference whose perturbed
+evaluations (the columns of the Jacobian) are spread over
+
+- the MPI ranks, when running under mpirun (see mpi_tools.under_mpirun).  Every rank must hold its own copy of
+  the Problem (Problem(comm=MPI.COMM_SELF)) and run the same driver, the columns are distributed round robin and
+  gathered on all ranks.  If the model itself is distributed over the ranks, OpenMDAO's own totals are used
+  instead (see Group num_par_fd).
+- a local pool of worker processes otherwise.  The workers are forked from the driver process when the gradient
+  is requested, so they start from the current design point without any model data being sent to them.
+
+The perturbations are applied to the driver-scaled design variables and the derivatives are returned with driver
+scaling, as the driver expects.
+"""
+from __future__ import print_function
+import multiprocessing as mp
+import numpy as np
+
+from openmdao.api import ScipyOptimizeDriver
+
+from wisdem.commonse.mpi_tools import MPI, under_mpirun
+
+
+# driver being differenced, inherited by the forked worker processes
+_fd_driver = None
+
+
+def _fd_columns(columns):
+    # helper function for running with multiprocessing.Pool.map
+    return _fd_driver._fd_run_columns(columns)
+
+
+class _FDTotalJac(object):
+    """ Last Jacobian computed by ParallelFDMixin, stored where OpenMDAO drivers and reports look for the total
+    Jacobian (Driver._total_jac) """
+
+    def __init__(self, J):
+        self.J = J
+
+    def check_total_jac(self, raise_error=True, tol=1e-16):
+        pass
+
+
+class ParallelFDMixin(object):
+    """
+    Mixin for OpenMDAO drivers that computes total derivatives by parallel finite differences.  List it before
+    the driver class, e.g. class MyDriver(ParallelFDMixin, ScipyOptimizeDriver).
+
+    Options
+    -------
+    fd_step : float
+        step size, in driver-scaled design variable units
+    fd_step_calc : str
+        'abs' for absolute steps, 'rel' to scale the step by the design variable magnitude
+    fd_form : str
+        'forward' or 'central' differences
+    fd_cores : int
+        number of local worker processes (all cores by default).  Ignored under MPI, where every rank is used.
+    """
+
+    def _declare_options(self):
+        super(ParallelFDMixin, self)._declare_options()
+
+        self.options.declare('fd_step', default=1e-6, types=float, desc='Finite difference step size')
+        self.options.declare('fd_step_calc', default='abs', values=['abs', 'rel'],
+                             desc='Absolute or relative finite difference step')
+        self.options.declare('fd_form', default='forward', values=['forward', 'central'],
+                             desc='Finite difference form')
+        self.options.declare('fd_cores', default=None, types=int, allow_none=True,
+                             desc='Number of local processes used for the finite differences')
+
+    def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', **kwargs):
+        parallel_mpi = under_mpirun() and MPI.COMM_WORLD.Get_size() > 1
+        if parallel_mpi and self._problem().comm.Get_size() > 1:
+            # the model itself is distributed, the ranks cannot run different perturbations (use num_par_fd)
+            return super(ParallelFDMixin, self)._compute_totals(of=of, wrt=wrt, return_format=return_format, **kwargs)
+
+        if of is None:
+            of = list(self._objs) + list(self._cons)
+        if wrt is None:
+            wrt = list(self._designvars)
+        self._fd_of = list(of)
+
+        # base point, the model has already been run at the current design variables
+        x0 = self.get_design_var_values()
+        self._fd_x0 = dict((name, np.array(x0[name], dtype=np.float64).flatten()) for name in wrt)
+        y0 = self._fd_response_values()
+        self._fd_y0 = self._fd_stacked(y0)
+
+        # one column per design variable entry
+        columns = [(name, k) for name in wrt for k in range(self._fd_x0[name].size)]
+        ncol = len(columns)
+
+        if parallel_mpi:
+            comm  = MPI.COMM_WORLD
+            nproc = comm.Get_size()
+            parts = comm.allgather(self._fd_run_columns(columns[comm.Get_rank()::nproc]))
+            run_here = True
+        else:
+            nproc = min(self.options['fd_cores'] or mp.cpu_count(), ncol)
+            run_here = nproc <= 1 or 'fork' not in mp.get_all_start_methods()
+            if run_here:
+                nproc = 1
+                parts = [self._fd_run_columns(columns)]
+            else:
+                global _fd_driver
+                _fd_driver = self
+                pool = mp.get_context('fork').Pool(nproc)
+                try:
+                    parts = pool.map(_fd_columns, [columns[i::nproc] for i in range(nproc)])
+                finally:
+                    pool.close()
+                    pool.join()
+                    _fd_driver = None
+
+        # the model in this process was perturbed, return it to the base point
+        if run_here:
+            self._problem().model.run_solve_nonlinear()
+
+        # assemble the Jacobian, rows ordered by of and columns by wrt
+        J = np.zeros((self._fd_y0.size, ncol))
+        for i, part in enumerate(parts):
+            if len(part) > 0:
+                J[:,i::nproc] = np.array(part).T
+        self._total_jac = _FDTotalJac(J)
+
+        return self._fd_format(J, of, wrt, [np.size(y0[name]) for name in of], return_format)
+
+    def _fd_response_values(self):
+        y = {}
+        y.update(self.get_objective_values())
+        y.update(self.get_constraint_values())
+        return y
+
+    def _fd_stacked(self, y):
+        return np.concatenate([np.array(y[name], dtype=np.float64).flatten() for name in self._fd_of])
+
+    def _fd_run_columns(self, columns):
+        """ Run the perturbed evaluations of the given (design variable, index) columns, returns the
+        derivative of the stacked responses for each column """
+        model = self._problem().model
+        x0    = self._fd_x0
+
+        dy = []
+        for name, k in columns:
+            h = self.options['fd_step']
+            if self.options['fd_step_calc'] == 'rel':
+                h *= max(abs(x0[name][k]), 1.0)
+            steps = [h, -h] if self.options['fd_form'] == 'central' else [h]
+
+            y = []
+            for step in steps:
+                x = x0[name].copy()
+                x[k] += step
+                self.set_design_var(name, x)
+                model.run_solve_nonlinear()
+                y.append(self._fd_stacked(self._fd_response_values()))
+            self.set_design_var(name, x0[name])
+
+            if len(y) == 2:
+                dy.append((y[0] - y[1]) / (2.0*h))
+            else:
+                dy.append((y[0] - self._fd_y0) / h)
+
+        return dy
+
+    def _fd_format(self, J, of, wrt, nrow, return_format):
+        if return_format == 'array':
+            return J
+
+        row = np.r_[0, np.cumsum(nrow)]
+        col = np.r_[0, np.cumsum([self._fd_x0[name].size for name in wrt])]
+        totals = {}
+        for i, oname in enumerate(of):
+            for j, wname in enumerate(wrt):
+                block = J[row[i]:row[i+1], col[j]:col[j+1]]
+                if return_format == 'dict':
+                    totals.setdefault(oname, {})[wname] = block
+                else:
+                    totals[oname, wname] = block
+        return totals
+
+
+class ScipyOptimizeDriverParallelFD(ParallelFDMixin, ScipyOptimizeDriver):
+    """ ScipyOptimizeDriver with parallel finite difference total derivatives (see ParallelFDMixin) """
+    pass
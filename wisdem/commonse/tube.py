@@ -43,8 +43,10 @@ class CylindricalShellProperties(ExplicitComponent):
         self.add_output('Ixx', np.zeros(nFull-1), units='m**4', desc='area moment of inertia about x-axis')
         self.add_output('Iyy', np.zeros(nFull-1), units='m**4', desc='area moment of inertia about y-axis')
 
-        # Derivatives
-        self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        # Derivatives, each section depends on its two end diameters and its thickness
+        isec = np.arange(nFull-1)
+        self.declare_partials(['Az','Asx','Asy','Jz','Ixx','Iyy'], 'd', rows=np.repeat(isec, 2), cols=np.c_[isec, isec+1].flatten())
+        self.declare_partials(['Az','Asx','Asy','Jz','Ixx','Iyy'], 't', rows=isec, cols=isec)
 
 
     def compute(self, inputs, outputs):
@@ -58,6 +60,31 @@ class CylindricalShellProperties(ExplicitComponent):
         outputs['Ixx'] = tube.Jxx
         outputs['Iyy'] = tube.Jyy
 
+    def compute_partials(self, inputs, J):
+        D,_ = nodal2sectional(inputs['d'])
+        t   = inputs['t']
+        Di  = D - 2*t
+
+        dA_dD = pi*t
+        dA_dt = pi*Di
+
+        dI_dD = (D**3 - Di**3) * pi/16
+        dI_dt = Di**3 * pi/8
+
+        # shear area As = A / f(r), r = Ri/Ro = 1 - 2t/D
+        A  = (D**2 - Di**2) * pi/4
+        r  = Di / D
+        f  = 1.124235 + 0.055610*r + 1.097134*r**2 - 0.630057*r**3
+        df = 0.055610 + 2*1.097134*r - 3*0.630057*r**2
+        dAs_dD = dA_dD/f - A/f**2 * df * 2*t/D**2
+        dAs_dt = dA_dt/f + A/f**2 * df * 2/D
+
+        # sectional diameter is the mean of the two nodal diameters
+        for k, dD, dt in [('Az', dA_dD, dA_dt), ('Asx', dAs_dD, dAs_dt), ('Asy', dAs_dD, dAs_dt),
+                          ('Jz', 2*dI_dD, 2*dI_dt), ('Ixx', dI_dD, dI_dt), ('Iyy', dI_dD, dI_dt)]:
+            J[k,'d'] = np.repeat(0.5*dD, 2)
+            J[k,'t'] = dt
+
 ##        ro = self.d/2.0 + self.t/2.0
 ##        ri = self.d/2.0 - self.t/2.0
 ##        self.Az = math.pi * (ro**2 - ri**2)
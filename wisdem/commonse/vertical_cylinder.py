@@ -174,12 +174,18 @@ class CylinderFrame3DD(ExplicitComponent):
         self.options.declare('nK')
         self.options.declare('nMass')
         self.options.declare('nPL')
+        self.options.declare('nLC', default=1)
         
     def setup(self):
         npts  = self.options['npts']
         nK    = self.options['nK']
         nMass = self.options['nMass']
         nPL   = self.options['nPL']
+        nLC   = self.options['nLC']
+
+        # With several load cases, the loads and the load dependent outputs are suffixed by the load case number (1, 2, ...)
+        # and all cases are solved in one Frame3DD run on the same structure.  The modal analysis is shared.
+        self.lc = [''] if nLC == 1 else [str(iLC+1) for iLC in range(nLC)]
 
         # cross-sectional data along cylinder.
         self.add_input('z', np.zeros(npts), units='m', desc='location along cylinder. start at bottom and go to top')
@@ -225,18 +231,20 @@ class CylinderFrame3DD(ExplicitComponent):
 
         # point loads (if addGravityLoadForExtraMass=True be sure not to double count by adding those force here also)
         self.add_input('plidx', np.zeros(nPL), desc='indices where point loads should be applied.')
-        self.add_input('Fx', np.zeros(nPL), units='N', desc='point force in x-direction')
-        self.add_input('Fy', np.zeros(nPL), units='N', desc='point force in y-direction')
-        self.add_input('Fz', np.zeros(nPL), units='N', desc='point force in z-direction')
-        self.add_input('Mxx', np.zeros(nPL), units='N*m', desc='point moment about x-axis')
-        self.add_input('Myy', np.zeros(nPL), units='N*m', desc='point moment about y-axis')
-        self.add_input('Mzz', np.zeros(nPL), units='N*m', desc='point moment about z-axis')
+        for lc in self.lc:
+            self.add_input('Fx'+lc, np.zeros(nPL), units='N', desc='point force in x-direction')
+            self.add_input('Fy'+lc, np.zeros(nPL), units='N', desc='point force in y-direction')
+            self.add_input('Fz'+lc, np.zeros(nPL), units='N', desc='point force in z-direction')
+            self.add_input('Mxx'+lc, np.zeros(nPL), units='N*m', desc='point moment about x-axis')
+            self.add_input('Myy'+lc, np.zeros(nPL), units='N*m', desc='point moment about y-axis')
+            self.add_input('Mzz'+lc, np.zeros(nPL), units='N*m', desc='point moment about z-axis')
 
         # combined wind-water distributed loads
-        self.add_input('Px', np.zeros(npts), units='N/m', desc='force per unit length in x-direction')
-        self.add_input('Py', np.zeros(npts), units='N/m', desc='force per unit length in y-direction')
-        self.add_input('Pz', np.zeros(npts), units='N/m', desc='force per unit length in z-direction')
-        self.add_input('qdyn', np.zeros(npts), units='N/m**2', desc='dynamic pressure')
+        for lc in self.lc:
+            self.add_input('Px'+lc, np.zeros(npts), units='N/m', desc='force per unit length in x-direction')
+            self.add_input('Py'+lc, np.zeros(npts), units='N/m', desc='force per unit length in y-direction')
+            self.add_input('Pz'+lc, np.zeros(npts), units='N/m', desc='force per unit length in z-direction')
+            self.add_input('qdyn'+lc, np.zeros(npts), units='N/m**2', desc='dynamic pressure')
 
         # options
         self.add_discrete_input('shear', True, desc='include shear deformation')
@@ -252,24 +260,28 @@ class CylinderFrame3DD(ExplicitComponent):
         self.add_output('mass', 0.0)
         self.add_output('f1', 0.0, units='Hz', desc='First natural frequency')
         self.add_output('f2', 0.0, units='Hz', desc='Second natural frequency')
-        self.add_output('top_deflection', 0.0, units='m', desc='Deflection of cylinder top in yaw-aligned +x direction')
-        self.add_output('Fz_out', np.zeros(npts-1), units='N', desc='Axial foce in vertical z-direction in cylinder structure.')
-        self.add_output('Vx_out', np.zeros(npts-1), units='N', desc='Shear force in x-direction in cylinder structure.')
-        self.add_output('Vy_out', np.zeros(npts-1), units='N', desc='Shear force in y-direction in cylinder structure.')
-        self.add_output('Mxx_out', np.zeros(npts-1), units='N*m', desc='Moment about x-axis in cylinder structure.')
-        self.add_output('Myy_out', np.zeros(npts-1), units='N*m', desc='Moment about y-axis in cylinder structure.')
-        self.add_output('Mzz_out', np.zeros(npts-1), units='N*m', desc='Moment about z-axis in cylinder structure.')
-        self.add_output('base_F', val=np.zeros(3), units='N', desc='Total force on cylinder')
-        self.add_output('base_M', val=np.zeros(3), units='N*m', desc='Total moment on cylinder measured at base')
-
-        self.add_output('axial_stress', np.zeros(npts-1), units='N/m**2', desc='Axial stress in cylinder structure')
-        self.add_output('shear_stress', np.zeros(npts-1), units='N/m**2', desc='Shear stress in cylinder structure')
-        self.add_output('hoop_stress', np.zeros(npts-1), units='N/m**2', desc='Hoop stress in cylinder structure calculated with simple method used in API standards')
-        self.add_output('hoop_stress_euro', np.zeros(npts-1), units='N/m**2', desc='Hoop stress in cylinder structure calculated with Eurocode method')
+        for lc in self.lc:
+            self.add_output('top_deflection'+lc, 0.0, units='m', desc='Deflection of cylinder top in yaw-aligned +x direction')
+            self.add_output('Fz_out'+lc, np.zeros(npts-1), units='N', desc='Axial foce in vertical z-direction in cylinder structure.')
+            self.add_output('Vx_out'+lc, np.zeros(npts-1), units='N', desc='Shear force in x-direction in cylinder structure.')
+            self.add_output('Vy_out'+lc, np.zeros(npts-1), units='N', desc='Shear force in y-direction in cylinder structure.')
+            self.add_output('Mxx_out'+lc, np.zeros(npts-1), units='N*m', desc='Moment about x-axis in cylinder structure.')
+            self.add_output('Myy_out'+lc, np.zeros(npts-1), units='N*m', desc='Moment about y-axis in cylinder structure.')
+            self.add_output('Mzz_out'+lc, np.zeros(npts-1), units='N*m', desc='Moment about z-axis in cylinder structure.')
+            self.add_output('base_F'+lc, val=np.zeros(3), units='N', desc='Total force on cylinder')
+            self.add_output('base_M'+lc, val=np.zeros(3), units='N*m', desc='Total moment on cylinder measured at base')
+
+            self.add_output('axial_stress'+lc, np.zeros(npts-1), units='N/m**2', desc='Axial stress in cylinder structure')
+            self.add_output('shear_stress'+lc, np.zeros(npts-1), units='N/m**2', desc='Shear stress in cylinder structure')
+            self.add_output('hoop_stress'+lc, np.zeros(npts-1), units='N/m**2', desc='Hoop stress in cylinder structure calculated with simple method used in API standards')
+            self.add_output('hoop_stress_euro'+lc, np.zeros(npts-1), units='N/m**2', desc='Hoop stress in cylinder structure calculated with Eurocode method')
         
         # Derivatives
         # self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
 
+        # frame3dd object, reused between computes so that its output buffers are kept
+        self.frame = None
+
         
     def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
 
@@ -320,8 +332,16 @@ class CylinderFrame3DD(ExplicitComponent):
         options = frame3dd.Options(discrete_inputs['shear'], discrete_inputs['geom'], float(inputs['dx']))
         # -----------------------------------
 
-        # initialize frame3dd object
-        cylinder = frame3dd.Frame(nodes, reactions, elements, options)
+        # initialize frame3dd object, or update the one of the last compute
+        if self.frame is None:
+            self.frame = frame3dd.Frame(nodes, reactions, elements, options)
+        else:
+            self.frame.changeNodes(nodes)
+            self.frame.changeReactions(reactions)
+            self.frame.changeElements(elements)
+            self.frame.changeOptions(options)
+            self.frame.clearLoadCases()
+        cylinder = self.frame
 
 
         # ------ add extra mass ------------
@@ -338,43 +358,43 @@ class CylinderFrame3DD(ExplicitComponent):
         cylinder.enableDynamics(discrete_inputs['nM'], discrete_inputs['Mmethod'], discrete_inputs['lump'], float(inputs['tol']), float(inputs['shift']))
         # ----------------------------
 
-        # ------ static load case 1 ------------
+        # ------ static load cases ------------
 
         # gravity in the X, Y, Z, directions (global)
         gx = 0.0
         gy = 0.0
         gz = -gravity
 
-        load = frame3dd.StaticLoadCase(gx, gy, gz)
+        for lc in self.lc:
+            load = frame3dd.StaticLoadCase(gx, gy, gz)
 
-        # point loads
-        nF = inputs['plidx'] + np.ones(len(inputs['plidx']))
-        load.changePointLoads(nF, inputs['Fx'], inputs['Fy'], inputs['Fz'], inputs['Mxx'], inputs['Myy'], inputs['Mzz'])
+            # point loads
+            nF = inputs['plidx'] + np.ones(len(inputs['plidx']))
+            load.changePointLoads(nF, inputs['Fx'+lc], inputs['Fy'+lc], inputs['Fz'+lc], inputs['Mxx'+lc], inputs['Myy'+lc], inputs['Mzz'+lc])
 
-        # distributed loads
-        Px, Py, Pz = inputs['Pz'], inputs['Py'], -inputs['Px']  # switch to local c.s.
-        z = inputs['z']
+            # distributed loads
+            Px, Py, Pz = inputs['Pz'+lc], inputs['Py'+lc], -inputs['Px'+lc]  # switch to local c.s.
+            z = inputs['z']
 
-        # trapezoidally distributed loads
-        EL = np.arange(1, n)
-        xx1 = xy1 = xz1 = np.zeros(n-1)
-        xx2 = xy2 = xz2 = np.diff(z) - 1e-6  # subtract small number b.c. of precision
-        wx1 = Px[:-1]
-        wx2 = Px[1:]
-        wy1 = Py[:-1]
-        wy2 = Py[1:]
-        wz1 = Pz[:-1]
-        wz2 = Pz[1:]
+            # trapezoidally distributed loads
+            EL = np.arange(1, n)
+            xx1 = xy1 = xz1 = np.zeros(n-1)
+            xx2 = xy2 = xz2 = np.diff(z) - 1e-6  # subtract small number b.c. of precision
+            wx1 = Px[:-1]
+            wx2 = Px[1:]
+            wy1 = Py[:-1]
+            wy2 = Py[1:]
+            wz1 = Pz[:-1]
+            wz2 = Pz[1:]
 
-        load.changeTrapezoidalLoads(EL, xx1, xx2, wx1, wx2, xy1, xy2, wy1, wy2, xz1, xz2, wz1, wz2)
+            load.changeTrapezoidalLoads(EL, xx1, xx2, wx1, wx2, xy1, xy2, wy1, wy2, xz1, xz2, wz1, wz2)
 
-        cylinder.addLoadCase(load)
+            cylinder.addLoadCase(load)
         # Debugging
         #cylinder.write('temp.3dd')
         # -----------------------------------
         # run the analysis
         displacements, forces, reactions, internalForces, mass, modal = cylinder.run()
-        iCase = 0
 
         # mass
         outputs['mass'] = mass.struct_mass
@@ -383,46 +403,48 @@ class CylinderFrame3DD(ExplicitComponent):
         outputs['f1'] = modal.freq[0]
         outputs['f2'] = modal.freq[1]
 
-        # deflections due to loading (from cylinder top and wind/wave loads)
-        outputs['top_deflection'] = displacements.dx[iCase, n-1]  # in yaw-aligned direction
+        d,_ = nodal2sectional(inputs['d'])
+        L_reinforced = inputs['L_reinforced'] * np.ones(n-1)
 
-        # shear and bending, one per element (convert from local to global c.s.)
-        Fz = forces.Nx[iCase, 1::2]
-        Vy = forces.Vy[iCase, 1::2]
-        Vx = -forces.Vz[iCase, 1::2]
+        for iCase, lc in enumerate(self.lc):
+            # deflections due to loading (from cylinder top and wind/wave loads)
+            outputs['top_deflection'+lc] = displacements.dx[iCase, n-1]  # in yaw-aligned direction
 
-        Mzz = forces.Txx[iCase, 1::2]
-        Myy = forces.Myy[iCase, 1::2]
-        Mxx = -forces.Mzz[iCase, 1::2]
+            # shear and bending, one per element (convert from local to global c.s.)
+            Fz = forces.Nx[iCase, 1::2]
+            Vy = forces.Vy[iCase, 1::2]
+            Vx = -forces.Vz[iCase, 1::2]
 
-        # Record total forces and moments
-        outputs['base_F'] = -1.0 * np.array([reactions.Fx.sum(), reactions.Fy.sum(), reactions.Fz.sum()])
-        outputs['base_M'] = -1.0 * np.array([reactions.Mxx.sum(), reactions.Myy.sum(), reactions.Mzz.sum()])
+            Mzz = forces.Txx[iCase, 1::2]
+            Myy = forces.Myy[iCase, 1::2]
+            Mxx = -forces.Mzz[iCase, 1::2]
 
-        outputs['Fz_out']  = Fz
-        outputs['Vx_out']  = Vx
-        outputs['Vy_out']  = Vy
-        outputs['Mxx_out'] = Mxx
-        outputs['Myy_out'] = Myy
-        outputs['Mzz_out'] = Mzz
+            # Record total forces and moments
+            outputs['base_F'+lc] = -1.0 * np.array([reactions.Fx[iCase,:].sum(), reactions.Fy[iCase,:].sum(), reactions.Fz[iCase,:].sum()])
+            outputs['base_M'+lc] = -1.0 * np.array([reactions.Mxx[iCase,:].sum(), reactions.Myy[iCase,:].sum(), reactions.Mzz[iCase,:].sum()])
 
-        # axial and shear stress
-        d,_    = nodal2sectional(inputs['d'])
-        qdyn,_ = nodal2sectional(inputs['qdyn'])
-        
-        ##R = self.d/2.0
-        ##x_stress = R*np.cos(self.theta_stress)
-        ##y_stress = R*np.sin(self.theta_stress)
-        ##axial_stress = Fz/self.Az + Mxx/self.Ixx*y_stress - Myy/self.Iyy*x_stress
-#        V = Vy*x_stress/R - Vx*y_stress/R  # shear stress orthogonal to direction x,y
-#        shear_stress = 2. * V / self.Az  # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
-        outputs['axial_stress'] = Fz/inputs['Az'] - np.sqrt(Mxx**2+Myy**2)/inputs['Iyy']*d/2.0  #More conservative, just use the tilted bending and add total max shear as well at the same point, if you do not like it go back to the previous lines
-
-        outputs['shear_stress'] = 2. * np.sqrt(Vx**2+Vy**2) / inputs['Az'] # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
-
-        # hoop_stress (Eurocode method)
-        L_reinforced = inputs['L_reinforced'] * np.ones(Fz.shape)
-        outputs['hoop_stress_euro'] = hoopStressEurocode(inputs['z'], d, inputs['t'], L_reinforced, qdyn)
-
-        # Simpler hoop stress used in API calculations
-        outputs['hoop_stress'] = hoopStress(d, inputs['t'], qdyn)
+            outputs['Fz_out'+lc]  = Fz
+            outputs['Vx_out'+lc]  = Vx
+            outputs['Vy_out'+lc]  = Vy
+            outputs['Mxx_out'+lc] = Mxx
+            outputs['Myy_out'+lc] = Myy
+            outputs['Mzz_out'+lc] = Mzz
+
+            # axial and shear stress
+            qdyn,_ = nodal2sectional(inputs['qdyn'+lc])
+
+            ##R = self.d/2.0
+            ##x_stress = R*np.cos(self.theta_stress)
+            ##y_stress = R*np.sin(self.theta_stress)
+            ##axial_stress = Fz/self.Az + Mxx/self.Ixx*y_stress - Myy/self.Iyy*x_stress
+#            V = Vy*x_stress/R - Vx*y_stress/R  # shear stress orthogonal to direction x,y
+#            shear_stress = 2. * V / self.Az  # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
+            outputs['axial_stress'+lc] = Fz/inputs['Az'] - np.sqrt(Mxx**2+Myy**2)/inputs['Iyy']*d/2.0  #More conservative, just use the tilted bending and add total max shear as well at the same point, if you do not like it go back to the previous lines
+
+            outputs['shear_stress'+lc] = 2. * np.sqrt(Vx**2+Vy**2) / inputs['Az'] # coefficient of 2 for a hollow circular section, but should be conservative for other shapes
+
+            # hoop_stress (Eurocode method)
+            outputs['hoop_stress_euro'+lc] = hoopStressEurocode(inputs['z'], d, inputs['t'], L_reinforced, qdyn)
+
+            # Simpler hoop stress used in API calculations
+            outputs['hoop_stress'+lc] = hoopStress(d, inputs['t'], qdyn)
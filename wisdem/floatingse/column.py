@@ -57,7 +57,10 @@ class BulkheadProperties(ExplicitComponent):
         self.add_output('bulkhead_I_keel', val=np.zeros(6), units='kg*m**2', desc='Moments of inertia of bulkheads relative to keel point')
         
         # Derivatives
-        self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        self.declare_partials('bulkhead_mass', ['d_full','t_full','rho','bulkhead_thickness','bulkhead_mass_factor'])
+        self.declare_partials('bulkhead_I_keel', ['z_full','d_full','t_full','rho','bulkhead_thickness','bulkhead_mass_factor'])
+        self.declare_partials('bulkhead_cost', ['d_full','t_full','rho','bulkhead_thickness','bulkhead_mass_factor','shell_mass',
+                                                'material_cost_rate','labor_cost_rate','painting_cost_rate'])
 
         
     def compute(self, inputs, outputs):
@@ -131,6 +134,108 @@ class BulkheadProperties(ExplicitComponent):
         outputs['bulkhead_mass'] = m_bulk
         outputs['bulkhead_cost'] = c_bulk
 
+    def compute_partials(self, inputs, J):
+        nFull      = self.options['nFull']
+        z_full     = inputs['z_full']
+        z_param    = inputs['z_param']
+        R_od       = 0.5*inputs['d_full']
+        twall      = inputs['t_full']
+        R_id       = get_inner_radius(R_od, twall)
+        t_bulk     = inputs['bulkhead_thickness']
+        rho        = inputs['rho']
+        fact       = inputs['bulkhead_mass_factor']
+
+        # Bulkhead mapping as a matrix, with the caps taken from the wall thickness
+        Zf,Zp = np.meshgrid(z_full, z_param)
+        idx = np.argmin( np.abs(Zf-Zp), axis=1 )
+        t_bulk_full = np.zeros( z_full.shape )
+        t_bulk_full[idx] = t_bulk
+        dtb_dtb = np.zeros((nFull, t_bulk.size))
+        dtb_dtb[idx, np.arange(t_bulk.size)] = 1.0
+        dtb_dt = np.zeros((nFull, nFull-1))
+        if (t_bulk_full[ 0] == 0.0):
+            t_bulk_full[ 0] = twall[ 0]
+            dtb_dtb[ 0,:] = 0.0
+            dtb_dt[  0, 0] = 1.0
+        if (t_bulk_full[-1] == 0.0):
+            t_bulk_full[-1] = twall[-1]
+            dtb_dtb[-1,:] = 0.0
+            dtb_dt[ -1,-1] = 1.0
+
+        # Inner radius at the nodes from the sectional wall thickness
+        dR_dt = np.zeros((nFull, nFull-1))
+        dR_dt[0,0] = dR_dt[-1,-1] = -1.0
+        dR_dt[np.arange(1,nFull-1), np.arange(nFull-2)] = -0.5
+        dR_dt[np.arange(1,nFull-1), np.arange(1,nFull-1)] = -0.5
+        dR_dd = 0.5
+
+        V_bulk = np.pi * R_id**2 * t_bulk_full
+        m_bulk = fact * rho * V_bulk
+        dm_dR  = fact * rho * np.pi * 2.0 * R_id * t_bulk_full
+        dm_dtb = fact * rho * np.pi * R_id**2
+
+        # Total derivatives of a function of the nodal R_id, t_bulk_full and m_bulk, given its partials to these
+        def chain(dR, dtb, dm):
+            dR  = dR  + dm * dm_dR
+            dtb = dtb + dm * dm_dtb
+            return {'d_full' : dR_dd * dR,
+                    't_full' : np.dot(dR, dR_dt) + np.dot(dtb, dtb_dt),
+                    'bulkhead_thickness' : np.dot(dtb, dtb_dtb),
+                    'rho' : np.dot(dm, fact * V_bulk),
+                    'bulkhead_mass_factor' : np.dot(dm, rho * V_bulk)}
+
+        # Bulkhead masses, one node at a time
+        J['bulkhead_mass','d_full'] = np.diag(dR_dd * dm_dR)
+        J['bulkhead_mass','t_full'] = dm_dR[:,np.newaxis]*dR_dt + dm_dtb[:,np.newaxis]*dtb_dt
+        J['bulkhead_mass','bulkhead_thickness'] = dm_dtb[:,np.newaxis]*dtb_dtb
+        J['bulkhead_mass','rho'] = fact * V_bulk
+        J['bulkhead_mass','bulkhead_mass_factor'] = rho * V_bulk
+
+        # Moments of inertia, only the diagonal terms are non-zero
+        dz  = z_full - z_full[0]
+        zero = np.zeros(nFull)
+        dIxx = chain(0.5*m_bulk*R_id, zero, 0.25*R_id**2 + dz**2)
+        dIzz = chain(m_bulk*R_id, zero, 0.5*R_id**2)
+        dIxx_dz = 2.0 * m_bulk * dz
+        dIxx_dz[0] = -dIxx_dz[1:].sum()
+        J['bulkhead_I_keel','z_full'] = np.vstack([dIxx_dz, dIxx_dz, np.zeros((4,nFull))])
+        for k in dIxx:
+            J['bulkhead_I_keel',k] = np.vstack([dIxx[k], dIxx[k], dIzz[k], np.zeros((3,dIxx[k].size))])
+
+        # Costs, see compute for the correlations
+        k_m     = inputs['material_cost_rate']
+        k_f     = inputs['labor_cost_rate']
+        k_p     = inputs['painting_cost_rate']
+        m_shell = inputs['shell_mass'].sum()
+        nbulk   = np.count_nonzero(V_bulk)
+        bulkind = (V_bulk > 0.0)
+        theta_w = 3.0
+        theta_p = 1.0
+        coeff_w = 0.3394
+        pp      = np.array([2.44908121e+02, 1.74461814e+01, 7.05214799e-02])
+        cutLengths = 2.0 * np.pi * R_id * bulkind
+
+        t_cut  = manufacture.steel_cutting_plasma_time(cutLengths, t_bulk_full)
+        t_weld = manufacture.steel_filett_welding_time(theta_w, nbulk, m_bulk+m_shell, 2*np.pi*R_id, t_bulk_full)
+        
+        dcut_dR  = 2.0 * np.pi * bulkind * np.polyval(pp, t_bulk_full)
+        dcut_dtb = cutLengths * np.polyval(np.polyder(pp), t_bulk_full)
+        dweld_dR = 1.3e-3 * coeff_w * 2*np.pi * (1e3*t_bulk_full)**1.9358
+        dweld_dtb = 1.3e-3 * coeff_w * 2*np.pi*R_id * 1.9358e3 * (1e3*t_bulk_full)**0.9358
+        sqrt_m  = np.sqrt(nbulk * (m_bulk+m_shell))
+        dweld_dm = np.zeros(nFull)
+        dweld_dm[sqrt_m > 0.0] = theta_w * 0.5 * nbulk / sqrt_m[sqrt_m > 0.0]
+        
+        dc = chain(k_f*(dcut_dR + dweld_dR) + k_p*theta_p*2*np.pi*2.0*R_id*bulkind,
+                   k_f*(dcut_dtb + dweld_dtb),
+                   k_m + k_f*dweld_dm)
+        for k in dc:
+            J['bulkhead_cost',k] = dc[k]
+        J['bulkhead_cost','shell_mass'] = k_f * dweld_dm.sum() * np.ones(nFull-1)
+        J['bulkhead_cost','material_cost_rate'] = m_bulk.sum()
+        J['bulkhead_cost','labor_cost_rate'] = t_cut + t_weld
+        J['bulkhead_cost','painting_cost_rate'] = theta_p * 2 * (np.pi * R_id**2.0 * bulkind).sum()
+
     
 
 class BuoyancyTankProperties(ExplicitComponent):
@@ -10,6 +10,8 @@ from wisdem.commonse.utilities import assembleI, unassembleI
 Anchor    = Enum('DRAGEMBEDMENT SUCTIONPILE')
 NLINES_MAX = 15
 NPTS_PLOT = 20
+HEADING_STEP = 10.0 # Heading step of the initial sweep for the weakest direction [deg]
+HEADING_TOL  = 0.5  # Heading resolution of the weakest direction [deg]
 
 class MapMooring(ExplicitComponent):
     """
@@ -17,6 +19,11 @@ class MapMooring(ExplicitComponent):
     Should be tightly coupled with Spar class for full system representation.
     """
 
+    def initialize(self):
+        # MAP++ session kept across calls, re-initialized only when the MAP input changes
+        self.mymap   = None
+        self.map_key = None
+
     def setup(self):
     
         # Variables local to the class and not OpenMDAO
@@ -417,14 +424,8 @@ class MapMooring(ExplicitComponent):
         # Write the mooring system input file for this design
         self.write_input_file(inputs, discrete_inputs)
 
-        # Initiate MAP++ for this design
-        mymap = pyMAP( )
-        #mymap.ierr = 0
-        mymap.map_set_sea_depth(waterDepth)
-        mymap.map_set_gravity(gravity)
-        mymap.map_set_sea_density(rhoWater)
-        mymap.read_list_input(self.finput)
-        mymap.init( )
+        # Initiate MAP++ for this design, or reuse the session of the previous call
+        mymap = self.get_map_session(inputs)
 
         # Get the stiffness matrix at neutral position
         mymap.displace_vessel(0, 0, 0, 0, 0, 0)
@@ -485,46 +486,29 @@ class MapMooring(ExplicitComponent):
 
         outputs['operational_heel_restoring_force'] = Fh
 
-        # Get angles by which to find the weakest line
-        dangle  = 2.0
-        angles  = np.deg2rad( np.arange(0.0, 360.0, dangle) )
-        nangles = len(angles)
-
         # Get restoring force at weakest line at maximum allowable offset
         # Will global minimum always be along mooring angle?
-        max_tension   = 0.0
-        max_angle     = None
-        min_angle     = None
-        F_max_tension = None
-        F_min         = np.inf
-        T = np.zeros((NLINES_MAX,))
-        F = np.zeros((NLINES_MAX,))
-        # Loop around all angles to find weakest point
-        for a in angles:
-            # Unit vector and offset in x-y components
-            idir  = np.array([np.cos(a), np.sin(a)])
-            surge = offset * idir[0]
-            sway  = offset * idir[1]
-
-            # Get restoring force of offset at this angle
-            mymap.displace_vessel(surge, sway, 0, 0, 0, 0) # 0s for z, angles
-            mymap.update_states(0.0, 0)
-            for k in range(ntotal):
-                # Force in x-y-z coordinates
-                fx,fy,fz = mymap.get_fairlead_force_3d(k)
-                T[k]     = np.sqrt(fx*fx + fy*fy + fz*fz)
-                # Total restoring force
-                F[k]     = np.dot([fx, fy], idir)
-                
-            # Check if this is the weakest direction (highest tension)
-            tempMax = T.max()
-            if tempMax > max_tension:
-                max_tension   = tempMax
-                F_max_tension = F.sum()
-                max_angle     = a
-            if F.sum() < F_min:
-                F_min     = F.sum()
-                min_angle = a
+        # Sweep around all headings with a coarse step, then refine the headings of highest line tension and
+        # lowest restoring force by halving the step around them
+        angles   = np.deg2rad( np.arange(0.0, 360.0, HEADING_STEP) )
+        T, F     = self.offset_sweep(mymap, offset, angles, ntotal)
+        angle_T  = angles[np.argmax(T)]
+        angle_F  = angles[np.argmin(F)]
+        max_tension = T.max()
+        F_min       = F.min()
+        dangle   = 0.5*np.deg2rad(HEADING_STEP)
+        while dangle >= np.deg2rad(HEADING_TOL):
+            angles = np.array([angle_T - dangle, angle_T + dangle, angle_F - dangle, angle_F + dangle])
+            T, F   = self.offset_sweep(mymap, offset, angles, ntotal)
+            k = np.argmax(T[:2])
+            if T[k] > max_tension:
+                max_tension = T[k]
+                angle_T     = angles[k]
+            k = 2 + np.argmin(F[2:])
+            if F[k] < F_min:
+                F_min   = F[k]
+                angle_F = angles[k]
+            dangle *= 0.5
                 
         # Store the weakest restoring force when the vessel is offset the maximum amount
         outputs['max_offset_restoring_force'] = F_min
@@ -535,7 +519,71 @@ class MapMooring(ExplicitComponent):
         else:
             outputs['axial_unity'] = gamma * max_tension / self.min_break_load
 
-        mymap.end()
+
+    def offset_sweep(self, mymap, offset, angles, ntotal):
+        """Offsets the vessel by the same distance in each of the given directions and returns the maximum line
+        tension and the total restoring force along the offset direction for each of them.
+        
+        INPUTS:
+        ----------
+        mymap    : pyMAP instance
+        offset   : vessel offset [m]
+        angles   : directions of the offset [rad]
+        ntotal   : number of mooring lines
+        
+        OUTPUTS  : maximum tension and restoring force arrays [N]
+        """
+        # Unit vector and offset in x-y components, 0s for z and angles
+        idir = np.c_[np.cos(angles), np.sin(angles)]
+        disp = np.zeros((angles.size, 6))
+        disp[:,:2] = offset * idir
+
+        # Force in x-y-z coordinates for every line
+        forces = np.array( mymap.offset_vessel_sweep(disp) )[:,:ntotal,:]
+        T = np.sqrt( np.sum(forces**2, axis=2) ).max(axis=1)
+        F = np.sum( forces[:,:,:2] * idir[:,np.newaxis,:], axis=(1,2) )
+        return T, F
+
+
+    def get_map_session(self, inputs):
+        """Returns a MAP++ instance initialized with the current input file (self.finput).
+        The instance of the previous call is reused when the line dictionary, nodes, lines, solver options and
+        environment are unchanged, so only the vessel displacement is applied and MAP++ starts the catenary solve
+        from the last equilibrium.  Otherwise the previous instance is ended and a new one is initialized.
+        
+        INPUTS:
+        ----------
+        inputs   : dictionary of input parameters
+        
+        OUTPUTS  : pyMAP instance
+        """
+        key = (tuple(self.finput), float(inputs['water_depth']), float(inputs['water_density']))
+        if self.mymap is not None and key == self.map_key:
+            return self.mymap
+
+        self.end_map_session()
+        mymap = pyMAP( )
+        mymap.map_set_sea_depth(inputs['water_depth'])
+        mymap.map_set_gravity(gravity)
+        mymap.map_set_sea_density(inputs['water_density'])
+        mymap.read_list_input(self.finput)
+        mymap.init( )
+        self.mymap   = mymap
+        self.map_key = key
+        return mymap
+
+
+    def end_map_session(self):
+        """Ends the MAP++ instance kept by get_map_session, if any"""
+        if self.mymap is not None:
+            self.mymap.end()
+        self.mymap   = None
+        self.map_key = None
+
+
+    def cleanup(self):
+        self.end_map_session()
+        super(MapMooring, self).cleanup()
 
         
     def compute_cost(self, inputs, discrete_inputs, outputs):
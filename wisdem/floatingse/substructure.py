@@ -3,8 +3,33 @@ import numpy as np
 from scipy.integrate import cumtrapz
 
 from wisdem.commonse import gravity, eps, DirectionVector, NFREQ
-from wisdem.commonse.utilities import assembleI, unassembleI
+from wisdem.commonse.utilities import assembleI, unassembleI, interp_with_deriv, trapz_deriv
 from .map_mooring import NLINES_MAX
+
+
+def _interp_deriv(x, xp, yp):
+    """np.interp and its derivatives with respect to x, xp and yp, constant outside of xp like np.interp"""
+    x = np.atleast_1d(x)
+    _, dy_dx, dy_dxp, dy_dyp = interp_with_deriv(x, xp, yp)
+    dy_dx = np.atleast_2d(dy_dx).diagonal().copy()
+    for ind, k in [(x < xp[0], 0), (x > xp[-1], -1)]:
+        dy_dx[ind]  = 0.0
+        dy_dxp[ind] = 0.0
+        dy_dyp[ind] = 0.0
+        dy_dyp[ind, k] = 1.0
+    return np.interp(x, xp, yp), dy_dx, dy_dxp, dy_dyp
+
+
+def _parallel_axis(m, dm, R, dR):
+    """Parallel axis term m*(R.R*I - R R^T) as [xx yy zz xy xz yz] and its derivatives, given the derivatives dm
+    (vector) and dR (3 rows) of the mass and of the offset"""
+    x, y, z = R
+    dx, dy, dz = dR
+    Ir  = np.array([y**2 + z**2, x**2 + z**2, x**2 + y**2, -x*y, -x*z, -y*z])
+    dIr = np.vstack([2*y*dy + 2*z*dz, 2*x*dx + 2*z*dz, 2*x*dx + 2*y*dy,
+                     -(x*dy + y*dx), -(x*dz + z*dx), -(y*dz + z*dy)])
+    return m*Ir, np.outer(Ir, dm) + m*dIr
+
         
 class SubstructureGeometry(ExplicitComponent):
     """
@@ -47,7 +72,15 @@ class SubstructureGeometry(ExplicitComponent):
 
         
         # Derivatives
-        self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        fairlead_inputs = ['main_d_full', 'offset_d_full', 'main_z_nodes', 'offset_z_nodes', 'fairlead_location']
+        self.declare_partials('main_offset_spacing', ['main_d_full', 'offset_d_full', 'radius_to_offset_column'])
+        self.declare_partials('fairlead', ['main_z_nodes', 'offset_z_nodes', 'fairlead_location'])
+        self.declare_partials('fairlead_radius', fairlead_inputs + ['fairlead_offset_from_shell', 'radius_to_offset_column'])
+        self.declare_partials('wave_height_fairlead_ratio', ['main_z_nodes', 'offset_z_nodes', 'fairlead_location', 'Hs'])
+        self.declare_partials('tower_transition_buffer', ['main_d_full', 'tower_d_full'])
+        self.declare_partials('nacelle_transition_buffer', ['Rhub', 'tower_d_full'])
+        self.declare_partials('offset_freeboard_heel_margin', ['offset_freeboard', 'radius_to_offset_column', 'max_survival_heel'])
+        self.declare_partials('offset_draft_heel_margin', ['offset_draft', 'radius_to_offset_column', 'max_survival_heel'])
 
         
     def compute(self, inputs, outputs):
@@ -101,6 +134,75 @@ class SubstructureGeometry(ExplicitComponent):
         outputs['offset_freeboard_heel_margin'] = off_freeboard - heel_deflect
         outputs['offset_draft_heel_margin']     = off_draft - heel_deflect
 
+    def compute_partials(self, inputs, J):
+        nFull           = self.options['nFull']
+        nFullTow        = self.options['nFullTow']
+        ncolumns        = int(inputs['number_of_offset_columns'])
+        R_semi          = inputs['radius_to_offset_column']
+        location        = inputs['fairlead_location']
+        max_heel        = inputs['max_survival_heel']
+
+        # Spacing constraint only sees the widest section of each column
+        dspace_dmain   = np.zeros(nFull)
+        dspace_doffset = np.zeros(nFull)
+        dspace_dmain[np.argmax(inputs['main_d_full'])]     = -0.5
+        dspace_doffset[np.argmax(inputs['offset_d_full'])] = -0.5
+        J['main_offset_spacing','main_d_full']             = dspace_dmain
+        J['main_offset_spacing','offset_d_full']           = dspace_doffset
+        J['main_offset_spacing','radius_to_offset_column'] = 1.0
+
+        # Fairlead is placed on the offset columns if there are any, on the main column otherwise
+        if ncolumns > 0:
+            zkey, dkey, zother, dother = 'offset_z_nodes', 'offset_d_full', 'main_z_nodes', 'main_d_full'
+        else:
+            zkey, dkey, zother, dother = 'main_z_nodes', 'main_d_full', 'offset_z_nodes', 'offset_d_full'
+        z_nodes    = inputs[zkey]
+        z_fairlead = location * (z_nodes[-1] - z_nodes[0]) + z_nodes[0]
+        dzf_dz     = np.zeros(nFull)
+        dzf_dz[0]  = 1.0 - location
+        dzf_dz[-1] = location
+        dzf_dloc   = z_nodes[-1] - z_nodes[0]
+        _, dr_dzf, dr_dz, dr_dr = _interp_deriv(z_fairlead, z_nodes, 0.5*inputs[dkey])
+        dr_dzf = dr_dzf[0]
+
+        J['fairlead',zkey]               = -dzf_dz
+        J['fairlead',zother]             = np.zeros(nFull)
+        J['fairlead','fairlead_location'] = -dzf_dloc
+
+        J['fairlead_radius',zkey]   = dr_dz.flatten() + dr_dzf*dzf_dz
+        J['fairlead_radius',zother] = np.zeros(nFull)
+        J['fairlead_radius',dkey]   = 0.5*dr_dr.flatten()
+        J['fairlead_radius',dother] = np.zeros(nFull)
+        J['fairlead_radius','fairlead_location']          = dr_dzf*dzf_dloc
+        J['fairlead_radius','fairlead_offset_from_shell'] = 1.0
+        J['fairlead_radius','radius_to_offset_column']    = 1.0 if ncolumns > 0 else 0.0
+
+        dratio_dzf = -inputs['Hs'] * np.sign(z_fairlead) / z_fairlead**2
+        J['wave_height_fairlead_ratio',zkey]   = dratio_dzf*dzf_dz
+        J['wave_height_fairlead_ratio',zother] = np.zeros(nFull)
+        J['wave_height_fairlead_ratio','fairlead_location'] = dratio_dzf*dzf_dloc
+        J['wave_height_fairlead_ratio','Hs'] = 1.0 / np.abs(z_fairlead)
+
+        # Tower and nacelle transitions
+        dbuffer_dmain     = np.zeros(nFull)
+        dbuffer_dmain[-1] = 0.5
+        dbuffer_dtower     = np.zeros(nFullTow)
+        dbuffer_dtower[0]  = -0.5
+        J['tower_transition_buffer','main_d_full']  = dbuffer_dmain
+        J['tower_transition_buffer','tower_d_full'] = dbuffer_dtower
+        dbuffer_dtower     = np.zeros(nFullTow)
+        dbuffer_dtower[-1] = -0.5
+        J['nacelle_transition_buffer','Rhub']         = 1.0
+        J['nacelle_transition_buffer','tower_d_full'] = dbuffer_dtower
+
+        # Heel margins
+        ddeflect_dR    = np.sin(np.deg2rad(max_heel))
+        ddeflect_dheel = R_semi*np.cos(np.deg2rad(max_heel))*np.deg2rad(1.0)
+        for k, var in [('offset_freeboard_heel_margin', 'offset_freeboard'), ('offset_draft_heel_margin', 'offset_draft')]:
+            J[k,var] = 1.0
+            J[k,'radius_to_offset_column'] = -ddeflect_dR
+            J[k,'max_survival_heel']       = -ddeflect_dheel
+
 
 
 class Substructure(ExplicitComponent):
@@ -203,7 +305,44 @@ class Substructure(ExplicitComponent):
         
         
         # Derivatives
-        self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        balance   = ['structural_mass', 'mooring_neutral_load', 'total_displacement', 'water_density',
+                     'water_ballast_zpts_vector', 'water_ballast_radius_vector']
+        cg        = balance + ['structure_center_of_mass']
+        stability = cg + ['z_center_of_buoyancy', 'main_Iwaterplane', 'offset_Iwaterplane', 'offset_Awaterplane', 'radius_to_offset_column']
+        inertia   = cg + ['radius_to_offset_column', 'main_mass', 'main_center_of_mass', 'main_moments_of_inertia',
+                          'offset_mass', 'offset_center_of_mass', 'offset_moments_of_inertia']
+        mass      = inertia + ['tower_mass', 'tower_I_base', 'tower_z_full', 'rna_mass', 'rna_cg', 'rna_I']
+        added     = cg + ['radius_to_offset_column', 'main_added_mass', 'main_center_of_buoyancy',
+                          'offset_added_mass', 'offset_center_of_buoyancy']
+        stiffness = stability + ['main_Awaterplane']
+        periods   = sorted(set(mass + added + stiffness + ['mooring_stiffness']))
+        waves     = ['wave_period_range_low', 'wave_period_range_high']
+
+        self.partials_wrt = {'substructure_moments_of_inertia' : inertia,
+                             'total_mass' : ['structural_mass', 'mooring_mass'],
+                             'total_cost' : ['mooring_cost', 'offset_cost', 'main_cost', 'pontoon_cost', 'tower_shell_cost'],
+                             'metacentric_height' : stability,
+                             'buoyancy_to_gravity' : cg + ['z_center_of_buoyancy'],
+                             'offset_force_ratio' : ['total_force', 'mooring_surge_restoring_force'],
+                             'heel_moment_ratio' : stability + ['operational_heel', 'total_moment', 'mooring_pitch_restoring_force',
+                                                                'fairlead', 'fairlead_radius'],
+                             'Iwaterplane_system' : ['offset_Iwaterplane'],
+                             'center_of_mass' : cg,
+                             'variable_ballast_mass' : ['structural_mass', 'mooring_neutral_load', 'total_displacement', 'water_density'],
+                             'variable_ballast_center_of_mass' : balance,
+                             'variable_ballast_moments_of_inertia' : balance,
+                             'variable_ballast_height' : balance,
+                             'variable_ballast_height_ratio' : balance,
+                             'mass_matrix' : mass,
+                             'added_mass_matrix' : added,
+                             'hydrostatic_stiffness' : stiffness,
+                             'rigid_body_periods' : periods,
+                             'period_margin_low' : periods + waves,
+                             'period_margin_high' : periods + waves,
+                             'modal_margin_low' : ['structural_frequencies'] + waves,
+                             'modal_margin_high' : ['structural_frequencies'] + waves}
+        for of, wrt in self.partials_wrt.items():
+            self.declare_partials(of, wrt)
         
     def compute(self, inputs, outputs):
         # TODO: Get centerlines right- in sparGeometry?
@@ -278,7 +417,7 @@ class Substructure(ExplicitComponent):
         r_int = np.interp(z_int, z_water_data, r_water_data)
         Izz   = 0.5 * rhoWater * np.pi * np.trapz(r_int**4, z_int)
         Ixx   = rhoWater * np.pi * np.trapz(0.25*r_int**4 + r_int**2*(z_int-z_cg)**2, z_int)
-        outputs['variable_ballast_moments_of_inertia'] = np.array([Ixx, Ixx, Izz, 0.0, 0.0, 0.0])
+        outputs['variable_ballast_moments_of_inertia'] = np.r_[Ixx, Ixx, Izz, 0.0, 0.0, 0.0]
 
         
     def compute_stability(self, inputs, outputs):
@@ -312,7 +451,7 @@ class Substructure(ExplicitComponent):
         # and http://farside.ph.utexas.edu/teaching/336L/Fluidhtml/node30.html
 
         # Water plane area of all components with parallel axis theorem
-        Iwater_system = Iwater_main
+        Iwater_system = np.copy(Iwater_main)
         radii = R_semi * np.cos( np.linspace(0, 2*np.pi, ncolumn+1) )
         for k in range(ncolumn):
             Iwater_system += Iwater_column + Awater_column*radii[k]**2
@@ -427,7 +566,7 @@ class Substructure(ExplicitComponent):
         # Save what we have so far as m_substructure & I_substructure and move to its own CM
         m_subs    =  m_main           + ncolumn*m_column             + m_water
         z_cg_subs = (m_main*z_cg_main + ncolumn*m_column*z_cg_column + m_water*z_cg_water) / m_subs
-        R              = r_cg - np.array([0.0, 0.0, z_cg_subs])
+        R              = r_cg - np.r_[0.0, 0.0, z_cg_subs]
         I_substructure = I_total + m_subs*(np.dot(R, R)*np.eye(3) - np.outer(R, R))
         outputs['substructure_moments_of_inertia'] = unassembleI( I_total )
 
@@ -505,6 +644,297 @@ class Substructure(ExplicitComponent):
         outputs['modal_margin_low']  = T_struct / indicator_low
         
         
+    def compute_partials(self, inputs, J):
+        """Derivatives of all outputs, carried forward through the same steps as compute.  Every intermediate
+        quantity q comes with dq, its gradient with respect to all inputs flattened into one vector."""
+        nFull   = self.options['nFull']
+        ncolumn = int(inputs['number_of_offset_columns'])
+        nDOF    = 6
+
+        # Layout of the flattened inputs
+        wrt_names = sorted(set( sum(self.partials_wrt.values(), []) ))
+        sizes     = [inputs[k].size for k in wrt_names]
+        offsets   = dict(zip(wrt_names, np.r_[0, np.cumsum(sizes)[:-1]]))
+        N         = np.sum(sizes)
+        def val(name):
+            return inputs[name].flatten()
+        def grad(name):
+            d = np.zeros((inputs[name].size, N))
+            d[:, offsets[name]:offsets[name]+inputs[name].size] = np.eye(inputs[name].size)
+            return d
+
+        # ---- Balance, see balance()
+        m_struct, dm_struct = val('structural_mass')[0], grad('structural_mass')[0]
+        V_system, dV_system = val('total_displacement')[0], grad('total_displacement')[0]
+        rhoWater, drhoWater = val('water_density')[0], grad('water_density')[0]
+        Fz_mooring  = np.sum( inputs['mooring_neutral_load'][:,-1] )
+        dFz_mooring = grad('mooring_neutral_load')[2::3,:].sum(axis=0)
+        cg_struct, dcg_struct = val('structure_center_of_mass'), grad('structure_center_of_mass')
+        z_water_data, dz_water_data = val('water_ballast_zpts_vector'), grad('water_ballast_zpts_vector')
+        r_water_data, dr_water_data = val('water_ballast_radius_vector'), grad('water_ballast_radius_vector')
+
+        m_water  = V_system*rhoWater - (m_struct + Fz_mooring/gravity)
+        dm_water = rhoWater*dV_system + V_system*drhoWater - dm_struct - dFz_mooring/gravity
+        m_system  = m_struct + m_water
+        dm_system = dm_struct + dm_water
+
+        # Cumulative ballast mass at the ballast z-points
+        dz_seg  = np.diff(z_water_data)
+        r2_seg  = 0.5*(r_water_data[:-1]**2 + r_water_data[1:]**2)
+        dV_seg  = ((r_water_data[:-1]*dz_seg)[:,np.newaxis] * dr_water_data[:-1,:] +
+                   (r_water_data[1:] *dz_seg)[:,np.newaxis] * dr_water_data[1:,:] +
+                   r2_seg[:,np.newaxis] * (dz_water_data[1:,:] - dz_water_data[:-1,:]))
+        V_water_data  = np.r_[0.0, cumtrapz(r_water_data**2, z_water_data)]
+        m_water_data  = rhoWater * np.pi * V_water_data
+        dm_water_data = np.pi * (rhoWater * np.r_[np.zeros((1,N)), np.cumsum(dV_seg, axis=0)] + np.outer(V_water_data, drhoWater))
+        
+        if m_water_data[-1] < m_water:
+            z_end  = z_water_data[-1]
+            dz_end = dz_water_data[-1,:]
+            coeff  = m_water / m_water_data[-1]
+            dcoeff = dm_water / m_water_data[-1] - m_water / m_water_data[-1]**2 * dm_water_data[-1,:]
+        elif m_water < 0.0:
+            z_end  = z_water_data[0]
+            dz_end = dz_water_data[0,:]
+            coeff  = 0.0
+            dcoeff = np.zeros(N)
+        else:
+            z_end, dz_dm, dz_dmdata, dz_dzdata = _interp_deriv(m_water, m_water_data, z_water_data)
+            z_end  = z_end[0]
+            dz_end = dz_dm[0]*dm_water + np.dot(dz_dmdata, dm_water_data)[0] + np.dot(dz_dzdata, dz_water_data)[0]
+            coeff  = 1.0
+            dcoeff = np.zeros(N)
+        h_water  = z_end - z_water_data[0]
+        dh_water = dz_end - dz_water_data[0,:]
+        h_avail  = z_water_data[-1] - z_water_data[0]
+        dh_avail = dz_water_data[-1,:] - dz_water_data[0,:]
+        dh_ballast = coeff*dh_water + h_water*dcoeff
+
+        # Center of mass of the variable ballast and of the whole system
+        m_half  = 0.5*coeff*m_water
+        dm_half = 0.5*(coeff*dm_water + m_water*dcoeff)
+        z_cg, dz_dm, dz_dmdata, dz_dzdata = _interp_deriv(m_half, m_water_data, z_water_data)
+        z_cg  = z_cg[0]
+        dz_cg = dz_dm[0]*dm_half + np.dot(dz_dmdata, dm_water_data)[0] + np.dot(dz_dzdata, dz_water_data)[0]
+
+        r_cg  = (m_struct*cg_struct + m_water*np.r_[0.0, 0.0, z_cg]) / m_system
+        dr_cg = np.outer(cg_struct, dm_struct) + m_struct*dcg_struct
+        dr_cg[2,:] += z_cg*dm_water + m_water*dz_cg
+        dr_cg = (dr_cg - np.outer(r_cg, dm_system)) / m_system
+
+        # Moment of inertia of variable ballast
+        npts  = 100
+        s_int = np.linspace(0.0, 1.0, npts)
+        z_int = np.linspace(z_water_data[0], z_end, npts)
+        dz_int = np.outer(1.0-s_int, dz_water_data[0,:]) + np.outer(s_int, dz_end)
+        r_int, dr_dz, dr_dzdata, dr_drdata = _interp_deriv(z_int, z_water_data, r_water_data)
+        dr_int = dr_dz[:,np.newaxis]*dz_int + np.dot(dr_dzdata, dz_water_data) + np.dot(dr_drdata, dr_water_data)
+
+        yzz = r_int**4
+        dyzz = (4*r_int**3)[:,np.newaxis] * dr_int
+        dI_dy, dI_dx = trapz_deriv(yzz, z_int)
+        Izz  = 0.5 * rhoWater * np.pi * np.trapz(yzz, z_int)
+        dIzz = 0.5 * np.pi * (np.trapz(yzz, z_int)*drhoWater + rhoWater*(np.dot(dI_dy, dyzz) + np.dot(dI_dx, dz_int)))
+
+        dz_rel = z_int - z_cg
+        yxx  = 0.25*r_int**4 + r_int**2*dz_rel**2
+        dyxx = ((r_int**3 + 2*r_int*dz_rel**2)[:,np.newaxis] * dr_int +
+                (2*r_int**2*dz_rel)[:,np.newaxis] * (dz_int - dz_cg[np.newaxis,:]))
+        dI_dy, dI_dx = trapz_deriv(yxx, z_int)
+        Ixx  = rhoWater * np.pi * np.trapz(yxx, z_int)
+        dIxx = np.pi * (np.trapz(yxx, z_int)*drhoWater + rhoWater*(np.dot(dI_dy, dyxx) + np.dot(dI_dx, dz_int)))
+        I_water  = np.array([Ixx, Ixx, Izz, 0.0, 0.0, 0.0])
+        dI_water = np.vstack([dIxx, dIxx, dIzz, np.zeros((3,N))])
+
+        d = {}
+        d['total_mass'] = grad('structural_mass') + grad('mooring_mass')
+        d['variable_ballast_mass']         = dm_water
+        d['variable_ballast_height']       = dh_ballast
+        d['variable_ballast_height_ratio'] = dh_ballast/h_avail - coeff*h_water/h_avail**2 * dh_avail
+        d['variable_ballast_center_of_mass'] = dz_cg
+        d['variable_ballast_moments_of_inertia'] = dI_water
+        d['center_of_mass'] = dr_cg
+
+        # ---- Stability, see compute_stability()
+        z_cb, dz_cb = val('z_center_of_buoyancy')[0], grad('z_center_of_buoyancy')[0]
+        Awater_column, dAwater_column = val('offset_Awaterplane')[0], grad('offset_Awaterplane')[0]
+        R_semi, dR_semi = val('radius_to_offset_column')[0], grad('radius_to_offset_column')[0]
+        oper_heel  = np.deg2rad( val('operational_heel')[0] )
+        doper_heel = np.deg2rad( grad('operational_heel')[0] )
+        
+        cos2 = np.sum( np.cos( np.linspace(0, 2*np.pi, ncolumn+1)[:ncolumn] )**2 )
+        Iwater_system  = val('main_Iwaterplane')[0] + ncolumn*val('offset_Iwaterplane')[0] + Awater_column*R_semi**2*cos2
+        dIwater_system = (grad('main_Iwaterplane')[0] + ncolumn*grad('offset_Iwaterplane')[0] +
+                          R_semi**2*cos2*dAwater_column + 2*Awater_column*R_semi*cos2*dR_semi)
+        d['Iwaterplane_system'] = grad('offset_Iwaterplane')
+
+        d['buoyancy_to_gravity'] = dr_cg[2,:] - dz_cb
+        h_metacenter  = Iwater_system/V_system - (r_cg[2] - z_cb)
+        dh_metacenter = dIwater_system/V_system - Iwater_system/V_system**2*dV_system - d['buoyancy_to_gravity']
+        d['metacentric_height'] = dh_metacenter
+
+        F_buoy  = V_system * rhoWater * gravity
+        dF_buoy = gravity * (rhoWater*dV_system + V_system*drhoWater)
+        M_restore  = h_metacenter * np.sin(oper_heel) * F_buoy
+        dM_restore = (np.sin(oper_heel)*F_buoy*dh_metacenter + h_metacenter*np.cos(oper_heel)*F_buoy*doper_heel +
+                      h_metacenter*np.sin(oper_heel)*dF_buoy)
+
+        # Mooring restoring moment about y of the heeled fairleads, M.y = z_hub*F_x - x_hub*F_z
+        F_pitch  = inputs['mooring_pitch_restoring_force']
+        dF_pitch = grad('mooring_pitch_restoring_force')
+        nlines   = np.count_nonzero(F_pitch[:,2])
+        R_fair, dR_fair = val('fairlead_radius')[0], grad('fairlead_radius')[0]
+        z_moor   = -val('fairlead')[0] - r_cg[2]
+        dz_moor  = -grad('fairlead')[0] - dr_cg[2,:]
+        c, s     = np.cos(oper_heel), np.sin(oper_heel)
+        for k, angle in enumerate( np.linspace(0, 2*np.pi, nlines+1)[:-1] ):
+            x_moor = R_fair*np.cos(angle)
+            Fx, Fz = F_pitch[k,0], F_pitch[k,2]
+            M_restore  += (z_moor*c + x_moor*s)*Fx - (x_moor*c - z_moor*s)*Fz
+            dM_restore += ((z_moor*c + x_moor*s)*dF_pitch[3*k,:] - (x_moor*c - z_moor*s)*dF_pitch[3*k+2,:] +
+                           (c*Fx + s*Fz)*dz_moor + (s*Fx - c*Fz)*np.cos(angle)*dR_fair +
+                           ((x_moor*c - z_moor*s)*Fx + (x_moor*s + z_moor*c)*Fz)*doper_heel)
+
+        M_pitch, dM_pitch = val('total_moment')[1], grad('total_moment')[1]
+        heel_ratio  = c**2 * M_pitch / M_restore
+        dheel_ratio = (c**2*dM_pitch - 2*c*s*M_pitch*doper_heel) / M_restore - heel_ratio / M_restore * dM_restore
+        d['heel_moment_ratio'] = np.sign(heel_ratio) * dheel_ratio
+
+        F_surge, dF_surge     = val('total_force')[0], grad('total_force')[0]
+        F_restore, dF_restore = val('mooring_surge_restoring_force')[0], grad('mooring_surge_restoring_force')[0]
+        force_ratio = F_surge / F_restore
+        d['offset_force_ratio'] = np.sign(force_ratio) * (dF_surge - force_ratio*dF_restore) / F_restore
+
+        # ---- Rigid body periods, see compute_rigid_body_periods()
+        radii_x  = np.cos( np.linspace(0, 2*np.pi, ncolumn+1) )[:ncolumn]
+        radii_y  = np.sin( np.linspace(0, 2*np.pi, ncolumn+1) )[:ncolumn]
+        m_water_pos  = max(0.0, m_water)
+        dm_water_pos = dm_water if m_water > 0.0 else np.zeros(N)
+
+        # Position and derivative of a point relative to the system center of mass
+        def offset(x, y, z, dx, dy, dz):
+            R  = np.array([x, y, z]) - r_cg
+            dR = np.vstack([dx, dy, dz]) - dr_cg
+            return R, dR
+        zero = np.zeros(N)
+        
+        M_mat  = np.zeros(nDOF)
+        dM_mat = np.zeros((nDOF, N))
+        M_mat[:3]  = m_struct + m_water_pos
+        dM_mat[:3] = dm_struct + dm_water_pos
+
+        m_main, dm_main = val('main_mass').sum(), grad('main_mass').sum(axis=0)
+        R, dR   = offset(0.0, 0.0, val('main_center_of_mass')[0], zero, zero, grad('main_center_of_mass')[0])
+        I, dI   = _parallel_axis(m_main, dm_main, R, dR)
+        I_total  = val('main_moments_of_inertia') + I
+        dI_total = grad('main_moments_of_inertia') + dI
+
+        m_column, dm_column = val('offset_mass').sum(), grad('offset_mass').sum(axis=0)
+        for k in range(ncolumn):
+            R, dR = offset(R_semi*radii_x[k], R_semi*radii_y[k], val('offset_center_of_mass')[0],
+                           radii_x[k]*dR_semi, radii_y[k]*dR_semi, grad('offset_center_of_mass')[0])
+            I, dI = _parallel_axis(m_column, dm_column, R, dR)
+            I_total  += val('offset_moments_of_inertia') + I
+            dI_total += grad('offset_moments_of_inertia') + dI
+
+        R, dR = offset(0.0, 0.0, z_cg, zero, zero, dz_cg)
+        I, dI = _parallel_axis(m_water_pos, dm_water_pos, R, dR)
+        I_total  += I_water + I
+        dI_total += dI_water + dI
+        d['substructure_moments_of_inertia'] = dI_total.copy()
+
+        z_tower, dz_tower = val('tower_z_full'), grad('tower_z_full')
+        R, dR = offset(0.0, 0.0, z_tower[0], zero, zero, dz_tower[0])
+        I, dI = _parallel_axis(val('tower_mass')[0], grad('tower_mass')[0], R, dR)
+        I_total  += val('tower_I_base') + I
+        dI_total += grad('tower_I_base') + dI
+
+        cg_rna, dcg_rna = val('rna_cg'), grad('rna_cg')
+        R, dR = offset(cg_rna[0], cg_rna[1], z_tower[-1] + cg_rna[2], dcg_rna[0], dcg_rna[1], dz_tower[-1] + dcg_rna[2])
+        I, dI = _parallel_axis(val('rna_mass')[0], grad('rna_mass')[0], R, dR)
+        I_total  += val('rna_I') + I
+        dI_total += grad('rna_I') + dI
+        M_mat[3:]  = I_total[:3]
+        dM_mat[3:] = dI_total[:3]
+        d['mass_matrix'] = dM_mat
+
+        # Added mass
+        m_a_main, dm_a_main     = val('main_added_mass'), grad('main_added_mass')
+        m_a_column, dm_a_column = val('offset_added_mass'), grad('offset_added_mass')
+        A_mat  = np.zeros(nDOF)
+        dA_mat = np.zeros((nDOF, N))
+        A_mat[:3]  = m_a_main[:3] + ncolumn*m_a_column[:3]
+        dA_mat[:3] = dm_a_main[:3] + ncolumn*dm_a_column[:3]
+
+        R, dR = offset(0.0, 0.0, val('main_center_of_buoyancy')[0], zero, zero, grad('main_center_of_buoyancy')[0])
+        I, dI = _parallel_axis(m_a_main[0], dm_a_main[0], R, dR)
+        I_total  = np.r_[m_a_main[3:], np.zeros(3)] + I
+        dI_total = np.vstack([dm_a_main[3:], np.zeros((3,N))]) + dI
+        for k in range(ncolumn):
+            R, dR = offset(R_semi*radii_x[k], R_semi*radii_y[k], val('offset_center_of_buoyancy')[0],
+                           radii_x[k]*dR_semi, radii_y[k]*dR_semi, grad('offset_center_of_buoyancy')[0])
+            I, dI = _parallel_axis(m_a_column[0], dm_a_column[0], R, dR)
+            I_total  += np.r_[m_a_column[3:], np.zeros(3)] + I
+            dI_total += np.vstack([dm_a_column[3:], np.zeros((3,N))]) + dI
+        A_mat[3:]  = I_total[:3]
+        dA_mat[3:] = dI_total[:3]
+        d['added_mass_matrix'] = dA_mat
+
+        # Hydrostatic and mooring stiffness
+        K_hydro  = np.zeros(nDOF)
+        dK_hydro = np.zeros((nDOF, N))
+        Awater   = val('main_Awaterplane')[0] + ncolumn*Awater_column
+        dAwater  = grad('main_Awaterplane')[0] + ncolumn*dAwater_column
+        K_hydro[2]    = rhoWater * gravity * Awater
+        dK_hydro[2]   = gravity * (Awater*drhoWater + rhoWater*dAwater)
+        K_hydro[3:5]  = rhoWater * gravity * V_system * h_metacenter
+        dK_hydro[3:5] = gravity * (V_system*h_metacenter*drhoWater + rhoWater*h_metacenter*dV_system + rhoWater*V_system*dh_metacenter)
+        d['hydrostatic_stiffness'] = dK_hydro
+
+        K_moor  = np.diag( inputs['mooring_stiffness'] )
+        dK_moor = grad('mooring_stiffness')[::nDOF+1]
+        K_total  = K_hydro + K_moor
+        dK_total = (dK_hydro + dK_moor) * (K_total > 0.0)[:,np.newaxis]
+        K_total  = np.maximum(K_total, 0.0)
+
+        epsilon = 1e-6
+        MA      = M_mat + A_mat
+        ratio   = MA / (K_total + epsilon)
+        dratio  = ((dM_mat + dA_mat) - (ratio[:,np.newaxis] * dK_total)) / (K_total + epsilon)[:,np.newaxis]
+        T_sys   = 2*np.pi * np.sqrt(ratio)
+        dT_sys  = np.zeros((nDOF, N))
+        dT_sys[ratio > 0.0] = (np.pi / np.sqrt(ratio[ratio > 0.0]))[:,np.newaxis] * dratio[ratio > 0.0]
+        d['rigid_body_periods'] = dT_sys
+
+        # ---- Frequency margins, see check_frequency_margins()
+        T_wave_low,  dT_wave_low  = val('wave_period_range_low')[0],  grad('wave_period_range_low')[0]
+        T_wave_high, dT_wave_high = val('wave_period_range_high')[0], grad('wave_period_range_high')[0]
+        f_struct  = val('structural_frequencies')
+        T_struct  = 1.0 / f_struct
+        dT_struct = -grad('structural_frequencies') / f_struct[:,np.newaxis]**2
+
+        # Margin T / T_wave, unless the indicator was replaced by a constant
+        def margin(T, dT, T_wave, dT_wave, use_wave, const):
+            indicator = np.where(use_wave, T_wave, const)
+            return (dT - np.outer(use_wave*T/indicator, dT_wave)) / indicator[:,np.newaxis]
+
+        not_yaw = np.arange(nDOF) < nDOF-1
+        d['period_margin_high'] = margin(T_sys, dT_sys, T_wave_high, dT_wave_high, (T_sys >= T_wave_low) & not_yaw, 1e-16)
+        d['period_margin_low']  = margin(T_sys, dT_sys, T_wave_low, dT_wave_low, (T_sys <= T_wave_high) & not_yaw, 1e30)
+        d['modal_margin_high']  = margin(T_struct, dT_struct, T_wave_high, dT_wave_high, T_struct >= T_wave_low, 1e-16)
+        d['modal_margin_low']   = margin(T_struct, dT_struct, T_wave_low, dT_wave_low, T_struct <= T_wave_high, 1e30)
+
+        # ---- Costs, see compute_costs()
+        d['total_cost'] = (grad('mooring_cost') + ncolumn*grad('offset_cost') + grad('main_cost') +
+                           grad('pontoon_cost') + grad('tower_shell_cost'))
+
+        # Split the gradients by input
+        for of, wrt in self.partials_wrt.items():
+            dof = np.atleast_2d(d[of])
+            for k in wrt:
+                J[of, k] = dof[:, offsets[k]:offsets[k]+inputs[k].size]
+
+        
     def compute_costs(self, inputs, outputs):
         # Unpack variables
         ncolumn    = int(inputs['number_of_offset_columns'])
@@ -121,11 +121,12 @@ Beam::Beam(const SectionData& sec, const Loads& loads,
         GJ[i] = Poly(2, sec.GJ(i+1) - sec.GJ(i), sec.GJ(i));
         rhoA[i] = Poly(2, sec.rhoA(i+1) - sec.rhoA(i), sec.rhoA(i));
         rhoJ[i] = Poly(2, sec.rhoJ(i+1) - sec.rhoJ(i), sec.rhoJ(i));
-        Px[i] = Poly(2, loads.Px(i+1) - loads.Px(i), loads.Px(i));
-        Py[i] = Poly(2, loads.Py(i+1) - loads.Py(i), loads.Py(i));
-        Pz[i] = Poly(2, loads.Pz(i+1) - loads.Pz(i), loads.Pz(i));
     }
 
+    linearLoads(loads.Px, Px);
+    linearLoads(loads.Py, Py);
+    linearLoads(loads.Pz, Pz);
+
     translateFromGlobalToFEACoordinateSystem();
 
     assembleMatrices();
@@ -232,6 +233,20 @@ void Beam::assembleMatrices(){
     // apply base b.c.
     length = applyBaseBoundaryCondition(base.k, base.rigid, nodes, KFull, MFull, NotherFull, NFull, FFull, K, M, Nother, N, F);
 
+    // stiffness does not depend on the loads, factor once
+    Kfactor.compute(K);
+
+}
+
+
+// private method
+void Beam::linearLoads(const Vector &P_node, PolyVec &P) const{
+
+    P.resize(nodes-1);
+
+    for (int i = 0; i < nodes-1; i++) {
+        P[i] = Poly(2, P_node(i+1) - P_node(i), P_node(i));
+    }
 }
 
 
@@ -353,13 +368,62 @@ void Beam::naturalFrequencies(bool cmpVec, int n, Vector &freq, Matrix &vec) con
 void Beam::computeDisplacement(Vector &dx, Vector &dy, Vector&dz, Vector &dtheta_x, Vector &dtheta_y, Vector &dtheta_z) const{
 
     // solve linear system
-    Vector q(length);
-
-    myMath::solveSPDBLinearSystem(K, F, q);
+    Vector q = Kfactor.solve(F);
 
     computeDisplacementComponentsFromVector(q, dx, dy, dz, dtheta_x, dtheta_y, dtheta_z);
 }
 
+
+void Beam::computeDisplacement(const Matrix &Px_node, const Matrix &Py_node, const Matrix &Pz_node,
+                               Matrix &dx, Matrix &dy, Matrix &dz, Matrix &dtheta_x, Matrix &dtheta_y, Matrix &dtheta_z) const{
+
+    using namespace BeamFEA;
+
+    int ncases = Px_node.cols();
+
+    // assemble load vector of each case (point and tip loads are common to all cases)
+    Vector FCommon = Vector::Zero(DOF*nodes);
+    addPointLoads(nodes, FCommon, Fx_node, Fy_node, Fz_node, Mx_node, My_node, Mz_node);
+    addTipLoads(tip, nodes, FCommon);
+
+    Matrix Fcases(length, ncases);
+    PolyVec Px_case, Py_case, Pz_case;
+    Vector FFull(DOF*nodes), Fcase(length);
+
+    for (int j = 0; j < ncases; j++) {
+        linearLoads(Px_node.col(j), Px_case);
+        linearLoads(Py_node.col(j), Py_case);
+        linearLoads(Pz_node.col(j), Pz_case);
+
+        loadVectorAssembly(nodes, z_node, Px_case, Py_case, Pz_case, FFull);
+        FFull += FCommon;
+
+        applyBaseBoundaryCondition(base.rigid, nodes, FFull, Fcase);
+        Fcases.col(j) = Fcase;
+    }
+
+    // solve all load cases with the existing factorization
+    Matrix q = Kfactor.solve(Fcases);
+
+    dx.resize(nodes, ncases);
+    dy.resize(nodes, ncases);
+    dz.resize(nodes, ncases);
+    dtheta_x.resize(nodes, ncases);
+    dtheta_y.resize(nodes, ncases);
+    dtheta_z.resize(nodes, ncases);
+
+    Vector dx_j, dy_j, dz_j, dtx_j, dty_j, dtz_j;
+    for (int j = 0; j < ncases; j++) {
+        computeDisplacementComponentsFromVector(q.col(j), dx_j, dy_j, dz_j, dtx_j, dty_j, dtz_j);
+        dx.col(j) = dx_j;
+        dy.col(j) = dy_j;
+        dz.col(j) = dz_j;
+        dtheta_x.col(j) = dtx_j;
+        dtheta_y.col(j) = dty_j;
+        dtheta_z.col(j) = dtz_j;
+    }
+}
+
 // private method
 void Beam::computeDisplacementComponentsFromVector(const Vector &q, Vector &dx, Vector &dy, Vector&dz,
                                                    Vector &dtheta_x, Vector &dtheta_y, Vector &dtheta_z) const{
@@ -491,6 +555,27 @@ double Beam::estimateCriticalBucklingLoad(double FzExisting, int ix1, int ix2) c
 // using FEA coordinate system
 void Beam::shearAndBending(PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const{
 
+    integrateShearAndBending(Px, Py, Pz, Vx, Vy, Fz, Mx, My, Tz);
+}
+
+
+// using FEA coordinate system
+void Beam::shearAndBending(const Vector &Px_node, const Vector &Py_node, const Vector &Pz_node,
+                           PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const{
+
+    PolyVec Px_case, Py_case, Pz_case;
+    linearLoads(Px_node, Px_case);
+    linearLoads(Py_node, Py_case);
+    linearLoads(Pz_node, Pz_case);
+
+    integrateShearAndBending(Px_case, Py_case, Pz_case, Vx, Vy, Fz, Mx, My, Tz);
+}
+
+
+// private method
+void Beam::integrateShearAndBending(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                                    PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const{
+
     Vx.resize(nodes-1);
     Vy.resize(nodes-1);
     Fz.resize(nodes-1);
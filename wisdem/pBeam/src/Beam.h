@@ -50,6 +50,7 @@ class Beam {
     int length;
     Matrix K, M, N, Nother;
     Vector F;
+    Eigen::LDLT<Matrix> Kfactor;  // factorization of K, reused for every load case
 
 
 
@@ -174,6 +175,24 @@ public:
     void computeDisplacement(Vector &dx, Vector &dy, Vector&dz, Vector &dtheta_x, Vector &dtheta_y, Vector &dtheta_z) const;
 
 
+    /**
+     Compute the displacements of the structure for several load cases with one solve.
+     The stiffness matrix is factored once, and each load case is an additional right-hand side.
+     Point loads and tip loads given at construction are applied in every load case, the distributed
+     loads given at construction are replaced by the ones below.
+
+     Arguments:
+     Px_node, Py_node, Pz_node - distributed loads at each node (assumed to vary linearly between nodes).
+                                 size: nodes x ncases, one load case per column
+
+     Out:
+     displacements in x, y, z, theta_x, theta_y, theta_z at each node.  size: nodes x ncases
+
+     **/
+    void computeDisplacement(const Matrix &Px_node, const Matrix &Py_node, const Matrix &Pz_node,
+                             Matrix &dx, Matrix &dy, Matrix &dz, Matrix &dtheta_x, Matrix &dtheta_y, Matrix &dtheta_z) const;
+
+
 
     /**
      Estimates the minimum critical buckling loads due to axial loading in addition to any existing input loads.
@@ -203,6 +222,18 @@ public:
     void shearAndBending(PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const;
 
 
+    /**
+     Same as above, but for the distributed loads given here instead of those given at construction.
+     Point loads and tip loads given at construction are included.
+
+     In:
+     Px_node, Py_node, Pz_node - distributed loads at each node (assumed to vary linearly between nodes)
+
+     **/
+    void shearAndBending(const Vector &Px_node, const Vector &Py_node, const Vector &Pz_node,
+                         PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const;
+
+
     /**
      Computes the axial strain along the structure at given locations.
 
@@ -232,6 +263,13 @@ private:
     // estimate natural frequencies and associated eigenvectors
     void naturalFrequencies(bool cmpVec, int n, Vector &freq, Matrix &vec) const;
 
+    // linear variation of distributed loads between nodes
+    void linearLoads(const Vector &P_node, PolyVec &P) const;
+
+    // shear and bending for given distributed load polynomials
+    void integrateShearAndBending(const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                                  PolyVec &Vx, PolyVec &Vy, PolyVec &Fz, PolyVec &Mx, PolyVec &My, PolyVec &Tz) const;
+
     void computeDisplacementComponentsFromVector(const Vector &q, Vector &dx, Vector &dy, Vector&dz,
                                                  Vector &dtheta_x, Vector &dtheta_y, Vector &dtheta_z) const;
 
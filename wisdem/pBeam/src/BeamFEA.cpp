@@ -69,6 +69,44 @@ namespace BeamFEA {
   }
 
 
+  // computes work-equivalent nodal forces for one 12-dof beam element
+  void beamLoadVector(double L, const Poly &Px, const Poly &Py, const Poly &FzfromPz, Vector &F){
+
+    F.setZero();
+
+    // ------- bending ---------------
+    const int ns = 4; // number of shape functions
+
+    Poly f[ns] = {
+		  Poly(4, 2.0, -3.0, 0.0, 1.0),
+		  Poly(4, 1.0*L, -2.0*L, 1.0*L, 0.0*L),
+		  Poly(4, -2.0, 3.0, 0.0, 0.0),
+		  Poly(4, 1.0*L, -1.0*L, 0.0*L, 0.0*L)
+    };
+
+    // distributed applied loads
+    Vector FbendX(ns);
+    vectorAssembly(Px, ns, f, L, FbendX);
+
+    Vector FbendY(ns);
+    vectorAssembly(Py, ns, f, L, FbendY);
+
+    std::vector<int> idx_x = {0, 1, 6, 7};
+    std::vector<int> idx_y = {2, 3, 8, 9};
+
+    for (int ii=0; ii<ns; ii++) {
+      F(idx_x[ii]) = FbendX(ii);
+      F(idx_y[ii]) = FbendY(ii);
+    }
+
+    // ----------- axial ----------------
+    // axial loads already given (work equivalent approach not appropriate for distributed axial loads)
+    F(4) = FzfromPz.eval(0.0);
+    F(10) = FzfromPz.eval(1.0);
+
+  }
+
+
   // computes FEM matrices for one 12-dof beam element
   void beamMatrix(double L, const Poly &EIx, const Poly &EIy, const Poly &EA, 
 		  const Poly &GJ, const Poly &rhoA, const Poly &rhoJ,
@@ -78,12 +116,14 @@ namespace BeamFEA {
     //using namespace boost::numeric::ublas;
     
     // initialize
-    F.setZero();
     K.setZero();
     M.setZero();
     Ndist.setZero();
     Nconst.setZero();
 
+    // distributed applied loads
+    beamLoadVector(L, Px, Py, FzfromPz, F);
+
     int i;
     
     // ------- bending (x-dir) ---------------
@@ -123,16 +163,11 @@ namespace BeamFEA {
     Poly one(1, 1.0);
     matrixAssembly(one, ns, fp, 1.0/L, Nbend_const);
 
-    // distributed applied loads    
-    Vector FbendX(ns);
-    vectorAssembly(Px, ns, f, L, FbendX);
-    
     // put into global matrix
     std::vector<int> idx = {0, 1, 6, 7};
     //idx(0) = 0; idx(1) = 1; idx(2) = 6; idx(3) = 7;
 
     for (int ii=0; ii<ns; ii++) {
-      F(idx[ii]) = FbendX(ii);
       for (int jj=0; jj<ns; jj++) {
 	K(idx[ii], idx[jj]) = KbendX(ii,jj);
 	M(idx[ii], idx[jj]) = Mbend(ii,jj);
@@ -144,7 +179,6 @@ namespace BeamFEA {
     //project(M, idx, idx) = Mbend;
     //project(Ndist, idx, idx) = Nbend_dist;
     //project(Nconst, idx, idx) = Nbend_const;
-    //project(F, idx) = FbendX;
     
     
     // ---------- bending (y-dir) ---------------
@@ -153,17 +187,12 @@ namespace BeamFEA {
     Matrix KbendY(ns, ns);
     matrixAssembly(EIy, ns, fpp, 1.0/pow(L,3), KbendY);
 
-    
-    // distributed applied loads
-    Vector FbendY(ns);
-    vectorAssembly(Py, ns, f, L, FbendY);
 
     // put into global matrix (mass and incremental stiffness are same in x an y)
     idx = {2, 3, 8, 9};
     //idx(0) = 2; idx(1) = 3; idx(2) = 8; idx(3) = 9;
     
     for (int ii=0; ii<ns; ii++) {
-      F(idx[ii]) = FbendY(ii);
       for (int jj=0; jj<ns; jj++) {
 	K(idx[ii], idx[jj]) = KbendY(ii,jj);
 	M(idx[ii], idx[jj]) = Mbend(ii,jj);
@@ -175,7 +204,6 @@ namespace BeamFEA {
     //project(M, idx, idx) = Mbend;
     //project(Ndist, idx, idx) = Nbend_dist;
     //project(Nconst, idx, idx) = Nbend_const;
-    //project(F, idx) = FbendY;
     
     
     // ----------- axial ----------------
@@ -204,17 +232,11 @@ namespace BeamFEA {
     Matrix Maxial(nsz, nsz);
     matrixAssembly(rhoA, nsz, fz, L, Maxial);
     
-    // axial loads already given (work equivalent approach not appropriate for distributed axial loads)
-    Vector Faxial(nsz);
-    Faxial(0) = FzfromPz.eval(0.0);
-    Faxial(1) = FzfromPz.eval(1.0);
-    
     // put into global matrix
     std::vector<int> idx_z = {4, 10};
     //idx_z(0) = 4; idx_z(1) = 10;
     
     for (int ii=0; ii<nsz; ii++) {
-      F(idx_z[ii]) = Faxial(ii);
       for (int jj=0; jj<nsz; jj++) {
 	K(idx_z[ii], idx_z[jj]) = Kaxial(ii,jj);
 	M(idx_z[ii], idx_z[jj]) = Maxial(ii,jj);
@@ -222,7 +244,6 @@ namespace BeamFEA {
     }
     //project(K, idx_z, idx_z) = Kaxial;
     //project(M, idx_z, idx_z) = Maxial;
-    //project(F, idx_z) = Faxial;
     
     // --------- torsion -------------
     // same shape functions as axial
@@ -320,6 +341,36 @@ namespace BeamFEA {
 
 
 
+  // assembles the work-equivalent nodal forces of the distributed loads into the global force vector
+  // F is of length DOF*nodes
+  void loadVectorAssembly(int nodes, const Vector &z, const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+			  Vector &F){
+
+    F.setZero();
+
+    Vector Fsub(2*DOF);
+
+    // integrate distributed axial loads
+    PolyVec FzFromPz;
+    integrateDistributedCompressionLoads(z, Pz, FzFromPz);
+
+    for (int i = 0; i < nodes-1; i++) {
+
+      double L = z[i+1] - z[i];
+
+      beamLoadVector(L, Px[i], Py[i], FzFromPz[i], Fsub);
+
+      for (int ii=0; ii<2*DOF; ii++) {
+	F(i*DOF + ii) += Fsub(ii);
+      }
+    }
+
+  }
+
+
+
+
+
   // MARK: --------- BOUNDARY CONDITIONS ------------------
 
 
@@ -366,14 +417,6 @@ namespace BeamFEA {
       }
     }
     
-    Vector Ftip(DOF);
-    Ftip(0) = tip.Fx;
-    Ftip(1) = tip.Mx;
-    Ftip(2) = tip.Fy;
-    Ftip(3) = tip.My;
-    Ftip(4) = tip.Fz;
-    Ftip(5) = tip.Mz;
-    
     // add at end of matrix
     std::vector<int> r(DOF);
     for (int k=0; k<DOF; k++) r[k] = (nodes-1)*DOF + k;
@@ -381,17 +424,36 @@ namespace BeamFEA {
 
     
     for (int ii=0; ii<DOF; ii++) {
-      F(r[ii]) += Ftip(ii);
       for (int jj=0; jj<DOF; jj++) {
 	M(r[ii], r[jj]) += Mtip(ii,jj);
       }
     }
     //project(M, r, r) += Mtip;
-    //project(F, r) += Ftip;
+
+    addTipLoads(tip, nodes, F);
     
   }
 
 
+  // Vector is DOF*nodes
+  void addTipLoads(const TipData &tip, int nodes, Vector &F){
+
+    Vector Ftip(DOF);
+    Ftip(0) = tip.Fx;
+    Ftip(1) = tip.Mx;
+    Ftip(2) = tip.Fy;
+    Ftip(3) = tip.My;
+    Ftip(4) = tip.Fz;
+    Ftip(5) = tip.Mz;
+
+    // add at end of vector
+    for (int ii=0; ii<DOF; ii++) {
+      F((nodes-1)*DOF + ii) += Ftip(ii);
+    }
+
+  }
+
+
   int __computeReducedSize(const bool rigidDirections[DOF], int nodes);
     
   // intended to be private method.  Computes the new size of the global matrices after removing rigid directions
@@ -473,6 +535,25 @@ namespace BeamFEA {
 
 
 
+  // FFull is DOF*nodes, F has length given by reduction
+  int applyBaseBoundaryCondition(const bool rigidDirections[], int nodes, const Vector &FFull, Vector &F){
+
+    int length = __computeReducedSize(rigidDirections, nodes);
+    F.resize(length);
+
+    int j = 0;
+    for (int i = 0; i < DOF*nodes; i++) {
+      if (i >= DOF || !rigidDirections[i]){
+	F(j++) = FFull(i);
+      }
+    }
+
+    return length;
+  }
+
+
+
+
   // F is legnth DOF*nodes
   // others are length nodes
   void addPointLoads(int nodes, Vector &F,
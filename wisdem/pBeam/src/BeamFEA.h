@@ -115,6 +115,22 @@ namespace BeamFEA {
                     Matrix &K, Matrix &M, Matrix &Ndist, Matrix &Nconst, Vector &F);
     
     
+    /**
+     Computes the work-equivalent nodal forces of a 12-dof beam element (the F of beamMatrix).
+
+     Arguments:
+     L - length of element
+     Px - distributed force (force per unit length) in x direction (polynomial)
+     Py - distributed force in y direction
+     FzFromPz - nodal axial forces from distributed force in z-direction
+
+     Returns:
+     F - work-equivalent nodal forces/moments. length: 2*DOF
+
+     **/
+    void beamLoadVector(double L, const Poly &Px, const Poly &Py, const Poly &FzfromPz, Vector &F);
+
+
     /**
      Assembes the FEA matrices from each element into the global matrix for the structure.
      See beam() for order of the DOFs
@@ -151,6 +167,24 @@ namespace BeamFEA {
     
     
     
+    /**
+     Assembles the work-equivalent nodal forces of the distributed loads only (the F of FEMAssembly),
+     so that new load cases can be formed without reassembling the matrices.
+
+     Arguments:
+     nodes - number of nodes at which data is supplied
+     z - axial location of each node
+     Px, Py, Pz - distributed loads polynomials of each element.  length: nodes-1
+
+     Returns:
+     F - work-equivalent nodal forces/moments.  length: DOF*nodes
+
+     **/
+    void loadVectorAssembly(int nodes, const Vector &z, const PolyVec &Px, const PolyVec &Py, const PolyVec &Pz,
+                            Vector &F);
+
+
+
     // MARK: -------------------- BOUNDARY CONDITION METHODS  ----------------------
     
     
@@ -169,6 +203,20 @@ namespace BeamFEA {
      
      **/
     void addTipMassContribution(const TipData &tip, int nodes, Matrix &M, Vector &F);
+
+
+    /**
+     Adds the tip forces and moments to the force vector (also done by addTipMassContribution)
+
+     Arguments:
+     tipData - struct containing tip force information (see FEAData.h)
+     nodes - number of nodes in beam
+
+     In/Out:
+     F - nodal force vector modified in place.  length: DOF*nodes
+
+     **/
+    void addTipLoads(const TipData &tip, int nodes, Vector &F);
     
     
     
@@ -194,6 +242,15 @@ namespace BeamFEA {
                                            Matrix &KFull, const Matrix &MFull, const Matrix &NotherFull, 
                                            const Matrix &NFull, const Vector &FFull, 
                                            Matrix &K, Matrix &M, Matrix &Nother, Matrix &N, Vector &F);
+
+
+    /**
+     Same as above for a force vector only (rigid directions are removed, the base stiffness does not affect F)
+
+     Return:
+     legnth - the new length of the reduced force vector
+     **/
+    int applyBaseBoundaryCondition(const bool rigidDirections[], int nodes, const Vector &FFull, Vector &F);
     
     
     
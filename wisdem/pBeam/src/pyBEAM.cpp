@@ -383,6 +383,31 @@ public:
   }
 
 
+  /**
+     Compute the displacements of the structure for several sets of distributed loads
+     (in global coordinate system).  The stiffness matrix is factored once and all load cases
+     are solved together.  Point loads and tip loads of the beam are applied in every case.
+
+     Arguments:
+     Px, Py, Pz - numpy arrays of distributed loads, size: nodes x ncases (one load case per column)
+
+     Return:
+     a tuple containing (x, y, z, theta_x, theta_y, theta_z).
+     each entry of the tuple is a numpy array (nodes x ncases) describing the deflections for the given
+     degree of freedom at each node and load case.
+
+  **/
+  py::tuple computeDisplacementMulti(const Matrix &Px, const Matrix &Py, const Matrix &Pz){
+
+    Matrix dx, dy, dz, dtx, dty, dtz;
+
+    beam->computeDisplacement(Px, Py, Pz, dx, dy, dz, dtx, dty, dtz);
+
+    return py::make_tuple(dx, dy, dz, dtx, dty, dtz);
+
+  }
+
+
 
   /**
      Estimates the minimum critical buckling loads due to axial loading in addition to any existing input loads.
@@ -435,10 +460,52 @@ public:
     PolyVec Vx, Vy, Fz, Mx, My, Tz;
     beam->shearAndBending(Vx, Vy, Fz, Mx, My, Tz);
 
-    int n = beam->getNumNodes() - 1;
-    int nodes = n + 1;
-    
+    int nodes = beam->getNumNodes();
+
     Vector Vx0(nodes), Vy0(nodes), Fz0(nodes), Mx0(nodes), My0(nodes), Tz0(nodes);
+    evalShearAndBending(Vx, Vy, Fz, Mx, My, Tz, Vx0, Vy0, Fz0, Mx0, My0, Tz0);
+
+    return py::make_tuple(Vx0, Vy0, Fz0, Mx0, My0, Tz0);
+  }
+
+
+  // in global 3D coordinate system, for several sets of distributed loads (nodes x ncases).
+  // returns numpy arrays of size nodes x ncases
+  py::tuple computeShearAndBendingMulti(const Matrix &Px, const Matrix &Py, const Matrix &Pz){
+
+    int nodes = beam->getNumNodes();
+    int ncases = Px.cols();
+
+    Matrix Vx0(nodes, ncases), Vy0(nodes, ncases), Fz0(nodes, ncases);
+    Matrix Mx0(nodes, ncases), My0(nodes, ncases), Tz0(nodes, ncases);
+
+    PolyVec Vx, Vy, Fz, Mx, My, Tz;
+    Vector Vx_j(nodes), Vy_j(nodes), Fz_j(nodes), Mx_j(nodes), My_j(nodes), Tz_j(nodes);
+
+    for (int j = 0; j < ncases; j++) {
+      beam->shearAndBending(Px.col(j), Py.col(j), Pz.col(j), Vx, Vy, Fz, Mx, My, Tz);
+      evalShearAndBending(Vx, Vy, Fz, Mx, My, Tz, Vx_j, Vy_j, Fz_j, Mx_j, My_j, Tz_j);
+
+      Vx0.col(j) = Vx_j;
+      Vy0.col(j) = Vy_j;
+      Fz0.col(j) = Fz_j;
+      Mx0.col(j) = Mx_j;
+      My0.col(j) = My_j;
+      Tz0.col(j) = Tz_j;
+    }
+
+    return py::make_tuple(Vx0, Vy0, Fz0, Mx0, My0, Tz0);
+  }
+
+
+private:
+
+  // evaluate shear and bending polynomials at the nodes
+  static void evalShearAndBending(const PolyVec &Vx, const PolyVec &Vy, const PolyVec &Fz,
+				  const PolyVec &Mx, const PolyVec &My, const PolyVec &Tz,
+				  Vector &Vx0, Vector &Vy0, Vector &Fz0, Vector &Mx0, Vector &My0, Vector &Tz0){
+
+    int n = Vx.size();
 
     for(int i = 0; i < n; i++) {
       Vx0[i] = Vx[i].eval(0.0);
@@ -454,8 +521,6 @@ public:
     Mx0[n] = -My[n-1].eval(1.0);  // translate back to global coordinates
     My0[n] = Mx[n-1].eval(1.0);  // translate back to global coordinates
     Tz0[n] = Tz[n-1].eval(1.0);
-
-    return py::make_tuple(Vx0, Vy0, Fz0, Mx0, My0, Tz0);
   }
 
 };
@@ -524,10 +589,12 @@ PYBIND11_MODULE(_pBEAM, m)
     .def("naturalFrequencies", &pyBEAM::computeNaturalFrequencies)
     .def("naturalFrequenciesAndEigenvectors", &pyBEAM::computeNaturalFrequenciesAndEigenvectors)
     .def("displacement", &pyBEAM::computeDisplacement)
+    .def("displacementMulti", &pyBEAM::computeDisplacementMulti)
     .def("criticalBucklingLoads", &pyBEAM::computeCriticalBucklingLoads)
     .def("axialStrain", &pyBEAM::computeAxialStrain)
     .def("outOfPlaneMomentOfInertia", &pyBEAM::computeOutOfPlaneMomentOfInertia)
     .def("shearAndBending", &pyBEAM::computeShearAndBending)
+    .def("shearAndBendingMulti", &pyBEAM::computeShearAndBendingMulti)
     ;
 
   py::class_<pyCurveFEM>(m, "CurveFEM")
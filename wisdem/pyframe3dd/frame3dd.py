@@ -17,6 +17,8 @@ from distutils.sysconfig import get_config_var
 
 from sys import platform
 
+from wisdem.pyframe3dd.sparse_solver import SparseFrameSolver
+
 libext = get_config_var('EXT_SUFFIX')
 if libext is None or libext == '':
     if platform == "linux" or platform == "linux2":
@@ -44,6 +46,35 @@ def dp(x):
     return x.ctypes.data_as(c_double_p)
 
 
+# shared handle to the compiled library, loaded by the first Frame
+_frame3dd_lib = None
+
+
+def _load_library():
+    global _frame3dd_lib
+
+    if _frame3dd_lib is None:
+        mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
+        try:
+            lib = np.ctypeslib.load_library(libname, mydir)
+        except:
+            mydir = os.path.abspath(os.path.dirname(mydir))
+            lib = np.ctypeslib.load_library(libname, mydir)
+
+        lib.run.argtypes = [POINTER(C_Nodes), POINTER(C_Reactions), POINTER(C_Elements),
+            POINTER(C_OtherElementData), c_int, POINTER(C_LoadCase),
+            POINTER(C_DynamicData), POINTER(C_ExtraInertia), POINTER(C_ExtraMass),
+            POINTER(C_Condensation),
+            POINTER(C_Displacements), POINTER(C_Forces), POINTER(C_ReactionForces),
+            POINTER(POINTER(C_InternalForces)), POINTER(C_MassResults), POINTER(C_ModalResults)]
+
+        lib.run.restype = c_int
+
+        _frame3dd_lib = lib
+
+    return _frame3dd_lib
+
+
 
 # --------------
 # General Inputs
@@ -345,7 +376,8 @@ NodeData = namedtuple('NodeData', ['node', 'x', 'y', 'z', 'r'])
 ReactionData = namedtuple('ReactionData', ['node', 'Kx', 'Ky', 'Kz', 'Ktx', 'Kty', 'Ktz', 'rigid'])
 ElementData = namedtuple('ElementData', ['element', 'N1', 'N2', 'Ax', 'Asy', 'Asz',
     'Jx', 'Iy', 'Iz', 'E', 'G', 'roll', 'density'])
-Options = namedtuple('Options', ['shear', 'geom', 'dx'])
+Options = namedtuple('Options', ['shear', 'geom', 'dx', 'solver'])
+Options.__new__.__defaults__ = ('dense',)  # 'dense': Frame3DD C code, 'sparse': scipy sparse matrices (see sparse_solver)
 
 
 # outputs
@@ -366,21 +398,55 @@ class Frame(object):
     def __init__(self, nodes, reactions, elements, options):
         """docstring"""
 
-        self.nodes = nodes
-        self.reactions = reactions
-        self.elements = elements
-        self.options = options
-
         # convert to C int size (not longs) and copy to prevent releasing (b/c address space is shared by c)
+        self.changeNodes(nodes)
+        self.changeReactions(reactions)
+        self.changeElements(elements)
+        self.changeOptions(options)
+
+        # leave off dynamics by default
+        self.nM = 0              # number of desired dynamic modes of vibration (below only necessary if nM > 0)
+        self.Mmethod = 1         # 1: subspace Jacobi     2: Stodola
+        self.lump = 0            # 0: consistent mass ... 1: lumped mass matrix
+        self.tol = 1e-9          # mode shape tolerance
+        self.shift = 0.0         # shift value ... for unrestrained structures
+
+        # create list for load cases
+        self.loadCases = []
+
+        # initialize extra mass data
+        i = np.array([], dtype=np.int32)
+        d = np.array([])
+        self.changeExtraNodeMass(i, d, d, d, d, d, d, d, d, d, d, False)
+        self.changeExtraElementMass(i, d, False)
+        self.changeCondensationData(0, i, d, d, d, d, d, d, i)
+
+        # output arrays and c structs, kept between runs of the same size (see run)
+        self._workspace = None
+        self._workspace_key = None
+
+        # load c module
+        self._frame3dd = _load_library()
+
+
+    def changeNodes(self, nodes):
+
+        self.nodes = nodes
 
-        # nodes
         self.nnode = nodes.node.astype(np.int32)
         self.nx = np.copy(nodes.x)
         self.ny = np.copy(nodes.y)
         self.nz = np.copy(nodes.z)
         self.nr = np.copy(nodes.r)
 
-        # reactions
+        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx),
+            dp(self.ny), dp(self.nz), dp(self.nr))
+
+
+    def changeReactions(self, reactions):
+
+        self.reactions = reactions
+
         self.rnode = reactions.node.astype(np.int32)
         self.rKx = reactions.Kx.astype(np.float64)  # convert rather than copy to allow old syntax of integers
         self.rKy = reactions.Ky.astype(np.float64)
@@ -389,7 +455,15 @@ class Frame(object):
         self.rKty = reactions.Kty.astype(np.float64)
         self.rKtz = reactions.Ktz.astype(np.float64)
 
-        # elements
+        self.c_reactions = C_Reactions(len(self.rnode), ip(self.rnode),
+            dp(self.rKx), dp(self.rKy), dp(self.rKz),
+            dp(self.rKtx), dp(self.rKty), dp(self.rKtz), reactions.rigid)
+
+
+    def changeElements(self, elements):
+
+        self.elements = elements
+
         self.eelement = elements.element.astype(np.int32)
         self.eN1 = elements.N1.astype(np.int32)
         self.eN2 = elements.N2.astype(np.int32)
@@ -404,69 +478,37 @@ class Frame(object):
         self.eroll = np.copy(elements.roll)
         self.edensity = np.copy(elements.density)
 
-        # Compute length of elements
-        self.eL = np.sqrt( (self.nx[self.eN2-1]-self.nx[self.eN1-1])**2.0 +
-                           (self.ny[self.eN2-1]-self.ny[self.eN1-1])**2.0 +
-                           (self.nz[self.eN2-1]-self.nz[self.eN1-1])**2.0 )
-            
-        # create c objects
-        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx),
-            dp(self.ny), dp(self.nz), dp(self.nr))
-
-        self.c_reactions = C_Reactions(len(self.rnode), ip(self.rnode),
-            dp(self.rKx), dp(self.rKy), dp(self.rKz),
-            dp(self.rKtx), dp(self.rKty), dp(self.rKtz), reactions.rigid)
-
         self.c_elements = C_Elements(len(self.eelement), ip(self.eelement),
             ip(self.eN1), ip(self.eN2), dp(self.eAx), dp(self.eAsy),
             dp(self.eAsz), dp(self.eJx), dp(self.eIy), dp(self.eIz),
             dp(self.eE), dp(self.eG), dp(self.eroll), dp(self.edensity))
 
 
-        # options
+    def changeOptions(self, options):
+
+        self.options = options
+
         exagg_static = 1.0  # not used
         self.c_other = C_OtherElementData(options.shear, options.geom, exagg_static, options.dx)
 
-        # leave off dynamics by default
-        self.nM = 0              # number of desired dynamic modes of vibration (below only necessary if nM > 0)
-        self.Mmethod = 1         # 1: subspace Jacobi     2: Stodola
-        self.lump = 0            # 0: consistent mass ... 1: lumped mass matrix
-        self.tol = 1e-9          # mode shape tolerance
-        self.shift = 0.0         # shift value ... for unrestrained structures
 
-        # create list for load cases
-        self.loadCases = []
-
-        # initialize extra mass data
-        i = np.array([], dtype=np.int32)
-        d = np.array([])
-        self.changeExtraNodeMass(i, d, d, d, d, d, d, d, d, d, d, False)
-        self.changeExtraElementMass(i, d, False)
-        self.changeCondensationData(0, i, d, d, d, d, d, d, i)
+    def __computeElementLengths(self):
+        # computed in run, the nodes and elements can be changed one after the other
 
+        self.eL = np.sqrt( (self.nx[self.eN2-1]-self.nx[self.eN1-1])**2.0 +
+                           (self.ny[self.eN2-1]-self.ny[self.eN1-1])**2.0 +
+                           (self.nz[self.eN2-1]-self.nz[self.eN1-1])**2.0 )
 
-        # load c module
-        mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
-        try:
-            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
-        except:
-            mydir = os.path.abspath(os.path.dirname(mydir))
-            self._frame3dd = np.ctypeslib.load_library(libname, mydir)
 
-        self._frame3dd.run.argtypes = [POINTER(C_Nodes), POINTER(C_Reactions), POINTER(C_Elements),
-            POINTER(C_OtherElementData), c_int, POINTER(C_LoadCase),
-            POINTER(C_DynamicData), POINTER(C_ExtraInertia), POINTER(C_ExtraMass),
-            POINTER(C_Condensation),
-            POINTER(C_Displacements), POINTER(C_Forces), POINTER(C_ReactionForces),
-            POINTER(POINTER(C_InternalForces)), POINTER(C_MassResults), POINTER(C_ModalResults)]
 
-        self._frame3dd.run.restype = c_int
+    def addLoadCase(self, loadCase):
 
+        self.loadCases.append(loadCase)
 
 
-    def addLoadCase(self, loadCase):
+    def clearLoadCases(self):
 
-        self.loadCases.append(loadCase)
+        self.loadCases = []
 
 
     def changeExtraNodeMass(self, node, mass, Ixx, Iyy, Izz, Ixy, Ixz, Iyz, rhox, rhoy, rhoz, addGravityLoad):
@@ -504,6 +546,7 @@ class Frame(object):
     def changeCondensationData(self, Cmethod, N, cx, cy, cz, cxx, cyy, czz, m):
         # I don't think this is actually used in Frame3DD anyway
 
+        self.Cmethod = Cmethod
         self.NC = N.astype(np.int32)
         self.cx = np.copy(cx)
         self.cy = np.copy(cy)
@@ -648,6 +691,9 @@ class Frame(object):
 
 
     def run(self):
+        """Run the analysis.  The output arrays are kept by the frame and reused (overwritten) by the next
+        run with the same numbers of load cases, nodes, elements, reactions and modes, copy them to keep
+        results across runs."""
 
         nCases = len(self.loadCases)  # number of load cases
         nN = len(self.nodes.node)  # number of nodes
@@ -659,8 +705,70 @@ class Frame(object):
             print('error: must have at least 1 load case')
             return
 
+        self.__computeElementLengths()
         self.__addGravityToExtraMass()
 
+        # number of internal force points of each element
+        dx = self.options.dx
+        nIF = tuple(int(max(math.floor(L/dx), 1)) + 1 for L in self.eL)
+
+        # initialize output arrays and c structs, or reset the ones of the last run
+        key = (nCases, nN, nE, nR, nM, nIF)
+        if key != self._workspace_key:
+            self._workspace = self.__createWorkspace(nCases, nN, nE, nR, nM, nIF)
+            self._workspace_key = key
+        else:
+            for x in self._workspace['arrays']:
+                x.fill(0)
+        ws = self._workspace
+
+        dout, fout, rout, ifout = ws['dout'], ws['fout'], ws['rout'], ws['ifout']
+        mout, modalout = ws['mout'], ws['modalout']
+
+        # load cases may have changed since the last run
+        c_loadcases = (C_LoadCase * nCases)()
+        for i in range(nCases):
+            lci = self.loadCases[i]
+            c_loadcases[i] = C_LoadCase(lci.gx, lci.gy, lci.gz, lci.pL,
+                lci.uL, lci.tL, lci.eL, lci.tempL, lci.pD)
+
+        if self.options.solver == 'sparse':
+            mout = SparseFrameSolver(self).run(c_loadcases, ws, nIF)
+            return dout, fout, rout, ifout, mout, modalout
+
+        # set dynamics data
+        exagg_modal = 1.0  # not used
+        c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal)
+
+        exitCode = self._frame3dd.run(self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
+                                      nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
+                                      self.c_extraMass, self.c_condensation,
+                                      ws['c_disp'], ws['c_forces'], ws['c_reactions'], ws['c_internalForces'],
+                                      ws['c_massResults'], ws['c_modalResults'])
+
+        nantest = np.isnan( np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz] )
+        if (exitCode == 182 or exitCode == 183) and not np.any(nantest):
+            pass
+        elif exitCode != 0 or np.any(nantest):
+            raise RuntimeError('Frame3DD did not exit gracefully')
+
+        # put mass values back in since tuple is read only
+        mout = NodeMasses(ws['total_mass'].value, ws['struct_mass'].value, mout.node,
+            mout.xmass, mout.ymass, mout.zmass,
+            mout.xinrta, mout.yinrta, mout.zinrta)
+
+        # put modal results back in
+        for i in range(nM):
+            modalout.freq[i] = ws['freq'][i].value
+            modalout.xmpf[i] = ws['xmpf'][i].value
+            modalout.ympf[i] = ws['ympf'][i].value
+            modalout.zmpf[i] = ws['zmpf'][i].value
+
+        return dout, fout, rout, ifout, mout, modalout
+
+
+
+    def __createWorkspace(self, nCases, nN, nE, nR, nM, nIF):
 
         # initialize output arrays
 
@@ -678,18 +786,12 @@ class Frame(object):
             np.zeros((nCases, nR)), np.zeros((nCases, nR)), np.zeros((nCases, nR))
         )
 
-        dx = self.options.dx
-
         ifout = [0]*nE
         for i in range(nE):
-            L = self.eL[i]
-
-            nIF = int(max(math.floor(L/dx), 1)) + 1
-
-            ifout[i] = InternalForces(np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF)),
-                np.zeros((nCases, nIF)), np.zeros((nCases, nIF)), np.zeros((nCases, nIF))
+            ifout[i] = InternalForces(np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])),
+                np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])),
+                np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])),
+                np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i])), np.zeros((nCases, nIF[i]))
             )
 
 
@@ -707,17 +809,14 @@ class Frame(object):
 
         # create c structs
 
-        c_loadcases = (C_LoadCase * nCases)()
         c_disp = (C_Displacements * nCases)()
         c_forces = (C_Forces * nCases)()
         c_reactions = (C_ReactionForces * nCases)()
         c_internalForces = (POINTER(C_InternalForces) * nCases)()
+        c_internalForcesCase = [0]*nCases
 
 
         for i in range(nCases):
-            lci = self.loadCases[i]
-            c_loadcases[i] = C_LoadCase(lci.gx, lci.gy, lci.gz, lci.pL,
-                lci.uL, lci.tL, lci.eL, lci.tempL, lci.pD)
             c_disp[i] = C_Displacements(ip(dout.node[i, :]),
                 dp(dout.dx[i, :]), dp(dout.dy[i, :]), dp(dout.dz[i, :]),
                 dp(dout.dxrot[i, :]), dp(dout.dyrot[i, :]), dp(dout.dzrot[i, :]))
@@ -728,7 +827,9 @@ class Frame(object):
                 dp(rout.Fx[i, :]), dp(rout.Fy[i, :]), dp(rout.Fz[i, :]),
                 dp(rout.Mxx[i, :]), dp(rout.Myy[i, :]), dp(rout.Mzz[i, :]))
 
-            c_internalForces[i] = (C_InternalForces * nE)()
+            # keep a reference to the element arrays, the pointer array alone does not
+            c_internalForcesCase[i] = (C_InternalForces * nE)()
+            c_internalForces[i] = c_internalForcesCase[i]
             for j in range(nE):
                 (c_internalForces[i])[j] = C_InternalForces(dp(ifout[j].x[i, :]), dp(ifout[j].Nx[i, :]),
                     dp(ifout[j].Vy[i, :]), dp(ifout[j].Vz[i, :]), dp(ifout[j].Tx[i, :]),
@@ -762,35 +863,17 @@ class Frame(object):
                 dp(modalout.xrot[i, :]), dp(modalout.yrot[i, :]), dp(modalout.zrot[i, :])
             )
 
-
-        # set dynamics data
-        exagg_modal = 1.0  # not used
-        c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal)
-
-        exitCode = self._frame3dd.run(self.c_nodes, self.c_reactions, self.c_elements, self.c_other,
-                                      nCases, c_loadcases, c_dynamicData, self.c_extraInertia,
-                                      self.c_extraMass, self.c_condensation,
-                                      c_disp, c_forces, c_reactions, c_internalForces, c_massResults, c_modalResults)
-
-        nantest = np.isnan( np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz] )
-        if (exitCode == 182 or exitCode == 183) and not np.any(nantest):
-            pass
-        elif exitCode != 0 or np.any(nantest):
-            raise RuntimeError('Frame3DD did not exit gracefully')
-
-        # put mass values back in since tuple is read only
-        mout = NodeMasses(total_mass.value, struct_mass.value, mout.node,
-            mout.xmass, mout.ymass, mout.zmass,
-            mout.xinrta, mout.yinrta, mout.zinrta)
-        
-        # put modal results back in
-        for i in range(nM):
-            modalout.freq[i] = freq[i].value
-            modalout.xmpf[i] = xmpf[i].value
-            modalout.ympf[i] = ympf[i].value
-            modalout.zmpf[i] = zmpf[i].value
-
-        return dout, fout, rout, ifout, mout, modalout
+        # everything the c code writes to, reset before each run
+        arrays = list(dout) + list(fout) + list(rout) + list(mout[2:]) + list(modalout)
+        for f in ifout:
+            arrays.extend(f)
+
+        return dict(dout=dout, fout=fout, rout=rout, ifout=ifout, mout=mout, modalout=modalout,
+                    c_disp=c_disp, c_forces=c_forces, c_reactions=c_reactions,
+                    c_internalForces=c_internalForces, c_internalForcesCase=c_internalForcesCase,
+                    total_mass=total_mass, struct_mass=struct_mass, c_massResults=c_massResults,
+                    c_modalResults=c_modalResults, freq=freq, xmpf=xmpf, ympf=ympf, zmpf=zmpf,
+                    arrays=arrays)
 
 
 
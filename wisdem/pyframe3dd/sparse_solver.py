@@ -0,0 +1,750 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+sparse_solver.py
+
+Sparse matrix backend for Frame, selected with Options(..., solver='sparse').
+
+The element stiffness and mass matrices, equivalent loads, element end forces and internal forces are the
+same as in the Frame3DD C code (src/py_frame3dd.c, src/py_io.c), but the global matrices are assembled in
+scipy sparse format.  Statics are solved with a sparse LU factorization of the free degrees of freedom and
+the first nM modes are found with shift-invert Lanczos (scipy.sparse.linalg.eigsh) instead of the dense
+subspace-Jacobi or Stodola iterations.  Matrix condensation is not supported, a ValueError is raised if
+condensation data (Cmethod != 0) or the Stodola method (Mmethod = 2) is set.
+
+Frame3DD stores section properties and loads in single precision, the inputs are rounded the same way here
+so that both backends give the same results.
+"""
+
+from __future__ import print_function
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+def _f32(x):
+    # round to single precision (float in the C code), then compute in double
+    return np.asarray(x, dtype=np.float32).astype(np.float64)
+
+
+def _carray(ptr, n, dtype=np.float64):
+    # copy of a C array of a load case struct
+    if n == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.array(np.ctypeslib.as_array(ptr, shape=(n,)), dtype=dtype)
+
+
+def _sym(k, i, j, v):
+    # set a symmetric pair of entries, 1-based indices as in the C code
+    k[:, i-1, j-1] = v
+    k[:, j-1, i-1] = v
+
+
+class SparseFrameSolver(object):
+    """Solves the load cases and modes of a Frame with sparse matrices (see Frame.run)"""
+
+    def __init__(self, frame):
+
+        # options the sparse solver does not implement
+        if frame.Cmethod != 0:
+            raise ValueError("matrix condensation (Cmethod = %d) is not supported with solver='sparse'" % frame.Cmethod)
+        if frame.nM > 0 and frame.Mmethod != 1:
+            raise ValueError("Mmethod = %d is not supported with solver='sparse', the modes are found with Lanczos iterations" % frame.Mmethod)
+
+        self.frame = frame
+        opt = frame.options
+        self.shear = bool(opt.shear)
+        self.geom = bool(opt.geom)
+        self.dx = float(_f32(opt.dx))
+
+        # nodes
+        nN = len(frame.nnode)
+        self.nN = nN
+        self.DoF = DoF = 6*nN
+        self.xyz = np.zeros((nN, 3))
+        self.xyz[frame.nnode-1] = np.c_[frame.nx, frame.ny, frame.nz]
+        self.rj = np.zeros(nN)
+        self.rj[frame.nnode-1] = np.abs(_f32(frame.nr))
+
+        # elements, ordered by element number
+        nE = len(frame.eelement)
+        self.nE = nE
+        idx = frame.eelement - 1
+        def order(x, dtype=np.float64):
+            y = np.zeros(nE, dtype=dtype)
+            y[idx] = x
+            return y
+        self.N1 = order(frame.eN1 - 1, np.int64)
+        self.N2 = order(frame.eN2 - 1, np.int64)
+        self.Ax = order(_f32(frame.eAx))
+        self.Asy = order(_f32(frame.eAsy))
+        self.Asz = order(_f32(frame.eAsz))
+        self.Jx = order(_f32(frame.eJx))
+        self.Iy = order(_f32(frame.eIy))
+        self.Iz = order(_f32(frame.eIz))
+        self.E = order(_f32(frame.eE))
+        self.G = order(_f32(frame.eG))
+        self.p = order(_f32(_f32(frame.eroll)*np.pi/180.0))
+        self.d = order(_f32(frame.edensity))
+
+        dxyz = self.xyz[self.N2] - self.xyz[self.N1]
+        self.L = np.sqrt(np.sum(dxyz**2, axis=1))
+        self.Le = self.L - self.rj[self.N1] - self.rj[self.N2]
+        if np.any(self.L == 0.0) or np.any(self.Le <= 0.0):
+            raise RuntimeError('Frame3DD did not exit gracefully')
+        self.R = self.__coordTrans(dxyz)
+
+        if self.shear:
+            self.Ksy = 12.0*self.E*self.Iz / (self.G*self.Asy*self.Le**2)
+            self.Ksz = 12.0*self.E*self.Iy / (self.G*self.Asz*self.Le**2)
+        else:
+            self.Ksy = np.zeros(nE)
+            self.Ksz = np.zeros(nE)
+
+        # element to structure dof index table and sparse assembly pattern
+        ind = np.zeros((nE, 12), dtype=np.int64)
+        for i in range(6):
+            ind[:, i] = 6*self.N1 + i
+            ind[:, 6+i] = 6*self.N2 + i
+        self.ind = ind
+        self.rows = np.repeat(ind, 12, axis=1).flatten()
+        self.cols = np.tile(ind, (1, 12)).flatten()
+
+        # reactions: r=1 rigid, r=2 extra stiffness (both are reaction coordinates in the statics)
+        self.r = np.zeros(DoF, dtype=np.int64)
+        self.EK = np.zeros(DoF)
+        rigid = frame.reactions.rigid
+        K = np.c_[frame.rKx, frame.rKy, frame.rKz, frame.rKtx, frame.rKty, frame.rKtz]
+        for j, node in enumerate(frame.rnode):
+            for i in range(6):
+                dof = 6*(node-1) + i
+                if K[j, i] == rigid:
+                    self.r[dof] = 1
+                else:
+                    self.EK[dof] = _f32(K[j, i])
+                    if self.EK[dof] > 0.0:
+                        self.r[dof] = 2
+        self.q = self.r == 0
+        self.rr = ~self.q
+        self.sumR = int(np.sum(self.r))
+        if (self.sumR < 4 and self.geom) or self.sumR >= DoF:
+            raise RuntimeError('Frame3DD did not exit gracefully')
+
+
+    def __coordTrans(self, dxyz):
+        """rows of the 3x3 coordinate transformation of each element (t1 ... t9 in coord_trans)"""
+
+        L = self.L
+        Cx = dxyz[:, 0]/L
+        Cy = dxyz[:, 1]/L
+        Cz = dxyz[:, 2]/L
+        Cp = np.cos(self.p)
+        Sp = np.sin(self.p)
+
+        R = np.zeros((self.nE, 3, 3))
+        vert = np.abs(Cz) == 1.0
+        Cz_v = Cz[vert]
+        R[vert, 0, 2] = Cz_v
+        R[vert, 1, 0] = -Cz_v*Sp[vert]
+        R[vert, 1, 1] = Cp[vert]
+        R[vert, 2, 0] = -Cz_v*Cp[vert]
+        R[vert, 2, 1] = -Sp[vert]
+
+        o = ~vert
+        Cx, Cy, Cz, Cp, Sp = Cx[o], Cy[o], Cz[o], Cp[o], Sp[o]
+        den = np.sqrt(1.0 - Cz*Cz)
+        R[o, 0, 0] = Cx
+        R[o, 0, 1] = Cy
+        R[o, 0, 2] = Cz
+        R[o, 1, 0] = (-Cx*Cz*Sp - Cy*Cp)/den
+        R[o, 1, 1] = (-Cy*Cz*Sp + Cx*Cp)/den
+        R[o, 1, 2] = Sp*den
+        R[o, 2, 0] = (-Cx*Cz*Cp + Cy*Sp)/den
+        R[o, 2, 1] = (-Cy*Cz*Cp - Cx*Sp)/den
+        R[o, 2, 2] = Cp*den
+
+        return R
+
+
+    def __localStiffness(self, T=None, torsion=True):
+        """elastic (elastic_K) plus geometric (geometric_K) stiffness in local coordinates, for axial forces T.
+        Without torsion the geometric torsional terms are left out, as in frame_element_force."""
+
+        E, G, Ax, Jx, Iy, Iz = self.E, self.G, self.Ax, self.Jx, self.Iy, self.Iz
+        Le, L, Ksy, Ksz = self.Le, self.L, self.Ksy, self.Ksz
+
+        k = np.zeros((self.nE, 12, 12))
+
+        k11 = E*Ax/Le
+        k22 = 12.*E*Iz / (Le**3*(1.+Ksy))
+        k33 = 12.*E*Iy / (Le**3*(1.+Ksz))
+        k44 = G*Jx/Le
+        k55 = (4.+Ksz)*E*Iy / (Le*(1.+Ksz))
+        k66 = (4.+Ksy)*E*Iz / (Le*(1.+Ksy))
+        k53 = -6.*E*Iy / (Le**2*(1.+Ksz))
+        k62 = 6.*E*Iz / (Le**2*(1.+Ksy))
+
+        for i, v in [(1, k11), (2, k22), (3, k33), (4, k44), (5, k55), (6, k66)]:
+            k[:, i-1, i-1] = k[:, i+5, i+5] = v
+        _sym(k, 5, 3, k53)
+        _sym(k, 6, 2, k62)
+        _sym(k, 7, 1, -k11)
+        _sym(k, 12, 8, -k62)
+        _sym(k, 8, 6, -k62)
+        _sym(k, 11, 9, -k53)
+        _sym(k, 9, 5, -k53)
+        _sym(k, 10, 4, -k44)
+        _sym(k, 11, 3, k53)
+        _sym(k, 12, 2, k62)
+        _sym(k, 8, 2, -k22)
+        _sym(k, 9, 3, -k33)
+        _sym(k, 11, 5, (2.-Ksz)*E*Iy / (Le*(1.+Ksz)))
+        _sym(k, 12, 6, (2.-Ksy)*E*Iz / (Le*(1.+Ksy)))
+
+        if T is not None:
+            Dsy = (1.+Ksy)**2
+            Dsz = (1.+Ksz)**2
+            g22 = T/L*(1.2+2.0*Ksy+Ksy*Ksy)/Dsy
+            g33 = T/L*(1.2+2.0*Ksz+Ksz*Ksz)/Dsz
+            g55 = T*L*(2.0/15.0+Ksz/6.0+Ksz*Ksz/12.0)/Dsz
+            g66 = T*L*(2.0/15.0+Ksy/6.0+Ksy*Ksy/12.0)/Dsy
+
+            for i, v in [(2, g22), (3, g33), (5, g55), (6, g66)]:
+                k[:, i-1, i-1] += v
+                k[:, i+5, i+5] += v
+            if torsion:
+                g44 = T/L*Jx/Ax
+                k[:, 3, 3] += g44
+                k[:, 9, 9] += g44
+                k[:, 3, 9] -= g44
+                k[:, 9, 3] -= g44
+
+            for (i, j, v) in [(5, 3, -T/10.0/Dsz), (11, 3, -T/10.0/Dsz), (9, 5, T/10.0/Dsz), (11, 9, T/10.0/Dsz),
+                              (6, 2, T/10.0/Dsy), (12, 2, T/10.0/Dsy), (8, 6, -T/10.0/Dsy), (12, 8, -T/10.0/Dsy),
+                              (8, 2, -g22), (9, 3, -g33),
+                              (11, 5, -T*L*(1.0/30.0+Ksz/6.0+Ksz*Ksz/12.0)/Dsz),
+                              (12, 6, -T*L*(1.0/30.0+Ksy/6.0+Ksy*Ksy/12.0)/Dsy)]:
+                k[:, i-1, j-1] += v
+                k[:, j-1, i-1] += v
+
+        return k
+
+
+    def __toGlobal(self, k):
+        """T' k T for the block diagonal transformation of each element (atma), symmetrized"""
+
+        R = self.R
+        k = np.einsum('epi,eapbq,eqj->eaibj', R, k.reshape(-1, 4, 3, 4, 3), R).reshape(-1, 12, 12)
+        return 0.5*(k + np.transpose(k, (0, 2, 1)))
+
+
+    def __toLocal(self, v):
+        """element vectors of length 12 from global to local coordinates"""
+        return np.einsum('eij,ekj->eki', self.R, v.reshape(-1, 4, 3)).reshape(-1, 12)
+
+
+    def __assemble(self, k, diag=None):
+        A = sp.coo_matrix((k.flatten(), (self.rows, self.cols)), shape=(self.DoF, self.DoF)).tocsc()
+        if diag is not None:
+            A = A + sp.diags(diag, format='csc')
+        return A
+
+
+    def stiffness(self, Q=None):
+        """global stiffness matrix, including geometric stiffness for the element end forces Q (assemble_K)"""
+
+        T = -Q[:, 0] if self.geom else None
+        k = self.__toGlobal(self.__localStiffness(T))
+        return self.__assemble(k, self.EK)
+
+
+    def elementForces(self, D, eqF):
+        """element end forces in local coordinates for the displacements D (frame_element_force)"""
+
+        u = self.__toLocal(D[self.ind])
+        T = None
+        if self.geom:
+            T = (self.Ax*self.E/self.Le) * (u[:, 6] - u[:, 0])
+        s = np.einsum('eij,ej->ei', self.__localStiffness(T, torsion=False), u)
+        return s - self.__toLocal(eqF)
+
+
+    def __elementLoads(self, lc):
+        """equivalent loads of a load case (read_and_assemble_loads), returns the mechanical and temperature
+        load vectors, the element fixed end forces and the load data needed for the internal forces"""
+
+        nE, L, Le, R = self.nE, self.L, self.Le, self.R
+        gX, gY, gZ = _f32([lc.gx, lc.gy, lc.gz])
+        Ksy, Ksz = self.Ksy, self.Ksz
+
+        feF_mech = np.zeros((nE, 12))
+        feF_temp = np.zeros((nE, 12))
+
+        # gravity loads applied uniformly to all frame elements
+        t = R.reshape(nE, 9).T
+        t1, t2, t3, t4, t5, t6, t7, t8, t9 = t
+        m = self.d*self.Ax*L
+        feF_mech[:, [0, 6]] = (m*gX/2.0)[:, np.newaxis]
+        feF_mech[:, [1, 7]] = (m*gY/2.0)[:, np.newaxis]
+        feF_mech[:, [2, 8]] = (m*gZ/2.0)[:, np.newaxis]
+        c = m*L/12.0
+        feF_mech[:, 3] = c*((-t4*t8+t5*t7)*gY + (-t4*t9+t6*t7)*gZ)
+        feF_mech[:, 4] = c*((-t5*t7+t4*t8)*gX + (-t5*t9+t6*t8)*gZ)
+        feF_mech[:, 5] = c*((-t6*t7+t4*t9)*gX + (-t6*t8+t5*t9)*gY)
+        feF_mech[:, 9] = -feF_mech[:, 3]
+        feF_mech[:, 10] = -feF_mech[:, 4]
+        feF_mech[:, 11] = -feF_mech[:, 5]
+
+        def add(fe, n, loc):
+            # local fixed end forces of element n to global coordinates, {F} = [T]'{Q}
+            fe[n] += np.einsum('ji,kj->ki', R[n], loc.reshape(4, 3)).flatten()
+
+        # uniformly distributed loads (local element coordinates)
+        uL = lc.uniformLoads
+        U = np.column_stack([_carray(uL.EL, uL.nU)] + [_f32(_carray(getattr(uL, name), uL.nU)) for name in
+            ['Ux', 'Uy', 'Uz']])
+        for row in U:
+            n = int(row[0]) - 1
+            ux, uy, uz = row[1:]
+            Ln = Le[n]
+            N1 = ux*Ln/2.0
+            V1y = uy*Ln/2.0
+            V1z = uz*Ln/2.0
+            My1 = -uz*Ln*Ln/12.0
+            Mz1 = uy*Ln*Ln/12.0
+            add(feF_mech, n, np.array([N1, V1y, V1z, 0.0, My1, Mz1, N1, V1y, V1z, 0.0, -My1, -Mz1]))
+
+        # trapezoidally distributed loads (local element coordinates)
+        tL = lc.trapezoidalLoads
+        W = np.column_stack([_carray(tL.EL, tL.nW)] + [_f32(_carray(getattr(tL, name), tL.nW)) for name in
+            ['xx1', 'xx2', 'wx1', 'wx2', 'xy1', 'xy2', 'wy1', 'wy2', 'xz1', 'xz2', 'wz1', 'wz2']])
+        for row in W:
+            n = int(row[0]) - 1
+            Ln = L[n]
+            for (x1, x2) in [(row[1], row[2]), (row[5], row[6]), (row[9], row[10])]:
+                if x1 < 0 or x1 > x2 or x2 > Ln:
+                    raise RuntimeError('Frame3DD did not exit gracefully')
+
+            x1, x2, w1, w2 = row[1:5]
+            Nx1 = (3.0*(w1+w2)*Ln*(x2-x1) - (2.0*w2+w1)*x2*x2 + (w2-w1)*x2*x1 + (2.0*w1+w2)*x1*x1) / (6.0*Ln)
+            Nx2 = (-(2.0*w1+w2)*x1*x1 + (2.0*w2+w1)*x2*x2 - (w2-w1)*x1*x2) / (6.0*Ln)
+
+            Ksy_n = Ksy[n]
+            Ksz_n = Ksz[n]
+
+            x1, x2, w1, w2 = row[5:9]
+            R1o, R2o, f01, f02 = self.__trapezoid(x1, x2, w1, w2, Ln)
+            Mz1 = -(4.0*f01 + 2.0*f02 + Ksy_n*(f01 - f02)) / (Ln*Ln*(1.0+Ksy_n))
+            Mz2 = -(2.0*f01 + 4.0*f02 - Ksy_n*(f01 - f02)) / (Ln*Ln*(1.0+Ksy_n))
+            Vy1 = R1o + Mz1/Ln + Mz2/Ln
+            Vy2 = R2o - Mz1/Ln - Mz2/Ln
+
+            x1, x2, w1, w2 = row[9:13]
+            R1o, R2o, f01, f02 = self.__trapezoid(x1, x2, w1, w2, Ln)
+            My1 = (4.0*f01 + 2.0*f02 + Ksz_n*(f01 - f02)) / (Ln*Ln*(1.0+Ksz_n))
+            My2 = (2.0*f01 + 4.0*f02 - Ksz_n*(f01 - f02)) / (Ln*Ln*(1.0+Ksz_n))
+            Vz1 = R1o - My1/Ln - My2/Ln
+            Vz2 = R2o + My1/Ln + My2/Ln
+
+            add(feF_mech, n, np.array([Nx1, Vy1, Vz1, 0.0, My1, Mz1, Nx2, Vy2, Vz2, 0.0, My2, Mz2]))
+
+        # element point loads (local element coordinates)
+        eL = lc.elementLoads
+        P = np.column_stack([_carray(eL.EL, eL.nP)] + [_f32(_carray(getattr(eL, name), eL.nP)) for name in
+            ['Px', 'Py', 'Pz', 'x']])
+        for row in P:
+            n = int(row[0]) - 1
+            px, py, pz, a = row[1:]
+            Ln = L[n]
+            b = Ln - a
+            if a < 0 or Ln < a or b < 0 or Ln < b:
+                raise RuntimeError('Frame3DD did not exit gracefully')
+            Ksy_n = Ksy[n]
+            Ksz_n = Ksz[n]
+
+            Nx1 = px*a/Ln
+            Nx2 = px*b/Ln
+            Vy1 = (1./(1.+Ksz_n))*py*b*b*(3.*a + b)/Ln**3 + (Ksz_n/(1.+Ksz_n))*py*b/Ln
+            Vy2 = (1./(1.+Ksz_n))*py*a*a*(3.*b + a)/Ln**3 + (Ksz_n/(1.+Ksz_n))*py*a/Ln
+            Vz1 = (1./(1.+Ksy_n))*pz*b*b*(3.*a + b)/Ln**3 + (Ksy_n/(1.+Ksy_n))*pz*b/Ln
+            Vz2 = (1./(1.+Ksy_n))*pz*a*a*(3.*b + a)/Ln**3 + (Ksy_n/(1.+Ksy_n))*pz*a/Ln
+            My1 = -(1./(1.+Ksy_n))*pz*a*b*b/(Ln*Ln) - (Ksy_n/(1.+Ksy_n))*pz*a*b/(2.*Ln)
+            My2 = (1./(1.+Ksy_n))*pz*a*a*b/(Ln*Ln) + (Ksy_n/(1.+Ksy_n))*pz*a*b/(2.*Ln)
+            Mz1 = (1./(1.+Ksz_n))*py*a*b*b/(Ln*Ln) + (Ksz_n/(1.+Ksz_n))*py*a*b/(2.*Ln)
+            Mz2 = -(1./(1.+Ksz_n))*py*a*a*b/(Ln*Ln) - (Ksz_n/(1.+Ksz_n))*py*a*b/(2.*Ln)
+
+            add(feF_mech, n, np.array([Nx1, Vy1, Vz1, 0.0, My1, Mz1, Nx2, Vy2, Vz2, 0.0, My2, Mz2]))
+
+        # thermal loads (local element coordinates)
+        tempL = lc.temperatureLoads
+        nT = tempL.nT
+        for i in range(nT):
+            n = int(tempL.EL[i]) - 1
+            a, hy, hz, Typ, Tym, Tzp, Tzm = _f32([tempL.a[i], tempL.hy[i], tempL.hz[i],
+                                                 tempL.Typ[i], tempL.Tym[i], tempL.Tzp[i], tempL.Tzm[i]])
+            if hy < 0 or hz < 0:
+                raise RuntimeError('Frame3DD did not exit gracefully')
+            Nx2 = (a/4.0)*(Typ + Tym + Tzp + Tzm)*self.E[n]*self.Ax[n]
+            My1 = (a/hz)*(Tzm - Tzp)*self.E[n]*self.Iy[n]
+            Mz1 = (a/hy)*(Typ - Tym)*self.E[n]*self.Iz[n]
+            add(feF_temp, n, np.array([-Nx2, 0.0, 0.0, 0.0, My1, Mz1, Nx2, 0.0, 0.0, 0.0, -My1, -Mz1]))
+
+        # node point loads (global coordinates)
+        F_mech = np.zeros(self.DoF)
+        pL = lc.pointLoads
+        NF = _carray(pL.N, pL.nF, np.int64)
+        Fn = np.column_stack([_f32(_carray(getattr(pL, name), pL.nF)) for name in
+            ['Fx', 'Fy', 'Fz', 'Mxx', 'Myy', 'Mzz']])
+        for j, f in zip(NF, Fn):
+            F_mech[6*(j-1):6*j] = f
+
+        F_temp = np.zeros(self.DoF)
+        np.add.at(F_mech, self.ind, feF_mech)
+        np.add.at(F_temp, self.ind, feF_temp)
+
+        # prescribed displacements
+        Dp = np.zeros(self.DoF)
+        pD = lc.prescribedDisplacements
+        ND = _carray(pD.N, pD.nD, np.int64)
+        Dn = np.column_stack([_f32(_carray(getattr(pD, name), pD.nD)) for name in
+            ['Dx', 'Dy', 'Dz', 'Dxx', 'Dyy', 'Dzz']])
+        for j, dj in zip(ND, Dn):
+            Dp[6*(j-1):6*j] = dj
+        if np.any((self.r == 0) & (Dp != 0.0)):
+            raise RuntimeError('Frame3DD did not exit gracefully')
+
+        mech = pL.nF > 0 or len(U) > 0 or len(W) > 0 or len(P) > 0 or pD.nD > 0 or gX != 0 or gY != 0 or gZ != 0
+
+        return F_mech, F_temp, feF_mech, feF_temp, Dp, nT > 0, mech, (gX, gY, gZ, U, W, P)
+
+
+    @staticmethod
+    def __trapezoid(x1, x2, w1, w2, Ln):
+        R1o = ((2.0*w1+w2)*x1*x1 - (w1+2.0*w2)*x2*x2 + 3.0*(w1+w2)*Ln*(x2-x1) - (w1-w2)*x1*x2) / (6.0*Ln)
+        R2o = ((w1+2.0*w2)*x2*x2 + (w1-w2)*x1*x2 - (2.0*w1+w2)*x1*x1) / (6.0*Ln)
+        f01 = (3.0*(w2+4.0*w1)*x1**4 - 3.0*(w1+4.0*w2)*x2**4
+               - 15.0*(w2+3.0*w1)*Ln*x1**3 + 15.0*(w1+3.0*w2)*Ln*x2**3
+               - 3.0*(w1-w2)*x1*x2*(x1*x1 + x2*x2)
+               + 20.0*(w2+2.0*w1)*Ln*Ln*x1*x1 - 20.0*(w1+2.0*w2)*Ln*Ln*x2*x2
+               + 15.0*(w1-w2)*Ln*x1*x2*(x1+x2)
+               - 3.0*(w1-w2)*x1*x1*x2*x2 - 20.0*(w1-w2)*Ln*Ln*x1*x2) / 360.0
+        f02 = (3.0*(w2+4.0*w1)*x1**4 - 3.0*(w1+4.0*w2)*x2**4
+               - 3.0*(w1-w2)*x1*x2*(x1*x1+x2*x2)
+               - 10.0*(w2+2.0*w1)*Ln*Ln*x1*x1 + 10.0*(w1+2.0*w2)*Ln*Ln*x2*x2
+               - 3.0*(w1-w2)*x1*x1*x2*x2 + 10.0*(w1-w2)*Ln*Ln*x1*x2) / 360.0
+        return R1o, R2o, f01, f02
+
+
+    def __solve(self, K, F, Dr):
+        """solve K_qq D_q = F_q - K_qr D_r, returns D_q and the reactions R_r = K_rq D_q + K_rr D_r - F_r"""
+
+        q, rr = self.q, self.rr
+        Kq = K[:, q]
+        Kr = K[:, rr]
+        lu = spla.splu(Kq[q, :].tocsc())
+        Dq = lu.solve(F[q] - Kr[q, :].dot(Dr))
+        Rr = Kq[rr, :].dot(Dq) + Kr[rr, :].dot(Dr) - F[rr]
+        return Dq, Rr
+
+
+    def __equilibriumError(self, K, F, D):
+        q = self.q
+        dF = F - K.dot(D)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return dF, np.sqrt(np.sum(dF[q]**2)) / np.sqrt(np.sum(F[q]**2))
+
+
+    def statics(self, lc, tol):
+        """static analysis of a load case, as in the load case loop of py_main.c.
+        Returns the displacements, reactions, element end forces, stiffness matrix and load data."""
+
+        q, rr = self.q, self.rr
+        F_mech, F_temp, feF_mech, feF_temp, Dp, temp, mech, loads = self.__elementLoads(lc)
+        eqF = feF_temp + feF_mech
+
+        D = np.zeros(self.DoF)
+        R = np.zeros(self.DoF)
+        Q = np.zeros((self.nE, 12))
+        K = self.stiffness(Q)
+
+        # first apply temperature loads only
+        if temp:
+            Dq, Rr = self.__solve(K, F_temp, np.zeros(np.sum(rr)))
+            D[q] += Dq
+            R[rr] += Rr
+            if self.geom:
+                Q = self.elementForces(D, eqF)
+                K = self.stiffness(Q)
+
+        # ... then mechanical loads, with the prescribed displacements at the reactions
+        if mech:
+            Dq, Rr = self.__solve(K, F_mech, Dp[rr])
+            D[q] += Dq
+            D[rr] = Dp[rr]
+            R[rr] += Rr
+
+        F = F_temp + F_mech
+        Q = self.elementForces(D, eqF)
+
+        # quasi Newton-Raphson iteration for geometric nonlinearity
+        if self.geom:
+            error = 1.0
+            it = 0
+            while error > tol and it < 500:
+                it += 1
+                K = self.stiffness(Q)
+                dF, error = self.__equilibriumError(K, F, D)
+                Dq, _ = self.__solve(K, dF, np.zeros(np.sum(rr)))
+                D[q] += Dq
+                Q = self.elementForces(D, eqF)
+
+            R = np.zeros(self.DoF)
+            R[rr] = K.dot(D)[rr] - F[rr]
+
+        return D, R, Q, K, loads
+
+
+    def internalForces(self, m, Q, D, loads, nx):
+        """internal forces and displacements along element m (write_internal_forces)"""
+
+        gX, gY, gZ, U, W, P = loads
+        dx = self.dx
+        L = self.L[m]
+        E, G, Ax, Jx, Iy, Iz = self.E[m], self.G[m], self.Ax[m], self.Jx[m], self.Iy[m], self.Iz[m]
+        Qm = Q[m]
+        R = self.R[m]
+        i = np.arange(1, nx+1)
+
+        x = _f32(np.arange(nx+1, dtype=np.float32)*np.float32(dx))
+        x[nx] = L
+        h = np.diff(x)
+        h[:-1] = dx
+
+        # distributed gravity and uniform loads in local x, y, z coordinates
+        wg = self.d[m]*Ax*R.dot([gX, gY, gZ])
+        for row in U:
+            if int(row[0]) == m+1:
+                wg = wg + row[1:4]
+        w = np.tile(wg, (nx+1, 1))
+
+        # trapezoidally distributed loads, not included at x = 0
+        for row in W:
+            if int(row[0]) == m+1:
+                for k, c in enumerate([1, 5, 9]):
+                    x1, x2, w1, w2 = row[c:c+4]
+                    on = (x[1:] > x1) & (x[1:] <= x2)
+                    w[1:, k][on] += w1 + (w2-w1)*(x[1:][on]-x1)/(x2-x1)
+
+        # trapezoidal integration of distributed loads for axial force, shear forces and torque
+        V = -0.5*(w[1:] + w[:-1])*h[:, np.newaxis]
+
+        # interior point loads
+        for row in P:
+            if int(row[0]) == m+1:
+                xp = row[4]
+                xi = x[1:]
+                c1 = (xi <= xp) & (xp < xi + dx)
+                c2 = (xi - dx <= xp) & (xp < xi)
+                f = 0.5*(1.0 - (xp - xi)/dx)*c1 + 0.5*(1.0 - (xi - dx - xp)/dx)*c2
+                V -= np.outer(f, row[1:4])
+
+        F0 = np.array([-Qm[0], -Qm[1], -Qm[2]])
+        Nx, Vy, Vz = (F0 + np.r_[np.zeros((1, 3)), np.cumsum(V, axis=0)]).T
+        Tx = -Qm[3]*np.ones(nx+1)
+
+        def correct(y, end):
+            # linear correction for bias in trapezoidal integration
+            y[1:] -= (y[nx] - end)*i/nx
+            return y
+
+        def integrate(y0, f):
+            return y0 + np.r_[0.0, np.cumsum(0.5*(f[1:] + f[:-1])*h)]
+
+        Nx = correct(Nx, Qm[6])
+        Vy = correct(Vy, Qm[7])
+        Vz = correct(Vz, Qm[8])
+        Tx = correct(Tx, Qm[9])
+
+        My = correct(integrate(Qm[4], -Vz), -Qm[10])
+        Mz = correct(integrate(-Qm[5], -Vy), Qm[11])
+
+        # end displacements in local coordinates
+        u = D[self.ind[m]].reshape(4, 3).dot(R.T).flatten()
+
+        Dx = correct(integrate(u[0], Nx/(E*Ax)), u[6])
+        Rx = correct(integrate(u[3], Tx/(G*Jx)), u[9])
+
+        Sy = integrate(u[5], Mz/(E*Iz))
+        Sz = integrate(-u[4], My/(E*Iy))
+        if self.shear:
+            Sy[1:] += Vy[1:]/(G*self.Asy[m])
+            Sz[1:] += Vz[1:]/(G*self.Asz[m])
+        Sy = correct(Sy, u[11])
+        Sz = correct(Sz, -u[10])
+
+        Dy = correct(integrate(u[1], Sy), u[7])
+        Dz = correct(integrate(u[2], Sz), u[8])
+
+        return x, Nx, Vy, Vz, Tx, My, Mz, Dx, Dy, Dz, Rx
+
+
+    def mass(self, lump):
+        """global mass matrix (assemble_M) and the total and structural mass"""
+
+        frame = self.frame
+        nE, L, R = self.nE, self.L, self.R
+        d, Ax, Jx, Iy, Iz = self.d, self.Ax, self.Jx, self.Iy, self.Iz
+
+        EMs = np.zeros(nE)
+        EMs[frame.EEMelement-1] = _f32(frame.EEMmass)
+
+        m = np.zeros((nE, 12, 12))
+        if lump:
+            t = (d*Ax*L + EMs)/2.0
+            rot = np.einsum('eki,ek,ekj->eij', R, np.c_[d*L*Jx/2.0, d*Iy*L/2.0, d*Iz*L/2.0], R)
+            for i in [0, 1, 2, 6, 7, 8]:
+                m[:, i, i] = t
+            m[:, 3:6, 3:6] = rot
+            m[:, 9:12, 9:12] = rot
+        else:
+            t = d*Ax*L
+            ry = d*Iy
+            rz = d*Iz
+            po = d*Jx*L
+            for i, v in [(1, t/3.), (2, 13.*t/35. + 6.*rz/(5.*L)), (3, 13.*t/35. + 6.*ry/(5.*L)), (4, po/3.),
+                         (5, t*L*L/105. + 2.*L*ry/15.), (6, t*L*L/105. + 2.*L*rz/15.)]:
+                m[:, i-1, i-1] = m[:, i+5, i+5] = v
+            _sym(m, 5, 3, -11.*t*L/210. - ry/10.)
+            _sym(m, 6, 2, 11.*t*L/210. + rz/10.)
+            _sym(m, 7, 1, t/6.)
+            _sym(m, 8, 6, 13.*t*L/420. - rz/10.)
+            _sym(m, 9, 5, -13.*t*L/420. + ry/10.)
+            _sym(m, 10, 4, po/6.)
+            _sym(m, 11, 3, 13.*t*L/420. - ry/10.)
+            _sym(m, 12, 2, -13.*t*L/420. + rz/10.)
+            _sym(m, 11, 9, 11.*t*L/210. + ry/10.)
+            _sym(m, 12, 8, -11.*t*L/210. - rz/10.)
+            _sym(m, 8, 2, 9.*t/70. - 6.*rz/(5.*L))
+            _sym(m, 9, 3, 9.*t/70. - 6.*ry/(5.*L))
+            _sym(m, 11, 5, -L*L*t/140. - ry*L/30.)
+            _sym(m, 12, 6, -L*L*t/140. - rz*L/30.)
+            for i in [0, 1, 2, 6, 7, 8]:
+                m[:, i, i] += 0.5*EMs
+            m = self.__toGlobal(m)
+
+        # extra node mass and inertia
+        NM = np.zeros(self.DoF)
+        nodes = frame.ENMnode - 1
+        for i, x in enumerate([frame.ENMmass, frame.ENMmass, frame.ENMmass, frame.ENMIxx, frame.ENMIyy, frame.ENMIzz]):
+            NM[6*nodes + i] = _f32(x)
+
+        struct_mass = np.sum(d*Ax*L)
+        total_mass = struct_mass + np.sum(EMs) + np.sum(_f32(frame.ENMmass))
+
+        return self.__assemble(m, NM), total_mass, struct_mass
+
+
+    def modes(self, K, M, nM, shift):
+        """lowest nM natural frequencies and mass normalized mode shapes, with the rigid reaction coordinates
+        removed (Frame3DD uses a large stiffness there instead)"""
+
+        free = np.where(self.r != 1)[0]
+        Kf = K[free, :][:, free].tocsc()
+        Mf = M[free, :][:, free].tocsc()
+        nfree = len(free)
+
+        if nM < nfree - 1:
+            lam, V = spla.eigsh(Kf, k=nM, M=Mf, sigma=-shift, which='LM')
+        else:
+            lam, V = scipy.linalg.eigh(Kf.toarray(), Mf.toarray())
+        isort = np.argsort(lam)[:nM]
+        lam = lam[isort]
+        V = V[:, isort]
+        V /= np.sqrt(np.sum(V*Mf.dot(V), axis=0))
+
+        Vall = np.zeros((self.DoF, len(lam)))
+        Vall[free, :] = V
+        with np.errstate(invalid='ignore'):
+            freq = np.sqrt(lam)/(2.0*np.pi)
+        return freq, Vall
+
+
+    def run(self, c_loadcases, ws, nIF):
+        """run all load cases and modes, writing into the output arrays of a Frame workspace.
+        Returns the node masses (the namedtuple is read only)."""
+
+        frame = self.frame
+        dout, fout, rout, ifout = ws['dout'], ws['fout'], ws['rout'], ws['ifout']
+        mout, modalout = ws['mout'], ws['modalout']
+        nN, nE = self.nN, self.nE
+        nM = frame.nM
+        tol = frame.tol if nM > 0 else 1.0e-9
+
+        node = np.arange(1, nN+1)
+        element = np.arange(1, nE+1)
+        rnode = frame.rnode
+        rdof = 6*(rnode-1)[:, np.newaxis] + np.arange(6)
+
+        K = None
+        for ic, lc in enumerate(c_loadcases):
+            D, R, Q, K, loads = self.statics(lc, tol)
+
+            Dn = D.reshape(nN, 6)
+            dout.node[ic, :] = node
+            for j, name in enumerate(['dx', 'dy', 'dz', 'dxrot', 'dyrot', 'dzrot']):
+                getattr(dout, name)[ic, :] = Dn[:, j]
+
+            fout.element[ic, 0::2] = fout.element[ic, 1::2] = element
+            fout.node[ic, 0::2] = self.N1 + 1
+            fout.node[ic, 1::2] = self.N2 + 1
+            for j, name in enumerate(['Nx', 'Vy', 'Vz', 'Txx', 'Myy', 'Mzz']):
+                getattr(fout, name)[ic, 0::2] = Q[:, j]
+                getattr(fout, name)[ic, 1::2] = Q[:, 6+j]
+
+            Rn = np.where(self.r[rdof] != 0, R[rdof], 0.0)
+            rout.node[ic, :] = rnode
+            for j, name in enumerate(['Fx', 'Fy', 'Fz', 'Mxx', 'Myy', 'Mzz']):
+                getattr(rout, name)[ic, :] = Rn[:, j]
+
+            if self.dx != -1.0:
+                for m in range(nE):
+                    for name, y in zip(ifout[m]._fields, self.internalForces(m, Q, D, loads, nIF[m]-1)):
+                        getattr(ifout[m], name)[ic, :] = y
+
+        if np.any(np.isnan(np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz])):
+            raise RuntimeError('Frame3DD did not exit gracefully')
+
+        if nM == 0:
+            return mout
+
+        # modal analysis with the stiffness of the last load case
+        M, total_mass, struct_mass = self.mass(frame.lump)
+
+        # Frame3DD reports the node masses and participation factors with the reaction coordinates of M
+        # replaced by trace(M) on the diagonal (only the upper triangle of M is cleared)
+        rigid = self.r == 1
+        traceM = M.diagonal()[self.r == 0].sum()
+        Mc = M.tocoo()
+        keep = ~rigid[np.minimum(Mc.row, Mc.col)] | (Mc.row == Mc.col)
+        Mr = sp.coo_matrix((Mc.data[keep], (Mc.row[keep], Mc.col[keep])), shape=M.shape).tocsr()
+        Mr = Mr + sp.diags(np.where(rigid, traceM - Mr.diagonal(), 0.0))
+
+        Mdiag = Mr.diagonal().reshape(nN, 6)
+        mout.node[:] = node
+        for j, name in enumerate(['xmass', 'ymass', 'zmass', 'xinrta', 'yinrta', 'zinrta']):
+            getattr(mout, name)[:] = Mdiag[:, j]
+
+        num_modes = min(nM, self.DoF - self.sumR)
+        freq, V = self.modes(K, M, num_modes, frame.shift)
+        msXYZ = np.column_stack([Mr.dot((np.arange(self.DoF) % 6 == i).astype(float)) for i in range(3)])
+        mpf = V.T.dot(msXYZ)
+        for m in range(num_modes):
+            modalout.freq[m] = freq[m]
+            modalout.xmpf[m], modalout.ympf[m], modalout.zmpf[m] = mpf[m]
+            modalout.node[m, :] = node
+            Vn = V[:, m].reshape(nN, 6)
+            for j, name in enumerate(['xdsp', 'ydsp', 'zdsp', 'xrot', 'yrot', 'zrot']):
+                getattr(modalout, name)[m, :] = Vn[:, j]
+
+        return mout._replace(total_mass=total_mass, struct_mass=struct_mass)
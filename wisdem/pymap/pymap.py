@@ -229,6 +229,7 @@ libexec.map_plot_array_free.argtypes = [ POINTER(c_double) ]
 
 # modifyers
 libexec.map_offset_vessel.argtypes = [MapData_Type, MapInput_Type, c_double, c_double, c_double, c_double, c_double, c_double, c_char_p, POINTER(c_int)]        
+libexec.map_offset_vessel_sweep.argtypes = [MapInput_Type, MapParameter_Type, MapContinuous_Type, MapConstraint_Type, MapData_Type, c_int, POINTER(c_double), POINTER(c_double), POINTER(c_int), c_char_p]
 libexec.map_linearize_matrix.argtypes = [MapInput_Type, MapParameter_Type, MapData_Type, MapOutput_Type, MapConstraint_Type, c_double, POINTER(c_int), c_char_p]        
 libexec.map_linearize_matrix.restype  = POINTER(POINTER(c_double))
 libexec.map_free_linearize_matrix.argtypes = [POINTER(POINTER(c_double))]
@@ -624,6 +625,28 @@ class pyMAP(object):
             self.end( )
             sys.exit('MAP terminated premature.')    
 
+    def offset_vessel_sweep(self, displacements):
+        """Solves the mooring system for a sequence of vessel displacements in a single call and returns the 
+        fairlead forces of all lines for each of them. Same as calling displace_vessel(), update_states() and 
+        get_fairlead_force_3d() for every displacement and line, each solve starting from the equilibrium of the
+        previous displacement, so neighbouring displacements should be close to each other. Called C function:
+
+        MAP_EXTERNCALL void map_offset_vessel_sweep(MAP_InputType_t* u_type, MAP_ParameterType_t* p_type, MAP_ContinuousStateType_t* x_type, MAP_ConstraintStateType_t* z_type, MAP_OtherStateType_t* other_type, int n, double* displacements, double* fairlead_forces, MAP_ERROR_CODE* ierr, char* map_msg);
+
+        :param displacements: sequence of (x, y, z, phi, the, psi) vessel displacements [m, deg]
+        :returns: list with, for each displacement, the list of (fx, fy, fz) fairlead forces of each line [N]
+
+        >>> forces = offset_vessel_sweep([(10, 0, 0, 0, 0, 0), (0, 10, 0, 0, 0, 0)])
+        """
+        n       = len(displacements)
+        n_lines = self.size_lines()
+        disp    = (c_double * (6*n))(*[float(d) for row in displacements for d in row])
+        forces  = (c_double * (3*n*n_lines))()
+        libexec.map_offset_vessel_sweep(self.f_type_u, self.f_type_p, self.f_type_x, self.f_type_z, self.f_type_d, n, disp, forces, pointer(self.ierr), self.status)
+        if self.ierr.value != 0 : print(self.status.value)
+        return [[tuple(forces[3*(i*n_lines+k):3*(i*n_lines+k)+3]) for k in range(n_lines)] for i in range(n)]
+
+
     def read_file( self, fileName ):
         f           = open(fileName, 'r')
         charptr     = POINTER(c_char)
@@ -378,6 +378,53 @@ MAP_EXTERNCALL void map_offset_vessel(MAP_OtherStateType_t* other_type, MAP_Inpu
 };
 
 
+MAP_EXTERNCALL void map_offset_vessel_sweep(MAP_InputType_t* u_type,
+                                            MAP_ParameterType_t* p_type,
+                                            MAP_ContinuousStateType_t* x_type,
+                                            MAP_ConstraintStateType_t* z_type,
+                                            MAP_OtherStateType_t* other_type,
+                                            int n,
+                                            double* displacements,
+                                            double* fairlead_forces,
+                                            MAP_ERROR_CODE* ierr,
+                                            char* map_msg)
+{
+  Domain* domain = other_type->object;
+  const int n_lines = list_size(&domain->line);
+  MAP_ERROR_CODE first_ierr = MAP_SAFE;
+  char first_msg[MAP_ERROR_STRING_LENGTH] = "";
+  double* d = NULL;
+  double* f = NULL;
+  int i = 0;
+  int k = 0;
+
+  for (i=0 ; i<n ; i++) { 
+    /* each solve starts from the equilibrium of the previous displacement */
+    d = &displacements[6*i];
+    map_offset_vessel(other_type, u_type, d[0], d[1], d[2], d[3], d[4], d[5], map_msg, ierr);
+    if (*ierr==MAP_SAFE) {
+      map_update_states(0.0, 0, u_type, p_type, x_type, z_type, other_type, ierr, map_msg);
+    };
+    
+    for (k=0 ; k<n_lines ; k++) { 
+      f = &fairlead_forces[3*(i*n_lines + k)];
+      map_get_fairlead_force_3d(&f[0], &f[1], &f[2], other_type, k, map_msg, ierr);
+    };
+
+    /* keep the first error, the sweep goes on as a sequence of single solves would */
+    if (*ierr!=MAP_SAFE && first_ierr==MAP_SAFE) {
+      first_ierr = *ierr;
+      strncpy(first_msg, map_msg, MAP_ERROR_STRING_LENGTH-1);
+    };
+  };
+
+  if (first_ierr!=MAP_SAFE) {
+    *ierr = first_ierr;
+    strncpy(map_msg, first_msg, MAP_ERROR_STRING_LENGTH-1);
+  };
+};
+
+
 MAP_EXTERNCALL double** map_linearize_matrix(MAP_InputType_t* u_type, MAP_ParameterType_t* p_type, MAP_OtherStateType_t* other_type, MAP_OutputType_t* y_type, MAP_ConstraintStateType_t* z_type, double epsilon, MAP_ERROR_CODE* ierr, char* map_msg)
 {
   double* x_original = NULL;
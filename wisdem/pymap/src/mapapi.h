@@ -226,6 +226,36 @@ MAP_EXTERNCALL void map_get_anchor_force_3d(double* fx, double* fy, double* fz,
 MAP_EXTERNCALL void map_offset_vessel(MAP_OtherStateType_t* other_type, MAP_InputType_t* u_type, double x, double y, double z, double phi, double the, double psi, char* map_msg, MAP_ERROR_CODE* ierr);
 
 
+/**
+ * @brief     Solves the statics problem for a sequence of vessel displacements and returns the fairlead forces of 
+ *            every line for each of them. Equivalent to calling {@link map_offset_vessel()}, {@link map_update_states()} 
+ *            and {@link map_get_fairlead_force_3d()} for each displacement in turn, each solve starting from the 
+ *            equilibrium of the previous displacement. Order the displacements so neighbours are close to each other.
+ * @param     u_type input type, F2C FAST-native derived type. 
+ * @param     p_type parameter type, F2C FAST-native derived type
+ * @param     x_type continuous-state type, F2C FAST-native derived type
+ * @param     z_type constraint-state type, F2C FAST-native derived tpe
+ * @param     other_type other-state type, F2C FAST-native derived type
+ * @param     n number of vessel displacements
+ * @param     displacements array of size 6*n, (x, y, z, phi, the, psi) of each displacement. Angles are in degrees
+ * @param     fairlead_forces array of size 3*n*(number of lines), filled with (fx, fy, fz) of each line for each 
+ *            displacement in the global reference frame
+ * @param     ierr error code, the first error raised in the sequence
+ * @param     map_msg error string
+ * @see       {@link map_offset_vessel()}
+ */
+MAP_EXTERNCALL void map_offset_vessel_sweep(MAP_InputType_t* u_type,
+                                            MAP_ParameterType_t* p_type,
+                                            MAP_ContinuousStateType_t* x_type,
+                                            MAP_ConstraintStateType_t* z_type,
+                                            MAP_OtherStateType_t* other_type,
+                                            int n,
+                                            double* displacements,
+                                            double* fairlead_forces,
+                                            MAP_ERROR_CODE* ierr,
+                                            char* map_msg);
+
+
 /**
  * lib.linearize_matrix.argtypes = [MapInput_Type, MapData_Type, MapOutnput_Type, c_double, c_char_p, POINTER(c_int)]        
  */
@@ -134,12 +134,12 @@ class RotorSE(Group):
         self.connect('V_mean','wind.Uref')
         self.connect('wind_zvec', 'wind.z')
         self.connect('rated_V', ['rs.V_hub', 'rs.setuppc.Vrated'])
-        self.connect('rated_Omega', ['rs.Omega', 'rs.aero_rated.Omega_load',
-                                     'rs.aero_rated_0.Omega_load',
-                                     'rs.aero_rated_120.Omega_load','rs.aero_rated_240.Omega_load'])
-        self.connect('rated_pitch', 'rs.aero_rated.pitch_load')
-        self.connect('V_extreme50',    'rs.aero_extrm.V_load')
-        self.connect('V_extreme_full', 'rs.aero_extrm_forces.Uhub')
+        self.connect('rated_Omega', ['rs.Omega', 'rs.aero_loads.Omega_load_rated',
+                                     'rs.aero_loads.Omega_load_rated_0',
+                                     'rs.aero_loads.Omega_load_rated_120','rs.aero_loads.Omega_load_rated_240'])
+        self.connect('rated_pitch', 'rs.aero_loads.pitch_load_rated')
+        self.connect('V_extreme50',    'rs.aero_loads.V_load_extrm')
+        self.connect('V_extreme_full', 'rs.aero_loads.Uhub')
         self.connect('theta', 'rs.tip.theta', src_indices=[NPTS-1])
         
         # Connections to AeroelasticSE
@@ -11,7 +11,7 @@ from __future__ import print_function
 import numpy as np
 import os
 from openmdao.api import IndepVarComp, ExplicitComponent, Group, Problem
-from scipy.optimize import minimize_scalar, minimize
+from scipy.optimize import brentq
 from scipy.interpolate import PchipInterpolator
 
 from wisdem.ccblade.ccblade_component import CCBladeGeometry, CCBladePower
@@ -123,16 +123,173 @@ class RegulatedPowerCurve(ExplicitComponent): # Implicit COMPONENT
         self.add_output('cd_cutin', val=np.zeros(naero),                    desc='drag coefficient distribution along blade span at cut-in wind speed')
 
         # self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
-        
+
+        # regulation trajectory (V, pitch, rated_V) of the last call, used to predict the pitch table cells of the next one
+        self.regulation_warm_start = None
+
+    def _power(self, Uhub, Omega, pitch):
+        # aerodynamic power at arrays of conditions (Omega in rad/s), in one batched BEM evaluation
+        Uhub, Omega, pitch = np.broadcast_arrays(np.asarray(Uhub, dtype=float), np.asarray(Omega, dtype=float), np.asarray(pitch, dtype=float))
+        P, _, _, _ = self.ccblade.evaluate(Uhub.flatten(), Omega.flatten() * 30. / np.pi, pitch.flatten(), coefficients=False)
+        return P.reshape(Uhub.shape)
+
+    def _power_table(self, Uhub, Omega, pitch_grid):
+        # aerodynamic power for every combination of wind speed and pitch, shape (len(Uhub), len(pitch_grid))
+        return self._power(np.asarray(Uhub)[:, np.newaxis], Omega, np.asarray(pitch_grid)[np.newaxis, :])
+
+    def _max_power_cell(self, Uhub, Omega, pitch_grid, pitch_guess=None):
+        # Index m of the pitch grid point of maximum power at each wind speed, kept off the ends of the grid.
+        # With a guess only the grid points around it are evaluated, and the guessed point is kept where it is an
+        # interior local maximum, which for power unimodal in pitch is the maximum of the full table.  The other
+        # wind speeds are evaluated on the full grid.
+        Uhub  = np.asarray(Uhub, dtype=float).flatten()
+        m     = np.zeros(len(Uhub), dtype=int)
+        solve = np.ones(len(Uhub), dtype=bool)
+        if pitch_guess is not None:
+            m_guess = np.clip(np.round(np.interp(pitch_guess, pitch_grid, np.arange(len(pitch_grid)))).astype(int), 1, len(pitch_grid) - 2)
+            P       = self._power(Uhub[:, np.newaxis], Omega, pitch_grid[m_guess[:, np.newaxis] + np.array([-1, 0, 1])])
+            solve   = ~((P[:,1] > P[:,0]) & (P[:,1] >= P[:,2]))
+            m[~solve] = m_guess[~solve]
+        if np.any(solve):
+            P_table  = self._power_table(Uhub[solve], Omega, pitch_grid)
+            m[solve] = np.clip(np.argmax(P_table, axis=1), 1, len(pitch_grid) - 2)
+        return m
+
+    def _constant_power_cell(self, Uhub, Omega, P_target, pitch_grid, pitch_guess=None):
+        # Bracket [lower, upper] and initial guess of the pitch giving power P_target at each wind speed, from the
+        # first crossing of P_target on the feather side of maximum power on the pitch grid.  With a guess only the
+        # two grid points around it are evaluated, and the guessed cell is kept where power crosses P_target
+        # downwards in it, which for power unimodal in pitch is the crossing found on the full grid.
+        Uhub  = np.asarray(Uhub, dtype=float).flatten()
+        lower = np.zeros(len(Uhub))
+        upper = np.zeros(len(Uhub))
+        guess = np.zeros(len(Uhub))
+        solve = np.ones(len(Uhub), dtype=bool)
+        if pitch_guess is not None:
+            m_guess = np.clip(np.floor(np.interp(pitch_guess, pitch_grid, np.arange(len(pitch_grid)))).astype(int) + 1, 1, len(pitch_grid) - 1)
+            P       = self._power(Uhub[:, np.newaxis], Omega, pitch_grid[m_guess[:, np.newaxis] + np.array([-1, 0])])
+            solve   = ~((P[:,0] >= P_target) & (P[:,1] < P_target))
+            for n in np.nonzero(~solve)[0]:
+                m = m_guess[n]
+                lower[n], upper[n] = pitch_grid[m-1], pitch_grid[m]
+                guess[n] = np.interp(P_target, P[n,::-1], pitch_grid[m-1:m+1][::-1])
+        if np.any(solve):
+            P_table = self._power_table(Uhub[solve], Omega, pitch_grid)
+            for n, P_row in zip(np.nonzero(solve)[0], P_table):
+                m_max   = np.argmax(P_row)
+                below   = np.nonzero(P_row[m_max:] < P_target)[0]
+                if len(below) == 0:
+                    lower[n], upper[n], guess[n] = pitch_grid[-1], pitch_grid[-1] + 15., pitch_grid[-1]
+                elif below[0] == 0:
+                    lower[n], upper[n], guess[n] = pitch_grid[m_max], pitch_grid[m_max], pitch_grid[m_max]
+                else:
+                    m = m_max + below[0]
+                    lower[n], upper[n] = pitch_grid[m-1], pitch_grid[m]
+                    guess[n] = np.interp(P_target, P_row[m-1:m+1][::-1], pitch_grid[m-1:m+1][::-1])
+        return lower, upper, guess
+
+    def _max_power_pitch(self, Uhub, Omega, pitch0, lower, upper, h=0.05, tol=1.e-3, maxiter=10):
+        # Pitch maximizing power at each wind speed.  Newton iterations on dP/dpitch (central differences),
+        # all wind speeds evaluated together, safeguarded by bisection within [lower, upper].
+        # Returns the pitch and whether it converged inside the initial bounds.
+        Uhub      = np.asarray(Uhub, dtype=float).flatten()
+        lower0    = np.asarray(lower, dtype=float).flatten()
+        upper0    = np.asarray(upper, dtype=float).flatten()
+        lower     = lower0.copy()
+        upper     = upper0.copy()
+        pitch     = np.clip(np.asarray(pitch0, dtype=float).flatten(), lower, upper)
+        converged = np.zeros(len(Uhub), dtype=bool)
+
+        for it in range(maxiter):
+            a = np.nonzero(~converged)[0]
+            if len(a) == 0:
+                break
+
+            P   = self._power(Uhub[a][:, np.newaxis], Omega, pitch[a][:, np.newaxis] + np.array([-h, 0., h]))
+            dP  = (P[:,2] - P[:,0]) / (2.*h)
+            d2P = (P[:,2] - 2.*P[:,1] + P[:,0]) / h**2
+
+            lower[a] = np.where(dP > 0., pitch[a], lower[a])
+            upper[a] = np.where(dP <= 0., pitch[a], upper[a])
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pitch_new = pitch[a] - dP / d2P
+            pitch_new = np.where((d2P < 0.) & (pitch_new > lower[a]) & (pitch_new < upper[a]), pitch_new, 0.5*(lower[a] + upper[a]))
+
+            converged[a] = np.abs(pitch_new - pitch[a]) < tol
+            pitch[a]     = pitch_new
+
+        return pitch, converged & (pitch > lower0 + tol) & (pitch < upper0 - tol)
+
+    def _constant_power_pitch(self, Uhub, Omega, P_target, pitch0, lower, upper, h=0.01, tol=1.e-4, maxiter=20):
+        # Pitch giving aerodynamic power P_target at each wind speed, on the side where power decreases with pitch.
+        # Newton iterations (forward differences), all wind speeds evaluated together, safeguarded by bisection
+        # within [lower, upper].  Returns the pitch and whether it converged inside the initial bounds.
+        Uhub      = np.asarray(Uhub, dtype=float).flatten()
+        lower0    = np.asarray(lower, dtype=float).flatten()
+        upper0    = np.asarray(upper, dtype=float).flatten()
+        lower     = lower0.copy()
+        upper     = upper0.copy()
+        pitch     = np.clip(np.asarray(pitch0, dtype=float).flatten(), lower, upper)
+        converged = np.zeros(len(Uhub), dtype=bool)
+
+        for it in range(maxiter):
+            a = np.nonzero(~converged)[0]
+            if len(a) == 0:
+                break
+
+            P  = self._power(Uhub[a][:, np.newaxis], Omega, pitch[a][:, np.newaxis] + np.array([0., h]))
+            f  = P[:,0] - P_target
+            df = (P[:,1] - P[:,0]) / h
+
+            lower[a] = np.where(f > 0., pitch[a], lower[a])
+            upper[a] = np.where(f <= 0., pitch[a], upper[a])
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pitch_new = pitch[a] - f / df
+            pitch_new = np.where((df < 0.) & (pitch_new > lower[a]) & (pitch_new < upper[a]), pitch_new, 0.5*(lower[a] + upper[a]))
+
+            done         = np.abs(f) < 1.e-9*P_target
+            converged[a] = done | (np.abs(pitch_new - pitch[a]) < tol)
+            pitch[a]     = np.where(done, pitch[a], pitch_new)
+
+        return pitch, converged & (pitch > lower0 + tol) & (pitch < upper0 - tol)
+
+    def _rated_wind_speed(self, P_fun, P_target, U_lo, U_hi, P_lo, P_hi, pitch_lo, pitch_hi, tol=1.e-6, maxiter=20):
+        # Wind speed in [U_lo, U_hi] where the aerodynamic power P_fun(U, pitch_guess) -> (P, pitch) reaches P_target.
+        # Regula falsi on the cube root of power, which is nearly linear in wind speed at constant Cp.
+        U_lo, U_hi, pitch_lo, pitch_hi = float(U_lo), float(U_hi), float(pitch_lo), float(pitch_hi)
+        x_lo, x_hi, x_target = np.cbrt(float(P_lo)), np.cbrt(float(P_hi)), np.cbrt(P_target)
+        U, pitch = U_hi, pitch_hi
+
+        for it in range(maxiter):
+            U_new        = U_lo + (x_target - x_lo) * (U_hi - U_lo) / (x_hi - x_lo)
+            P_new, pitch = P_fun(U_new, np.interp(U_new, [U_lo, U_hi], [pitch_lo, pitch_hi]))
+            P_new, pitch = float(P_new), float(pitch)
+            converged    = abs(U_new - U) < tol or abs(P_new - P_target) < tol*P_target
+            U            = U_new
+            if converged or not np.isfinite(U):
+                break
+            if P_new < P_target:
+                U_lo, x_lo, pitch_lo = U, np.cbrt(P_new), pitch
+            else:
+                U_hi, x_hi, pitch_hi = U, np.cbrt(P_new), pitch
+
+        if not np.isfinite(U):
+            print('Regulation trajectory is struggling to find a solution for rated wind speed. Check rotor_aeropower.py. For now, U rated is assumed equal to ' + str(U_hi) + ' m/s')
+            U, pitch = U_hi, pitch_hi
+
+        return np.float64(U), float(pitch)
+
     def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
 
         # Create Airfoil class instances
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
         
 
-        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'])
+        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'], vectorized=True)
         
         Uhub     = np.linspace(inputs['control_Vin'],inputs['control_Vout'], self.options['n_pc']).flatten()
         
@@ -203,103 +360,85 @@ class RegulatedPowerCurve(ExplicitComponent): # Implicit COMPONENT
                 break
 
         
-        def maxPregionIIhalf(pitch, Uhub, Omega):
-            Uhub_i  = Uhub
-            Omega_i = Omega
-            pitch   = pitch
-                        
-            P, _, _, _ = self.ccblade.evaluate([Uhub_i], [Omega_i * 30. / np.pi], [pitch], coefficients=False)
-            return -P
-        
-        # Solve for regoin 2.5 pitch
-        options             = {}
-        options['disp']     = False
-        options['xatol']    = 1.e-2
-        if regionIIhalf == True:
-            for i in range(i_IIhalf_start + 1, len(Uhub)):   
-                Omega[i]    = Omega_max
-                pitch0      = pitch[i-1]
-                
-                bnds        = [pitch0 - 10., pitch0 + 10.]
-                pitch_regionIIhalf = minimize_scalar(lambda x: maxPregionIIhalf(x, Uhub[i], Omega[i]), bounds=bnds, method='bounded', options=options)['x']
-                pitch[i]    = pitch_regionIIhalf
-                
-                P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = self.ccblade.evaluate([Uhub[i]], [Omega[i] * 30. / np.pi], [pitch[i]], coefficients=True)
-                
-                P[i], eff  = CSMDrivetrain(P_aero[i], inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
-                Cp[i]      = Cp_aero[i]*eff
-
-                if P[i] > inputs['control_ratedPower']:    
-                    break    
-                        
-        options             = {}
-        options['disp']     = False
-        def constantPregionIII(pitch, Uhub, Omega):
-            Uhub_i  = Uhub
-            Omega_i = Omega
-            pitch   = pitch           
-            P_aero, _, _, _ = self.ccblade.evaluate([Uhub_i], [Omega_i * 30. / np.pi], [pitch], coefficients=False)
-            P, eff          = CSMDrivetrain(P_aero, inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
-            return abs(P - inputs['control_ratedPower'])
-            
+        # aerodynamic power that gives rated electrical power
+        ratedPower   = float(inputs['control_ratedPower'])
+        P_aero_rated = brentq(lambda x: float(CSMDrivetrain(x, inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])[0]) - ratedPower, ratedPower, 10.*ratedPower)
+
+        # The trajectory of the previous call, e.g. the previous design iteration, predicts the pitch table cells
+        # that bracket the solutions.  The predictions are checked on the grid, so the results are the same as
+        # from the full tables.
+        warm = self.regulation_warm_start
 
-        
         if regionIIhalf == True:
-            # Rated conditions
-            
-            def min_Uhub_rated_II12(min_inputs):
-                return min_inputs[1]
-                
-            def get_Uhub_rated_II12(min_inputs):
-
-                Uhub_i  = min_inputs[1]
-                Omega_i = Omega_max
-                pitch   = min_inputs[0]           
-                P_aero_i, _, _, _ = self.ccblade.evaluate([Uhub_i], [Omega_i * 30. / np.pi], [pitch], coefficients=False)
-                P_i,eff          = CSMDrivetrain(P_aero_i.flatten(), inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
-                return abs(P_i - inputs['control_ratedPower'])
-
-            x0              = [pitch[i] + 2. , Uhub[i]]
-            bnds            = [(pitch0, pitch0 + 10.),(Uhub[i-1],Uhub[i+1])]
-            const           = {}
-            const['type']   = 'eq'
-            const['fun']    = get_Uhub_rated_II12
-            params_rated    = minimize(min_Uhub_rated_II12, x0, method='SLSQP', bounds=bnds, constraints=const)
-            U_rated         = params_rated.x[1]
-            
-            if not np.isnan(U_rated):
-                Uhub[i]         = U_rated
-                pitch[i]        = params_rated.x[0]
-            else:
-                print('Regulation trajectory is struggling to find a solution for rated wind speed. Check rotor_aeropower.py')
-                U_rated         = Uhub[i]
-            
+            # Region 2.5, pitch for maximum power at Omega_max, solved for the remaining wind speeds together.  Only
+            # the wind speeds up to the first one above rated power are used.  With a previous trajectory the wind
+            # speeds up to the first one above its rated wind speed are solved first, and all of them only if rated
+            # power is not reached there.
+            k_all       = np.arange(i_IIhalf_start + 1, len(Uhub))
+            Omega[k_all] = Omega_max
+            pitch_grid  = pitch[i_IIhalf_start] + np.arange(-10., 10.5, 1.)
+            n_first     = len(k_all)
+            if warm is not None:
+                V_prev, pitch_prev, U_rated_prev = warm
+                idx_prev    = V_prev <= U_rated_prev
+                n_first     = min(np.searchsorted(Uhub[k_all], U_rated_prev, side='right') + 1, len(k_all))
+
+            for k in [k_all[:n_first], k_all]:
+                pitch_guess = None if warm is None else np.interp(Uhub[k], V_prev[idx_prev], pitch_prev[idx_prev])
+                m           = self._max_power_cell(Uhub[k], Omega_max, pitch_grid, pitch_guess)
+                pitch_k, _  = self._max_power_pitch(Uhub[k], Omega_max, pitch_grid[m], pitch_grid[m-1], pitch_grid[m+1])
+
+                P_aero_k, T_k, Q_k, M_k, Cp_aero_k, Ct_aero_k, Cq_aero_k, Cm_aero_k = self.ccblade.evaluate(Uhub[k], Omega[k] * 30. / np.pi, pitch_k, coefficients=True)
+                P_k, eff_k  = CSMDrivetrain(P_aero_k, inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
+                eff_k       = eff_k*np.ones_like(P_k)   # scalar for a single wind speed
+
+                # first wind speed above rated power
+                above       = np.nonzero(P_k > inputs['control_ratedPower'])[0]
+                if len(above) > 0 or len(k) == len(k_all):
+                    break
+
+            n_k         = above[0] + 1 if len(above) > 0 else len(k)
+            i           = k[n_k - 1]
+
+            pitch[k[:n_k]]   = pitch_k[:n_k]
+            P_aero[k[:n_k]]  = P_aero_k[:n_k]
+            T[k[:n_k]]       = T_k[:n_k]
+            Q[k[:n_k]]       = Q_k[:n_k]
+            M[k[:n_k]]       = M_k[:n_k]
+            Cp_aero[k[:n_k]] = Cp_aero_k[:n_k]
+            Ct_aero[k[:n_k]] = Ct_aero_k[:n_k]
+            Cq_aero[k[:n_k]] = Cq_aero_k[:n_k]
+            Cm_aero[k[:n_k]] = Cm_aero_k[:n_k]
+            P[k[:n_k]]       = P_k[:n_k]
+            Cp[k[:n_k]]      = Cp_aero_k[:n_k]*eff_k[:n_k]
+
+            # Rated conditions, lowest wind speed where the maximum power at Omega_max is rated power
+            pitch0          = pitch[i-1]
+            def P_rated_II12(Uhub_i, pitch_i):
+                pitch_i, _  = self._max_power_pitch([Uhub_i], Omega_max, [pitch_i], [pitch0], [pitch0 + 10.])
+                P_aero_i, _, _, _ = self.ccblade.evaluate([Uhub_i], [Omega_max * 30. / np.pi], pitch_i, coefficients=False)
+                return P_aero_i[0], pitch_i[0]
+
+            U_rated, pitch_rated = self._rated_wind_speed(P_rated_II12, P_aero_rated, Uhub[i-1], Uhub[i], P_aero[i-1], P_aero[i], pitch[i-1], pitch[i])
+
+            Uhub[i]         = U_rated
+            pitch[i]        = pitch_rated
             Omega[i]        = Omega_max
-            P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = self.ccblade.evaluate([Uhub[i]], [Omega[i] * 30. / np.pi], [pitch0], coefficients=True)
+            P_aero[i], T[i], Q[i], M[i], Cp_aero[i], Ct_aero[i], Cq_aero[i], Cm_aero[i] = self.ccblade.evaluate([Uhub[i]], [Omega[i] * 30. / np.pi], [pitch[i]], coefficients=True)
             P_i, eff        = CSMDrivetrain(P_aero[i], inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
             Cp[i]           = Cp_aero[i]*eff
             P[i]            = inputs['control_ratedPower']
             
             
         else:
-            # Rated conditions
-            def get_Uhub_rated_noII12(pitch, Uhub):
-                Uhub_i  = Uhub
-                Omega_i = min([Uhub_i * inputs['control_tsr'] / inputs['Rtip'], Omega_max])
-                pitch_i = pitch           
+            # Rated conditions, wind speed where rated power is reached at the Region 2 pitch
+            def P_rated_noII12(Uhub_i, pitch_i):
+                Omega_i     = min([Uhub_i * inputs['control_tsr'] / inputs['Rtip'], Omega_max])
                 P_aero_i, _, _, _ = self.ccblade.evaluate([Uhub_i], [Omega_i * 30. / np.pi], [pitch_i], coefficients=False)
-                P_i, eff          = CSMDrivetrain(P_aero_i, inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
-                return abs(P_i - inputs['control_ratedPower'])
-            
-            bnds     = [Uhub[i-1], Uhub[i+1]]
-            U_rated  = minimize_scalar(lambda x: get_Uhub_rated_noII12(pitch[i], x), bounds=bnds, method='bounded', options=options)['x']
-            
-            if not np.isnan(U_rated):
-                Uhub[i]         = U_rated
-            else:
-                print('Regulation trajectory is struggling to find a solution for rated wind speed. Check rotor_aeropower.py. For now, U rated is assumed equal to ' + str(Uhub[i]) + ' m/s')
-                U_rated         = Uhub[i]
-            
+                return P_aero_i[0], pitch_i
+
+            U_rated, _ = self._rated_wind_speed(P_rated_noII12, P_aero_rated, Uhub[i-1], Uhub[i], P_aero[i-1], P_aero[i], pitch[i], pitch[i])
+            Uhub[i]    = U_rated
             
             Omega[i] = min([Uhub[i] * inputs['control_tsr'] / inputs['Rtip'], Omega_max])
             pitch0   = pitch[i]
@@ -309,18 +448,24 @@ class RegulatedPowerCurve(ExplicitComponent): # Implicit COMPONENT
             Cp[i]        = Cp_aero[i]*eff
         
         
+        j        = np.arange(i + 1, len(Uhub))
+        Omega[j] = Omega[i]
+        if self.options['regulation_reg_III'] and len(j) > 0:
+            # Region III, pitch for constant power, solved for all wind speeds together
+            pitch_grid  = pitch[i] + np.arange(0., 45.5, 1.5)
+            pitch_guess = None
+            if warm is not None:
+                V_prev, pitch_prev, U_rated_prev = warm
+                pitch_guess = np.interp(Uhub[j], V_prev, pitch_prev)
+            lower, upper, guess = self._constant_power_cell(Uhub[j], Omega[i], P_aero_rated, pitch_grid, pitch_guess)
+            pitch[j], _ = self._constant_power_pitch(Uhub[j], Omega[i], P_aero_rated, guess, lower, upper)
+
+            P_aero[j], T[j], Q[j], M[j], Cp_aero[j], Ct_aero[j], Cq_aero[j], Cm_aero[j] = self.ccblade.evaluate(Uhub[j], Omega[j] * 30. / np.pi, pitch[j], coefficients=True)
+            P[j], eff = CSMDrivetrain(P_aero[j], inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
+            Cp[j]     = Cp_aero[j]*eff
+
         for j in range(i + 1,len(Uhub)):
-            Omega[j] = Omega[i]
             if self.options['regulation_reg_III']:
-                
-                pitch0   = pitch[j-1]
-                bnds     = [pitch0, pitch0 + 15.]
-                pitch_regionIII = minimize_scalar(lambda x: constantPregionIII(x, Uhub[j], Omega[j]), bounds=bnds, method='bounded', options=options)['x']
-                pitch[j]        = pitch_regionIII
-                P_aero[j], T[j], Q[j], M[j], Cp_aero[j], Ct_aero[j], Cq_aero[j], Cm_aero[j] = self.ccblade.evaluate([Uhub[j]], [Omega[j] * 30. / np.pi], [pitch[j]], coefficients=True)
-                P[j], eff       = CSMDrivetrain(P_aero[j], inputs['control_ratedPower'], discrete_inputs['drivetrainType'], inputs['drivetrainEff'])
-                Cp[j]           = Cp_aero[j]*eff
-
 
                 if abs(P[j] - inputs['control_ratedPower']) > 1e+4:
                     print('The pitch in region III is not being determined correctly at wind speed ' + str(Uhub[j]) + ' m/s')
@@ -347,6 +492,7 @@ class RegulatedPowerCurve(ExplicitComponent): # Implicit COMPONENT
                 Cq_aero[j]  = 0
                 Cm_aero[j]  = 0
 
+        self.regulation_warm_start = (Uhub.copy(), pitch.copy(), float(U_rated))
         
         outputs['T']       = T
         outputs['Q']       = Q
@@ -453,7 +599,7 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
         # Create Airfoil class instances
         af = [None]*self.naero
         for i in range(self.naero):
-            af[i] = CCAirfoil(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
+            af[i] = CCAirfoil.cached(inputs['airfoils_aoa'], inputs['airfoils_Re'], inputs['airfoils_cl'][:,i,:], inputs['airfoils_cd'][:,i,:], inputs['airfoils_cm'][:,i,:])
        
 
         n_pitch  = self.options['n_pitch']
@@ -466,7 +612,7 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
         tsr_vector = inputs['tsr_vector_in']
         pitch_vector = inputs['pitch_vector_in']
         
-        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'])
+        self.ccblade = CCBlade(inputs['r'], inputs['chord'], inputs['theta'], af, inputs['Rhub'], inputs['Rtip'], discrete_inputs['nBlades'], inputs['rho'], inputs['mu'], inputs['precone'], inputs['tilt'], inputs['yaw'], inputs['shearExp'], inputs['hub_height'], discrete_inputs['nSector'], inputs['precurve'], inputs['precurveTip'],inputs['presweep'], inputs['presweepTip'], discrete_inputs['tiploss'], discrete_inputs['hubloss'],discrete_inputs['wakerotation'], discrete_inputs['usecd'], vectorized=True)
         
         if max(U_vector) == 0.:
             U_vector    = np.linspace(V_in[0],V_out[0], n_U)
@@ -485,11 +631,15 @@ class Cp_Ct_Cq_Tables(ExplicitComponent):
         Ct_aero_table = np.zeros((n_tsr, n_pitch, n_U))
         Cq_aero_table = np.zeros((n_tsr, n_pitch, n_U))
         
-        for i in range(n_U):
-            for j in range(n_tsr):
-                U     =  U_vector[i] * np.ones(n_pitch)
-                Omega = tsr_vector[j] *  U_vector[i] / R * 30. / np.pi * np.ones(n_pitch)
-                _, _, _, _, outputs['Cp_aero_table'][j,:,i], outputs['Ct_aero_table'][j,:,i], outputs['Cq_aero_table'][j,:,i], _ = self.ccblade.evaluate(U, Omega, pitch_vector, coefficients=True)
+        # evaluate the whole (tsr, pitch, U) grid in one call
+        tsr_grid, pitch_grid, U_grid = np.meshgrid(tsr_vector, pitch_vector, U_vector, indexing='ij')
+        U     = U_grid.flatten()
+        Omega = tsr_grid.flatten() * U / R * 30. / np.pi
+        pitch = pitch_grid.flatten()
+        _, _, _, _, Cp, Ct, Cq, _ = self.ccblade.evaluate(U, Omega, pitch, coefficients=True)
+        outputs['Cp_aero_table'] = Cp.reshape((n_tsr, n_pitch, n_U))
+        outputs['Ct_aero_table'] = Ct.reshape((n_tsr, n_pitch, n_U))
+        outputs['Cq_aero_table'] = Cq.reshape((n_tsr, n_pitch, n_U))
 
 
 # Class to define a constraint so that the blade cannot operate in stall conditions
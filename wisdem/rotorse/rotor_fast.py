@@ -10,9 +10,10 @@ from wisdem.commonse.mpi_tools import MPI
 from wisdem.aeroelasticse.FAST_reader import InputReader_Common, InputReader_OpenFAST, InputReader_FAST7
 from wisdem.aeroelasticse.FAST_writer import InputWriter_Common, InputWriter_OpenFAST, InputWriter_FAST7
 from wisdem.aeroelasticse.FAST_wrapper import FastWrapper
+from wisdem.aeroelasticse.FAST_cache import FASTRunCache
 from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper, runFAST_pywrapper_batch
 from wisdem.aeroelasticse.CaseLibrary import RotorSE_rated, RotorSE_DLC_1_4_Rated, RotorSE_DLC_7_1_Steady, RotorSE_DLC_1_1_Turb, power_curve
-from wisdem.aeroelasticse.FAST_post import return_timeseries
+from wisdem.aeroelasticse.FAST_post import return_timeseries_lazy, FAST_Stats
 
 
 if MPI:
@@ -299,10 +300,25 @@ class FASTLoadCases(ExplicitComponent):
         self.DLC_extrm           = FASTpref['DLC_extrm']
         self.DLC_turbulent       = FASTpref['DLC_turbulent']
 
+        # channels whose means post_AEP uses from the power curve cases
+        self.power_curve_channels = ['GenPwr', 'RtAeroCp', 'Wind1VelX', 'RotSpeed', 'BldPitch1', 'RotThrust', 'RotTorq']
+
         self.clean_FAST_directory = False
         if 'clean_FAST_directory' in FASTpref.keys():
             self.clean_FAST_directory = FASTpref['clean_FAST_directory']
 
+        # write sub-files that do not change between load cases once, named by content hash
+        self.shared_files = False
+        if 'shared_files' in FASTpref.keys():
+            self.shared_files = FASTpref['shared_files']
+
+        # reuse the outputs of cases already run with identical inputs, stored in FASTpref['cache_dir']
+        self.cache = None
+        if 'cache_dir' in FASTpref.keys() and FASTpref['cache_dir']:
+            self.cache = FASTRunCache(os.path.abspath(FASTpref['cache_dir']))
+            if 'cache_size' in FASTpref.keys():
+                self.cache.max_size = FASTpref['cache_size']
+
         self.mpi_run             = False
         if 'mpi_run' in FASTpref.keys():
             self.mpi_run         = FASTpref['mpi_run']
@@ -349,7 +365,16 @@ class FASTLoadCases(ExplicitComponent):
         if self.Analysis_Level == 2:
             # Run FAST with ElastoDyn
             list_cases, list_casenames, required_channels, case_keys = self.DLC_creation(inputs, discrete_inputs, fst_vt)
-            FAST_Output = self.run_FAST(fst_vt, list_cases, list_casenames, required_channels)
+
+            # the power curve cases only need channel means, each worker reduces its outputs to a statistics record,
+            # the other cases return their time series
+            FAST_Output = [None]*len(list_cases)
+            for post, idx in [(FAST_Stats(channels=self.power_curve_channels), [i for i, key in enumerate(case_keys) if key == 1]),
+                              (return_timeseries_lazy, [i for i, key in enumerate(case_keys) if key != 1])]:
+                if idx:
+                    FAST_Output_i = self.run_FAST(fst_vt, [list_cases[i] for i in idx], [list_casenames[i] for i in idx], required_channels, post=post)
+                    for i, out in zip(idx, FAST_Output_i):
+                        FAST_Output[i] = out
             self.post_process(FAST_Output, case_keys, R_out, inputs, discrete_inputs, outputs)
 
         elif self.Analysis_Level == 1:
@@ -561,7 +586,7 @@ class FASTLoadCases(ExplicitComponent):
         return list_cases, list_casenames, channels_out, case_keys
 
 
-    def run_FAST(self, fst_vt, case_list, case_name_list, channels):
+    def run_FAST(self, fst_vt, case_list, case_name_list, channels, post=return_timeseries_lazy):
 
         # FAST wrapper setup
         fastBatch = runFAST_pywrapper_batch(FAST_ver=self.FAST_ver)
@@ -572,8 +597,10 @@ class FASTLoadCases(ExplicitComponent):
         fastBatch.FAST_directory    = self.FAST_directory
         fastBatch.debug_level       = self.debug_level
         fastBatch.dev_branch        = self.dev_branch
+        fastBatch.shared_files      = self.shared_files
+        fastBatch.cache             = self.cache
         fastBatch.fst_vt            = fst_vt
-        fastBatch.post              = return_timeseries
+        fastBatch.post              = post
 
         fastBatch.case_list         = case_list
         fastBatch.case_name_list    = case_name_list
@@ -586,7 +613,7 @@ class FASTLoadCases(ExplicitComponent):
             if self.cores == 1:
                 FAST_Output = fastBatch.run_serial()
             else:
-                FAST_Output = fastBatch.run_multi(self.cores)
+                FAST_Output = fastBatch.run_threaded(self.cores)
 
         self.fst_vt = fst_vt
 
@@ -725,9 +752,12 @@ class FASTLoadCases(ExplicitComponent):
                 U = list(sorted(U))
             U = np.array(U)
 
+            # statistics records of the power curve cases, see compute
+            stats = data
+
             U_below = [Vi for Vi in U if Vi <= inputs['Vrated']]
             # P_below = np.array([np.mean(datai['GenPwr'])*1000. for datai in data])
-            P_below = np.array([np.mean(datai['GenPwr'])*1000. for datai, Vi in zip(data, U) if Vi <= inputs['Vrated']])
+            P_below = np.array([statsi['GenPwr']['mean']*1000. for statsi, Vi in zip(stats, U) if Vi <= inputs['Vrated']])
             np.place(P_below, P_below>inputs['control_ratedPower'], inputs['control_ratedPower'])
 
             U_rated = [Vi for Vi in U if Vi > inputs['Vrated']]
@@ -738,7 +768,7 @@ class FASTLoadCases(ExplicitComponent):
             else:
                 P_fast = P_below
 
-            data_rated = data[-1]
+            stats_rated = stats[-1]
 
             # U_fit = np.array([4.,8.,9.,10.])
 
@@ -803,12 +833,12 @@ class FASTLoadCases(ExplicitComponent):
             outputs['P'] = P
 
 
-            outputs['Cp']          = np.mean(data_rated["RtAeroCp"])
-            outputs['rated_V']     = np.mean(data_rated["Wind1VelX"])
-            outputs['rated_Omega'] = np.mean(data_rated["RotSpeed"])
-            outputs['rated_pitch'] = np.mean(data_rated["BldPitch1"])
-            outputs['rated_T']     = np.mean(data_rated["RotThrust"])*1000
-            outputs['rated_Q']     = np.mean(data_rated["RotTorq"])*1000
+            outputs['Cp']          = stats_rated["RtAeroCp"]['mean']
+            outputs['rated_V']     = stats_rated["Wind1VelX"]['mean']
+            outputs['rated_Omega'] = stats_rated["RotSpeed"]['mean']
+            outputs['rated_pitch'] = stats_rated["BldPitch1"]['mean']
+            outputs['rated_T']     = stats_rated["RotThrust"]['mean']*1000
+            outputs['rated_Q']     = stats_rated["RotTorq"]['mean']*1000
 
             # import matplotlib.pyplot as plt
             # plt.plot(U, P, 'o')
@@ -4,7 +4,7 @@ import numpy as np
 from scipy.optimize import curve_fit
 import os, copy
 from openmdao.api import IndepVarComp, ExplicitComponent, Group, Problem, ExecComp
-from wisdem.ccblade.ccblade_component import CCBladePower, CCBladeLoads, CCBladeGeometry
+from wisdem.ccblade.ccblade_component import CCBladeMultiLoads, CCBladeGeometry
 from wisdem.commonse import gravity, NFREQ
 from wisdem.commonse.csystem import DirectionVector
 from wisdem.commonse.utilities import trapz_deriv, interp_with_deriv
@@ -356,9 +356,9 @@ class RotorWithpBEAM(ExplicitComponent):
         self.sa = np.sin(alpha)
 
 
-    def strain(self, blade, xu, yu, xl, yl):
+    def strain(self, shear_bending, xu, yu, xl, yl):
 
-        Vx, Vy, Fz, Mx, My, Tz = blade.shearAndBending()
+        Vx, Vy, Fz, Mx, My, Tz = shear_bending
 
         # use profile c.s. to use Hansen's notation
         Vx, Vy = Vy, Vx
@@ -463,16 +463,18 @@ class RotorWithpBEAM(ExplicitComponent):
         p_base = _pBEAM.BaseData(np.ones(6), 1.0)  # rigid base
 
 
-        # ----- tip deflection -----
-
-        # evaluate displacements
-        p_loads = _pBEAM.Loads(nsec, Px_defl, Py_defl, Pz_defl)
+        # the stiffness does not depend on the loads, so a single beam (factored once) is used for all load cases
+        p_loads = _pBEAM.Loads(nsec)
         blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
-        dx_defl, dy_defl, dz_defl, dtheta_r1, dtheta_r2, dtheta_z = blade.displacement()
 
-        p_loads = _pBEAM.Loads(nsec, Px_pc_defl, Py_pc_defl, Pz_pc_defl)
-        blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
-        dx_pc_defl, dy_pc_defl, dz_pc_defl, dtheta_r1, dtheta_r2, dtheta_z = blade.displacement()
+        # ----- tip deflection -----
+
+        # evaluate displacements, one load case per column
+        dx, dy, dz, dtheta_r1, dtheta_r2, dtheta_z = blade.displacementMulti(np.column_stack((Px_defl, Px_pc_defl)),
+                                                                             np.column_stack((Py_defl, Py_pc_defl)),
+                                                                             np.column_stack((Pz_defl, Pz_pc_defl)))
+        dx_defl, dy_defl, dz_defl = dx[:,0], dy[:,0], dz[:,0]
+        dx_pc_defl, dy_pc_defl, dz_pc_defl = dx[:,1], dy[:,1], dz[:,1]
 
 
         # --- mass ---
@@ -487,13 +489,12 @@ class RotorWithpBEAM(ExplicitComponent):
         # ----- strain -----
         self.principalCS(inputs['EIyy'], inputs['EIxx'], inputs['y_ec'], inputs['x_ec'], inputs['EA'], inputs['EIxy'])
 
-        p_loads = _pBEAM.Loads(nsec, Px_strain, Py_strain, Pz_strain)
-
-        blade = _pBEAM.Beam(p_section, p_loads, p_tip, p_base)
+        shear_bending = blade.shearAndBendingMulti(Px_strain[:,np.newaxis], Py_strain[:,np.newaxis], Pz_strain[:,np.newaxis])
+        shear_bending = [v[:,0] for v in shear_bending]
 
-        strainU_spar, strainL_spar = self.strain(blade, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar)
+        strainU_spar, strainL_spar = self.strain(shear_bending, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar)
 
-        strainU_te, strainL_te = self.strain(blade, xu_strain_te, yu_strain_te, xl_strain_te, yl_strain_te)
+        strainU_te, strainL_te = self.strain(shear_bending, xu_strain_te, yu_strain_te, xl_strain_te, yl_strain_te)
 
         damageU_spar, damageL_spar = self.damage(Mx_damage, My_damage, xu_strain_spar, yu_strain_spar, xl_strain_spar, yl_strain_spar,
                                                  emax=strain_ult_spar, eta=gamma_fatigue, m=m_damage, N=N_damage)
@@ -1919,15 +1920,10 @@ class RotorStructure(Group):
         self.add_subsystem('gust',      GustETM(), promotes=['V_mean','turbulence_class','V_hub'])
         self.add_subsystem('setuppc',   SetupPCModVarSpeed(),promotes=['R','control_tsr','control_pitch'])
 
-        self.add_subsystem('aero_rated',            CCBladeLoads(naero=NPTS, npower=1, n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-        self.add_subsystem('aero_extrm',            CCBladeLoads(naero=NPTS, npower=1, n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-        self.add_subsystem('aero_extrm_forces',     CCBladePower(naero=NPTS, npower=2, n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-        self.add_subsystem('aero_defl_powercurve',  CCBladeLoads(naero=NPTS, npower=1, n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-
-        # Out of plane loads
-        self.add_subsystem('aero_rated_0',    CCBladeLoads(naero=NPTS, npower=1,  n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-        self.add_subsystem('aero_rated_120',  CCBladeLoads(naero=NPTS, npower=1,  n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
-        self.add_subsystem('aero_rated_240',  CCBladeLoads(naero=NPTS, npower=1,  n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
+        # Aerodynamic loads: rated (tip deflection), extreme (max strain), power curve (gust reversal), out of plane loads
+        # at three azimuths (drivetrain), and extreme thrust/torque (tower), all solved by one rotor model
+        load_cases = ['rated', 'extrm', 'defl_powercurve', 'rated_0', 'rated_120', 'rated_240']
+        self.add_subsystem('aero_loads',    CCBladeMultiLoads(naero=NPTS, load_cases=load_cases, npower=2, n_aoa_grid=NAFgrid, n_Re_grid=NRe), promotes=promoteList)
         
         self.add_subsystem('loads_defl',        TotalLoads(NPTS=NPTS), promotes=['tilt','theta','rhoA','z','totalCone','z_az'])
         self.add_subsystem('loads_pc_defl',     TotalLoads(NPTS=NPTS), promotes=['tilt','theta','rhoA','z','totalCone','z_az'])
@@ -1963,65 +1959,65 @@ class RotorStructure(Group):
         # connections to setuppc
         #self.connect('geom.R',      'setuppc.R')
         self.connect('VfactorPC',   'setuppc.Vfactor')
-        self.connect('gust.V_gust',            ['aero_rated.V_load',    'aero_rated_0.V_load',      'aero_rated_120.V_load',      'aero_rated_240.V_load'])
+        self.connect('gust.V_gust',            ['aero_loads.V_load_rated',    'aero_loads.V_load_rated_0',      'aero_loads.V_load_rated_120',      'aero_loads.V_load_rated_240'])
         
         if topLevelFlag:
-            self.connect('Omega_rated', ['Omega', 'aero_rated.Omega_load', 'aero_rated_0.Omega_load','aero_rated_120.Omega_load','aero_rated_240.Omega_load'])
+            self.connect('Omega_rated', ['Omega', 'aero_loads.Omega_load_rated', 'aero_loads.Omega_load_rated_0','aero_loads.Omega_load_rated_120','aero_loads.Omega_load_rated_240'])
         
-        # connections to aero_extrm (for max strain)
+        # connections to extreme load case (for max strain)
         if topLevelFlag:
-            self.connect('V_extreme50',    'aero_extrm.V_load')
-        self.connect('pitch_extreme',               'aero_extrm.pitch_load')
-        self.connect('azimuth_extreme',             'aero_extrm.azimuth_load')
-        self.aero_extrm.Omega_load = 0.0  # parked case
-
-        # connections to aero_extrm_forces (for tower thrust)
-        self.aero_extrm_forces.Uhub  = np.zeros(2)
-        self.aero_extrm_forces.Omega = np.zeros(2)  # parked case
-        self.aero_extrm_forces.pitch = np.zeros(2)
+            self.connect('V_extreme50',    'aero_loads.V_load_extrm')
+        self.connect('pitch_extreme',               'aero_loads.pitch_load_extrm')
+        self.connect('azimuth_extreme',             'aero_loads.azimuth_load_extrm')
+        self.aero_loads.Omega_load_extrm = 0.0  # parked case
+
+        # connections to extreme forces (for tower thrust)
+        self.aero_loads.Uhub  = np.zeros(2)
+        self.aero_loads.Omega = np.zeros(2)  # parked case
+        self.aero_loads.pitch = np.zeros(2)
         if topLevelFlag:
-            self.connect('V_extreme_full', 'aero_extrm_forces.Uhub')
-        self.aero_extrm_forces.pitch =  np.array([0.0, 90.0])  # feathered
-        self.aero_extrm_forces.T =      np.zeros(2)
-        self.aero_extrm_forces.Q =      np.zeros(2)
-
-        # connections to aero_defl_powercurve (for gust reversal)
-        self.connect('setuppc.Uhub',    'aero_defl_powercurve.V_load')
-        self.connect('setuppc.Omega',   'aero_defl_powercurve.Omega_load')
-        self.connect('setuppc.pitch',   'aero_defl_powercurve.pitch_load')
-        self.connect('setuppc.azimuth', 'aero_defl_powercurve.azimuth_load')
-        self.aero_defl_powercurve.azimuth_load = 0.0
+            self.connect('V_extreme_full', 'aero_loads.Uhub')
+        self.aero_loads.pitch =  np.array([0.0, 90.0])  # feathered
+        self.aero_loads.T =      np.zeros(2)
+        self.aero_loads.Q =      np.zeros(2)
+
+        # connections to power curve load case (for gust reversal)
+        self.connect('setuppc.Uhub',    'aero_loads.V_load_defl_powercurve')
+        self.connect('setuppc.Omega',   'aero_loads.Omega_load_defl_powercurve')
+        self.connect('setuppc.pitch',   'aero_loads.pitch_load_defl_powercurve')
+        self.connect('setuppc.azimuth', 'aero_loads.azimuth_load_defl_powercurve')
+        self.aero_loads.azimuth_load_defl_powercurve = 0.0
 
         # connections to loads_defl
-        self.connect('aero_rated.loads_Omega',  'loads_defl.aeroloads_Omega')
-        self.connect('aero_rated.loads_Px',     'loads_defl.aeroloads_Px')
-        self.connect('aero_rated.loads_Py',     'loads_defl.aeroloads_Py')
-        self.connect('aero_rated.loads_Pz',     'loads_defl.aeroloads_Pz')
-        self.connect('aero_rated.loads_azimuth','loads_defl.aeroloads_azimuth')
-        self.connect('aero_rated.loads_pitch',  'loads_defl.aeroloads_pitch')
-        self.connect('aero_rated.loads_r',      'loads_defl.aeroloads_r')
+        self.connect('aero_loads.loads_Omega_rated',  'loads_defl.aeroloads_Omega')
+        self.connect('aero_loads.loads_Px_rated',     'loads_defl.aeroloads_Px')
+        self.connect('aero_loads.loads_Py_rated',     'loads_defl.aeroloads_Py')
+        self.connect('aero_loads.loads_Pz_rated',     'loads_defl.aeroloads_Pz')
+        self.connect('aero_loads.loads_azimuth_rated','loads_defl.aeroloads_azimuth')
+        self.connect('aero_loads.loads_pitch_rated',  'loads_defl.aeroloads_pitch')
+        self.connect('aero_loads.loads_r',            'loads_defl.aeroloads_r')
         self.connect('dynamic_amplification',   'loads_defl.dynamicFactor')
 
         # connections to loads_pc_defl
-        self.connect('aero_defl_powercurve.loads_Omega',    'loads_pc_defl.aeroloads_Omega')
-        self.connect('aero_defl_powercurve.loads_Px',       'loads_pc_defl.aeroloads_Px')
-        self.connect('aero_defl_powercurve.loads_Py',       'loads_pc_defl.aeroloads_Py')
-        self.connect('aero_defl_powercurve.loads_Pz',       'loads_pc_defl.aeroloads_Pz')
-        self.connect('aero_defl_powercurve.loads_azimuth',  'loads_pc_defl.aeroloads_azimuth')
-        self.connect('aero_defl_powercurve.loads_pitch',    'loads_pc_defl.aeroloads_pitch')
-        self.connect('aero_defl_powercurve.loads_r',        'loads_pc_defl.aeroloads_r')
+        self.connect('aero_loads.loads_Omega_defl_powercurve',    'loads_pc_defl.aeroloads_Omega')
+        self.connect('aero_loads.loads_Px_defl_powercurve',       'loads_pc_defl.aeroloads_Px')
+        self.connect('aero_loads.loads_Py_defl_powercurve',       'loads_pc_defl.aeroloads_Py')
+        self.connect('aero_loads.loads_Pz_defl_powercurve',       'loads_pc_defl.aeroloads_Pz')
+        self.connect('aero_loads.loads_azimuth_defl_powercurve',  'loads_pc_defl.aeroloads_azimuth')
+        self.connect('aero_loads.loads_pitch_defl_powercurve',    'loads_pc_defl.aeroloads_pitch')
+        self.connect('aero_loads.loads_r',                         'loads_pc_defl.aeroloads_r')
         self.connect('dynamic_amplification',               'loads_pc_defl.dynamicFactor')
 
         # connections to loads_strain
         if Analysis_Level<1:
-            self.connect('aero_extrm.loads_Px',         'loads_strain.aeroloads_Px')
-            self.connect('aero_extrm.loads_Py',         'loads_strain.aeroloads_Py')
-            self.connect('aero_extrm.loads_Pz',         'loads_strain.aeroloads_Pz')
-            self.connect('aero_extrm.loads_Omega',      'loads_strain.aeroloads_Omega')
-            self.connect('aero_extrm.loads_azimuth',    'loads_strain.aeroloads_azimuth')
-            self.connect('aero_extrm.loads_pitch',      'loads_strain.aeroloads_pitch')
+            self.connect('aero_loads.loads_Px_extrm',         'loads_strain.aeroloads_Px')
+            self.connect('aero_loads.loads_Py_extrm',         'loads_strain.aeroloads_Py')
+            self.connect('aero_loads.loads_Pz_extrm',         'loads_strain.aeroloads_Pz')
+            self.connect('aero_loads.loads_Omega_extrm',      'loads_strain.aeroloads_Omega')
+            self.connect('aero_loads.loads_azimuth_extrm',    'loads_strain.aeroloads_azimuth')
+            self.connect('aero_loads.loads_pitch_extrm',      'loads_strain.aeroloads_pitch')
             
-        self.connect('aero_extrm.loads_r',      'loads_strain.aeroloads_r')
+        self.connect('aero_loads.loads_r',      'loads_strain.aeroloads_r')
         self.connect('dynamic_amplification',   'loads_strain.dynamicFactor')
 
         # connections to damage
@@ -2049,18 +2045,18 @@ class RotorStructure(Group):
             self.connect('dz_defl', 'tip.dz', src_indices=[NPTS-1])
         if topLevelFlag:
             self.connect('theta', 'tip.theta', src_indices=[NPTS-1])
-        self.connect('aero_rated.loads_pitch',      'tip.pitch')
-        self.connect('aero_rated.loads_azimuth',    'tip.azimuth')
+        self.connect('aero_loads.loads_pitch_rated',      'tip.pitch')
+        self.connect('aero_loads.loads_azimuth_rated',    'tip.azimuth')
         self.connect('totalCone',         'tip.totalConeTip', src_indices=[NPTS-1])
         self.connect('dynamic_amplification',       'tip.dynamicFactor')
 
 
         # connections to root moment
         if not Analysis_Level>1:
-            self.connect('aero_rated.loads_Px',     'root_moment.aeroloads_Px')
-            self.connect('aero_rated.loads_Py',     'root_moment.aeroloads_Py')
-            self.connect('aero_rated.loads_Pz',     'root_moment.aeroloads_Pz')
-            self.connect('aero_rated.loads_r',      'root_moment.aeroloads_r')
+            self.connect('aero_loads.loads_Px_rated',     'root_moment.aeroloads_Px')
+            self.connect('aero_loads.loads_Py_rated',     'root_moment.aeroloads_Py')
+            self.connect('aero_loads.loads_Pz_rated',     'root_moment.aeroloads_Pz')
+            self.connect('aero_loads.loads_r',            'root_moment.aeroloads_r')
             self.connect('dynamic_amplification',   'root_moment.dynamicFactor')
 
         # connections to mass
@@ -2068,14 +2064,14 @@ class RotorStructure(Group):
         self.connect('blade_moment_of_inertia',   'mass.blade_moment_of_inertia')
 
         # connectsion to extreme
-        self.connect('aero_extrm_forces.T', 'extreme.T')
-        self.connect('aero_extrm_forces.Q', 'extreme.Q')
+        self.connect('aero_loads.T', 'extreme.T')
+        self.connect('aero_loads.Q', 'extreme.Q')
 
         # connections to blade_defl
         self.connect('dx_pc_defl',                    'blade_defl.dx')
         self.connect('dy_pc_defl',                    'blade_defl.dy')
         self.connect('dz_pc_defl',                    'blade_defl.dz')
-        self.connect('aero_defl_powercurve.loads_pitch',    'blade_defl.pitch')
+        self.connect('aero_loads.loads_pitch_defl_powercurve',    'blade_defl.pitch')
 
         # connect to outputs
         self.connect('blade_mass',                'mass_one_blade_in')
@@ -2086,24 +2082,22 @@ class RotorStructure(Group):
         self.connect('blade_defl.delta_bladeLength',    'delta_bladeLength_out_in')
         self.connect('blade_defl.delta_precurve_sub',   'delta_precurve_sub_out_in')
         
-        self.connect('azimuth_load180', 'aero_rated.azimuth_load') # Blade position closest to root for max tip deflection constraint
-        self.connect('azimuth_load0',   'aero_rated_0.azimuth_load')
-        self.connect('azimuth_load120', 'aero_rated_120.azimuth_load')
-        self.connect('azimuth_load240', 'aero_rated_240.azimuth_load')
+        self.connect('azimuth_load180', 'aero_loads.azimuth_load_rated') # Blade position closest to root for max tip deflection constraint
+        self.connect('azimuth_load0',   'aero_loads.azimuth_load_rated_0')
+        self.connect('azimuth_load120', 'aero_loads.azimuth_load_rated_120')
+        self.connect('azimuth_load240', 'aero_loads.azimuth_load_rated_240')
         
         # connections to root moment for drivetrain
-        self.connect('aero_rated_0.loads_Px',   'root_moment_0.aeroloads_Px')
-        self.connect('aero_rated_120.loads_Px', 'root_moment_120.aeroloads_Px')
-        self.connect('aero_rated_240.loads_Px', 'root_moment_240.aeroloads_Px')
-        self.connect('aero_rated_0.loads_Py',   'root_moment_0.aeroloads_Py')
-        self.connect('aero_rated_120.loads_Py', 'root_moment_120.aeroloads_Py')
-        self.connect('aero_rated_240.loads_Py', 'root_moment_240.aeroloads_Py')
-        self.connect('aero_rated_0.loads_Pz',   'root_moment_0.aeroloads_Pz')
-        self.connect('aero_rated_120.loads_Pz', 'root_moment_120.aeroloads_Pz')
-        self.connect('aero_rated_240.loads_Pz', 'root_moment_240.aeroloads_Pz')
-        self.connect('aero_rated_0.loads_r',    'root_moment_0.aeroloads_r')
-        self.connect('aero_rated_120.loads_r',  'root_moment_120.aeroloads_r')
-        self.connect('aero_rated_240.loads_r',  'root_moment_240.aeroloads_r')
+        self.connect('aero_loads.loads_Px_rated_0',   'root_moment_0.aeroloads_Px')
+        self.connect('aero_loads.loads_Px_rated_120', 'root_moment_120.aeroloads_Px')
+        self.connect('aero_loads.loads_Px_rated_240', 'root_moment_240.aeroloads_Px')
+        self.connect('aero_loads.loads_Py_rated_0',   'root_moment_0.aeroloads_Py')
+        self.connect('aero_loads.loads_Py_rated_120', 'root_moment_120.aeroloads_Py')
+        self.connect('aero_loads.loads_Py_rated_240', 'root_moment_240.aeroloads_Py')
+        self.connect('aero_loads.loads_Pz_rated_0',   'root_moment_0.aeroloads_Pz')
+        self.connect('aero_loads.loads_Pz_rated_120', 'root_moment_120.aeroloads_Pz')
+        self.connect('aero_loads.loads_Pz_rated_240', 'root_moment_240.aeroloads_Pz')
+        self.connect('aero_loads.loads_r',            ['root_moment_0.aeroloads_r', 'root_moment_120.aeroloads_r', 'root_moment_240.aeroloads_r'])
                 
         self.connect('dynamic_amplification', ['root_moment_0.dynamicFactor', 'root_moment_120.dynamicFactor','root_moment_240.dynamicFactor'])
 
@@ -2112,7 +2106,7 @@ class RotorStructure(Group):
         self.connect('root_moment_120.Mxyz',    'Mxyz_2_in')
         self.connect('root_moment_240.Mxyz',    'Mxyz_3_in')
         self.connect('totalCone',     'TotalCone_in', src_indices=[NPTS-1])
-        # self.connect('aero_rated.pitch_load',   'Pitch_in')
+        # self.connect('aero_loads.pitch_load_rated',   'Pitch_in')
         self.connect('root_moment_0.Fxyz',      'Fxyz_1_in')
         self.connect('root_moment_120.Fxyz',    'Fxyz_2_in')
         self.connect('root_moment_240.Fxyz',    'Fxyz_3_in')
@@ -2143,9 +2137,9 @@ def Init_RotorStructure_wRefBlade(rotor, blade):
     # ------------------
 
     # === atmosphere ===
-    rotor['aero_rated_0.rho']       = 1.225  # (Float, kg/m**3): density of air
-    rotor['aero_rated_0.mu']        = 1.81206e-5  # (Float, kg/m/s): dynamic viscosity of air
-    rotor['aero_rated_0.shearExp']  = 0.25  # (Float): shear exponent
+    rotor['aero_loads.rho']         = 1.225  # (Float, kg/m**3): density of air
+    rotor['aero_loads.mu']          = 1.81206e-5  # (Float, kg/m/s): dynamic viscosity of air
+    rotor['aero_loads.shearExp']    = 0.25  # (Float): shear exponent
     rotor['hub_height']       = blade['config']['hub_height']  # (Float, m): hub height
     rotor['turbine_class']    = blade['config']['turbine_class'].upper() #TURBINE_CLASS['I']  # (Enum): IEC turbine class
     rotor['turbulence_class'] = blade['config']['turbulence_class'].upper()  # (Enum): IEC turbulence class class
@@ -2194,8 +2188,8 @@ def Init_RotorStructure_wRefBlade(rotor, blade):
 
     # Adding in only in rotor_structure- otherwise would have been connected in larger assembly
     rotor['gust.V_hub'] = 11.7386065326
-    rotor['aero_rated.Omega_load'] = 12.1
-    rotor['aero_rated.pitch_load'] = rotor['control_pitch']
+    rotor['aero_loads.Omega_load_rated'] = 12.1
+    rotor['aero_loads.pitch_load_rated'] = rotor['control_pitch']
 
     return rotor
 
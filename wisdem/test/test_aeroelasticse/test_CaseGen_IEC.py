@@ -0,0 +1,96 @@
+import numpy as np
+import unittest
+import os
+import shutil
+import tempfile
+from wisdem.aeroelasticse.CaseGen_IEC import CaseGen_IEC, windfile_key
+from wisdem.aeroelasticse.pyIECWind import pyIECWind_extreme, pyIECWind_turb
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def turb(AnalysisTime=630., PLExp=0.2):
+    iecwind = pyIECWind_turb()
+    iecwind.AnalysisTime     = AnalysisTime
+    iecwind.Turbulence_Class = 'A'
+    iecwind.PLExp            = PLExp
+    iecwind.outdir           = 'wind'
+    iecwind.case_name        = 'testing'
+    return iecwind
+
+
+class TestWindfileKey(unittest.TestCase):
+
+    def testSharedInflow(self):
+        # same wind model, settings, Uref and seed from two DLCs (e.g. 1.1 and 1.2)
+        change_vars = ['U', 'Seeds']
+        key = windfile_key(turb(), 'NTM', change_vars, np.array([12, 5]))
+        self.assertEqual(windfile_key(turb(), 'NTM', change_vars, np.array([12., 5.])), key)
+
+        self.assertNotEqual(windfile_key(turb(), 'NTM', change_vars, np.array([12., 6.])), key)
+        self.assertNotEqual(windfile_key(turb(), 'NTM', change_vars, np.array([14., 5.])), key)
+        self.assertNotEqual(windfile_key(turb(), '1ETM', change_vars, np.array([12., 5.])), key)
+        self.assertNotEqual(windfile_key(turb(PLExp=0.11), 'NTM', change_vars, np.array([12., 5.])), key)
+        self.assertNotEqual(windfile_key(turb(AnalysisTime=90.), 'NTM', change_vars, np.array([12., 5.])), key)
+
+    def testGeneratorType(self):
+        key_turb = windfile_key(turb(), 'NTM', ['U'], np.array([12.]))
+        key_ex   = windfile_key(pyIECWind_extreme(), 'NTM', ['U'], np.array([12.]))
+        self.assertNotEqual(key_turb, key_ex)
+
+
+class TestSharedWindFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+        self.iec = CaseGen_IEC()
+        self.iec.run_dir        = os.path.join(self.dirname, 'run')
+        self.iec.wind_dir       = os.path.join(self.dirname, 'wind')
+        self.iec.case_name_base = 'testing'
+        self.iec.Turbsim_exe    = 'turbsim'
+
+        # stand-in for TurbSim, records the wind files it is asked for
+        self.generated = []
+        def execute(iecwind, IEC_WindType, Uref):
+            wind_file = os.path.join(iecwind.outdir, '%s_%s_U%1.6f_Seed%1.1f.bts' % (iecwind.case_name, IEC_WindType, Uref, iecwind.seed))
+            self.generated.append(wind_file)
+            return wind_file, 3
+        self.patch = mock.patch.object(pyIECWind_turb, 'execute', execute)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.dirname)
+
+    def run_dlcs(self, seeds):
+        self.iec.dlc_inputs = {'DLC': [1.1, 1.2], 'U': [[12.], [12.]], 'Seeds': seeds, 'Yaw': [[], []]}
+        case_list, case_names = self.iec.execute()
+        return [case[('InflowWind', 'Filename')] for case in case_list]
+
+    def testSharedInflow(self):
+        # DLC 1.1 and 1.2 with the same U and seed: one wind file, referenced by the cases of both
+        wind_files = self.run_dlcs([[5], [5]])
+        self.assertEqual(len(self.generated), 1)
+        self.assertEqual(wind_files, [self.generated[0]]*2)
+
+    def testPartlyShared(self):
+        wind_files = self.run_dlcs([[5, 6], [6, 7]])
+        self.assertEqual(len(self.generated), 3)
+        self.assertEqual(len(set(self.generated)), 3)
+        self.assertEqual(sorted(set(wind_files)), sorted(self.generated))
+        self.assertEqual(wind_files[1], wind_files[2])
+        self.assertEqual(len(wind_files), 4)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestWindfileKey))
+    suite.addTest(unittest.makeSuite(TestSharedWindFiles))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,137 @@
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import unittest
+from wisdem.aeroelasticse.FAST_cache import FASTRunCache, fst_vt_digest
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.run_dir = os.path.join(self.dirname, 'run')
+        os.mkdir(self.run_dir)
+        self.cache = FASTRunCache(os.path.join(self.dirname, 'cache'))
+
+        self.fst_vt = {'Fst': {'TMax': 60., 'DT': 0.01},
+                       'InflowWind': {'WindType': 3, 'Filename': 'wind.bts'},
+                       'ElastoDynBlade': {'BlFract': np.linspace(0., 1., 5)},
+                       'outlist': {'ElastoDyn': {'RotSpeed': True}}}
+        self.write('wind.bts', 'wind 1')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, fname, text):
+        fname = os.path.join(self.run_dir, fname)
+        with open(fname, 'w') as f:
+            f.write(text)
+        return fname
+
+    def key(self, fst_vt):
+        return self.cache.key(fst_vt, 'OpenFAST', 'openfast', self.run_dir)
+
+    def testDigest(self):
+        fst_vt = {'outlist': {'ElastoDyn': {'RotSpeed': True}}, 'ElastoDynBlade': {'BlFract': np.linspace(0., 1., 5)},
+                  'InflowWind': {'Filename': 'wind.bts', 'WindType': 3}, 'Fst': {'DT': 0.01, 'TMax': 60.}}
+        self.assertEqual(fst_vt_digest(fst_vt), fst_vt_digest(self.fst_vt))
+
+        fst_vt['Fst']['TMax'] = 60.5
+        self.assertNotEqual(fst_vt_digest(fst_vt), fst_vt_digest(self.fst_vt))
+        fst_vt['Fst']['TMax'] = 60
+        self.assertNotEqual(fst_vt_digest(fst_vt), fst_vt_digest(self.fst_vt))
+        fst_vt['Fst']['TMax'] = 60.
+        fst_vt['ElastoDynBlade']['BlFract'][2] += 1e-12
+        self.assertNotEqual(fst_vt_digest(fst_vt), fst_vt_digest(self.fst_vt))
+
+    def testKeyWindFile(self):
+        key = self.key(self.fst_vt)
+        self.assertEqual(self.key(self.fst_vt), key)
+
+        # same file name, new wind
+        time.sleep(0.01)
+        self.write('wind.bts', 'wind 2')
+        self.assertNotEqual(self.key(self.fst_vt), key)
+
+    def testKeyControllerInput(self):
+        self.fst_vt['ServoDyn'] = {'DLL_InFile': 'DISCON.IN'}
+        self.write('DISCON.IN', 'gains 1')
+        key = self.key(self.fst_vt)
+
+        time.sleep(0.01)
+        self.write('DISCON.IN', 'gains 2')
+        key_new = self.key(self.fst_vt)
+        self.assertNotEqual(key_new, key)
+
+        # written from DISCON_in, the file in the run directory is from another case, but the
+        # performance table it references is read
+        self.fst_vt['DISCON_in'] = {'PerfFileName': 'Cp_Ct_Cq.txt'}
+        self.write('Cp_Ct_Cq.txt', 'table 1')
+        key = self.key(self.fst_vt)
+        time.sleep(0.01)
+        self.write('DISCON.IN', 'gains 3')
+        self.assertEqual(self.key(self.fst_vt), key)
+        self.write('Cp_Ct_Cq.txt', 'table 2')
+        self.assertNotEqual(self.key(self.fst_vt), key)
+
+    def testKeyPotFile(self):
+        os.mkdir(os.path.join(self.run_dir, 'HydroData'))
+        self.fst_vt['HydroDyn'] = {'PotMod': 1, 'PotFile': '"HydroData/platform"'}
+        for ext in ['1', '3', 'hst']:
+            self.write(os.path.join('HydroData', 'platform.' + ext), ext)
+        key = self.key(self.fst_vt)
+        self.assertEqual(len(self.cache.input_files(self.fst_vt, self.run_dir)), 4)
+
+        time.sleep(0.01)
+        self.write(os.path.join('HydroData', 'platform.hst'), 'hydrostatics')
+        self.assertNotEqual(self.key(self.fst_vt), key)
+
+    def testGetPut(self):
+        key = self.key(self.fst_vt)
+        out = self.write('case_0.outb', 'output')
+        self.assertFalse(self.cache.get(key, out))
+        self.cache.put(key, out)
+
+        out_new = os.path.join(self.run_dir, 'case_1.outb')
+        self.assertTrue(self.cache.get(key, out_new))
+        with open(out_new) as f:
+            self.assertEqual(f.read(), 'output')
+
+    def testGetMemoryMappedOutput(self):
+        key = self.key(self.fst_vt)
+        self.cache.put(key, self.write('case_0.outb', 'new output'))
+
+        # a previous output of the case, still memory mapped
+        out = self.write('case_1.outb', 'old output')
+        data = np.memmap(out, dtype=np.uint8, mode='r')
+        self.assertTrue(self.cache.get(key, out))
+        self.assertEqual(bytes(data), b'old output')
+        with open(out) as f:
+            self.assertEqual(f.read(), 'new output')
+        del data
+        self.assertFalse([fname for fname in os.listdir(self.run_dir) if fname.endswith('.tmp')])
+
+    def testEvict(self):
+        self.cache.max_size = 35
+        keys = ['%040d' % i for i in range(3)]
+        out = self.write('case.outb', '0123456789')
+        for i, key in enumerate(keys):
+            self.cache.put(key, out)
+            os.utime(self.cache.cached_file(key, out), (i, i))
+        # key 0 used last, key 1 is the least recently used
+        self.assertTrue(self.cache.get(keys[0], out))
+
+        self.cache.put('%040d' % 3, out)
+        cached = sorted(os.listdir(self.cache.cache_dir))
+        self.assertEqual(cached, [keys[0] + '.outb', keys[2] + '.outb', '%040d.outb' % 3])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestCache))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
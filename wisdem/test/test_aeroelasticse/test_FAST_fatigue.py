@@ -0,0 +1,116 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import os
+import shutil
+import tempfile
+import wisdem.aeroelasticse.FAST_fatigue as fat
+from wisdem.test.test_aeroelasticse.test_FAST_post import write_outb
+
+
+def rainflow_stack(x):
+    # sequential stack based 4-point rainflow, reference for the vectorized counter
+    stack = []
+    full  = []
+    for p in fat.turning_points(x):
+        stack.append(p)
+        while len(stack) >= 4:
+            a, b, c, d = stack[-4:]
+            if abs(c-b) <= abs(b-a) and abs(c-b) <= abs(d-c):
+                full.append(abs(c-b))
+                del stack[-3:-1]
+            else:
+                break
+    return np.sort(full), np.sort(np.abs(np.diff(stack)))
+
+
+class TestFatigue(unittest.TestCase):
+
+    def testTurningPoints(self):
+        x = np.array([0., 1., 1., 2., 1., -1., -1., 3., 3.])
+        npt.assert_equal(fat.turning_points(x), [0., 2., -1., 3.])
+
+    def testRainflowSimple(self):
+        # ASTM E1049 example signal, same cycles as ASTM rainflow counting
+        x = np.array([-2., 1., -3., 5., -1., 3., -4., 4., -2.])
+        ranges, means, counts = fat.rainflow(x)
+        npt.assert_equal(ranges[counts==1.], [4.])
+        npt.assert_equal(means[counts==1.], [1.])
+        npt.assert_equal(np.sort(ranges[counts==0.5]), [3., 4., 6., 8., 8., 9.])
+
+    def testRainflowMulti(self):
+        np.random.seed(1)
+        signals = [np.cumsum(np.random.randn(n)) for n in [3, 10, 200, 2000]]
+        signals.append(np.random.randint(0, 5, 300).astype(float))
+        for x, (ranges, means, counts) in zip(signals, fat.rainflow_multi(signals)):
+            full, half = rainflow_stack(x)
+            npt.assert_almost_equal(np.sort(ranges[counts==1.]), full)
+            npt.assert_almost_equal(np.sort(ranges[counts==0.5]), half)
+
+        # columns of a 2-D array are independent signals
+        X = np.cumsum(np.random.randn(500, 4), axis=0)
+        D = fat.damage_sum(X, 4.)
+        for i in range(4):
+            self.assertAlmostEqual(D[i], fat.damage_sum([X[:,i]], 4.)[0])
+
+    def testDEL(self):
+        # constant amplitude sine, DEL with one cycle per period is the range
+        t = np.linspace(0., 100., 10001)
+        x = 3.*np.sin(2.*np.pi*0.5*t)
+        DEL = fat.damage_equivalent_load([x], 4., 50.)
+        npt.assert_almost_equal(DEL, 6., decimal=2)
+
+    def testLifetimeDEL(self):
+        p = fat.weibull_bin_probability([4., 6., 8.], 2., 10., U_in=3., U_out=9.)
+        npt.assert_almost_equal(np.sum(p), np.exp(-(0.3)**2) - np.exp(-(0.9)**2))
+
+        # identical damage rate in every bin and full probability: lifetime DEL scales with the Miner sum only
+        U = np.array([5., 5., 15., 15.])
+        D = np.array([[2., 20.], [2., 20.], [2., 20.], [2., 20.]])
+        DEL, N_eq = fat.lifetime_DEL(D, U, 10., [3., 10.], 2., 10., T_life=1000., f_eq=1., U_in=0., U_out=1e3)
+        self.assertEqual(N_eq, 1000.)
+        npt.assert_almost_equal(DEL, [(0.2)**(1./3.), (2.)**(1./10.)])
+
+
+class TestFASTDEL(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname   = os.path.join(self.tmp_dir, 'case.outb')
+
+        np.random.seed(2)
+        self.data = {}
+        self.data['RootMyb1'] = np.round(np.cumsum(np.random.randn(200))*10.)
+        self.data['TwrBsMyt'] = np.round(np.cumsum(np.random.randn(200))*10.)
+        write_outb(self.fname, 0.1, [(chan, self.data[chan]) for chan in ['RootMyb1', 'TwrBsMyt']])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testMinerSum(self):
+        out = fat.FAST_DEL(['TwrBsMyt', 'RootMyb1'], [4., 10.], t_start=5.)(self.fname)
+        npt.assert_almost_equal(out['T'], 19.9 - 5.)
+        npt.assert_almost_equal(out['D'], fat.damage_sum([self.data['TwrBsMyt'][50:], self.data['RootMyb1'][50:]], [4., 10.]))
+        self.assertEqual(out['channels'], ['TwrBsMyt', 'RootMyb1'])
+
+    def testStartAfterEnd(self):
+        with self.assertRaises(ValueError) as err:
+            fat.FAST_DEL(['RootMyb1'], 10., t_start=30.)(self.fname)
+        self.assertIn(self.fname, str(err.exception))
+        self.assertIn('t_start = 30', str(err.exception))
+
+    def testMissingChannel(self):
+        with self.assertRaises(ValueError) as err:
+            fat.FAST_DEL(['RootMyb1', 'RootMxb1'], 10.)(self.fname)
+        self.assertIn(self.fname, str(err.exception))
+        self.assertIn('RootMxb1', str(err.exception))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFatigue))
+    suite.addTest(unittest.makeSuite(TestFASTDEL))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
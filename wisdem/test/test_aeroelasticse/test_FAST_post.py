@@ -0,0 +1,103 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import os
+import shutil
+import struct
+import tempfile
+
+from wisdem.aeroelasticse.FAST_post import FAST_Stats
+
+
+def write_outb(fname, dt, channels, units=None, DescStr='Synthetic FAST output'):
+    """ Write a binary FAST output file (FileID 2, time given by the time step) with the integer valued
+    time series channels, a list of (name, values), stored without scaling """
+    NumOutChans = len(channels)
+    NT          = len(channels[0][1])
+    ChanName    = ['Time'] + [chan for chan, val in channels]
+    ChanUnit    = ['(s)'] + (['(-)']*NumOutChans if units is None else units)
+
+    with open(fname, 'wb') as f:
+        f.write(struct.pack('=hiidd', 2, NumOutChans, NT, 0., dt))
+        f.write(np.ones(NumOutChans, dtype=np.float32).tobytes())
+        f.write(np.zeros(NumOutChans, dtype=np.float32).tobytes())
+        f.write(struct.pack('i', len(DescStr)))
+        f.write(DescStr.encode('utf-8'))
+        f.write(''.join(['%-10s' % name for name in ChanName]).encode('utf-8'))
+        f.write(''.join(['%-10s' % unit for unit in ChanUnit]).encode('utf-8'))
+        f.write(np.column_stack([val for chan, val in channels]).astype(np.int16).tobytes())
+
+
+class TestFASTStats(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname   = os.path.join(self.tmp_dir, 'case.outb')
+
+        self.time = 0.1*np.arange(100)
+        self.data = {}
+        self.data['GenPwr']   = np.round(1000.*np.sin(0.1*np.arange(100)))
+        self.data['RootMyc1'] = np.round(500.*np.cos(0.07*np.arange(100)) - 200.)
+        self.data['TipDyc1']  = np.arange(100.) - 50.
+        write_outb(self.fname, 0.1, [(chan, self.data[chan]) for chan in ['GenPwr', 'RootMyc1', 'TipDyc1']])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def testStats(self):
+        t_start = 2.
+        stats   = FAST_Stats(channels=['GenPwr', 'RootMyc1'], coincident=['TipDyc1'], t_start=t_start)(self.fname)
+        self.assertEqual(sorted(stats.keys()), ['GenPwr', 'RootMyc1'])
+
+        idx_s = np.searchsorted(self.time, t_start)
+        time  = self.time[idx_s:]
+        for chan in ['GenPwr', 'RootMyc1']:
+            x = self.data[chan][idx_s:]
+            npt.assert_allclose(stats[chan]['mean'], np.mean(x))
+            npt.assert_allclose(stats[chan]['std'], np.std(x))
+            self.assertEqual(stats[chan]['min'], np.min(x))
+            self.assertEqual(stats[chan]['max'], np.max(x))
+            self.assertEqual(stats[chan]['absmax'], np.max(np.abs(x)))
+            for key, idx in [('min', np.argmin(x)), ('max', np.argmax(x)), ('absmax', np.argmax(np.abs(x)))]:
+                npt.assert_allclose(stats[chan]['time_'+key], time[idx])
+                self.assertEqual(stats[chan]['coincident_'+key], {'TipDyc1': self.data['TipDyc1'][idx_s+idx]})
+
+    def testAllChannels(self):
+        stats = FAST_Stats()(self.fname)
+        self.assertEqual(sorted(stats.keys()), ['GenPwr', 'RootMyc1', 'TipDyc1'])
+        self.assertEqual(stats['TipDyc1']['coincident_max'], {})
+        npt.assert_allclose(stats['TipDyc1']['time_max'], self.time[-1])
+
+    def testReduce(self):
+        data  = dict([('Time', self.time)] + list(self.data.items()))
+        stats = FAST_Stats(channels=['RootMyc1'], coincident=['GenPwr'])
+        self.assertEqual(stats.reduce(data), stats(self.fname))
+
+    def testNoChannels(self):
+        self.assertEqual(FAST_Stats(channels=[])(self.fname), {})
+
+    def testMissingChannel(self):
+        for channels, coincident in [(['GenPwr', 'RotSpeed'], None), (['GenPwr'], ['RotSpeed'])]:
+            with self.assertRaises(ValueError) as err:
+                FAST_Stats(channels=channels, coincident=coincident)(self.fname)
+            self.assertIn(self.fname, str(err.exception))
+            self.assertIn('RotSpeed', str(err.exception))
+
+    def testStartAfterEnd(self):
+        with self.assertRaises(ValueError) as err:
+            FAST_Stats(channels=['GenPwr'], t_start=20.)(self.fname)
+        self.assertIn(self.fname, str(err.exception))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFASTStats))
+    return suite
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(suite())
+
+    if result.wasSuccessful():
+        exit(0)
+    else:
+        exit(1)
@@ -0,0 +1,136 @@
+import os
+import copy
+import shutil
+import tempfile
+import numpy as np
+import numpy.testing as npt
+import unittest
+from wisdem.aeroelasticse.FAST_reader import InputReader_OpenFAST, read_array
+
+
+blade_ad = '''------- AERODYN v15.00.* BLADE DEFINITION INPUT FILE -------------------------------------
+test blade
+======  Blade Properties =================================================================
+          3   NumBlNds    - Number of blade nodes used in the analysis (-)
+    BlSpn        BlCrvAC        BlSwpAC        BlCrvAng       BlTwist        BlChord          BlAFID
+     (m)           (m)            (m)            (deg)         (deg)           (m)              (-)
+ 0.0  0.0  0.0  0.0  13.3  3.5  1
+ 30.0 -0.1 0.0  0.0  5.0   3.0  2
+ 61.5 -0.5 0.0  0.0  0.1   1.4  2
+'''
+
+polar_ad = '''! ------------ AirfoilInfo v1.01.x Input File ----------------------------------
+! test airfoil
+! ------------------------------------------------------------------------------
+"DEFAULT"     InterpOrd         ! Interpolation order to use for quasi-steady table lookup {1=linear; 3=cubic spline; "default"} [default=3]
+          1   NonDimArea        ! The non-dimensional area of the airfoil (area/chord^2) (set to 1.0 if unsure or unneeded)
+          0   NumCoords         ! The number of coordinates in the airfoil shape file.  Set to zero if coordinates not included.
+          1   NumTabs           ! Number of airfoil tables in this file.
+! ------------------------------------------------------------------------------
+       0.75   Re                ! Reynolds number in millions
+          0   Ctrl              ! Control setting (must be 0 for current AirfoilInfo)
+False         InclUAdata        ! Is unsteady aerodynamics data included in this table? If TRUE, then include 30 UA coefficients below this line
+!........................................
+! Table of aerodynamics coefficients
+          4   NumAlf            ! Number of data lines in the following table
+!    Alpha      Cl      Cd        Cm
+!    (deg)      (-)     (-)       (-)
+ -180.0  0.0   0.5  0.0
+
+  -10.0 -0.8   0.02 -0.05
+!  a commented row
+   10.0  1.2   0.02 -0.10
+  180.0  0.0   0.5  0.0
+'''
+
+
+class TestReader(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.reader = InputReader_OpenFAST()
+        self.reader.fst_vt = copy.deepcopy(self.reader.fst_vt)
+        self.reader.FAST_directory = self.dirname
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, fname, text, newline='\n'):
+        fname = os.path.join(self.dirname, fname)
+        with open(fname, 'w', newline=newline) as f:
+            f.write(text)
+        return fname
+
+    def testReadArray(self):
+        fname = self.write('table.dat', '1 2 3\n! skip\n\n4 5 6\n7 8 9\n', newline='\r\n')
+        with open(fname) as f:
+            npt.assert_equal(read_array(f, 1), [[1., 2., 3.]])
+        with open(fname) as f:
+            f.readline()
+            npt.assert_equal(read_array(f, 2, skip_comments=True), [[4., 5., 6.], [7., 8., 9.]])
+            self.assertEqual(f.readline(), '')
+        with open(fname) as f:
+            self.assertRaises(ValueError, read_array, f, 4, None, True)
+
+    def testReadArrayInlineComment(self):
+        fname = self.write('table.dat', '1 2 3 ! note\n4 5 6\n')
+        with open(fname) as f:
+            npt.assert_equal(read_array(f, 2), [[1., 2., 3.], [4., 5., 6.]])
+
+    def testReadArrayRagged(self):
+        # extra values past the table columns are ignored, missing values are an error naming the row
+        fname = self.write('table.dat', '1 2 3\n4 5 6 7\n')
+        with open(fname) as f:
+            npt.assert_equal(read_array(f, 2), [[1., 2., 3.], [4., 5., 6.]])
+        with open(fname) as f:
+            npt.assert_equal(read_array(f, 2, ncols=2), [[1., 2.], [4., 5.]])
+
+        fname = self.write('short.dat', '1 2 3\n4 5\n')
+        with open(fname) as f:
+            with self.assertRaises(ValueError) as err:
+                read_array(f, 2)
+        self.assertIn('short.dat', str(err.exception))
+        self.assertIn('row 2', str(err.exception))
+
+        fname = self.write('text.dat', '1 2 3\n4 x 6\n')
+        with open(fname) as f:
+            with self.assertRaises(ValueError) as err:
+                read_array(f, 2)
+        self.assertIn('row 2', str(err.exception))
+
+    def testAeroDyn15Blade(self):
+        self.reader.fst_vt['AeroDyn15']['ADBlFile1'] = self.write('blade.dat', blade_ad)
+        self.reader.read_AeroDyn15Blade()
+
+        blade = self.reader.fst_vt['AeroDynBlade']
+        self.assertEqual(blade['NumBlNds'], 3)
+        npt.assert_equal(blade['BlSpn'], [0., 30., 61.5])
+        npt.assert_equal(blade['BlCrvAC'], [0., -0.1, -0.5])
+        npt.assert_equal(blade['BlTwist'], [13.3, 5., 0.1])
+        npt.assert_equal(blade['BlChord'], [3.5, 3., 1.4])
+        npt.assert_equal(blade['BlAFID'], [1, 2, 2])
+
+    def testAeroDyn15Polar(self):
+        af = self.reader.fst_vt['AeroDyn15']
+        af['NumAFfiles'] = 2
+        af['AFNames'] = [self.write('af1.dat', polar_ad), self.write('af2.dat', polar_ad, newline='\r\n')]
+        af['InCol_Alfa'], af['InCol_Cl'], af['InCol_Cd'], af['InCol_Cm'], af['InCol_Cpmin'] = 1, 2, 3, 4, 0
+        self.reader.read_AeroDyn15Polar()
+
+        for polar in af['af_data']:
+            self.assertEqual(polar['Re'], 0.75)
+            self.assertEqual(polar['NumAlf'], 4)
+            npt.assert_equal(polar['Alpha'], [-180., -10., 10., 180.])
+            npt.assert_equal(polar['Cl'], [0., -0.8, 1.2, 0.])
+            npt.assert_equal(polar['Cd'], [0.5, 0.02, 0.02, 0.5])
+            npt.assert_equal(polar['Cm'], [0., -0.05, -0.1, 0.])
+            npt.assert_equal(polar['Cpmin'], np.zeros(4))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestReader))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,189 @@
+import os
+import sys
+import copy
+import shutil
+import tempfile
+import threading
+import unittest
+import numpy as np
+import numpy.testing as npt
+from wisdem.aeroelasticse.FAST_wrapper import FastWrapper
+from wisdem.aeroelasticse.FAST_writer import InputWriter_OpenFAST
+from wisdem.aeroelasticse.runFAST_pywrapper import runFAST_pywrapper_batch, fst_vt_overlay, get_fst_vt_shared
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class TestWrapper(unittest.TestCase):
+
+    def setUp(self):
+        # stand-in executable: writes the directory it runs in to <input file>.out
+        self.dirname = tempfile.mkdtemp()
+        self.exe = os.path.join(self.dirname, 'fast_stub.py')
+        with open(self.exe, 'w') as f:
+            f.write('#!%s\nimport os, sys\nopen(sys.argv[1]+".out", "w").write(os.getcwd())\n' % sys.executable)
+        os.chmod(self.exe, 0o755)
+
+        self.run_dirs = []
+        for i in range(4):
+            run_dir = os.path.join(self.dirname, 'case%d' % i)
+            os.mkdir(run_dir)
+            self.run_dirs.append(run_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    @unittest.skipIf(sys.platform.startswith('win'), 'needs an executable script')
+    def testRunDirectoryFromThreads(self):
+        olddir = os.getcwd()
+
+        # exit codes of the runs, checked in this thread
+        exit_codes = [None]*len(self.run_dirs)
+        def run(i, run_dir):
+            fast = FastWrapper(FAST_exe=self.exe, FAST_InputFile='case.fst', FAST_directory=run_dir)
+            exit_codes[i] = fast.execute()
+
+        threads = [threading.Thread(target=run, args=(i, run_dir)) for i, run_dir in enumerate(self.run_dirs)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(exit_codes, [0]*len(self.run_dirs))
+        self.assertEqual(os.getcwd(), olddir)
+        for run_dir in self.run_dirs:
+            with open(os.path.join(run_dir, 'case.fst.out')) as f:
+                self.assertEqual(os.path.realpath(f.read()), os.path.realpath(run_dir))
+
+
+@unittest.skipIf(sys.platform.startswith('win'), 'needs an executable script')
+class TestBatchThreaded(unittest.TestCase):
+
+    def setUp(self):
+        # stand-in executable: sleeps for the time given in the input file, then writes it to <input file>.out
+        self.dirname = tempfile.mkdtemp()
+        self.exe = os.path.join(self.dirname, 'fast_stub.py')
+        with open(self.exe, 'w') as f:
+            f.write('#!%s -I\nimport sys, time\nt = open(sys.argv[1]).read()\ntime.sleep(float(t))\nopen(sys.argv[1]+".out", "w").write(t)\n' % sys.executable)
+        os.chmod(self.exe, 0o755)
+
+        self.sleep = [1.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        self.batch = runFAST_pywrapper_batch(FAST_exe=self.exe, FAST_runDirectory=os.path.join(self.dirname, 'run'))
+        self.batch.fst_vt         = {'Fst': {}}
+        self.batch.case_list      = [{'sleep': t} for t in self.sleep]
+        self.batch.case_name_list = ['case%d' % i for i in range(len(self.sleep))]
+
+        # the case writer stands in for the FAST input files, the stub is run as FAST
+        self.lock        = threading.Lock()
+        self.n_running   = 0
+        self.max_running = 0
+        def eval_fast(case, case_name, FAST_ver, FAST_exe, FAST_runDirectory, *args):
+            with self.lock:
+                self.n_running  += 1
+                self.max_running = max(self.max_running, self.n_running)
+            with open(os.path.join(FAST_runDirectory, case_name + '.fst'), 'w') as f:
+                f.write(str(case['sleep']))
+            FastWrapper(FAST_exe=FAST_exe, FAST_InputFile=case_name + '.fst', FAST_directory=FAST_runDirectory).execute()
+            with self.lock:
+                self.n_running -= 1
+            return os.path.join(FAST_runDirectory, case_name + '.fst.out')
+        self.patch = mock.patch('wisdem.aeroelasticse.runFAST_pywrapper.eval_fast', eval_fast)
+        self.patch.start()
+
+        self.post_threads = []
+        def post(FAST_Output):
+            self.post_threads.append(threading.current_thread())
+            with open(FAST_Output) as f:
+                return float(f.read())
+        self.batch.post = post
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.dirname)
+
+    def testCompletionOrder(self):
+        slow_output = os.path.join(self.batch.FAST_runDirectory, 'case0.fst.out')
+
+        results = []
+        for i, out in self.batch.run_threaded_iter(cores=2):
+            # results are streamed as the runs finish, the slow first case does not hold up the others
+            if len(results) == 0:
+                self.assertFalse(os.path.exists(slow_output))
+            results.append((i, out))
+
+        self.assertEqual(sorted(results), list(enumerate(self.sleep)))
+        self.assertEqual(results[-1], (0, self.sleep[0]))
+        self.assertEqual(self.max_running, 2)
+        self.assertEqual(self.post_threads, [threading.current_thread()]*len(self.sleep))
+
+    def testCaseOrder(self):
+        # the first case finishes last
+        self.assertEqual(self.batch.run_threaded(cores=3), self.sleep)
+        self.assertTrue(self.max_running <= 3)
+        self.assertEqual(self.post_threads, [threading.current_thread()]*len(self.sleep))
+
+
+class TestSharedModel(unittest.TestCase):
+
+    def setUp(self):
+        self.fst_vt = {'Fst': {'TMax': 60., 'EDFile': 'base_ElastoDyn.dat'},
+                       'InflowWind': {'HWindSpeed': 8.},
+                       'ElastoDynBlade': {'BlFract': np.linspace(0., 1., 5)},
+                       'AeroDyn15': {'AFNames': ['af0.dat', 'af1.dat']},
+                       'outlist': {'ElastoDyn': {'RotSpeed': True, 'BldPitch1': False}}}
+        self.fst_vt_ref = copy.deepcopy(self.fst_vt)
+
+    def check_base(self):
+        self.assertEqual(sorted(self.fst_vt.keys()), sorted(self.fst_vt_ref.keys()))
+        for module in self.fst_vt_ref.keys():
+            self.assertEqual(sorted(self.fst_vt[module].keys()), sorted(self.fst_vt_ref[module].keys()))
+            for var, val in self.fst_vt_ref[module].items():
+                npt.assert_equal(self.fst_vt[module][var], val)
+
+    def testOverlay(self):
+        # case update, output channels and file names set by the writer, on an overlay of the base model
+        writer = InputWriter_OpenFAST(FAST_ver='OpenFAST')
+        writer.fst_vt = fst_vt_overlay(self.fst_vt)
+        writer.update(fst_update={('Fst', 'TMax'): 10., ('InflowWind', 'HWindSpeed'): 12.})
+        writer.update_outlist({'BldPitch1': True})
+        writer.fst_vt['Fst']['EDFile'] = 'case_ElastoDyn.dat'
+        writer.fst_vt['AeroDyn15']['AFNames'][1] = 'case_af1.dat'
+
+        self.assertEqual(writer.fst_vt['Fst']['TMax'], 10.)
+        self.assertEqual(writer.fst_vt['InflowWind']['HWindSpeed'], 12.)
+        self.assertTrue(writer.fst_vt['outlist']['ElastoDyn']['BldPitch1'])
+        self.assertEqual(writer.fst_vt['AeroDyn15']['AFNames'], ['af0.dat', 'case_af1.dat'])
+        self.check_base()
+
+        # the table data is shared, not copied
+        self.assertIs(writer.fst_vt['ElastoDynBlade']['BlFract'], self.fst_vt['ElastoDynBlade']['BlFract'])
+
+    def testShared(self):
+        # the base model is stored with the first case a process receives, later cases only reference it
+        fst_vt = get_fst_vt_shared(('batch0', self.fst_vt))
+        self.assertIs(fst_vt, self.fst_vt)
+        for HWindSpeed in [10., 12.]:
+            fst_vt = fst_vt_overlay(get_fst_vt_shared(('batch0', None)))
+            fst_vt['InflowWind']['HWindSpeed'] = HWindSpeed
+            fst_vt['Fst']['TMax'] = 30.
+        self.check_base()
+        self.assertIs(get_fst_vt_shared(('batch0', None)), self.fst_vt)
+
+        # a new batch replaces it, a full model is passed through
+        get_fst_vt_shared(('batch1', {}))
+        self.assertRaises(KeyError, get_fst_vt_shared, ('batch0', None))
+        self.assertIs(get_fst_vt_shared(self.fst_vt), self.fst_vt)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestWrapper))
+    suite.addTest(unittest.makeSuite(TestBatchThreaded))
+    suite.addTest(unittest.makeSuite(TestSharedModel))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
@@ -0,0 +1,92 @@
+import os
+import shutil
+import hashlib
+import tempfile
+import unittest
+import numpy as np
+from wisdem.aeroelasticse.FAST_writer import InputWriter_OpenFAST
+
+
+class TestSharedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.blade = {'NumBlNds': 3,
+                      'BlSpn'   : [0., 30., 61.5],
+                      'BlCrvAC' : [0., -0.1, -0.5],
+                      'BlSwpAC' : [0., 0., 0.],
+                      'BlCrvAng': [0., 0., 0.],
+                      'BlTwist' : [13.3, 5., 0.1],
+                      'BlChord' : [3.5, 3., 1.4],
+                      'BlAFID'  : [1, 2, 2]}
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write_case(self, case_name, blade, shared_files=True):
+        # write the AeroDyn blade file of a case, returns the name the case references it by
+        writer = InputWriter_OpenFAST()
+        writer.FAST_namingOut    = case_name
+        writer.FAST_runDirectory = self.dirname
+        writer.shared_files      = shared_files
+        writer.fst_vt            = {'AeroDyn15': {}, 'AeroDynBlade': blade}
+        writer.write_AeroDyn15Blade()
+
+        ad = writer.fst_vt['AeroDyn15']
+        self.assertEqual(ad['ADBlFile2'], ad['ADBlFile1'])
+        self.assertEqual(ad['ADBlFile3'], ad['ADBlFile1'])
+        return ad['ADBlFile1']
+
+    def testUnchanged(self):
+        # both cases reference the same file, written once and named by the hash of its content
+        name0 = self.write_case('case0', self.blade)
+        name1 = self.write_case('case1', dict(self.blade))
+        self.assertEqual(name0, name1)
+        self.assertEqual(os.listdir(self.dirname), [name0])
+
+        with open(os.path.join(self.dirname, name0)) as f:
+            text = f.read()
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+        self.assertEqual(name0, 'AeroDyn15_blade_%s.dat' % digest)
+        self.assertFalse('case0' in name0)
+
+    def testChanged(self):
+        name0 = self.write_case('case0', self.blade)
+        blade = dict(self.blade)
+        blade['BlTwist'] = np.array(self.blade['BlTwist']) + 1.
+        name1 = self.write_case('case1', blade)
+        self.assertNotEqual(name0, name1)
+        self.assertEqual(sorted(os.listdir(self.dirname)), sorted([name0, name1]))
+
+        # an existing file is not written again
+        mtime = os.stat(os.path.join(self.dirname, name0)).st_mtime
+        os.utime(os.path.join(self.dirname, name0), (mtime - 100., mtime - 100.))
+        self.assertEqual(self.write_case('case2', self.blade), name0)
+        self.assertEqual(os.stat(os.path.join(self.dirname, name0)).st_mtime, mtime - 100.)
+        self.assertEqual(len(os.listdir(self.dirname)), 2)
+
+    def testNotShared(self):
+        name0 = self.write_case('case0', self.blade, shared_files=False)
+        name1 = self.write_case('case1', self.blade, shared_files=False)
+        self.assertEqual(name0, 'case0_AeroDyn15_blade.dat')
+        self.assertEqual(name1, 'case1_AeroDyn15_blade.dat')
+
+        # same content as the shared file
+        name = self.write_case('case2', self.blade)
+        for fname in [name0, name1]:
+            with open(os.path.join(self.dirname, fname)) as f, open(os.path.join(self.dirname, name)) as f_shared:
+                self.assertEqual(f.read(), f_shared.read())
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSharedFiles))
+    return suite
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(suite())
+
+    if result.wasSuccessful():
+        exit(0)
+    else:
+        exit(1)
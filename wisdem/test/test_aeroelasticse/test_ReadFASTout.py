@@ -0,0 +1,155 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+
+from wisdem.aeroelasticse.Util.ReadFASTout import ReadFASTbinary, ReadFASTtext, ReadFASToutFormat, FASTOutput
+from wisdem.test.test_aeroelasticse.test_FAST_post import write_outb
+
+
+class TestFASTOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname   = os.path.join(self.tmp_dir, 'case.outb')
+
+        self.time = 0.05*np.arange(50)
+        self.data = {}
+        self.data['GenPwr']   = np.arange(50.)*10.
+        self.data['RotSpeed'] = np.arange(50.) % 7
+        self.data['BldPitch1'] = 50. - np.arange(50.)
+        self.channels = ['GenPwr', 'RotSpeed', 'BldPitch1']
+        write_outb(self.fname, 0.05, [(chan, self.data[chan]) for chan in self.channels], units=['(kW)', '(rpm)', '(deg)'])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def check_data(self, out, channels):
+        self.assertEqual(sorted(out.keys()), sorted(['Time'] + channels))
+        npt.assert_allclose(out['Time'], self.time)
+        for chan in channels:
+            npt.assert_array_equal(out[chan], self.data[chan])
+
+    def testLazyAccess(self):
+        out = FASTOutput(self.fname)
+        self.assertEqual(len(out), 4)
+        self.assertTrue('RotSpeed' in out)
+        self.assertEqual(out.meta['units']['GenPwr'], '(kW)')
+        self.assertEqual(out._cache, {})
+        self.assertIsNone(out._packed)
+
+        # only the indexed channel is decoded
+        npt.assert_array_equal(out['RotSpeed'], self.data['RotSpeed'])
+        self.assertEqual(list(out._cache.keys()), ['RotSpeed'])
+        self.assertIs(out['RotSpeed'], out['RotSpeed'])
+        self.check_data(out, self.channels)
+
+        # same data as the full read
+        Channels, ChanName, ChanUnit, FileID, DescStr = ReadFASTbinary(self.fname)
+        for k, chan in enumerate(ChanName):
+            npt.assert_array_equal(out[chan], Channels[:,k])
+
+        out.clear_cache()
+        self.assertEqual(out._cache, {})
+        self.check_data(out, self.channels)
+
+    def testChannels(self):
+        out = FASTOutput(self.fname, channels=['BldPitch1', 'GenPwr', 'Azimuth'])
+        self.check_data(out, ['BldPitch1', 'GenPwr'])
+        self.assertEqual(sorted(out.meta['units'].keys()), ['BldPitch1', 'GenPwr', 'Time'])
+        with self.assertRaises(KeyError):
+            out['RotSpeed']
+
+    def testPickle(self):
+        out = FASTOutput(self.fname, channels=['GenPwr'])
+        out['GenPwr']
+
+        # only the header is transferred, the channels are decoded again from the file
+        out_new = pickle.loads(pickle.dumps(out))
+        self.assertEqual(out_new._cache, {})
+        self.assertIsNone(out_new._packed)
+        self.check_data(out_new, ['GenPwr'])
+        self.assertEqual(out_new.meta, out.meta)
+
+    def testLoad(self):
+        out = FASTOutput(self.fname).load()
+        out_pickled = pickle.dumps(out)
+
+        # the data does not depend on the file anymore, also after pickling
+        write_outb(self.fname, 0.05, [(chan, np.zeros(50)) for chan in self.channels])
+        self.check_data(out, self.channels)
+        os.remove(self.fname)
+        self.check_data(pickle.loads(out_pickled), self.channels)
+
+
+class TestReadChannels(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.time  = 0.05*np.arange(20)
+        self.names = ['GenPwr', 'RotSpeed', 'BldPitch1']
+        self.units = ['(kW)', '(rpm)', '(deg)']
+        self.data  = np.column_stack([np.arange(20.)*10., np.arange(20.) % 7, 20. - np.arange(20.)])
+
+        self.outb = os.path.join(self.tmp_dir, 'case.outb')
+        write_outb(self.outb, 0.05, [(chan, self.data[:,k]) for k, chan in enumerate(self.names)], units=self.units)
+
+        self.out = os.path.join(self.tmp_dir, 'case.out')
+        with open(self.out, 'w') as f:
+            f.write('\nSynthetic FAST output\n\n')
+            f.write('\t'.join(['Time'] + self.names) + '\n')
+            f.write('\t'.join(['(s)'] + self.units) + '\n')
+            for t, row in zip(self.time, self.data):
+                f.write('\t'.join(['%.4f' % t] + ['%.4f' % val for val in row]) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def check_read(self, read):
+        # all channels
+        Channels, ChanName, ChanUnit, FileID, DescStr = read(None)
+        self.assertEqual(ChanName, ['Time'] + self.names)
+        self.assertEqual(ChanUnit, ['(s)'] + self.units)
+        npt.assert_allclose(Channels, np.column_stack([self.time, self.data]), atol=1e-10)
+
+        # subset in the requested order, channels missing from the file are left out, time is always read
+        Channels, ChanName, ChanUnit, FileID, DescStr = read(['BldPitch1', 'Azimuth', 'GenPwr'])
+        self.assertEqual(ChanName, ['Time', 'BldPitch1', 'GenPwr'])
+        self.assertEqual(ChanUnit, ['(s)', '(deg)', '(kW)'])
+        npt.assert_allclose(Channels, np.column_stack([self.time, self.data[:,2], self.data[:,0]]), atol=1e-10)
+
+        Channels, ChanName, ChanUnit, FileID, DescStr = read(['Azimuth'])
+        self.assertEqual(ChanName, ['Time'])
+        npt.assert_allclose(Channels, self.time[:,np.newaxis], atol=1e-10)
+
+    def testBinary(self):
+        self.check_read(lambda channels: ReadFASTbinary(self.outb, channels=channels))
+
+    def testText(self):
+        self.check_read(lambda channels: ReadFASTtext(self.out, channels=channels))
+
+    def testFormat(self):
+        for OutFileFmt, fname in [(1, self.out), (2, self.outb)]:
+            data, meta = ReadFASToutFormat(fname, OutFileFmt, channels=['RotSpeed', 'Azimuth'])
+            self.assertEqual(sorted(data.keys()), ['RotSpeed', 'Time'])
+            npt.assert_allclose(data['RotSpeed'], self.data[:,1], atol=1e-10)
+            self.assertEqual(meta['units'], {'Time': '(s)', 'RotSpeed': '(rpm)'})
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestFASTOutput))
+    suite.addTest(unittest.makeSuite(TestReadChannels))
+    return suite
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(suite())
+
+    if result.wasSuccessful():
+        exit(0)
+    else:
+        exit(1)
@@ -0,0 +1,27 @@
+import unittest
+
+from . import test_FAST_fatigue
+from . import test_FAST_reader
+from . import test_FAST_writer
+from . import test_FAST_wrapper
+from . import test_FAST_cache
+from . import test_CaseGen_IEC
+from . import test_FAST_post
+from . import test_ReadFASTout
+
+def suite():
+    suite = unittest.TestSuite( (test_FAST_fatigue.suite(),
+    test_FAST_reader.suite(),
+    test_FAST_writer.suite(),
+    test_FAST_wrapper.suite(),
+    test_FAST_cache.suite(),
+    test_CaseGen_IEC.suite(),
+    test_FAST_post.suite(),
+    test_ReadFASTout.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
+        
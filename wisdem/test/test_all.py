@@ -1,5 +1,6 @@
 import unittest
 
+import wisdem.test.test_aeroelasticse as test_aeroelasticse
 import wisdem.test.test_airfoilprep as test_airfoilprep
 import wisdem.test.test_ccblade as test_ccblade
 import wisdem.test.test_commonse as test_commonse
@@ -17,6 +18,7 @@ import wisdem.test.test_wisdem as test_wisdem
 
 def suite():
     suite = unittest.TestSuite( (
+        test_aeroelasticse.test_all.suite(),
         test_airfoilprep.test_all.suite(),
         test_ccblade.test_all.suite(),
         test_commonse.test_all.suite(),
@@ -27,7 +29,7 @@ def suite():
         test_plant_financese.test_all.suite(),
         test_pyframe3dd.test_all.suite(),
         #test_pymap.test_all.suite(),
-        #test_rotorse.test_all.suite(),
+        test_rotorse.test_all.suite(),
         #test_towerse.test_all.suite(),
         test_turbinecostsse.test_all.suite()
         #test_wisdem.test_all.suite()                                 
@@ -120,6 +120,92 @@ class TestNREL5MW(unittest.TestCase):
 
 
 
+    def test_vectorized(self):
+
+        Uinf = np.array([3., 8., 11., 16., 25.])
+        Omega = np.array([6.972, 9.156, 11.890, 12.100, 0.0])
+        pitch = np.array([0.000, 0.000, 0.000, 12.055, 90.0])
+
+        P, T, Q, M = self.rotor.evaluate(Uinf, Omega, pitch)
+        Np, Tp = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+
+        self.rotor.vectorized = True
+        Pv, Tv, Qv, Mv = self.rotor.evaluate(Uinf, Omega, pitch)
+        Npv, Tpv = self.rotor.distributedAeroLoads(Uinf[1], Omega[1], pitch[1], 90.0)
+
+        np.testing.assert_allclose(Pv, P, rtol=1e-10, atol=1e-6)
+        np.testing.assert_allclose(Tv, T, rtol=1e-10, atol=1e-6)
+        np.testing.assert_allclose(Qv, Q, rtol=1e-10, atol=1e-6)
+        np.testing.assert_allclose(Mv, M, rtol=1e-10, atol=1e-6)
+        np.testing.assert_allclose(Npv, Np, rtol=1e-10, atol=1e-8)
+        np.testing.assert_allclose(Tpv, Tp, rtol=1e-10, atol=1e-8)
+
+
+    def test_loads_multi(self):
+
+        Uinf = np.array([11., 11., 70., 16.])
+        Omega = np.array([11.890, 11.890, 0.0, 12.100])
+        pitch = np.array([0.000, 0.000, 0.000, 12.055])
+        azimuth = np.array([180., 0., 90., 120.])
+
+        Npm, Tpm = self.rotor.distributedAeroLoadsMulti(Uinf, Omega, pitch, azimuth)
+        self.rotor.vectorized = True
+        Npv, Tpv = self.rotor.distributedAeroLoadsMulti(Uinf, Omega, pitch, azimuth)
+        self.rotor.vectorized = False
+
+        for i in range(len(Uinf)):
+            Np, Tp = self.rotor.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth[i])
+            np.testing.assert_allclose(Npm[i], Np, rtol=1e-10, atol=1e-8)
+            np.testing.assert_allclose(Tpm[i], Tp, rtol=1e-10, atol=1e-8)
+            np.testing.assert_allclose(Npv[i], Np, rtol=1e-10, atol=1e-8)
+            np.testing.assert_allclose(Tpv[i], Tp, rtol=1e-10, atol=1e-8)
+
+
+    def test_airfoil_vectorized(self):
+
+        af = self.rotor.af[-1]
+        alpha = np.radians(np.linspace(-20., 30., 11))
+        Re = np.linspace(1e6, 1e7, 11)
+
+        cl, cd, cm, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = af.evaluate_vectorized(alpha, Re, return_cm=True, return_derivatives=True)
+
+        for i in range(len(alpha)):
+            cl_i, cd_i, cm_i = af.evaluate(alpha[i], Re[i], return_cm=True)
+            dcl_dalpha_i, dcl_dRe_i, dcd_dalpha_i, dcd_dRe_i = af.derivatives(alpha[i], Re[i])
+            self.assertAlmostEqual(cl[i], cl_i, 12)
+            self.assertAlmostEqual(cd[i], cd_i, 12)
+            self.assertAlmostEqual(cm[i], cm_i, 12)
+            self.assertAlmostEqual(dcl_dalpha[i], dcl_dalpha_i, 12)
+            self.assertAlmostEqual(dcl_dRe[i], dcl_dRe_i, 12)
+            self.assertAlmostEqual(dcd_dalpha[i], dcd_dalpha_i, 12)
+            self.assertAlmostEqual(dcd_dRe[i], dcd_dRe_i, 12)
+
+    def test_airfoil_cache(self):
+
+        alpha = np.linspace(-180., 180., 73)
+        Re = [1e6]
+        cl = 2*np.pi*np.sin(np.radians(alpha))[:, np.newaxis]
+        cd = 0.01 + 1.5*(1 - np.cos(np.radians(2*alpha)))[:, np.newaxis]
+
+        CCAirfoil.clear_cache()
+        af1 = CCAirfoil.cached(alpha, Re, cl, cd)
+        af2 = CCAirfoil.cached(alpha.copy(), Re, cl.copy(), cd.copy())
+        af3 = CCAirfoil.cached(alpha, Re, 1.1*cl, cd)
+        self.assertIs(af1, af2)
+        self.assertIsNot(af1, af3)
+        np.testing.assert_equal(af1.evaluate(0.1, 1e6), CCAirfoil(alpha, Re, cl, cd).evaluate(0.1, 1e6))
+
+        # least recently used entries are evicted first
+        cache_size = CCAirfoil.cache_size
+        CCAirfoil.cache_size = 2
+        CCAirfoil.cached(alpha, Re, cl, cd)
+        CCAirfoil.cached(alpha, Re, 1.2*cl, cd)
+        self.assertIs(CCAirfoil.cached(alpha, Re, cl, cd), af1)
+        self.assertIsNot(CCAirfoil.cached(alpha, Re, 1.1*cl, cd), af3)
+        CCAirfoil.cache_size = cache_size
+        CCAirfoil.clear_cache()
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestNREL5MW))
@@ -0,0 +1,73 @@
+"""
+Timing of the shell buckling utilities: the section by section (scalar) path against the array path.
+
+python benchmark_utilizationSupplement.py [number of sections]
+"""
+import sys
+import timeit
+import numpy as np
+from scipy.optimize import brentq
+
+import wisdem.commonse.UtilizationSupplement as util
+
+
+def eurocode_scalar(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma_y, gamma_f=1.2, gamma_b=1.1):
+    # previous shellBucklingEurocode, one section at a time
+    r = 0.5*d - 0.5*t
+    return np.array([util._shellBucklingOneSection(L_reinforced[i], r[i], r[i], t[i], gamma_b, gamma_f*abs(sigma_z[i]),
+                                                   gamma_f*abs(sigma_t[i]), gamma_f*abs(tau_zt[i]), E[i], sigma_y[i])
+                     for i in range(d.size)])
+
+
+def FthFph_scalar(Fxci, Frci, c1, c2):
+    # previous solveFthFph in shellBuckling_withStiffeners, one brentq per section
+    Fthci = np.zeros(Fxci.shape)
+    for k in range(Fxci.size):
+        try:
+            Fthci[k] = brentq(lambda x: (c2[k]*x/Fxci[k])**2 - c1[k]*(c2[k]*x/Fxci[k])*(x/Frci[k]) + (x/Frci[k])**2 - 1.0,
+                              0, Fxci[k]+Frci[k], maxiter=20)
+        except:
+            Fthci[k] = Fxci[k] + Frci[k]
+    return c2*Fthci, Fthci
+
+
+def FthFph_vectorized(Fxci, Frci, c1, c2):
+    Fmax = Fxci + Frci
+    a = (c2/Fxci)**2 - c1*c2/Fxci/Frci + 1.0/Frci**2
+    Fthci = np.where(a*Fmax**2 >= 1.0, np.sign(Fmax)/np.sqrt(a), Fmax)
+    return c2*Fthci, Fthci
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    number = 20
+    rng = np.random.RandomState(0)
+
+    # tower sections
+    d = rng.uniform(3.0, 8.0, n)
+    t = rng.uniform(0.01, 0.05, n)
+    L = rng.uniform(1.0, 30.0, n)
+    sigma_z, sigma_t, tau_zt = rng.uniform(-2e8, 2e8, (3, n))
+    E = 2e11*np.ones(n)
+    sigma_y = 3.45e8*np.ones(n)
+    args = (d, t, sigma_z, sigma_t, tau_zt, L, E, sigma_y)
+
+    np.testing.assert_allclose(util.shellBucklingEurocode(*args), eurocode_scalar(*args), rtol=1e-12)
+    t_scalar = timeit.timeit(lambda: eurocode_scalar(*args), number=number)/number
+    t_vector = timeit.timeit(lambda: util.shellBucklingEurocode(*args), number=number)/number
+    print('shellBucklingEurocode, %d sections: scalar %.3g s, vectorized %.3g s, speedup %.1fx' %
+          (n, t_scalar, t_vector, t_scalar/t_vector))
+
+    # interaction of axial and hoop stress limits in stiffened columns
+    sy = 3.45e8
+    Fxci = rng.uniform(1e7, 3e8, n)
+    Frci = rng.uniform(1e6, 3e8, n)
+    c1 = (Fxci + Frci)/sy - 1.0
+    c2 = rng.uniform(-5.0, 5.0, n)
+    args = (Fxci, Frci, c1, c2)
+
+    np.testing.assert_allclose(FthFph_vectorized(*args), FthFph_scalar(*args), rtol=1e-10)
+    t_scalar = timeit.timeit(lambda: FthFph_scalar(*args), number=number)/number
+    t_vector = timeit.timeit(lambda: FthFph_vectorized(*args), number=number)/number
+    print('solveFthFph, %d sections: scalar %.3g s, vectorized %.3g s, speedup %.1fx' %
+          (n, t_scalar, t_vector, t_scalar/t_vector))
@@ -4,6 +4,8 @@ from . import test_WindWaveDrag
 from . import test_enum
 from . import test_environment
 from . import test_frustum
+from . import test_mpi_tools
+from . import test_parallel_fd
 from . import test_tube
 from . import test_utilities
 from . import test_utilizationSupplement
@@ -17,6 +19,8 @@ def suite():
                                  test_enum.suite(),
                                  test_environment.suite(),
                                  test_frustum.suite(),
+                                 test_mpi_tools.suite(),
+                                 test_parallel_fd.suite(),
                                  test_tube.suite(),
                                  test_utilities.suite(),
                                  test_utilizationSupplement.suite(),
@@ -0,0 +1,121 @@
+import sys
+import types
+import unittest
+
+from wisdem.commonse.mpi_tools import subprocessor_map
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class FakeStatus(object):
+
+    def __init__(self):
+        self.source = None
+
+    def Get_source(self):
+        return self.source
+
+
+class FakeComm(object):
+    """ COMM_WORLD whose worker ranks run a task as soon as it is sent.  The simulated run time of a task
+    is duration(args), recv returns the result of the rank that finishes first. """
+
+    def __init__(self, duration):
+        self.duration = duration
+        self.time     = 0.
+        self.running  = {}
+        self.sent     = []
+
+    def send(self, msg, dest, tag):
+        func, args = msg
+        self.sent.append((dest, args))
+        self.running[dest] = (self.time + self.duration(args), func(args))
+
+    def recv(self, source, tag, status):
+        rank = min(self.running.keys(), key=lambda r: (self.running[r][0], r))
+        self.time, data = self.running.pop(rank)
+        status.source = rank
+        return data
+
+
+def square(args):
+    return args[-1]**2
+
+
+class TestSubprocessorMap(unittest.TestCase):
+
+    def setUp(self):
+        self.cost = [2., 5., 1., 8., 3., 1., 4.]
+        self.args = [(i,) for i in range(len(self.cost))]
+        self.comm = FakeComm(lambda args: self.cost[args[-1]])
+
+        MPI = types.ModuleType('mpi4py.MPI')
+        MPI.COMM_WORLD  = self.comm
+        MPI.ANY_SOURCE  = -1
+        MPI.Status      = FakeStatus
+        mpi4py = types.ModuleType('mpi4py')
+        mpi4py.MPI = MPI
+        self.patch = mock.patch.dict(sys.modules, {'mpi4py': mpi4py, 'mpi4py.MPI': MPI})
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def testOrder(self):
+        out = subprocessor_map(square, self.args, [1, 2, 3], cost=self.cost)
+        self.assertEqual(out, [i**2 for i in range(len(self.cost))])
+
+        # most expensive task first, the others in decreasing cost
+        sent = [args[-1] for rank, args in self.comm.sent]
+        self.assertEqual(sent[0], 3)
+        self.assertEqual(sent, sorted(range(len(self.cost)), key=lambda i: -self.cost[i]))
+        self.assertEqual([rank for rank, args in self.comm.sent[:3]], [1, 2, 3])
+
+        # without costs, in the order of args_list
+        self.comm.sent = []
+        out = subprocessor_map(square, self.args, [1, 2, 3])
+        self.assertEqual(out, [i**2 for i in range(len(self.cost))])
+        self.assertEqual([args[-1] for rank, args in self.comm.sent], list(range(len(self.cost))))
+
+    def testDynamicBalancing(self):
+        # the rank running the long task does not get another one until the others are done
+        self.cost = [10., 1., 1., 1., 1.]
+        self.args = [(i,) for i in range(len(self.cost))]
+        out = subprocessor_map(square, self.args, [1, 2], cost=self.cost)
+        self.assertEqual(out, [i**2 for i in range(len(self.cost))])
+        self.assertEqual([rank for rank, args in self.comm.sent], [1, 2, 2, 2, 2])
+
+    def testArgsFirst(self):
+        out = subprocessor_map(square, self.args, [1, 2, 3], cost=self.cost, args_first=lambda args: ('first',) + args)
+        self.assertEqual(out, [i**2 for i in range(len(self.cost))])
+
+        for rank in [1, 2, 3]:
+            args_rank = [args for rank_i, args in self.comm.sent if rank_i == rank]
+            self.assertEqual(args_rank[0][0], 'first')
+            self.assertEqual(len([args for args in args_rank if args[0] == 'first']), 1)
+
+    def testFewTasks(self):
+        out = subprocessor_map(square, self.args[:2], [1, 2, 3], args_first=lambda args: ('first',) + args)
+        self.assertEqual(out, [0, 1])
+        self.assertEqual(self.comm.sent, [(1, ('first', 0)), (2, ('first', 1))])
+        self.assertEqual(subprocessor_map(square, [], [1, 2]), [])
+
+    def testNoRanks(self):
+        self.assertRaises(ValueError, subprocessor_map, square, self.args, [])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestSubprocessorMap))
+    return suite
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(suite())
+
+    if result.wasSuccessful():
+        exit(0)
+    else:
+        exit(1)
@@ -0,0 +1,75 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, ScipyOptimizeDriver
+from wisdem.commonse.parallel_fd import ScipyOptimizeDriverParallelFD
+
+
+def build(driver):
+    prob = Problem()
+    ivc = prob.model.add_subsystem('ivc', IndepVarComp(), promotes=['*'])
+    ivc.add_output('x', np.array([3.0, -1.0]))
+    ivc.add_output('y', -4.0)
+    prob.model.add_subsystem('obj', ExecComp('f = (x[0]-3.0)**2 + x[0]*x[1]*y + (y+4.0)**2 - 3.0 + x[1]**2', x=np.zeros(2)), promotes=['*'])
+    prob.model.add_subsystem('con', ExecComp('c = x*y + x**3', c=np.zeros(2), x=np.zeros(2)), promotes=['*'])
+
+    prob.driver = driver
+    prob.model.add_design_var('x', lower=-50.0, upper=50.0, scaler=2.0)
+    prob.model.add_design_var('y', lower=-50.0, upper=50.0)
+    prob.model.add_objective('f', ref=10.0)
+    prob.model.add_constraint('c', upper=100.0)
+    prob.model.approx_totals(method='fd', step=1e-7)
+    prob.setup()
+    prob.run_model()
+    return prob
+
+
+class TestParallelFD(unittest.TestCase):
+
+    def setUp(self):
+        self.ref = build(ScipyOptimizeDriver(optimizer='SLSQP', disp=False))
+        self.J_ref = self.ref.driver._compute_totals(return_format='array')
+
+    def testSerial(self):
+        driver = ScipyOptimizeDriverParallelFD(optimizer='SLSQP', disp=False)
+        driver.options['fd_cores'] = 1
+        driver.options['fd_form'] = 'central'
+        prob = build(driver)
+        J = prob.driver._compute_totals(return_format='array')
+        npt.assert_allclose(J, self.J_ref, rtol=1e-5, atol=1e-5)
+
+        # model is returned to the base point
+        npt.assert_allclose(prob['f'], self.ref['f'])
+
+    def testPool(self):
+        driver = ScipyOptimizeDriverParallelFD(optimizer='SLSQP', disp=False)
+        driver.options['fd_cores'] = 2
+        prob = build(driver)
+        J = prob.driver._compute_totals(return_format='array')
+        npt.assert_allclose(J, self.J_ref, rtol=1e-5, atol=1e-5)
+
+        # same keys and blocks as the native total derivatives
+        totals = prob.driver._compute_totals()
+        totals_ref = build(ScipyOptimizeDriver(optimizer='SLSQP', disp=False)).driver._compute_totals()
+        self.assertEqual(list(totals), list(totals_ref))
+        for key in totals_ref:
+            npt.assert_allclose(totals[key], totals_ref[key], rtol=1e-5, atol=1e-5)
+
+    def testOptimization(self):
+        driver = ScipyOptimizeDriverParallelFD(optimizer='SLSQP', disp=False)
+        driver.options['fd_cores'] = 2
+        prob = build(driver)
+        prob.run_driver()
+
+        self.ref.run_driver()
+        npt.assert_allclose(prob['x'], self.ref['x'], rtol=1e-4, atol=1e-4)
+        npt.assert_allclose(prob['y'], self.ref['y'], rtol=1e-4, atol=1e-4)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestParallelFD))
+    return suite
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
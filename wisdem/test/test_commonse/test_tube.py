@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import unittest
+from openmdao.api import Problem
 from wisdem.commonse.tube import Tube, CylindricalShellProperties
 
 npts = 100
@@ -34,6 +35,18 @@ class TestTube(unittest.TestCase):
         npt.assert_almost_equal(self.unknowns['Ixx'],  np.pi*369.0/4.0)
         npt.assert_almost_equal(self.unknowns['Iyy'],  np.pi*369.0/4.0)
         npt.assert_almost_equal(self.unknowns['Jz'],  np.pi*369.0/2.0)
+
+    def testDerivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('tube', CylindricalShellProperties(nFull=6), promotes=['*'])
+        prob.setup()
+        prob['d'] = np.array([8.0, 7.5, 7.0, 6.2, 6.5, 5.0])
+        prob['t'] = np.array([0.05, 0.04, 0.045, 0.03, 0.02])
+        prob.run_model()
+
+        data = prob.check_partials(out_stream=None, form='central')
+        for key, val in data['tube'].items():
+            npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-6, err_msg=str(key))
         
 def suite():
     suite = unittest.TestSuite()
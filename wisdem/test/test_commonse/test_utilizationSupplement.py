@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import unittest
+from openmdao.api import Problem
 import wisdem.commonse.UtilizationSupplement as util
 
 from wisdem.commonse import gravity as g
@@ -203,6 +204,49 @@ class TestUtilization(unittest.TestCase):
         npt.assert_almost_equal(external_local_unity, 1.07, 1)
         npt.assert_almost_equal(external_general_unity, 0.59, 1)
 
+
+    def testShellBucklingVectorized(self):
+        # Sections spanning the smoothed regions of Cx, Ctheta and Ctau (r/t = 100), compared with the one section routine
+        omega = np.array([0.5, 1.7, 10.0, 50.0, 150.0, 244.5, 650.0, 870.0, 1000.0])
+        t = 0.03*np.ones(omega.shape)
+        d = 2*3.0 + t
+        L = omega*np.sqrt(3.0*t)
+        sigma_z = np.array([1e8, -2e8, 5e7, 2e6, -3e7, 1e8, 2e8, 1e6, 1e5])
+        sigma_t = np.array([1e7, 2e7, -5e7, 1e6, 3e7, -1e8, 1e6, 1e5, 1e4])
+        tau_zt = np.array([1e6, 1e7, 5e6, 1e5, -3e6, 1e7, 2e7, 1e4, 1e3])
+        E = 2e11*np.ones(d.shape)
+        sigma_y = 3.45e8*np.ones(d.shape)
+
+        EU = util.shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L, E, sigma_y)
+
+        r = 0.5*(d - t)
+        for k in range(d.size):
+            EU_k = util._shellBucklingOneSection(L[k], r[k], r[k], t[k], 1.1, 1.2*abs(sigma_z[k]), 1.2*abs(sigma_t[k]),
+                                                 1.2*abs(tau_zt[k]), E[k], sigma_y[k])
+            self.assertAlmostEqual(EU[k]/EU_k, 1.0, 12)
+
+        # tapered sections
+        sigma_z, sigma_t, tau_zt = np.abs(sigma_z), np.abs(sigma_t), np.abs(tau_zt)
+        EU = util._shellBuckling_vectorized(L, r, 0.8*r, t, 1.1, sigma_z, sigma_t, tau_zt, E, sigma_y)
+        for k in range(d.size):
+            EU_k = util._shellBucklingOneSection(L[k], r[k], 0.8*r[k], t[k], 1.1, sigma_z[k], sigma_t[k], tau_zt[k],
+                                                 E[k], sigma_y[k])
+            self.assertAlmostEqual(EU[k]/EU_k, 1.0, 12)
+
+
+    def testGeometricConstraintsDerivatives(self):
+        for diamFlag in [True, False]:
+            prob = Problem()
+            prob.model.add_subsystem('geom', util.GeometricConstraints(nPoints=6, diamFlag=diamFlag), promotes=['*'])
+            prob.setup()
+            prob['d'] = np.array([8.0, 7.5, 7.0, 6.2, 6.5, 5.0])
+            prob['t'] = np.array([0.05, 0.04, 0.045, 0.03, 0.02])
+            prob.run_model()
+
+            data = prob.check_partials(out_stream=None, form='central')
+            for key, val in data['geom'].items():
+                npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-6, err_msg=str(key))
+
         
 def suite():
     suite = unittest.TestSuite()
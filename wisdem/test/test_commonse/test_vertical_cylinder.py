@@ -1,7 +1,9 @@
 import numpy as np
 import numpy.testing as npt
 import unittest
+from openmdao.api import Problem
 import wisdem.commonse.vertical_cylinder as vc
+from wisdem.commonse.tube import CylindricalShellProperties
 from wisdem.commonse.utilities import nodal2sectional
 
 npts = 100
@@ -97,11 +99,72 @@ class TestMass(unittest.TestCase):
         npt.assert_almost_equal(self.unknowns['mass'].sum(), expect)
         '''
 
+
+class TestFrame(unittest.TestCase):
+    def setUp(self):
+        n = 11
+        z = np.linspace(0, 80.0, n)
+        d = np.linspace(6.0, 4.0, n)
+        t = 0.03*np.ones(n-1)
+        props = Problem()
+        props.model.add_subsystem('props', CylindricalShellProperties(nFull=n), promotes=['*'])
+        props.setup()
+        props['d'] = d
+        props['t'] = t
+        props.run_model()
+
+        self.inputs = {'z':z, 'd':d, 't':t, 'E':2e11, 'G':7.93e10, 'rho':7850.0, 'sigma_y':3.45e8,
+                       'L_reinforced':30.0, 'dx':5.0,
+                       'kidx':[0], 'kx':[vc.RIGID], 'ky':[vc.RIGID], 'kz':[vc.RIGID],
+                       'ktx':[vc.RIGID], 'kty':[vc.RIGID], 'ktz':[vc.RIGID],
+                       'midx':[n-1], 'm':[3e5], 'mIxx':[1e8], 'mIyy':[2e7], 'mIzz':[2e7], 'mrhox':[-1.0], 'mrhoz':[0.5],
+                       'plidx':[n-1]}
+        for k in ['Az','Asx','Asy','Jz','Ixx','Iyy']:
+            self.inputs[k] = props[k]
+
+        # two load cases
+        self.loads = [{'Fx':[1.3e6], 'Fz':[-2.9e6], 'Mxx':[4e6], 'Myy':[-2.3e6], 'Mzz':[-3.5e5],
+                       'Px':np.linspace(1e3, 3e3, n), 'Py':np.zeros(n), 'Pz':np.zeros(n), 'qdyn':np.linspace(50.0, 150.0, n)},
+                      {'Fx':[9.3e5], 'Fy':[2e5], 'Fz':[-2.9e6], 'Mxx':[-1.7e6], 'Myy':[-2.5e6], 'Mzz':[1.5e5],
+                       'Px':np.linspace(5e3, 9e3, n), 'Py':np.linspace(1e3, 2e3, n), 'Pz':np.zeros(n), 'qdyn':np.linspace(1e3, 3e3, n)}]
+
+        self.n = n
+
+    def testMultiLoadCase(self):
+        n = self.n
+        prob = Problem()
+        prob.model.add_subsystem('single', vc.CylinderFrame3DD(npts=n, nK=1, nMass=1, nPL=1))
+        prob.model.add_subsystem('multi', vc.CylinderFrame3DD(npts=n, nK=1, nMass=1, nPL=1, nLC=2))
+        prob.setup()
+        for k in self.inputs:
+            prob['single.'+k] = self.inputs[k]
+            prob['multi.'+k] = self.inputs[k]
+        for iLC, load in enumerate(self.loads):
+            for k in load:
+                prob['multi.'+k+str(iLC+1)] = load[k]
+
+        for iLC, load in enumerate(self.loads):
+            for k in load:
+                prob['single.'+k] = load[k]
+            prob.run_model()
+
+            lc = str(iLC+1)
+            npt.assert_equal(prob['multi.mass'], prob['single.mass'])
+            npt.assert_allclose(prob['multi.f1'], prob['single.f1'], rtol=1e-12)
+            npt.assert_allclose(prob['multi.f2'], prob['single.f2'], rtol=1e-12)
+            for k in ['top_deflection','Fz_out','Vx_out','Vy_out','Mxx_out','Myy_out','Mzz_out','base_F','base_M',
+                      'axial_stress','shear_stress','hoop_stress','hoop_stress_euro']:
+                npt.assert_allclose(prob['multi.'+k+lc], prob['single.'+k], rtol=1e-10, atol=1e-6)
+
+        # the load cases are different
+        self.assertNotAlmostEqual(prob['multi.top_deflection1'][0], prob['multi.top_deflection2'][0])
+
         
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestDiscretization))
     suite.addTest(unittest.makeSuite(TestMass))
+    suite.addTest(unittest.makeSuite(TestFrame))
     return suite
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import unittest
+from openmdao.api import Problem
 import wisdem.floatingse.column as column
 from wisdem.commonse.utilities import nodal2sectional
 from wisdem.commonse import gravity as g
@@ -65,6 +66,22 @@ class TestBulk(unittest.TestCase):
         self.bulk.compute(self.inputs, self.outputs)
         self.assertGreater(self.outputs['bulkhead_cost'], 2e3)
 
+    def testDerivatives(self):
+        prob = Problem()
+        prob.model.add_subsystem('bulk', column.BulkheadProperties(nSection=5, nFull=NPTS), promotes=['*'])
+        prob.setup()
+        for k in self.inputs:
+            prob[k] = self.inputs[k]
+        # Non-zero thickness everywhere, capping the ends with the wall thickness is not differentiable
+        prob['bulkhead_thickness'] = 0.05 * np.array([0.5, 1.0, 0.3, 1.2, 0.2, 0.7])
+        prob['d_full'] = 10.0 + np.linspace(0, 1, NPTS)
+        prob['t_full'] = 0.05 + 0.01*np.sin(np.arange(NPTS-1))
+        prob.run_model()
+
+        data = prob.check_partials(out_stream=None, form='central')
+        for key, val in data['bulk'].items():
+            npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-5*np.abs(val['J_fd']).max(), err_msg=str(key))
+
 
 class TestBuoyancyTank(unittest.TestCase):
     def setUp(self):
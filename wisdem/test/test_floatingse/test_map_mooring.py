@@ -161,6 +161,26 @@ class TestMapMooring(unittest.TestCase):
         self.assertEqual(np.count_nonzero(self.outputs['operational_heel_restoring_force']), 9)
         self.assertGreater(np.count_nonzero(self.outputs['mooring_plot_matrix']), 9*20-3)
 
+    def testRunMapReuse(self):
+        self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+        mymap = self.mymap.mymap
+        K = self.outputs['mooring_stiffness'].copy()
+
+        # Only the vessel displacements change, same MAP++ instance
+        self.inputs['max_offset'] = 12.0
+        self.inputs['operational_heel'] = 8.0
+        self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+        self.assertIs(self.mymap.mymap, mymap)
+        npt.assert_allclose(self.outputs['mooring_stiffness'], K, rtol=1e-6, atol=1e-6*np.abs(K).max())
+
+        # New line length, new MAP++ instance
+        self.inputs['mooring_line_length'] += 1.0
+        self.mymap.runMAP(self.inputs, self.discrete_inputs, self.outputs)
+        self.assertIsNot(self.mymap.mymap, mymap)
+
+        self.mymap.end_map_session()
+        self.assertIsNone(self.mymap.mymap)
+
     def testCost(self):
         self.mymap.compute_cost(self.inputs, self.discrete_inputs, self.outputs)
     
@@ -176,6 +196,29 @@ class TestMapMooring(unittest.TestCase):
         mymap.displace_vessel(0, 0, 0, 0, 10, 0)
         mymap.update_states(0.0, 0)
         mymap.end()
+
+    def testOffsetSweep(self):
+        mymap = pyMAP( )
+        mymap.map_set_sea_depth(self.inputs['water_depth'])
+        mymap.map_set_gravity(g)
+        mymap.map_set_sea_density(self.inputs['water_density'])
+        mymap.read_list_input(truth)
+        mymap.init( )
+
+        angles = np.deg2rad(np.arange(0.0, 360.0, 30.0))
+        disp = np.zeros((angles.size, 6))
+        disp[:,0] = 10.0*np.cos(angles)
+        disp[:,1] = 10.0*np.sin(angles)
+        disp[:,4] = 2.0
+        forces = np.array( mymap.offset_vessel_sweep(disp) )
+        self.assertEqual(forces.shape, (angles.size, 3, 3))
+
+        for i in range(angles.size):
+            mymap.displace_vessel(*disp[i])
+            mymap.update_states(0.0, 0)
+            for k in range(3):
+                npt.assert_allclose(forces[i,k], mymap.get_fairlead_force_3d(k), rtol=1e-5)
+        mymap.end()
         
         
 def suite():
@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.testing as npt
 import unittest
+from openmdao.api import Problem
 import wisdem.floatingse.substructure as subs
 
 from wisdem.commonse import gravity as g
@@ -240,6 +241,70 @@ class TestSubs(unittest.TestCase):
         ind = T_struct<T_wave_high
         npt.assert_equal(self.outputs['modal_margin_low'][ind], T_struct[ind]/T_wave_low[ind] )
         
+    def testGeometryDerivatives(self):
+        for ncolumn in [3, 0]:
+            prob = Problem()
+            prob.model.add_subsystem('geom', subs.SubstructureGeometry(nFull=4, nFullTow=3), promotes=['*'])
+            prob.setup()
+            prob['number_of_offset_columns'] = ncolumn
+            prob['Rhub'] = 3.0
+            prob['tower_d_full'] = np.array([10.0, 8.0, 6.0])
+            prob['main_d_full'] = np.array([20.0, 21.0, 19.0, 12.0])
+            prob['offset_d_full'] = np.array([18.0, 16.0, 17.0, 13.0])
+            prob['offset_z_nodes'] = np.array([-35.0, -20.0, -15.0, 15.0])
+            prob['main_z_nodes'] = np.array([-45.0, -25.0, -15.0, 15.0])
+            prob['radius_to_offset_column'] = 25.0
+            prob['fairlead_location'] = 0.35
+            prob['fairlead_offset_from_shell'] = 1.0
+            prob['offset_freeboard'] = 10.0
+            prob['offset_draft'] = 15.0
+            prob['Hs'] = 4.0
+            prob['max_survival_heel'] = 10.0
+            prob.run_model()
+
+            data = prob.check_partials(out_stream=None, form='central')
+            for key, val in data['geom'].items():
+                if key[1] == 'number_of_offset_columns': continue # integer input
+                npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-5, atol=1e-6, err_msg=str(key))
+
+        
+    def testDerivatives(self):
+        nFull, nFullTow = 6, 4
+        self.inputs['total_displacement'] = 30.0
+        self.inputs['water_density'] = 1025.0
+        self.inputs['structure_center_of_mass'] = np.array([0.3, -0.2, 20.0])
+        self.inputs['structural_frequencies'] = np.array([0.055, 0.2, 1.0, 0.3, 0.08])
+        self.inputs['total_force'] = np.array([26.0, 3.0, 4.0])
+        self.inputs['total_moment'] = np.array([1e3, 5e4, 2e3])
+        # All lines loaded, the number of lines is counted from the non-zero z-forces
+        self.inputs['mooring_pitch_restoring_force'] = 1e5*np.c_[np.linspace(1.0, 0.3, 15), np.linspace(0.2, 1.0, 15), np.linspace(0.5, 1.1, 15)]
+        self.inputs['mooring_stiffness'] = np.diag([1e3, 2e3, 3e3, 4e5, 5e5, 6e3]) + 10.0
+        self.inputs['fairlead'] = 5.5
+        self.inputs['operational_heel'] = 7.0
+        self.inputs['main_mass'] = np.linspace(2, 5, nFull-1)
+        self.inputs['main_moments_of_inertia'] = 1e2 * np.array([10.0, 11.0, 2.0, 0.1, 0.2, 0.3])
+        self.inputs['offset_mass'] = np.linspace(1, 2, nFull-1)
+        self.inputs['tower_z_full'] = np.linspace(1, 90, nFullTow)
+        self.inputs['rna_cg'] = np.array([-1.0, 0.5, 5.0])
+        self.inputs['water_ballast_radius_vector'] = np.array([3.0, 2.8, 2.5, 2.6, 2.2, 2.0])
+        self.inputs['water_ballast_zpts_vector'] = np.array([-10.5, -9.1, -8.3, -7.2, -6.1, -5.0])
+
+        prob = Problem()
+        prob.model.add_subsystem('subs', subs.Substructure(nFull=nFull, nFullTow=nFullTow), promotes=['*'])
+        prob.setup()
+        for k in self.inputs:
+            try:
+                prob[k] = self.inputs[k]
+            except KeyError:
+                pass
+        prob.run_model()
+
+        data = prob.check_partials(out_stream=None, form='central', step_calc='rel')
+        for key, val in data['subs'].items():
+            if key[1] == 'number_of_offset_columns': continue # integer input
+            npt.assert_allclose(val['J_fwd'], val['J_fd'], rtol=1e-4, atol=1e-4*np.abs(val['J_fd']).max(), err_msg=str(key))
+
+        
     def testCost(self):
         self.mysemi.compute_costs(self.inputs, self.outputs)
         c_expect = 256.0 + 512.0 + 32.0 + 3*64.0 + 2e5
@@ -363,6 +363,49 @@ class TestPyBeam(unittest.TestCase):
         zv = np.linspace(z[0], z[-1], npts)
         self.assertNotIn( beam.axialStrain(npts, xv, yv, zv).sum(), badlist)
 
+    def testMultipleLoadCases(self):
+        # several distributed load cases on one beam should match one beam per load case
+
+        nodes = 6
+        ncases = 3
+
+        tip = pb.TipData(0.0, np.zeros(3), np.zeros(6), [1.0, -2.0, 3.0], [0.5, 0.0, -1.0])
+
+        base = pb.BaseData(np.ones(6), 1.0)
+
+        z = np.linspace(0.0, 10.0, nodes)
+        EIx = np.linspace(10.0, 2.0, nodes)
+        EIy = np.linspace(20.0, 3.0, nodes)
+        EA = 100.0*np.ones(nodes)
+        GJ = 5.0*np.ones(nodes)
+        rhoA = rhoJ = np.ones(nodes)
+        sec = pb.SectionData(nodes, z, EA, EIx, EIy, GJ, rhoA, rhoJ)
+
+        Fx_pt = np.zeros(nodes)
+        Fx_pt[2] = -1.5
+        My_pt = np.zeros(nodes)
+        My_pt[3] = 2.0
+        Fy_pt = Fz_pt = Mx_pt = Mz_pt = np.zeros(nodes)
+
+        Px = np.array([np.linspace(-1.0, 0.0, nodes), np.ones(nodes), np.sin(z)]).T
+        Py = np.array([np.zeros(nodes), np.linspace(0.0, 2.0, nodes), np.cos(z)]).T
+        Pz = np.array([np.ones(nodes), np.zeros(nodes), -z]).T
+
+        loads = pb.Loads(nodes, np.zeros(nodes), np.zeros(nodes), np.zeros(nodes), Fx_pt, Fy_pt, Fz_pt, Mx_pt, My_pt, Mz_pt)
+        beam = pb.Beam(sec, loads, tip, base)
+        disp_multi = beam.displacementMulti(Px, Py, Pz)
+        shear_multi = beam.shearAndBendingMulti(Px, Py, Pz)
+
+        for j in range(ncases):
+            loads = pb.Loads(nodes, Px[:,j], Py[:,j], Pz[:,j], Fx_pt, Fy_pt, Fz_pt, Mx_pt, My_pt, Mz_pt)
+            beam_j = pb.Beam(sec, loads, tip, base)
+
+            for d_multi, d in zip(disp_multi, beam_j.displacement()):
+                npt.assert_allclose(d_multi[:,j], d, rtol=1e-10, atol=1e-12)
+
+            for s_multi, s in zip(shear_multi, beam_j.shearAndBending()):
+                npt.assert_allclose(s_multi[:,j], s, rtol=1e-10, atol=1e-12)
+
     def testCurveFEM_FixedBeam_n1(self):
         # Test data from "Consistent Mass Matrix for Distributed Mass Systmes", John Archer,
         # Journal of the Structural Division Proceedings of the American Society of Civil Engineers,
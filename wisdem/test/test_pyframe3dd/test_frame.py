@@ -140,6 +140,8 @@ class FrameTestEXA(unittest.TestCase):
 
         self.displacements, self.forces, self.reactions, self.internalForces, self.mass, self.modal = frame.run()
 
+        self.frame = frame
+
 
 
 
@@ -579,6 +581,9 @@ class FrameTestEXB(unittest.TestCase):
 
         self.displacements, self.forces, self.reactions, self.internalForces, self.mass, self.modal = frame.run()
 
+        self.frame = frame
+        self.elements = elements
+
 
     def test_disp1(self):
 
@@ -799,6 +804,42 @@ class FrameTestEXB(unittest.TestCase):
 
 
 
+    def test_rerun(self):
+
+        disp = np.copy(self.displacements.dx)
+        Nx = np.copy(self.forces.Nx)
+        Mz = np.copy(self.internalForces[1].Mz)
+        freq = np.copy(self.modal.freq)
+
+        # same sizes, the output buffers are reused
+        displacements, forces, reactions, internalForces, mass, modal = self.frame.run()
+        self.assertIs(displacements.dx, self.displacements.dx)
+        np.testing.assert_equal(displacements.dx, disp)
+        np.testing.assert_equal(forces.Nx, Nx)
+        np.testing.assert_equal(internalForces[1].Mz, Mz)
+        np.testing.assert_equal(modal.freq, freq)
+        self.assertEqual(mass.total_mass, self.mass.total_mass)
+
+        # stiffer elements, then back to the original ones
+        stiff = self.elements._replace(E=2*self.elements.E)
+        self.frame.changeElements(stiff)
+        displacements, forces, reactions, internalForces, mass, modal = self.frame.run()
+        self.assertTrue(np.all(np.abs(displacements.dx) <= np.abs(disp)))
+        self.assertFalse(np.allclose(displacements.dx, disp))
+
+        self.frame.changeElements(self.elements)
+        displacements, forces, reactions, internalForces, mass, modal = self.frame.run()
+        np.testing.assert_allclose(displacements.dx, disp, rtol=1e-12, atol=0.0)
+        np.testing.assert_allclose(internalForces[1].Mz, Mz, rtol=1e-12, atol=0.0)
+        np.testing.assert_allclose(modal.freq, freq, rtol=1e-12)
+
+        # different number of load cases, new buffers
+        self.frame.loadCases = self.frame.loadCases[:1]
+        displacements, forces, reactions, internalForces, mass, modal = self.frame.run()
+        self.assertEqual(displacements.dx.shape[0], 1)
+        np.testing.assert_allclose(displacements.dx[0], disp[0], rtol=1e-12, atol=0.0)
+
+
     def test_modal(self):
 
         modal = self.modal
@@ -828,6 +869,74 @@ class FrameTestEXB(unittest.TestCase):
 
 
 
+class FrameTestSparse(unittest.TestCase):
+
+    def compare(self, test):
+
+        frame = test.frame
+        frame.changeOptions(frame.options._replace(solver='sparse'))
+        displacements, forces, reactions, internalForces, mass, modal = frame.run()
+
+        for dense, sparse in [(test.displacements, displacements), (test.forces, forces),
+                              (test.reactions, reactions)] + list(zip(test.internalForces, internalForces)):
+            for name in dense._fields:
+                x = np.asarray(getattr(dense, name), dtype=np.float64)
+                y = np.asarray(getattr(sparse, name), dtype=np.float64)
+                np.testing.assert_allclose(y, x, rtol=1e-6, atol=1e-8*np.abs(x).max())
+
+        if test.modal.freq.size == 0:
+            return
+
+        self.assertAlmostEqual(mass.total_mass, test.mass.total_mass, places=8)
+        self.assertAlmostEqual(mass.struct_mass, test.mass.struct_mass, places=8)
+        for name in ['xmass', 'ymass', 'zmass', 'xinrta', 'yinrta', 'zinrta']:
+            np.testing.assert_allclose(getattr(mass, name), getattr(test.mass, name), rtol=1e-6)
+
+        # the subspace iteration in Frame3DD converges to about 1e-5, the sign of the modes is arbitrary
+        np.testing.assert_allclose(modal.freq, test.modal.freq, rtol=1e-4)
+        for name in ['xmpf', 'ympf', 'zmpf']:
+            x = getattr(test.modal, name)
+            np.testing.assert_allclose(np.abs(getattr(modal, name)), np.abs(x), rtol=1e-2, atol=1e-3*np.abs(x).max())
+        for name in ['xdsp', 'ydsp', 'zdsp', 'xrot', 'yrot', 'zrot']:
+            x = getattr(test.modal, name)[0]
+            np.testing.assert_allclose(np.abs(getattr(modal, name)[0]), np.abs(x), rtol=1e-2, atol=1e-3*np.abs(x).max())
+
+
+    def test_exa(self):
+        test = FrameTestEXA('test_disp1')
+        test.setUp()
+        self.compare(test)
+
+
+    def test_exb(self):
+        test = FrameTestEXB('test_disp1')
+        test.setUp()
+        self.compare(test)
+
+
+    def test_unsupported(self):
+        test = FrameTestEXB('test_disp1')
+        test.setUp()
+        frame = test.frame
+        frame.changeOptions(frame.options._replace(solver='sparse'))
+
+        # matrix condensation
+        i = np.array([1], dtype=np.int32)
+        d = np.zeros(1)
+        frame.changeCondensationData(1, i, d, d, d, d, d, d, i)
+        self.assertRaises(ValueError, frame.run)
+        i = np.array([], dtype=np.int32)
+        d = np.array([])
+        frame.changeCondensationData(0, i, d, d, d, d, d, d, i)
+
+        # Stodola iterations
+        frame.enableDynamics(frame.nM, 2, frame.lump, frame.tol, frame.shift)
+        self.assertRaises(ValueError, frame.run)
+        frame.enableDynamics(frame.nM, 1, frame.lump, frame.tol, frame.shift)
+        frame.run()
+
+
+
 class GravityAdd(unittest.TestCase):
 
     def test_addgrav_working(self):
@@ -917,11 +1026,61 @@ class GravityAdd(unittest.TestCase):
         self.assertAlmostEqual(2*reactions.Fz[0,0], reactions.Fz[2,0])
 
 
+
+class FrameResize(unittest.TestCase):
+
+    def cantilever(self, nnode):
+        # vertical cantilever with a tip load and the element weight, as nodes, reactions, elements, options, load case
+        rigid = 1e16
+        node = np.arange(1, 1+nnode)
+        z = 10.0*np.arange(nnode)/(nnode-1)
+        nodes = NodeData(node, np.zeros(nnode), np.zeros(nnode), z, np.zeros(nnode))
+        reactions = ReactionData(np.array([1]), *([np.array([rigid])]*6 + [rigid]))
+
+        ne = nnode-1
+        elements = ElementData(np.arange(1, nnode), np.arange(1, nnode), np.arange(2, nnode+1),
+                               5.0*np.ones(ne), np.ones(ne), np.ones(ne), np.ones(ne), np.ones(ne), 0.5*np.ones(ne),
+                               1e5*np.ones(ne), 1e4*np.ones(ne), np.zeros(ne), 0.25*np.ones(ne))
+        options = Options(False, False, 1.0)
+
+        load = StaticLoadCase(0.0, 0.0, -10.0)
+        zero = np.array([0.0])
+        load.changePointLoads(np.array([nnode]), np.array([100.0]), zero, zero, zero, zero, zero)
+        return nodes, reactions, elements, options, load
+
+    def run_frame(self, frame, nnode, load):
+        ne = nnode-1
+        frame.changeExtraElementMass(np.arange(1, nnode), 2.0*np.ones(ne), True)
+        frame.clearLoadCases()
+        frame.addLoadCase(load)
+        return frame.run()
+
+    def test_change_size(self):
+        nodes, reactions, elements, options, load = self.cantilever(5)
+        frame = Frame(nodes, reactions, elements, options)
+        self.run_frame(frame, 5, load)
+
+        # fewer nodes first, then fewer elements, and back
+        for nnode in [3, 5]:
+            nodes, reactions, elements, options, load = self.cantilever(nnode)
+            frame.changeNodes(nodes)
+            frame.changeElements(elements)
+            displacements, forces, reactions_out, internalForces, mass, modal = self.run_frame(frame, nnode, load)
+
+            new = self.run_frame(Frame(nodes, reactions, elements, options), nnode, load)
+            self.assertEqual(displacements.dx.shape, (1, nnode))
+            np.testing.assert_equal(displacements.dx, new[0].dx)
+            np.testing.assert_equal(reactions_out.Fz, new[2].Fz)
+            self.assertEqual(mass.total_mass, new[4].total_mass)
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(FrameTestEXA))
     suite.addTest(unittest.makeSuite(FrameTestEXB))
+    suite.addTest(unittest.makeSuite(FrameTestSparse))
     suite.addTest(unittest.makeSuite(GravityAdd))
+    suite.addTest(unittest.makeSuite(FrameResize))
     return suite
 
 if __name__ == '__main__':
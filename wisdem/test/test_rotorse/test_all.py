@@ -0,0 +1,13 @@
+import unittest
+
+from . import test_rotor_aeropower
+
+def suite():
+    suite = unittest.TestSuite( (test_rotor_aeropower.suite(),
+    ) )
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner().run(suite())
+        
@@ -0,0 +1,178 @@
+import numpy as np
+import numpy.testing as npt
+import unittest
+from os import path
+from openmdao.api import Problem, Group
+
+from wisdem.airfoilprep import Airfoil
+from wisdem.rotorse.rotor_aeropower import RegulatedPowerCurve
+
+# NREL 5MW rotor, as in test_ccblade
+r = np.array([2.8667, 5.6000, 8.3333, 11.7500, 15.8500, 19.9500, 24.0500,
+              28.1500, 32.2500, 36.3500, 40.4500, 44.5500, 48.6500, 52.7500,
+              56.1667, 58.9000, 61.6333])
+chord = np.array([3.542, 3.854, 4.167, 4.557, 4.652, 4.458, 4.249, 4.007, 3.748,
+                  3.502, 3.256, 3.010, 2.764, 2.518, 2.313, 2.086, 1.419])
+theta = np.array([13.308, 13.308, 13.308, 13.308, 11.480, 10.162, 9.011, 7.795,
+                  6.544, 5.361, 4.188, 3.125, 2.319, 1.526, 0.863, 0.370, 0.106])
+af_files = ['Cylinder1.dat', 'Cylinder2.dat', 'DU40_A17.dat', 'DU35_A17.dat', 'DU30_A17.dat',
+            'DU25_A17.dat', 'DU21_A17.dat', 'NACA64_A17.dat']
+af_idx = [0, 0, 1, 2, 3, 3, 4, 5, 5, 6, 6, 7, 7, 7, 7, 7, 7]
+naero = len(r)
+n_pc  = 20
+
+# Regulation trajectories of the NREL 5MW rotor from the scalar optimizer based solver (minimize_scalar in
+# Region 2.5 and Region III, SLSQP at rated) that RegulatedPowerCurve used before, by maximum rotor speed (rpm)
+P_rated = 5e6
+trajectory_old = {
+    12.1 : {'rated_V'     : 11.647311,
+            'rated_pitch' : 0.0,
+            'V'           : [3.0, 4.157895, 5.315789, 6.473684, 7.631579, 8.789474, 9.947368, 10.573228, 11.647311, 13.421053,
+                             14.578947, 15.736842, 16.894737, 18.052632, 19.210526, 20.368421, 21.526316, 22.684211, 23.842105, 25.0],
+            'pitch'       : [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 6.844460,
+                             9.165907, 11.14398, 12.92266, 14.56624, 16.10961, 17.57402, 18.97348, 20.31769, 21.61366, 22.86664],
+            'P'           : [23474.472162, 169631.168459, 424708.184128, 819037.760008, 1382952.136936, 2146783.55575, 3140864.257289, 3784734.81626, P_rated, P_rated,
+                             P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated]},
+    9.5  : {'rated_V'     : 12.994364,
+            'rated_pitch' : 2.128925,
+            'V'           : [3.0, 4.157895, 5.315789, 6.473684, 7.631579, 8.301294, 9.947368, 11.105263, 12.263158, 12.994364,
+                             14.578947, 15.736842, 16.894737, 18.052632, 19.210526, 20.368421, 21.526316, 22.684211, 23.842105, 25.0],
+            'pitch'       : [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.394005, -0.28141, 1.267823, 2.128925,
+                             9.177256, 12.000092, 14.417777, 16.591204, 18.593787, 20.465874, 22.232358, 23.909716, 25.509456, 27.040015],
+            'P'           : [23474.472162, 169631.168459, 424708.184128, 819037.760008, 1382952.136936, 1798423.946673, 3027989.402336, 3860249.081955, 4581125.581551, P_rated,
+                             P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated, P_rated]},
+}
+
+
+def polar_grid():
+    # polars of the 5MW airfoils, on a common angle of attack grid
+    basepath = path.join(path.dirname(path.dirname(path.realpath(__file__))), 'test_ccblade', '5MW_AFFiles')
+    aoa      = np.linspace(-180., 180., 361)
+    cl       = np.zeros((len(aoa), naero, 1))
+    cd       = np.zeros((len(aoa), naero, 1))
+    cm       = np.zeros((len(aoa), naero, 1))
+    for k, fname in enumerate(af_files):
+        alpha_k, _, cl_k, cd_k, cm_k = Airfoil.initFromAerodynFile(path.join(basepath, fname)).createDataGrid()
+        for i in np.nonzero(np.array(af_idx) == k)[0]:
+            cl[:,i,0] = np.interp(aoa, alpha_k, cl_k[:,0])
+            cd[:,i,0] = np.interp(aoa, alpha_k, cd_k[:,0])
+            cm[:,i,0] = np.interp(aoa, alpha_k, cm_k[:,0])
+    return aoa, cl, cd, cm
+
+
+def power_curve_problem():
+    aoa, cl, cd, cm = polar_grid()
+
+    prob = Problem(model=Group())
+    prob.model.add_subsystem('powercurve', RegulatedPowerCurve(naero=naero, n_pc=n_pc, n_pc_spline=200,
+                                                               regulation_reg_II5=True, regulation_reg_III=True,
+                                                               n_aoa_grid=len(aoa), n_Re_grid=1), promotes=['*'])
+    prob.setup()
+
+    prob['control_Vin']        = 3.0
+    prob['control_Vout']       = 25.0
+    prob['control_ratedPower'] = 5e6
+    prob['control_minOmega']   = 0.0
+    prob['control_maxOmega']   = 12.1
+    prob['control_maxTS']      = 80.
+    prob['control_tsr']        = 7.55
+    prob['control_pitch']      = 0.0
+    prob['drivetrainType']     = 'GEARED'
+    prob['drivetrainEff']      = 0.0
+
+    prob['r']            = r
+    prob['chord']        = chord
+    prob['theta']        = theta
+    prob['Rhub']         = 1.5
+    prob['Rtip']         = 63.0
+    prob['hub_height']   = 90.0
+    prob['precone']      = 2.5
+    prob['tilt']         = 5.0
+    prob['yaw']          = 0.0
+    prob['airfoils_aoa'] = aoa
+    prob['airfoils_Re']  = np.array([1e6])
+    prob['airfoils_cl']  = cl
+    prob['airfoils_cd']  = cd
+    prob['airfoils_cm']  = cm
+    prob['nBlades']      = 3
+    prob['rho']          = 1.225
+    prob['mu']           = 1.81206e-5
+    prob['shearExp']     = 0.2
+    prob['nSector']      = 4
+    return prob
+
+
+class TestRegulatedPowerCurve(unittest.TestCase):
+
+    def setUp(self):
+        self.prob = power_curve_problem()
+
+    def check_trajectory(self, maxOmega):
+        self.prob['control_maxOmega'] = maxOmega
+        self.prob.run_model()
+
+        ref = trajectory_old[maxOmega]
+        npt.assert_allclose(self.prob['rated_V'], ref['rated_V'], atol=1e-4)
+        npt.assert_allclose(self.prob['rated_pitch'], ref['rated_pitch'], atol=1e-2)
+        npt.assert_allclose(self.prob['V'], ref['V'], atol=1e-4)
+        npt.assert_allclose(self.prob['pitch'], ref['pitch'], atol=1e-2)
+        npt.assert_allclose(self.prob['P'], ref['P'], rtol=1e-6)
+
+    def testRegulationTrajectory(self):
+        self.check_trajectory(12.1)
+
+    def testRegulationTrajectoryRegionIIhalf(self):
+        self.check_trajectory(9.5)
+
+    def testIndependentOfCallHistory(self):
+        # a run at other inputs must not change the solution at the original ones
+        self.prob.run_model()
+        outputs = dict([(var, self.prob[var].copy()) for var in ['V', 'pitch', 'P', 'Omega', 'rated_V', 'rated_pitch']])
+
+        self.prob['control_maxOmega'] = 9.5
+        self.prob.run_model()
+        self.prob['control_maxOmega'] = 12.1
+        self.prob.run_model()
+
+        for var in outputs.keys():
+            npt.assert_array_equal(self.prob[var], outputs[var])
+
+    def testWarmStart(self):
+        # the previous trajectory predicts the pitch table cells, the full tables are only evaluated where it does not
+        comp = self.prob.model.powercurve
+        self.prob.run_model()
+        self.assertIsNotNone(comp.regulation_warm_start)
+
+        table_rows = []
+        power_table = comp._power_table
+        def count_rows(Uhub, Omega, pitch_grid):
+            table_rows.append(len(Uhub))
+            return power_table(Uhub, Omega, pitch_grid)
+        comp._power_table = count_rows
+
+        for maxOmega in [12.0, 11.5]:
+            del table_rows[:]
+            self.prob['control_maxOmega'] = maxOmega
+            self.prob.run_model()
+            self.assertTrue(sum(table_rows) < n_pc // 2)
+
+            # same result as a first call
+            prob_cold = power_curve_problem()
+            prob_cold['control_maxOmega'] = maxOmega
+            prob_cold.run_model()
+            for var in ['V', 'pitch', 'P', 'Omega', 'T', 'Q', 'rated_V', 'rated_pitch']:
+                npt.assert_array_equal(self.prob[var], prob_cold[var])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(TestRegulatedPowerCurve))
+    return suite
+
+if __name__ == '__main__':
+    result = unittest.TextTestRunner().run(suite())
+
+    if result.wasSuccessful():
+        exit(0)
+    else:
+        exit(1)
@@ -156,8 +156,8 @@ class TurbineMass(ExplicitComponent):
     def compute(self, inputs, outputs):
         outputs['turbine_mass'] = inputs['rna_mass'] + inputs['tower_mass']
         
-        cg_rna   = inputs['rna_cg'] + np.array([0.0, 0.0, inputs['hub_height']])
-        cg_tower = np.array([0.0, 0.0, inputs['tower_center_of_mass']])
+        cg_rna   = inputs['rna_cg'] + np.r_[0.0, 0.0, inputs['hub_height']]
+        cg_tower = np.r_[0.0, 0.0, inputs['tower_center_of_mass']]
         outputs['turbine_center_of_mass'] = (inputs['rna_mass']*cg_rna + inputs['tower_mass']*cg_tower) / outputs['turbine_mass']
 
         R = cg_rna
@@ -476,6 +476,7 @@ class TowerSE(Group):
         self.options.declare('wind', default='')
         self.options.declare('topLevelFlag', default=True)
         self.options.declare('monopile', default=False)
+        self.options.declare('frame3ddMultiLC', default=False)
     
     def setup(self):
         nLC           = self.options['nLC']
@@ -485,6 +486,9 @@ class TowerSE(Group):
         wind          = self.options['wind']
         topLevelFlag  = self.options['topLevelFlag']
         self.monopile = self.options['monopile']
+        # Solve all load cases with one Frame3DD component ('tower') instead of one per load case ('tower1', 'tower2', ...).
+        # The modal analysis then runs once, with geometric stiffness it uses the axial loads of the last load case.
+        multiLC       = self.options['frame3ddMultiLC'] and nLC > 1
         
         # Independent variables that are unique to TowerSE
         towerIndeps = IndepVarComp()
@@ -571,13 +575,19 @@ class TowerSE(Group):
             self.add_subsystem('distLoads'+lc, AeroHydroLoads(nPoints=nFull), promotes=['yaw'])
 
             self.add_subsystem('pre'+lc, TowerPreFrame(nFull=nFull), promotes=['monopile','transition_piece_mass','transition_piece_height'])
-            self.add_subsystem('tower'+lc, CylinderFrame3DD(npts=nFull, nK=1, nMass=2, nPL=1), promotes=['E','G','tol','Mmethod','geom','lump','shear',
-                                                                             'nM','shift','sigma_y'])
-            self.add_subsystem('post'+lc, TowerPostFrame(nFull=nFull), promotes=['E','sigma_y','DC','life','m_SN',
-                                                                                 'gamma_b','gamma_f','gamma_fatigue','gamma_m','gamma_n'])
+            if not multiLC:
+                self.add_subsystem('tower'+lc, CylinderFrame3DD(npts=nFull, nK=1, nMass=2, nPL=1), promotes=['E','G','tol','Mmethod','geom','lump','shear',
+                                                                                 'nM','shift','sigma_y'])
+                self.add_subsystem('post'+lc, TowerPostFrame(nFull=nFull), promotes=['E','sigma_y','DC','life','m_SN',
+                                                                                     'gamma_b','gamma_f','gamma_fatigue','gamma_m','gamma_n'])
+
+            # Frame3DD component and suffix of its load case dependent variables
+            tower, tlc = ('tower', lc) if multiLC else ('tower'+lc, '')
+            # the structure (geometry, reactions and extra masses) is shared by all load cases of a multi load case frame
+            structure = not multiLC or iLC == 0
             
-            self.connect('z_full', ['wind'+lc+'.z', 'windLoads'+lc+'.z', 'distLoads'+lc+'.z', 'pre'+lc+'.z', 'tower'+lc+'.z', 'post'+lc+'.z'])
-            self.connect('d_full', ['windLoads'+lc+'.d', 'tower'+lc+'.d', 'pre'+lc+'.d', 'post'+lc+'.d'])
+            self.connect('z_full', ['wind'+lc+'.z', 'windLoads'+lc+'.z', 'distLoads'+lc+'.z', 'pre'+lc+'.z', 'post'+lc+'.z'])
+            self.connect('d_full', ['windLoads'+lc+'.d', 'pre'+lc+'.d', 'post'+lc+'.d'])
             if self.monopile:
                 self.connect('z_full', ['wave'+lc+'.z', 'waveLoads'+lc+'.z'])
                 self.connect('d_full', 'waveLoads'+lc+'.d')
@@ -586,47 +596,62 @@ class TowerSE(Group):
                 self.connect('rna_mass', 'pre'+lc+'.mass')
                 self.connect('rna_cg', 'pre'+lc+'.mrho')
                 self.connect('rna_I', 'pre'+lc+'.mI')
-                self.connect('material_density', 'tower'+lc+'.rho')
-
-            self.connect('pre'+lc+'.kidx', 'tower'+lc+'.kidx')
-            self.connect('pre'+lc+'.kx', 'tower'+lc+'.kx')
-            self.connect('pre'+lc+'.ky', 'tower'+lc+'.ky')
-            self.connect('pre'+lc+'.kz', 'tower'+lc+'.kz')
-            self.connect('pre'+lc+'.ktx', 'tower'+lc+'.ktx')
-            self.connect('pre'+lc+'.kty', 'tower'+lc+'.kty')
-            self.connect('pre'+lc+'.ktz', 'tower'+lc+'.ktz')
-            self.connect('pre'+lc+'.midx', 'tower'+lc+'.midx')
-            self.connect('pre'+lc+'.m', 'tower'+lc+'.m')
-            self.connect('pre'+lc+'.mIxx', 'tower'+lc+'.mIxx')
-            self.connect('pre'+lc+'.mIyy', 'tower'+lc+'.mIyy')
-            self.connect('pre'+lc+'.mIzz', 'tower'+lc+'.mIzz')
-            self.connect('pre'+lc+'.mIxy', 'tower'+lc+'.mIxy')
-            self.connect('pre'+lc+'.mIxz', 'tower'+lc+'.mIxz')
-            self.connect('pre'+lc+'.mIyz', 'tower'+lc+'.mIyz')
-            self.connect('pre'+lc+'.mrhox', 'tower'+lc+'.mrhox')
-            self.connect('pre'+lc+'.mrhoy', 'tower'+lc+'.mrhoy')
-            self.connect('pre'+lc+'.mrhoz', 'tower'+lc+'.mrhoz')
-
-            self.connect('pre'+lc+'.plidx', 'tower'+lc+'.plidx')
-            self.connect('pre'+lc+'.Fx', 'tower'+lc+'.Fx')
-            self.connect('pre'+lc+'.Fy', 'tower'+lc+'.Fy')
-            self.connect('pre'+lc+'.Fz', 'tower'+lc+'.Fz')
-            self.connect('pre'+lc+'.Mxx', 'tower'+lc+'.Mxx')
-            self.connect('pre'+lc+'.Myy', 'tower'+lc+'.Myy')
-            self.connect('pre'+lc+'.Mzz', 'tower'+lc+'.Mzz')
-            self.connect('tower_force_discretization', 'tower'+lc+'.dx')
-            self.connect('tower_add_gravity', 'tower'+lc+'.addGravityLoadForExtraMass')
-            self.connect('t_full', ['tower'+lc+'.t','post'+lc+'.t'])
+
+            if structure:
+                self.connect('z_full', tower+'.z')
+                self.connect('d_full', tower+'.d')
+                if topLevelFlag:
+                    self.connect('material_density', tower+'.rho')
+
+                self.connect('pre'+lc+'.kidx', tower+'.kidx')
+                self.connect('pre'+lc+'.kx', tower+'.kx')
+                self.connect('pre'+lc+'.ky', tower+'.ky')
+                self.connect('pre'+lc+'.kz', tower+'.kz')
+                self.connect('pre'+lc+'.ktx', tower+'.ktx')
+                self.connect('pre'+lc+'.kty', tower+'.kty')
+                self.connect('pre'+lc+'.ktz', tower+'.ktz')
+                self.connect('pre'+lc+'.midx', tower+'.midx')
+                self.connect('pre'+lc+'.m', tower+'.m')
+                self.connect('pre'+lc+'.mIxx', tower+'.mIxx')
+                self.connect('pre'+lc+'.mIyy', tower+'.mIyy')
+                self.connect('pre'+lc+'.mIzz', tower+'.mIzz')
+                self.connect('pre'+lc+'.mIxy', tower+'.mIxy')
+                self.connect('pre'+lc+'.mIxz', tower+'.mIxz')
+                self.connect('pre'+lc+'.mIyz', tower+'.mIyz')
+                self.connect('pre'+lc+'.mrhox', tower+'.mrhox')
+                self.connect('pre'+lc+'.mrhoy', tower+'.mrhoy')
+                self.connect('pre'+lc+'.mrhoz', tower+'.mrhoz')
+
+                self.connect('pre'+lc+'.plidx', tower+'.plidx')
+                self.connect('tower_force_discretization', tower+'.dx')
+                self.connect('tower_add_gravity', tower+'.addGravityLoadForExtraMass')
+                self.connect('t_full', tower+'.t')
+                self.connect('tower_buckling_length', tower+'.L_reinforced')
+
+                self.connect('props.Az', tower+'.Az')
+                self.connect('props.Asx', tower+'.Asx')
+                self.connect('props.Asy', tower+'.Asy')
+                self.connect('props.Jz', tower+'.Jz')
+                self.connect('props.Ixx', tower+'.Ixx')
+                self.connect('props.Iyy', tower+'.Iyy')
+
+            self.connect('pre'+lc+'.Fx', tower+'.Fx'+tlc)
+            self.connect('pre'+lc+'.Fy', tower+'.Fy'+tlc)
+            self.connect('pre'+lc+'.Fz', tower+'.Fz'+tlc)
+            self.connect('pre'+lc+'.Mxx', tower+'.Mxx'+tlc)
+            self.connect('pre'+lc+'.Myy', tower+'.Myy'+tlc)
+            self.connect('pre'+lc+'.Mzz', tower+'.Mzz'+tlc)
+            self.connect('t_full', 'post'+lc+'.t')
             self.connect('soil.k', 'pre'+lc+'.k_monopile')
 
-            self.connect('tower'+lc+'.f1', 'post'+lc+'.f1')
-            self.connect('tower'+lc+'.f2', 'post'+lc+'.f2')
-            self.connect('tower'+lc+'.Fz_out', 'post'+lc+'.Fz')
-            self.connect('tower'+lc+'.Mxx_out', 'post'+lc+'.Mxx')
-            self.connect('tower'+lc+'.Myy_out', 'post'+lc+'.Myy')
-            self.connect('tower'+lc+'.axial_stress', 'post'+lc+'.axial_stress')
-            self.connect('tower'+lc+'.shear_stress', 'post'+lc+'.shear_stress')
-            self.connect('tower'+lc+'.hoop_stress_euro', 'post'+lc+'.hoop_stress')
+            self.connect(tower+'.f1', 'post'+lc+'.f1')
+            self.connect(tower+'.f2', 'post'+lc+'.f2')
+            self.connect(tower+'.Fz_out'+tlc, 'post'+lc+'.Fz')
+            self.connect(tower+'.Mxx_out'+tlc, 'post'+lc+'.Mxx')
+            self.connect(tower+'.Myy_out'+tlc, 'post'+lc+'.Myy')
+            self.connect(tower+'.axial_stress'+tlc, 'post'+lc+'.axial_stress')
+            self.connect(tower+'.shear_stress'+tlc, 'post'+lc+'.shear_stress')
+            self.connect(tower+'.hoop_stress_euro'+tlc, 'post'+lc+'.hoop_stress')
         
             # connections to wind, wave
             if topLevelFlag:
@@ -686,21 +711,22 @@ class TowerSE(Group):
                 self.connect('waveLoads'+lc+'.waveLoads_d', 'distLoads'+lc+'.waveLoads_d')
 
             # Tower connections
-            self.connect('tower_buckling_length', ['tower'+lc+'.L_reinforced', 'post'+lc+'.L_reinforced'])
+            self.connect('tower_buckling_length', 'post'+lc+'.L_reinforced')
             #self.connect('tower_M_DEL', 'post'+lc+'.M_DEL')
             #self.connect('tower_z_DEL', 'post'+lc+'.z_DEL')
 
-            self.connect('props.Az', 'tower'+lc+'.Az')
-            self.connect('props.Asx', 'tower'+lc+'.Asx')
-            self.connect('props.Asy', 'tower'+lc+'.Asy')
-            self.connect('props.Jz', 'tower'+lc+'.Jz')
-            self.connect('props.Ixx', 'tower'+lc+'.Ixx')
-            self.connect('props.Iyy', 'tower'+lc+'.Iyy')
-
-            self.connect('distLoads'+lc+'.Px',   'tower'+lc+'.Px')
-            self.connect('distLoads'+lc+'.Py',   'tower'+lc+'.Py')
-            self.connect('distLoads'+lc+'.Pz',   'tower'+lc+'.Pz')
-            self.connect('distLoads'+lc+'.qdyn', 'tower'+lc+'.qdyn')
+            self.connect('distLoads'+lc+'.Px',   tower+'.Px'+tlc)
+            self.connect('distLoads'+lc+'.Py',   tower+'.Py'+tlc)
+            self.connect('distLoads'+lc+'.Pz',   tower+'.Pz'+tlc)
+            self.connect('distLoads'+lc+'.qdyn', tower+'.qdyn'+tlc)
+
+        if multiLC:
+            # one stiffness assembly and modal analysis for all load cases, then the per case post-processing
+            self.add_subsystem('tower', CylinderFrame3DD(npts=nFull, nK=1, nMass=2, nPL=1, nLC=nLC), promotes=['E','G','tol','Mmethod','geom','lump','shear',
+                                                                                     'nM','shift','sigma_y'])
+            for iLC in range(nLC):
+                self.add_subsystem('post'+str(iLC+1), TowerPostFrame(nFull=nFull), promotes=['E','sigma_y','DC','life','m_SN',
+                                                                                             'gamma_b','gamma_f','gamma_fatigue','gamma_m','gamma_n'])
 
         
 if __name__ == '__main__':